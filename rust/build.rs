@@ -15,6 +15,7 @@ const EXPECTED_SOURCE_FILES: &[&str] = &[
     "src/ids.rs",
     "src/lib.rs",
     "src/match_buffer.rs",
+    "src/normalize.rs",
 ];
 
 fn rust_sources(root: &Path, directory: &Path, output: &mut Vec<String>) {
@@ -1,9 +1,13 @@
-use crate::engine::{DetectorMetadata, NativeEngine, RegexResourceProfile};
+use crate::engine::{
+    DetectorMetadata, EntitySelection, LiteralResourceProfile, NativeEngine, RegexResourceProfile,
+    ScanLimiterStats, ScanOptions,
+};
 use crate::error::{validation, BankError, Result};
 use crate::flags::{canonicalize_flag_names, merge_flags, parse_flags_value};
 use crate::formats::{parse_source_auto, parse_source_value, SourceFormat};
 use crate::ids::{bank_hash, entity_stable_id, pattern_stable_id};
-use crate::match_buffer::NativeMatchBuffer;
+use crate::match_buffer::{NativeMatchBuffer, OverlapGroup};
+use crate::normalize::NormalizationForm;
 use regex_syntax::Parser;
 use serde::{Deserialize, Serialize};
 use serde_json::{Map, Value};
@@ -16,6 +20,8 @@ const MAX_PATTERNS: usize = 100_000;
 const MAX_PATTERNS_PER_ENTITY: usize = 50_000;
 const MAX_PATTERN_BYTES: usize = 10_000;
 const MAX_TOTAL_PATTERN_BYTES: usize = 10_000_000;
+const MAX_COMPACT_PATTERNS: usize = 2_000_000;
+const MAX_COMPACT_TOTAL_PATTERN_BYTES: usize = 128_000_000;
 
 #[derive(Clone, Debug, Deserialize, Serialize, PartialEq, Eq)]
 #[serde(deny_unknown_fields)]
@@ -57,7 +63,6 @@ pub struct CanonicalPattern {
 #[derive(Debug)]
 pub struct NativeBank {
     canonical: CanonicalBank,
-    canonical_json: Vec<u8>,
     bank_hash: String,
     compile_options: Value,
     engine: NativeEngine,
@@ -70,6 +75,8 @@ struct BankOptions {
     match_mode: MatchMode,
     #[serde(default)]
     word_boundaries: bool,
+    #[serde(default)]
+    literal_matcher: LiteralMatcher,
 }
 
 impl Default for BankOptions {
@@ -77,8 +84,51 @@ impl Default for BankOptions {
         Self {
             match_mode: default_match_mode(),
             word_boundaries: false,
+            literal_matcher: LiteralMatcher::default(),
+        }
+    }
+}
+
+/// Literal automaton representation selected by the `literal_matcher` compile option.
+#[derive(Clone, Copy, Debug, Default, Deserialize, Serialize, PartialEq, Eq)]
+#[serde(rename_all = "snake_case")]
+pub(crate) enum LiteralMatcher {
+    #[default]
+    Standard,
+    Compact,
+}
+
+impl LiteralMatcher {
+    pub(crate) fn as_str(self) -> &'static str {
+        match self {
+            Self::Standard => "standard",
+            Self::Compact => "compact",
         }
     }
+
+    fn limits(self) -> BankLimits {
+        match self {
+            Self::Standard => BankLimits {
+                patterns: MAX_PATTERNS,
+                patterns_per_entity: MAX_PATTERNS_PER_ENTITY,
+                total_pattern_bytes: MAX_TOTAL_PATTERN_BYTES,
+            },
+            // Compact banks exist for million-alias catalogs, so one entity may
+            // own the whole pattern budget.
+            Self::Compact => BankLimits {
+                patterns: MAX_COMPACT_PATTERNS,
+                patterns_per_entity: MAX_COMPACT_PATTERNS,
+                total_pattern_bytes: MAX_COMPACT_TOTAL_PATTERN_BYTES,
+            },
+        }
+    }
+}
+
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+struct BankLimits {
+    patterns: usize,
+    patterns_per_entity: usize,
+    total_pattern_bytes: usize,
 }
 
 #[derive(Clone, Copy, Debug, Deserialize, Serialize, PartialEq, Eq)]
@@ -155,9 +205,13 @@ impl NativeBank {
                 Self::from_canonical_value(value, options)
             }
             _ => {
-                let canonical =
-                    canonicalize_source_value(value, source_format, options.word_boundaries)?;
-                Self::from_canonical_bank(canonical, options.match_mode)
+                let canonical = canonicalize_source_value(
+                    value,
+                    source_format,
+                    options.word_boundaries,
+                    options.literal_matcher.limits(),
+                )?;
+                Self::from_canonical_bank(canonical, options)
             }
         }
     }
@@ -171,8 +225,10 @@ impl NativeBank {
         Self::from_canonical_value(value, options)
     }
 
-    pub fn canonical_json(&self) -> &[u8] {
-        &self.canonical_json
+    /// Serialize the canonical bank on demand instead of retaining a second
+    /// copy of every pattern for the bank lifetime.
+    pub fn canonical_json(&self) -> Vec<u8> {
+        serde_json::to_vec(&self.canonical).expect("canonical bank must serialize")
     }
 
     pub fn hash(&self) -> &str {
@@ -191,14 +247,73 @@ impl NativeBank {
         self.engine.match_mode()
     }
 
-    pub fn detectors(&self) -> &[DetectorMetadata] {
-        self.engine.detectors()
+    pub fn scan_stats(&self) -> ScanLimiterStats {
+        self.engine.scan_stats()
+    }
+
+    pub fn chunk_overlap(&self) -> Option<usize> {
+        self.engine.chunk_overlap()
+    }
+
+    pub fn resolve_overlaps(
+        &self,
+        buffer: &NativeMatchBuffer,
+        tie_ranks: Option<&[u32]>,
+    ) -> Result<Vec<OverlapGroup>> {
+        self.engine.resolve_overlaps(buffer, tie_ranks)
+    }
+
+    pub fn normalization(&self) -> NormalizationForm {
+        self.engine.normalization()
+    }
+
+    pub fn detector_count(&self) -> usize {
+        self.engine.detector_count()
+    }
+
+    pub fn detector(&self, detector_index: u32) -> Option<DetectorMetadata<'_>> {
+        let (entity_index, pattern_index) = self.engine.detector_location(detector_index)?;
+        let entity = self.canonical.entities.get(entity_index)?;
+        let pattern = entity.patterns.get(pattern_index)?;
+        Some(DetectorMetadata {
+            detector_index,
+            entity: &entity.name,
+            canonical_name: &pattern.canonical_name,
+            surface_name: &pattern.surface_name,
+            stable_id: &pattern.stable_id,
+            priority: pattern.priority,
+        })
+    }
+
+    pub fn detectors(&self) -> impl Iterator<Item = DetectorMetadata<'_>> {
+        self.canonical
+            .entities
+            .iter()
+            .flat_map(|entity| {
+                entity
+                    .patterns
+                    .iter()
+                    .map(move |pattern| (entity.name.as_str(), pattern))
+            })
+            .zip(0u32..)
+            .map(|((entity, pattern), detector_index)| DetectorMetadata {
+                detector_index,
+                entity,
+                canonical_name: &pattern.canonical_name,
+                surface_name: &pattern.surface_name,
+                stable_id: &pattern.stable_id,
+                priority: pattern.priority,
+            })
     }
 
     pub fn regex_resource_profile(&self) -> Option<&RegexResourceProfile> {
         self.engine.regex_resource_profile()
     }
 
+    pub fn literal_resource_profile(&self) -> Option<&LiteralResourceProfile> {
+        self.engine.literal_resource_profile()
+    }
+
     pub fn scan_bytes(&self, haystack: &[u8]) -> Result<NativeMatchBuffer> {
         self.engine.scan_bytes(haystack)
     }
@@ -211,10 +326,73 @@ impl NativeBank {
         self.engine.scan_bytes_bounded(haystack, max_matches)
     }
 
+    pub fn scan_bytes_batch(
+        &self,
+        haystacks: &[&[u8]],
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+        threads: usize,
+    ) -> Result<Vec<NativeMatchBuffer>> {
+        self.engine
+            .scan_bytes_batch(haystacks, max_matches, options, threads)
+    }
+
     pub fn scan_bytes_into(&self, haystack: &[u8], buffer: &mut NativeMatchBuffer) -> Result<()> {
         self.engine.scan_bytes_into(haystack, buffer)
     }
 
+    pub fn entity_selection(&self, entity_indexes: &[usize]) -> Result<EntitySelection> {
+        self.engine.entity_selection(entity_indexes)
+    }
+
+    pub fn scan_bytes_with(
+        &self,
+        haystack: &[u8],
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+    ) -> Result<NativeMatchBuffer> {
+        self.engine.scan_bytes_with(haystack, max_matches, options)
+    }
+
+    pub fn scan_bytes_with_into(
+        &self,
+        haystack: &[u8],
+        buffer: &mut NativeMatchBuffer,
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+    ) -> Result<()> {
+        self.engine
+            .scan_bytes_with_into(haystack, buffer, max_matches, options)
+    }
+
+    pub fn scan_bytes_chunked(
+        &self,
+        haystack: &[u8],
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+        threads: usize,
+    ) -> Result<NativeMatchBuffer> {
+        self.engine
+            .scan_bytes_chunked(haystack, max_matches, options, threads)
+    }
+
+    pub fn scan_bytes_first(
+        &self,
+        haystack: &[u8],
+        stop_after: usize,
+        options: ScanOptions<'_>,
+    ) -> Result<NativeMatchBuffer> {
+        self.engine.scan_bytes_first(haystack, stop_after, options)
+    }
+
+    pub fn contains_any(&self, haystack: &[u8], options: ScanOptions<'_>) -> Result<bool> {
+        self.engine.contains_any(haystack, options)
+    }
+
+    pub fn count_bytes(&self, haystack: &[u8], options: ScanOptions<'_>) -> Result<Vec<u64>> {
+        self.engine.count_bytes(haystack, options)
+    }
+
     pub fn scan_bytes_leftmost_from_all_overlaps(
         &self,
         haystack: &[u8],
@@ -231,23 +409,23 @@ impl NativeBank {
                 "word_boundaries is a source canonicalization option and cannot be applied to canonical_json input",
             ));
         }
-        let canonical =
+        let mut canonical =
             serde_json::from_value::<CanonicalBank>(value).map_err(|error| BankError::Parse {
                 format: "canonical_json",
                 message: error.to_string(),
             })?;
-        Self::from_canonical_bank(canonical, options.match_mode)
+        validate_and_normalize_canonical_bank(&mut canonical, options.literal_matcher.limits())?;
+        Self::from_canonical_bank(canonical, options)
     }
 
-    fn from_canonical_bank(mut canonical: CanonicalBank, match_mode: MatchMode) -> Result<Self> {
-        validate_and_normalize_canonical_bank(&mut canonical)?;
-        let compile_options_value = compile_options_value(match_mode);
-        let canonical_json = serde_json::to_vec(&canonical).expect("canonical bank must serialize");
+    fn from_canonical_bank(canonical: CanonicalBank, options: BankOptions) -> Result<Self> {
+        let compile_options_value =
+            compile_options_value(options.match_mode, options.literal_matcher);
         let bank_hash = bank_hash(&canonical, &compile_options_value);
-        let engine = NativeEngine::compile(&canonical, match_mode)?;
+        let engine =
+            NativeEngine::compile(&canonical, options.match_mode, options.literal_matcher)?;
         Ok(Self {
             canonical,
-            canonical_json,
             bank_hash,
             compile_options: compile_options_value,
             engine,
@@ -275,8 +453,13 @@ fn parse_bank_options_struct(compile_options_json: Option<&str>) -> Result<BankO
     Ok(options)
 }
 
-fn compile_options_value(match_mode: MatchMode) -> Value {
-    let value = serde_json::json!({ "match_mode": match_mode });
+fn compile_options_value(match_mode: MatchMode, literal_matcher: LiteralMatcher) -> Value {
+    let mut value = serde_json::json!({ "match_mode": match_mode });
+    // The standard matcher is the implicit default, so existing bank hashes
+    // stay stable; only an explicit compact request becomes part of the hash.
+    if literal_matcher != LiteralMatcher::Standard {
+        value["literal_matcher"] = serde_json::json!(literal_matcher);
+    }
     crate::ids::canonicalize_json_value(&value)
 }
 
@@ -284,20 +467,21 @@ fn canonicalize_source_value(
     value: Value,
     source_format: SourceFormat,
     word_boundaries: bool,
+    limits: BankLimits,
 ) -> Result<CanonicalBank> {
     match source_format {
-        SourceFormat::Jsonl => canonicalize_jsonl_rows(value, word_boundaries),
+        SourceFormat::Jsonl => canonicalize_jsonl_rows(value, word_boundaries, limits),
         SourceFormat::Json | SourceFormat::Yaml | SourceFormat::CanonicalJson => {
             let object = as_object(&value, "")?;
             if is_current_json_bank_object(object) {
-                canonicalize_current_json_bank(object, word_boundaries)
+                canonicalize_current_json_bank(object, word_boundaries, limits)
             } else if object.contains_key("schema") || object.contains_key("schema_version") {
                 Err(validation(
                     "",
                     "compact detector maps cannot use reserved entity names \"schema\" or \"schema_version\"",
                 ))
             } else {
-                canonicalize_detector_map(object, word_boundaries)
+                canonicalize_detector_map(object, word_boundaries, limits)
             }
         }
     }
@@ -313,7 +497,11 @@ fn is_current_json_bank_object(object: &Map<String, Value>) -> bool {
     matches!(object.get("schema_version"), Some(Value::String(_)))
 }
 
-fn canonicalize_jsonl_rows(value: Value, word_boundaries: bool) -> Result<CanonicalBank> {
+fn canonicalize_jsonl_rows(
+    value: Value,
+    word_boundaries: bool,
+    limits: BankLimits,
+) -> Result<CanonicalBank> {
     let rows = match value {
         Value::Array(rows) => rows,
         _ => {
@@ -360,12 +548,17 @@ fn canonicalize_jsonl_rows(value: Value, word_boundaries: bool) -> Result<Canoni
         });
     }
     apply_word_boundaries(&mut candidates, word_boundaries);
-    build_canonical_bank(defaults(word_boundaries), candidates)
+    build_canonical_bank(
+        defaults(word_boundaries, NormalizationForm::None),
+        candidates,
+        limits,
+    )
 }
 
 fn canonicalize_detector_map(
     object: &Map<String, Value>,
     word_boundaries: bool,
+    limits: BankLimits,
 ) -> Result<CanonicalBank> {
     if object.is_empty() {
         return Err(validation(
@@ -433,12 +626,17 @@ fn canonicalize_detector_map(
         }
     }
     apply_word_boundaries(&mut candidates, word_boundaries);
-    build_canonical_bank(defaults(word_boundaries), candidates)
+    build_canonical_bank(
+        defaults(word_boundaries, NormalizationForm::None),
+        candidates,
+        limits,
+    )
 }
 
 fn canonicalize_current_json_bank(
     object: &Map<String, Value>,
     word_boundaries: bool,
+    limits: BankLimits,
 ) -> Result<CanonicalBank> {
     reject_unknown(
         object,
@@ -467,13 +665,10 @@ fn canonicalize_current_json_bank(
         ));
     }
     validate_current_id(&required_string(object, "id", "")?, "/id")?;
-    let normalization = required_string(object, "unicode_normalization", "")?;
-    if normalization != "none" {
-        return Err(validation(
-            "/unicode_normalization",
-            "Rust canonicalization currently supports unicode_normalization \"none\" only",
-        ));
-    }
+    let normalization = NormalizationForm::parse(
+        &required_string(object, "unicode_normalization", "")?,
+        "/unicode_normalization",
+    )?;
 
     let default_flags =
         parse_flags_value(object.get("default_regex_flags"), "/default_regex_flags")?;
@@ -563,13 +758,14 @@ fn canonicalize_current_json_bank(
                     &pattern_path,
                     &default_flags,
                     &entity_flags,
+                    normalization,
                 )?;
                 candidates.push(candidate);
             }
         }
     }
     apply_word_boundaries(&mut candidates, word_boundaries);
-    build_canonical_bank(defaults(word_boundaries), candidates)
+    build_canonical_bank(defaults(word_boundaries, normalization), candidates, limits)
 }
 
 fn candidate_from_current_pattern(
@@ -580,6 +776,7 @@ fn candidate_from_current_pattern(
     path: &str,
     default_flags: &[String],
     entity_flags: &[String],
+    normalization: NormalizationForm,
 ) -> Result<PatternCandidate> {
     reject_unknown(
         pattern,
@@ -601,6 +798,8 @@ fn candidate_from_current_pattern(
     )?;
     let kind = required_string(pattern, "kind", path)?;
     let value = required_string(pattern, "value", path)?;
+    // Scans match the normalized haystack, so detectors match normalized values.
+    let value = normalization.normalize(&value).into_owned();
     let priority = Some(required_i64(pattern, "priority", path)?);
     let flags = match kind.as_str() {
         "regex" => {
@@ -760,6 +959,7 @@ fn apply_word_boundaries(candidates: &mut [PatternCandidate], enabled: bool) {
 fn build_canonical_bank(
     defaults: CanonicalDefaults,
     candidates: Vec<PatternCandidate>,
+    limits: BankLimits,
 ) -> Result<CanonicalBank> {
     if candidates.is_empty() {
         return Err(validation(
@@ -792,12 +992,13 @@ fn build_canonical_bank(
     let mut duplicate_keys = HashSet::new();
     let mut entities = Vec::with_capacity(by_entity.len());
     for (entity_name, mut entity_patterns) in by_entity {
-        if entity_patterns.len() > MAX_PATTERNS_PER_ENTITY {
+        if entity_patterns.len() > limits.patterns_per_entity {
             return Err(validation(
                 format!("/entities/{entity_name}/patterns"),
                 format!(
-                    "pattern count {} exceeds per-entity limit {MAX_PATTERNS_PER_ENTITY}",
-                    entity_patterns.len()
+                    "pattern count {} exceeds per-entity limit {}",
+                    entity_patterns.len(),
+                    limits.patterns_per_entity
                 ),
             ));
         }
@@ -826,17 +1027,23 @@ fn build_canonical_bank(
         let mut canonical_patterns = Vec::with_capacity(entity_patterns.len());
         for pattern in entity_patterns {
             total_patterns += 1;
-            if total_patterns > MAX_PATTERNS {
+            if total_patterns > limits.patterns {
                 return Err(validation(
                     "/entities",
-                    format!("pattern count {total_patterns} exceeds bank limit {MAX_PATTERNS}"),
+                    format!(
+                        "pattern count {total_patterns} exceeds bank limit {}",
+                        limits.patterns
+                    ),
                 ));
             }
             total_pattern_bytes += pattern.regex.len();
-            if total_pattern_bytes > MAX_TOTAL_PATTERN_BYTES {
+            if total_pattern_bytes > limits.total_pattern_bytes {
                 return Err(validation(
                     "/entities",
-                    format!("total pattern bytes {total_pattern_bytes} exceeds limit {MAX_TOTAL_PATTERN_BYTES}"),
+                    format!(
+                        "total pattern bytes {total_pattern_bytes} exceeds limit {}",
+                        limits.total_pattern_bytes
+                    ),
                 ));
             }
 
@@ -890,7 +1097,10 @@ fn build_canonical_bank(
     })
 }
 
-fn validate_and_normalize_canonical_bank(bank: &mut CanonicalBank) -> Result<()> {
+fn validate_and_normalize_canonical_bank(
+    bank: &mut CanonicalBank,
+    limits: BankLimits,
+) -> Result<()> {
     if bank.schema != CANONICAL_SCHEMA {
         return Err(validation(
             "/schema",
@@ -965,7 +1175,7 @@ fn validate_and_normalize_canonical_bank(bank: &mut CanonicalBank) -> Result<()>
             });
         }
     }
-    let rebuilt = build_canonical_bank(bank.defaults.clone(), candidates)?;
+    let rebuilt = build_canonical_bank(bank.defaults.clone(), candidates, limits)?;
     if rebuilt != *bank {
         return Err(validation(
             "",
@@ -1006,6 +1216,19 @@ fn validate_candidate(candidate: &PatternCandidate, defaults: &CanonicalDefaults
         }
     }
     validate_defaults(defaults)?;
+    let normalization =
+        NormalizationForm::parse(&defaults.normalization, "/defaults/normalization")?;
+    if normalization.normalize(&candidate.regex) != candidate.regex {
+        return Err(validation(
+            "/regex",
+            format!(
+                "pattern for detector {:?}/{:?} must be stored in {} form",
+                candidate.entity,
+                candidate.canonical_name,
+                normalization.as_str()
+            ),
+        ));
+    }
     Parser::new().parse(&candidate.regex).map_err(|error| {
         validation(
             "/regex",
@@ -1040,22 +1263,17 @@ fn validate_defaults(defaults: &CanonicalDefaults) -> Result<()> {
             "bank-level case_insensitive defaults are not supported; migrate flags to patterns",
         ));
     }
-    if defaults.normalization != "none" {
-        return Err(validation(
-            "/defaults/normalization",
-            "Rust canonicalization currently supports normalization \"none\" only",
-        ));
-    }
+    NormalizationForm::parse(&defaults.normalization, "/defaults/normalization")?;
     Ok(())
 }
 
-fn defaults(word_boundaries: bool) -> CanonicalDefaults {
+fn defaults(word_boundaries: bool, normalization: NormalizationForm) -> CanonicalDefaults {
     CanonicalDefaults {
         engine: ENGINE_NAME.to_string(),
         unicode: true,
         case_insensitive: false,
         word_boundaries,
-        normalization: "none".to_string(),
+        normalization: normalization.as_str().to_string(),
     }
 }
 
@@ -1285,6 +1503,62 @@ GENRE:
             .starts_with("pattern:sha256:"));
     }
 
+    #[test]
+    fn current_json_normalization_stores_normalized_patterns() {
+        let mut source: Value =
+            serde_json::from_slice(&current_bank_source_with_pattern(serde_json::json!({
+                "kind": "literal",
+                "value": "\u{fb01}ne Corp",
+                "priority": 100,
+                "case_sensitive": true,
+                "normalize_whitespace": false,
+                "left_boundary": "none",
+                "right_boundary": "none",
+            })))
+            .unwrap();
+        source["unicode_normalization"] = Value::from("NFKC");
+
+        let bank = NativeBank::from_source_bytes(source.to_string().as_bytes(), Some("json"), None)
+            .unwrap();
+        let pattern = &bank.canonical().entities[0].patterns[0];
+        let text = "\u{fb01}ne Corp and fine Corp";
+        let matches = bank.scan_bytes(text.as_bytes()).unwrap();
+
+        assert_eq!(bank.canonical().defaults.normalization, "NFKC");
+        assert_eq!(pattern.regex, "fine Corp");
+        assert_eq!(pattern.surface_name, "\u{fb01}ne Corp");
+        assert_eq!(
+            (0..matches.len())
+                .map(|index| matches.get(index).unwrap().as_tuple())
+                .collect::<Vec<_>>(),
+            [
+                (0, 0, "\u{fb01}ne Corp".len() as u64),
+                (0, text.rfind("fine").unwrap() as u64, text.len() as u64),
+            ]
+        );
+
+        let error = build_canonical_bank(
+            bank.canonical().defaults.clone(),
+            vec![PatternCandidate {
+                entity: "customer".to_string(),
+                canonical_name: "Acme Corp".to_string(),
+                surface_name: "\u{fb01}ne Corp".to_string(),
+                regex: "\u{fb01}ne Corp".to_string(),
+                flags: Vec::new(),
+                priority: Some(100),
+            }],
+            LiteralMatcher::Standard.limits(),
+        )
+        .unwrap_err();
+        assert!(error.to_string().contains("must be stored in NFKC form"));
+
+        source["unicode_normalization"] = Value::from("NFD");
+        let error =
+            NativeBank::from_source_bytes(source.to_string().as_bytes(), Some("json"), None)
+                .unwrap_err();
+        assert!(error.to_string().contains("/unicode_normalization"));
+    }
+
     #[test]
     fn jsonl_preserves_distinct_same_regex_detectors() {
         let source = br#"
@@ -1327,7 +1601,12 @@ GENRE:
             });
         }
 
-        let error = build_canonical_bank(defaults(false), candidates).unwrap_err();
+        let error = build_canonical_bank(
+            defaults(false, NormalizationForm::None),
+            candidates,
+            LiteralMatcher::Standard.limits(),
+        )
+        .unwrap_err();
 
         assert!(error
             .to_string()
@@ -1389,6 +1668,98 @@ GENRE:
         assert_ne!(first.hash(), second.hash());
     }
 
+    #[test]
+    fn compact_literal_matcher_is_hashed_only_when_selected() {
+        let source = br#"{"CODE":{"Alpha":"alpha","Beta":"beta"}}"#;
+        let default = NativeBank::from_source_bytes(source, Some("json"), None).unwrap();
+        let standard = NativeBank::from_source_bytes(
+            source,
+            Some("json"),
+            Some(r#"{"literal_matcher":"standard"}"#),
+        )
+        .unwrap();
+        let compact = NativeBank::from_source_bytes(
+            source,
+            Some("json"),
+            Some(r#"{"literal_matcher":"compact"}"#),
+        )
+        .unwrap();
+        let haystack = b"beta alpha";
+
+        assert_eq!(default.hash(), standard.hash());
+        assert_ne!(default.hash(), compact.hash());
+        assert_eq!(
+            compact.compile_options(),
+            &serde_json::json!({"literal_matcher": "compact", "match_mode": "entity_independent"})
+        );
+        let default_matches = default.scan_bytes(haystack).unwrap();
+        let compact_matches = compact.scan_bytes(haystack).unwrap();
+        assert_eq!(compact_matches.len(), 2);
+        assert_eq!(
+            (0..default_matches.len())
+                .map(|index| default_matches.get(index))
+                .collect::<Vec<_>>(),
+            (0..compact_matches.len())
+                .map(|index| compact_matches.get(index))
+                .collect::<Vec<_>>()
+        );
+        assert_eq!(
+            compact.literal_resource_profile().unwrap().literal_matcher,
+            LiteralMatcher::Compact
+        );
+        assert_eq!(
+            compact.detectors().collect::<Vec<_>>(),
+            (0..2)
+                .map(|index| compact.detector(index).unwrap())
+                .collect::<Vec<_>>()
+        );
+        assert_eq!(compact.detector(1).unwrap().canonical_name, "Beta");
+        assert!(compact.detector(2).is_none());
+
+        let error = NativeBank::from_source_bytes(
+            source,
+            Some("json"),
+            Some(r#"{"literal_matcher":"dense"}"#),
+        )
+        .unwrap_err();
+        assert!(error.to_string().contains("unknown variant"));
+    }
+
+    #[test]
+    fn compact_literal_matcher_raises_per_entity_pattern_limit() {
+        let candidates = (0..=MAX_PATTERNS_PER_ENTITY)
+            .map(|index| PatternCandidate {
+                entity: "ALIAS".to_string(),
+                canonical_name: format!("alias_{index}"),
+                surface_name: format!("alias_{index}"),
+                regex: format!("alias {index}"),
+                flags: Vec::new(),
+                priority: None,
+            })
+            .collect::<Vec<_>>();
+
+        let error = build_canonical_bank(
+            defaults(false, NormalizationForm::None),
+            candidates.clone(),
+            LiteralMatcher::Standard.limits(),
+        )
+        .unwrap_err();
+        let compact = build_canonical_bank(
+            defaults(false, NormalizationForm::None),
+            candidates,
+            LiteralMatcher::Compact.limits(),
+        )
+        .unwrap();
+
+        assert!(error
+            .to_string()
+            .contains("pattern count 50001 exceeds per-entity limit 50000"));
+        assert_eq!(
+            compact.entities[0].patterns.len(),
+            MAX_PATTERNS_PER_ENTITY + 1
+        );
+    }
+
     #[test]
     fn word_boundaries_are_applied_during_source_canonicalization() {
         let source = br#"{"TERM":{"Art":"art"}}"#;
@@ -1400,7 +1771,7 @@ GENRE:
         )
         .unwrap();
         let round_tripped =
-            NativeBank::from_canonical_json_bytes(bounded.canonical_json(), None).unwrap();
+            NativeBank::from_canonical_json_bytes(&bounded.canonical_json(), None).unwrap();
 
         assert!(!plain.canonical().defaults.word_boundaries);
         assert!(bounded.canonical().defaults.word_boundaries);
@@ -1425,7 +1796,7 @@ GENRE:
         )
         .unwrap();
         let mut canonical: CanonicalBank =
-            serde_json::from_slice(bounded.canonical_json()).unwrap();
+            serde_json::from_slice(&bounded.canonical_json()).unwrap();
         canonical.entities[0].patterns[0].regex = "art".to_string();
         canonical.entities[0].patterns[0].stable_id = pattern_stable_id(
             &canonical.entities[0].name,
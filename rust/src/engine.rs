@@ -1,16 +1,24 @@
-use crate::bank::{CanonicalBank, CanonicalPattern, MatchMode};
-use crate::error::{memory, validation, Result};
-use crate::match_buffer::{NativeMatchBuffer, RawMatch};
-use aho_corasick::{AhoCorasick, AhoCorasickBuilder, Input as AhoInput, MatchKind as AhoMatchKind};
+use crate::bank::{CanonicalBank, CanonicalPattern, LiteralMatcher, MatchMode};
+use crate::error::{memory, validation, BankError, Result};
+use crate::match_buffer::{NativeMatchBuffer, OverlapGroup, RawMatch, ScanControl};
+use crate::normalize::{NormalizationForm, NormalizedHaystack};
+use aho_corasick::{
+    AhoCorasick, AhoCorasickBuilder, AhoCorasickKind, Input as AhoInput, MatchKind as AhoMatchKind,
+};
 use regex_automata::hybrid::dfa::{Cache as HybridCache, OverlappingState, DFA as HybridDfa};
 use regex_automata::meta::{BuildError as RegexBuildError, Cache as RegexCache, Regex};
 use regex_automata::nfa::thompson::{self, WhichCaptures};
 use regex_automata::util::iter::Searcher;
-use regex_automata::{Anchored, Input, MatchError, MatchKind as RegexMatchKind};
+use regex_automata::{
+    Anchored, Input, Match as RegexMatch, MatchError, MatchKind as RegexMatchKind,
+};
 use regex_syntax::hir::{Hir, HirKind, Look};
 use regex_syntax::{is_word_character, ParserBuilder};
 use std::cmp::Ordering;
+use std::ops::Range;
+use std::sync::atomic::{AtomicUsize, Ordering as AtomicOrdering};
 use std::sync::{Condvar, Mutex, MutexGuard, PoisonError};
+use std::time::{Duration, Instant};
 
 const ENTITY_INDEPENDENT_NFA_SIZE_LIMIT: usize = 10 * 1024 * 1024;
 const ENTITY_INDEPENDENT_ONEPASS_SIZE_LIMIT: usize = 2 * 1024 * 1024;
@@ -24,21 +32,84 @@ const PIKEVM_STATE_ID_BYTES: usize = 4;
 const ENTITY_INDEPENDENT_DFA_SIZE_LIMIT: usize = 2 * 1024 * 1024;
 const ENTITY_INDEPENDENT_DFA_STATE_LIMIT: usize = 1_000;
 pub(crate) const MAX_CONCURRENT_SCANS_PER_ENGINE: usize = 8;
+/// Upper bounds, in microseconds, of the scan slot wait histogram buckets.
+pub(crate) const SCAN_WAIT_HISTOGRAM_BOUNDS_US: [u64; 6] =
+    [10, 100, 1_000, 10_000, 100_000, 1_000_000];
+const SCAN_SLOT_CANCEL_POLL_INTERVAL: Duration = Duration::from_millis(10);
+/// Smallest share of one document that a chunked scan hands to a worker.
+const MIN_CHUNKED_SCAN_BYTES: usize = 256 * 1024;
+/// Bytes a chunk reads past its longest match: one UTF-8 character of look-ahead.
+const CHUNK_LOOKAHEAD_BYTES: usize = 4;
+/// Bytes one shard search reads before it checks the scan's deadline and cancellation.
+const SCAN_WINDOW_BYTES: usize = 64 * 1024;
 pub(crate) const MAX_SCAN_INPUT_BYTES: usize = 10 * 1024 * 1024;
 pub(crate) const MAX_ENTITY_INDEPENDENT_REGEX_LAYERS_PER_ENTITY: usize = 128;
 pub(crate) const MAX_ENTITY_INDEPENDENT_REGEX_ACCOUNTED_BYTES: usize = 768 * 1024 * 1024;
 pub(crate) const MAX_PATTERNS_PER_BOUNDED_REGEX_LAYER: usize = 128;
 const BOUNDED_REGEX_INITIAL_MAX_MINIMUM_BYTES: usize = 64 * 1024;
+const MAX_RETAINED_MAPPED_HAYSTACK_BYTES: usize = 1024 * 1024;
 
 #[derive(Debug)]
 pub struct NativeEngine {
     match_mode: MatchMode,
-    detectors: Vec<DetectorMetadata>,
+    entity_detector_starts: Vec<u32>,
+    detector_count: u32,
+    detector_ranks: Vec<u32>,
+    detector_priorities: Vec<i64>,
     shards: Vec<MatcherShard>,
     all_overlaps: Option<AllOverlapsMatcher>,
     global_leftmost: Option<GlobalLeftmostMatcher>,
     regex_resources: Option<RegexResourceProfile>,
+    literal_resources: Option<LiteralResourceProfile>,
     scan_limiter: ScanLimiter,
+    mapped_haystacks: Vec<Mutex<MappedHaystackPool>>,
+    normalization: NormalizationForm,
+    normalized_haystacks: Vec<Mutex<NormalizedHaystack>>,
+    chunk_overlap: Option<usize>,
+}
+
+/// Entities one scan visits, as a mask over the canonical entity order.
+///
+/// Only entity-independent banks scan one shard per entity, so only they can
+/// skip the unselected entities without changing the selected entities' matches.
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub struct EntitySelection {
+    selected: Vec<bool>,
+}
+
+impl EntitySelection {
+    fn contains(&self, entity_index: usize) -> bool {
+        self.selected.get(entity_index).copied().unwrap_or(false)
+    }
+}
+
+/// Optional entity selection and interrupt checks one scan runs under.
+#[derive(Clone, Copy, Debug, Default)]
+pub struct ScanOptions<'a> {
+    pub selection: Option<&'a EntitySelection>,
+    pub control: Option<&'a ScanControl>,
+}
+
+/// How much of a scan's result the caller needs.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+enum ScanGoal {
+    /// Every match in projected record order.
+    All,
+    /// The first `n` matches in projected record order.
+    First(usize),
+    /// Any one match; the scan ends at the first shard that finds one.
+    Any,
+}
+
+impl ScanGoal {
+    /// Matches one leftmost run must collect before it may stop.
+    fn run_limit(self) -> Option<usize> {
+        match self {
+            ScanGoal::All => None,
+            ScanGoal::First(limit) => Some(limit),
+            ScanGoal::Any => Some(1),
+        }
+    }
 }
 
 #[derive(Debug, Default)]
@@ -51,8 +122,35 @@ struct ScanLimiter {
 struct ScanLimiterState {
     active: usize,
     slots_in_use: [bool; MAX_CONCURRENT_SCANS_PER_ENGINE],
-    #[cfg(test)]
-    maximum_observed: usize,
+    stats: ScanLimiterStats,
+}
+
+/// Cumulative scan slot admission counters for one engine.
+///
+/// `contended` counts acquisitions that found every slot busy, whether they
+/// were admitted later or `rejected`. Wait times are in microseconds, and
+/// `wait_histogram[i]` counts admitted waits of at most
+/// `SCAN_WAIT_HISTOGRAM_BOUNDS_US[i]`, with one final bucket for longer waits.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct ScanLimiterStats {
+    pub active: usize,
+    pub high_water: usize,
+    pub acquisitions: u64,
+    pub contended: u64,
+    pub rejected: u64,
+    pub total_wait_us: u64,
+    pub max_wait_us: u64,
+    pub wait_histogram: [u64; SCAN_WAIT_HISTOGRAM_BOUNDS_US.len() + 1],
+}
+
+impl ScanLimiterStats {
+    fn record_wait(&mut self, waited: Duration) {
+        let waited_us = u64::try_from(waited.as_micros()).unwrap_or(u64::MAX);
+        let bucket = SCAN_WAIT_HISTOGRAM_BOUNDS_US.partition_point(|bound| *bound < waited_us);
+        self.wait_histogram[bucket] += 1;
+        self.total_wait_us = self.total_wait_us.saturating_add(waited_us);
+        self.max_wait_us = self.max_wait_us.max(waited_us);
+    }
 }
 
 #[derive(Debug)]
@@ -63,12 +161,64 @@ struct ScanPermit<'a> {
 
 impl ScanLimiter {
     fn acquire(&self) -> ScanPermit<'_> {
+        self.acquire_for(None)
+            .expect("an unbounded scan slot wait cannot fail")
+    }
+
+    /// Wait for a scan slot, giving up at the control's wait bound, deadline, or cancellation.
+    fn acquire_for(&self, control: Option<&ScanControl>) -> Result<ScanPermit<'_>> {
         let mut state = self.lock_state();
-        while state.active >= MAX_CONCURRENT_SCANS_PER_ENGINE {
-            state = self
-                .available
-                .wait(state)
-                .unwrap_or_else(PoisonError::into_inner);
+        let mut waited = Duration::ZERO;
+        if state.active >= MAX_CONCURRENT_SCANS_PER_ENGINE {
+            state.stats.contended += 1;
+            let started = Instant::now();
+            let busy_at = control
+                .and_then(|control| control.max_wait)
+                .and_then(|max_wait| started.checked_add(max_wait));
+            let deadline = control.and_then(|control| control.deadline);
+            let polls_cancel = control.is_some_and(|control| control.cancel.is_some());
+            while state.active >= MAX_CONCURRENT_SCANS_PER_ENGINE {
+                let now = Instant::now();
+                if let Some(reason) = control.and_then(ScanControl::interrupt_reason) {
+                    state.stats.rejected += 1;
+                    return Err(BankError::Interrupted {
+                        reason,
+                        elapsed_ms: duration_millis(now - started),
+                        shards_completed: 0,
+                        shards_total: 0,
+                        matches: 0,
+                    });
+                }
+                if busy_at.is_some_and(|busy_at| now >= busy_at) {
+                    state.stats.rejected += 1;
+                    return Err(BankError::Busy {
+                        waited_ms: duration_millis(now - started),
+                        slots: MAX_CONCURRENT_SCANS_PER_ENGINE,
+                    });
+                }
+                // Cancellation does not notify the condvar, so a cancellable wait polls.
+                let wake = [
+                    busy_at,
+                    deadline,
+                    polls_cancel.then(|| now + SCAN_SLOT_CANCEL_POLL_INTERVAL),
+                ]
+                .into_iter()
+                .flatten()
+                .min();
+                state = match wake {
+                    Some(wake) => {
+                        self.available
+                            .wait_timeout(state, wake.saturating_duration_since(now))
+                            .unwrap_or_else(PoisonError::into_inner)
+                            .0
+                    }
+                    None => self
+                        .available
+                        .wait(state)
+                        .unwrap_or_else(PoisonError::into_inner),
+                };
+            }
+            waited = started.elapsed();
         }
         let slot = state
             .slots_in_use
@@ -77,14 +227,21 @@ impl ScanLimiter {
             .expect("active scan count guarantees an available cache slot");
         state.slots_in_use[slot] = true;
         state.active += 1;
-        #[cfg(test)]
-        {
-            state.maximum_observed = state.maximum_observed.max(state.active);
-        }
+        state.stats.acquisitions += 1;
+        state.stats.high_water = state.stats.high_water.max(state.active);
+        state.stats.record_wait(waited);
         drop(state);
-        ScanPermit {
+        Ok(ScanPermit {
             limiter: self,
             slot,
+        })
+    }
+
+    fn stats(&self) -> ScanLimiterStats {
+        let state = self.lock_state();
+        ScanLimiterStats {
+            active: state.active,
+            ..state.stats
         }
     }
 
@@ -95,10 +252,14 @@ impl ScanLimiter {
     #[cfg(test)]
     fn observed_concurrency(&self) -> (usize, usize) {
         let state = self.lock_state();
-        (state.active, state.maximum_observed)
+        (state.active, state.stats.high_water)
     }
 }
 
+fn duration_millis(duration: Duration) -> u64 {
+    u64::try_from(duration.as_millis()).unwrap_or(u64::MAX)
+}
+
 impl ScanPermit<'_> {
     fn slot(&self) -> usize {
         self.slot
@@ -119,13 +280,14 @@ impl Drop for ScanPermit<'_> {
     }
 }
 
-#[derive(Clone, Debug)]
-pub struct DetectorMetadata {
+/// Detector fields borrowed from the canonical bank instead of copied per detector.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct DetectorMetadata<'a> {
     pub detector_index: u32,
-    pub entity: String,
-    pub canonical_name: String,
-    pub surface_name: String,
-    pub stable_id: String,
+    pub entity: &'a str,
+    pub canonical_name: &'a str,
+    pub surface_name: &'a str,
+    pub stable_id: &'a str,
     pub priority: i64,
 }
 
@@ -171,12 +333,41 @@ struct LayeredMatcherShard {
     residual_regex_layers: Vec<RegexMatcherLayer>,
 }
 
-#[derive(Debug)]
+#[derive(Debug, Default)]
 struct MappedHaystack {
     bytes: Vec<u8>,
     checkpoints: Vec<(usize, usize)>,
 }
 
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+enum HaystackMapping {
+    AsciiCasefold,
+    NormalizedWhitespace,
+    NormalizedAsciiCasefold,
+}
+
+/// Mapped haystack buffers owned by one scan slot and reused by its later scans.
+#[derive(Debug, Default)]
+struct MappedHaystackPool {
+    mappings: [MappedHaystack; 3],
+    #[cfg(test)]
+    builds: usize,
+}
+
+/// One scan's haystack plus the mapped variants its shards have asked for so far.
+///
+/// Each variant is built at most once per scan and then shared by every shard,
+/// instead of every case-insensitive or whitespace-normalized shard remapping
+/// the whole document.
+struct ScanHaystack<'a> {
+    bytes: &'a [u8],
+    text: &'a str,
+    pool: &'a mut MappedHaystackPool,
+    built: [bool; 3],
+    requires_ascii_casefold: Option<bool>,
+    requires_whitespace: Option<bool>,
+}
+
 impl MappedHaystack {
     fn original_boundary(&self, mapped: usize) -> Option<usize> {
         if mapped > self.bytes.len() {
@@ -212,6 +403,88 @@ impl MappedHaystack {
     }
 }
 
+impl HaystackMapping {
+    fn index(self) -> usize {
+        match self {
+            HaystackMapping::AsciiCasefold => 0,
+            HaystackMapping::NormalizedWhitespace => 1,
+            HaystackMapping::NormalizedAsciiCasefold => 2,
+        }
+    }
+
+    fn normalizes_whitespace(self) -> bool {
+        self != HaystackMapping::AsciiCasefold
+    }
+
+    fn folds_ascii_case(self) -> bool {
+        self != HaystackMapping::NormalizedWhitespace
+    }
+}
+
+impl<'a> ScanHaystack<'a> {
+    fn new(bytes: &'a [u8], pool: &'a mut MappedHaystackPool) -> Self {
+        let text = std::str::from_utf8(bytes)
+            .expect("scan_bytes_into validates UTF-8 before entity-independent dispatch");
+        Self {
+            bytes,
+            text,
+            pool,
+            built: [false; 3],
+            requires_ascii_casefold: None,
+            requires_whitespace: None,
+        }
+    }
+
+    fn requires(&mut self, mapping: HaystackMapping) -> bool {
+        let text = self.text;
+        let casefold = mapping.folds_ascii_case()
+            && *self
+                .requires_ascii_casefold
+                .get_or_insert_with(|| requires_ascii_casefold_mapping(text));
+        let whitespace = mapping.normalizes_whitespace()
+            && *self
+                .requires_whitespace
+                .get_or_insert_with(|| requires_whitespace_mapping(text));
+        casefold || whitespace
+    }
+
+    /// Build `mapping` if this document needs it and no earlier shard has.
+    fn prepare(&mut self, mapping: HaystackMapping) {
+        let index = mapping.index();
+        if self.built[index] || !self.requires(mapping) {
+            return;
+        }
+        map_haystack_into(
+            self.text,
+            mapping.normalizes_whitespace(),
+            mapping.folds_ascii_case(),
+            &mut self.pool.mappings[index],
+        );
+        self.built[index] = true;
+        #[cfg(test)]
+        {
+            self.pool.builds += 1;
+        }
+    }
+
+    fn mapped(&self, mapping: HaystackMapping) -> Option<&MappedHaystack> {
+        let index = mapping.index();
+        self.built[index].then(|| &self.pool.mappings[index])
+    }
+}
+
+impl Drop for ScanHaystack<'_> {
+    fn drop(&mut self) {
+        // Keep ordinary document-sized buffers for the next scan in this slot,
+        // but do not pin a rare multi-megabyte mapping for the engine lifetime.
+        for mapped in &mut self.pool.mappings {
+            if mapped.bytes.capacity() > MAX_RETAINED_MAPPED_HAYSTACK_BYTES {
+                *mapped = MappedHaystack::default();
+            }
+        }
+    }
+}
+
 #[derive(Debug, Default)]
 struct LiteralMatcherLayers {
     without_left_boundary: Option<LiteralMatcherLayer>,
@@ -223,7 +496,7 @@ struct LiteralMatcherLayer {
     matcher: AhoCorasick,
     case_insensitive: bool,
     requires_left_unicode_word_boundary: bool,
-    patterns: Vec<LayerLiteralPattern>,
+    literals: LiteralArena,
     prefix_index: LiteralPrefixIndex,
 }
 
@@ -234,9 +507,35 @@ struct LayerLiteralPattern {
     pattern_order: usize,
 }
 
+/// Every literal of one layer stored back to back in a single buffer, with
+/// fixed-size entries instead of one owned string per pattern.
+#[derive(Debug, Default)]
+struct LiteralArena {
+    bytes: String,
+    entries: Vec<LiteralArenaEntry>,
+}
+
+#[derive(Clone, Copy, Debug)]
+struct LiteralArenaEntry {
+    offset: u32,
+    len: u32,
+    detector_index: u32,
+    pattern_order: u32,
+    boundary_signature: u8,
+}
+
+#[derive(Clone, Copy, Debug)]
+struct ArenaLiteral<'a> {
+    value: &'a str,
+    detector_index: u32,
+    pattern_order: usize,
+    left_unicode_word_boundary: bool,
+    right_unicode_word_boundary: bool,
+}
+
 #[derive(Debug)]
 struct LiteralPrefixIndex {
-    sorted_pattern_indices: Vec<usize>,
+    sorted_pattern_indices: Vec<u32>,
 }
 
 #[derive(Debug, Default)]
@@ -289,6 +588,76 @@ impl Default for RegexResourceBudget {
     }
 }
 
+/// Retained memory of the entity-independent Aho-Corasick literal matchers.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct LiteralResourceProfile {
+    pub literal_matcher: LiteralMatcher,
+    pub literal_matchers: usize,
+    pub literal_patterns: usize,
+    pub automaton_bytes: usize,
+    pub literal_table_bytes: usize,
+}
+
+impl LiteralResourceProfile {
+    fn new(literal_matcher: LiteralMatcher) -> Self {
+        Self {
+            literal_matcher,
+            literal_matchers: 0,
+            literal_patterns: 0,
+            automaton_bytes: 0,
+            literal_table_bytes: 0,
+        }
+    }
+
+    pub fn total_bytes(&self) -> usize {
+        self.automaton_bytes + self.literal_table_bytes
+    }
+
+    pub fn bytes_per_pattern(&self) -> usize {
+        self.total_bytes()
+            .checked_div(self.literal_patterns)
+            .unwrap_or(0)
+    }
+
+    fn record_matcher(&mut self, matcher: &AhoCorasick) {
+        self.literal_matchers += 1;
+        self.literal_patterns += matcher.patterns_len();
+        self.automaton_bytes += matcher.memory_usage();
+    }
+
+    fn record_layer(&mut self, layer: &LiteralMatcherLayer) {
+        self.record_matcher(&layer.matcher);
+        self.literal_table_bytes += layer.literals.memory_usage()
+            + layer.prefix_index.sorted_pattern_indices.capacity() * std::mem::size_of::<u32>();
+    }
+
+    fn record_layers(&mut self, layers: &LiteralMatcherLayers) {
+        for layer in [&layers.without_left_boundary, &layers.with_left_boundary]
+            .into_iter()
+            .flatten()
+        {
+            self.record_layer(layer);
+        }
+    }
+
+    fn record_shard(&mut self, shard: &MatcherShard) {
+        match shard {
+            MatcherShard::Regex(_) => {}
+            MatcherShard::Literal(shard) => {
+                self.record_matcher(&shard.matcher);
+                self.literal_table_bytes +=
+                    shard.local_to_detector.capacity() * std::mem::size_of::<u32>();
+            }
+            MatcherShard::Layered(shard) => {
+                self.record_layers(&shard.case_sensitive_literals);
+                self.record_layers(&shard.ascii_case_insensitive_literals);
+                self.record_layers(&shard.normalized_case_sensitive_literals);
+                self.record_layers(&shard.normalized_ascii_case_insensitive_literals);
+            }
+        }
+    }
+}
+
 #[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
 pub struct RegexResourceProfile {
     pub physical_regex_layers: usize,
@@ -572,14 +941,28 @@ struct GlobalLeftmostMatcher {
 struct CachedRegex {
     regex: Regex,
     caches: Vec<Mutex<RegexCache>>,
+    /// Longest match of any pattern, or `None` when a pattern has no longest
+    /// match or can match the empty string, which keeps its searches whole.
+    window_overlap: Option<usize>,
 }
 
 impl CachedRegex {
-    fn new(regex: Regex) -> CachedRegex {
+    fn new(regex: Regex, patterns: &[Hir]) -> CachedRegex {
         let caches = (0..MAX_CONCURRENT_SCANS_PER_ENGINE)
             .map(|_| Mutex::new(regex.create_cache()))
             .collect();
-        CachedRegex { regex, caches }
+        let window_overlap = patterns.iter().try_fold(0, |longest: usize, hir| {
+            let properties = hir.properties();
+            match (properties.minimum_len(), properties.maximum_len()) {
+                (Some(minimum), Some(maximum)) if minimum > 0 => Some(longest.max(maximum)),
+                _ => None,
+            }
+        });
+        CachedRegex {
+            regex,
+            caches,
+            window_overlap,
+        }
     }
 
     fn cache(&self, scan_slot: usize) -> MutexGuard<'_, RegexCache> {
@@ -600,16 +983,32 @@ impl CachedRegex {
 }
 
 impl NativeEngine {
-    pub fn compile(canonical: &CanonicalBank, match_mode: MatchMode) -> Result<Self> {
-        let detectors = detector_metadata(canonical)?;
-        let (shards, regex_resources) = if matches!(
+    pub fn compile(
+        canonical: &CanonicalBank,
+        match_mode: MatchMode,
+        literal_matcher: LiteralMatcher,
+    ) -> Result<Self> {
+        let normalization =
+            NormalizationForm::parse(&canonical.defaults.normalization, "/defaults/normalization")?;
+        let (entity_detector_starts, detector_count) = entity_detector_starts(canonical)?;
+        let detector_ranks = detector_tie_ranks(canonical);
+        let detector_priorities = canonical
+            .entities
+            .iter()
+            .flat_map(|entity| entity.patterns.iter().map(|pattern| pattern.priority))
+            .collect();
+        let (shards, regex_resources, literal_resources) = if matches!(
             match_mode,
             MatchMode::EntityIndependent | MatchMode::AllOverlaps
         ) {
-            let (shards, resources) = compile_entity_independent(canonical)?;
-            (shards, Some(resources))
+            let (shards, regex_resources) = compile_entity_independent(canonical, literal_matcher)?;
+            let mut literal_resources = LiteralResourceProfile::new(literal_matcher);
+            for shard in &shards {
+                literal_resources.record_shard(shard);
+            }
+            (shards, Some(regex_resources), Some(literal_resources))
         } else {
-            (Vec::new(), None)
+            (Vec::new(), None, None)
         };
         let all_overlaps = if match_mode == MatchMode::AllOverlaps {
             Some(compile_all_overlaps(canonical)?)
@@ -621,29 +1020,100 @@ impl NativeEngine {
         } else {
             None
         };
+        let chunk_overlap = chunk_scan_overlap(canonical, match_mode, normalization)?;
         Ok(Self {
             match_mode,
-            detectors,
+            entity_detector_starts,
+            detector_count,
+            detector_ranks,
+            detector_priorities,
             shards,
             all_overlaps,
             global_leftmost,
             regex_resources,
+            literal_resources,
             scan_limiter: ScanLimiter::default(),
+            mapped_haystacks: (0..MAX_CONCURRENT_SCANS_PER_ENGINE)
+                .map(|_| Mutex::new(MappedHaystackPool::default()))
+                .collect(),
+            normalization,
+            normalized_haystacks: (0..MAX_CONCURRENT_SCANS_PER_ENGINE)
+                .map(|_| Mutex::new(NormalizedHaystack::default()))
+                .collect(),
+            chunk_overlap,
         })
     }
 
-    pub fn detectors(&self) -> &[DetectorMetadata] {
-        &self.detectors
+    pub fn detector_count(&self) -> usize {
+        self.detector_count as usize
+    }
+
+    /// Return the `(entity, pattern)` position of a detector in the canonical bank.
+    pub fn detector_location(&self, detector_index: u32) -> Option<(usize, usize)> {
+        if detector_index >= self.detector_count {
+            return None;
+        }
+        let entity_index = self
+            .entity_detector_starts
+            .partition_point(|&start| start <= detector_index)
+            .checked_sub(1)?;
+        let pattern_index = detector_index - self.entity_detector_starts[entity_index];
+        Some((entity_index, pattern_index as usize))
+    }
+
+    /// Cumulative scan slot admission counters and the current active count.
+    pub fn scan_stats(&self) -> ScanLimiterStats {
+        self.scan_limiter.stats()
+    }
+
+    /// Group the overlapping matches of `buffer` and pick each group's priority winner.
+    ///
+    /// `tie_ranks` orders detectors whose matches tie on priority, length and
+    /// start; it defaults to the rank that orders matches sharing a span.
+    pub fn resolve_overlaps(
+        &self,
+        buffer: &NativeMatchBuffer,
+        tie_ranks: Option<&[u32]>,
+    ) -> Result<Vec<OverlapGroup>> {
+        let tie_ranks = match tie_ranks {
+            Some(ranks) if ranks.len() != self.detector_ranks.len() => {
+                return Err(validation(
+                    "/resolve_overlaps/tie_ranks",
+                    format!(
+                        "Bank.resolve_overlaps tie_ranks must hold one rank per detector ({}); got {}",
+                        self.detector_ranks.len(),
+                        ranks.len()
+                    ),
+                ));
+            }
+            Some(ranks) => ranks,
+            None => &self.detector_ranks,
+        };
+        buffer.overlap_groups(&self.detector_priorities, tie_ranks)
+    }
+
+    /// Bytes every chunk of a chunked scan reads past its end, or `None` when
+    /// the bank always scans a document serially.
+    pub fn chunk_overlap(&self) -> Option<usize> {
+        self.chunk_overlap
     }
 
     pub fn match_mode(&self) -> MatchMode {
         self.match_mode
     }
 
+    pub fn normalization(&self) -> NormalizationForm {
+        self.normalization
+    }
+
     pub fn regex_resource_profile(&self) -> Option<&RegexResourceProfile> {
         self.regex_resources.as_ref()
     }
 
+    pub fn literal_resource_profile(&self) -> Option<&LiteralResourceProfile> {
+        self.literal_resources.as_ref()
+    }
+
     pub fn scan_bytes(&self, haystack: &[u8]) -> Result<NativeMatchBuffer> {
         let mut buffer = NativeMatchBuffer::new();
         self.scan_bytes_into(haystack, &mut buffer)?;
@@ -661,44 +1131,260 @@ impl NativeEngine {
         Ok(buffer)
     }
 
+    /// Scan many haystacks under `options` in one call on up to `threads` scoped workers.
+    ///
+    /// Buffers come back in input order, and a failure returns the error a
+    /// sequential loop would have reported first.
+    pub fn scan_bytes_batch(
+        &self,
+        haystacks: &[&[u8]],
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+        threads: usize,
+    ) -> Result<Vec<NativeMatchBuffer>> {
+        validate_scan_threads("scan_bytes_batch", threads)?;
+        scan_claimed(haystacks.len(), threads, |index| {
+            self.scan_bytes_with(haystacks[index], max_matches, options)
+        })
+    }
+
+    /// Scan one long document as concurrent chunks on up to `threads` workers.
+    ///
+    /// The result equals [`scan_bytes_with`](Self::scan_bytes_with). Each
+    /// chunk starts right after ASCII whitespace and reads
+    /// [`chunk_overlap`](Self::chunk_overlap) bytes past the next chunk's start,
+    /// so it finds every match that starts inside it. The chunks' leftmost runs
+    /// are then stitched across the cuts. Banks without a chunk overlap,
+    /// documents too short to split, and the rare stitch that cannot prove a
+    /// chunk agrees with the serial scan fall back to one serial scan.
+    pub fn scan_bytes_chunked(
+        &self,
+        haystack: &[u8],
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+        threads: usize,
+    ) -> Result<NativeMatchBuffer> {
+        self.scan_chunks(
+            haystack,
+            max_matches,
+            options,
+            threads,
+            MIN_CHUNKED_SCAN_BYTES,
+        )
+    }
+
+    /// Build the selection for `entity_indexes`, positions in the canonical entity order.
+    pub fn entity_selection(&self, entity_indexes: &[usize]) -> Result<EntitySelection> {
+        if self.match_mode != MatchMode::EntityIndependent {
+            return Err(validation(
+                "/scan_bytes/entities",
+                format!(
+                    "entity selection requires match_mode entity_independent; this bank uses {}",
+                    self.match_mode.as_str()
+                ),
+            ));
+        }
+        let mut selected = vec![false; self.entity_detector_starts.len()];
+        for &entity_index in entity_indexes {
+            let entity_count = selected.len();
+            let Some(slot) = selected.get_mut(entity_index) else {
+                return Err(validation(
+                    "/scan_bytes/entities",
+                    format!(
+                        "entity index {entity_index} is outside the bank's {entity_count} entities"
+                    ),
+                ));
+            };
+            *slot = true;
+        }
+        Ok(EntitySelection { selected })
+    }
+
+    /// Scan under `options`, visiting only the selected entities' shards.
+    ///
+    /// A selected result equals scanning a bank compiled from just those
+    /// entities, except that detector indexes keep their positions in this bank.
+    /// A scan that passes its deadline or is cancelled fails with
+    /// [`BankError::Interrupted`](crate::error::BankError::Interrupted).
+    pub fn scan_bytes_with(
+        &self,
+        haystack: &[u8],
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+    ) -> Result<NativeMatchBuffer> {
+        validate_scan_input_size(haystack)?;
+        let mut buffer = match max_matches {
+            Some(max_matches) => NativeMatchBuffer::with_match_limit(max_matches)?,
+            None => NativeMatchBuffer::new(),
+        };
+        self.scan_into(haystack, &mut buffer, options, ScanGoal::All)?;
+        Ok(buffer)
+    }
+
+    /// Like [`scan_bytes_with`](Self::scan_bytes_with), but reuse `buffer` and its capacity.
+    ///
+    /// The buffer takes `max_matches` as its new match limit and is left empty
+    /// when the scan fails.
+    pub fn scan_bytes_with_into(
+        &self,
+        haystack: &[u8],
+        buffer: &mut NativeMatchBuffer,
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+    ) -> Result<()> {
+        buffer.clear();
+        buffer.set_match_limit(max_matches)?;
+        self.scan_into(haystack, buffer, options, ScanGoal::All)
+    }
+
+    /// Return the first `stop_after` matches of a full scan.
+    ///
+    /// Leftmost scans stop once every shard holds `stop_after` matches, so a
+    /// long document is only read up to its last kept match per shard.
+    pub fn scan_bytes_first(
+        &self,
+        haystack: &[u8],
+        stop_after: usize,
+        options: ScanOptions<'_>,
+    ) -> Result<NativeMatchBuffer> {
+        let mut buffer = NativeMatchBuffer::new();
+        self.scan_into(haystack, &mut buffer, options, ScanGoal::First(stop_after))?;
+        Ok(buffer)
+    }
+
+    /// Report whether a full scan would return any match.
+    pub fn contains_any(&self, haystack: &[u8], options: ScanOptions<'_>) -> Result<bool> {
+        let mut buffer = NativeMatchBuffer::new();
+        self.scan_into(haystack, &mut buffer, options, ScanGoal::Any)?;
+        Ok(!buffer.is_empty())
+    }
+
+    /// Count a full scan's matches per detector index without storing them.
+    pub fn count_bytes(&self, haystack: &[u8], options: ScanOptions<'_>) -> Result<Vec<u64>> {
+        if self.normalization != NormalizationForm::None {
+            // Projecting normalized spans can collapse matches, so normalized
+            // banks count the projected buffer instead of the raw pushes.
+            let mut buffer = NativeMatchBuffer::new();
+            self.scan_into(haystack, &mut buffer, options, ScanGoal::All)?;
+            let mut counts = vec![0; self.detector_count()];
+            for index in 0..buffer.len() {
+                let raw_match = buffer.get(index).expect("match index is within the buffer");
+                if let Some(count) = counts.get_mut(raw_match.detector_index as usize) {
+                    *count += 1;
+                }
+            }
+            return Ok(counts);
+        }
+        let mut buffer = NativeMatchBuffer::counting(self.detector_count());
+        self.scan_into(haystack, &mut buffer, options, ScanGoal::All)?;
+        Ok(buffer.counts().unwrap_or_default().to_vec())
+    }
+
     pub fn scan_bytes_into(&self, haystack: &[u8], buffer: &mut NativeMatchBuffer) -> Result<()> {
+        self.scan_into(haystack, buffer, ScanOptions::default(), ScanGoal::All)
+    }
+
+    fn scan_into(
+        &self,
+        haystack: &[u8],
+        buffer: &mut NativeMatchBuffer,
+        options: ScanOptions<'_>,
+        goal: ScanGoal,
+    ) -> Result<()> {
         buffer.clear();
         validate_scan_input_size(haystack)?;
-        std::str::from_utf8(haystack).map_err(|error| {
+        let text = std::str::from_utf8(haystack).map_err(|error| {
             validation(
                 "/scan_bytes/haystack",
                 format!("Bank.scan_bytes requires valid UTF-8 input: {error}"),
             )
         })?;
-        let permit = self.scan_limiter.acquire();
+        // The deadline also covers the wait for a scan slot; every scanner
+        // checks it before its first shard.
+        buffer.set_control(options.control);
+        let permit = match self.scan_limiter.acquire_for(options.control) {
+            Ok(permit) => permit,
+            Err(error) => {
+                buffer.set_control(None);
+                return Err(error);
+            }
+        };
         let scan_slot = permit.slot();
 
-        let result = match self.match_mode {
-            MatchMode::EntityIndependent => {
-                scan_entity_independent(&self.shards, haystack, buffer, scan_slot)
-            }
-            MatchMode::AllOverlaps => scan_all_overlaps(
-                self.all_overlaps
-                    .as_ref()
-                    .expect("all_overlaps matcher must exist for all_overlaps mode"),
-                haystack,
-                buffer,
-            ),
-            MatchMode::GlobalLeftmost => scan_global_leftmost(
-                self.global_leftmost
-                    .as_ref()
-                    .expect("global_leftmost matcher must exist for global_leftmost mode"),
-                haystack,
-                buffer,
-                scan_slot,
-            ),
+        // Projection can merge normalized matches, so a normalized top-k scan
+        // collects every match and keeps the first `n` after projecting.
+        let scan_goal = match goal {
+            ScanGoal::First(_) if self.normalization != NormalizationForm::None => ScanGoal::All,
+            goal => goal,
         };
+        let result = self.scan_normalized(text, scan_slot, buffer, |haystack, buffer| {
+            self.scan_slot_into(haystack, buffer, scan_slot, options.selection, scan_goal)
+        });
+        buffer.stop_at(None);
+        buffer.set_control(None);
         if result.is_err() {
             buffer.clear();
+        } else if let ScanGoal::First(limit) = goal {
+            buffer.truncate(limit);
         }
         result
     }
 
+    fn scan_slot_into(
+        &self,
+        haystack: &[u8],
+        buffer: &mut NativeMatchBuffer,
+        scan_slot: usize,
+        selection: Option<&EntitySelection>,
+        goal: ScanGoal,
+    ) -> Result<()> {
+        match self.match_mode {
+            MatchMode::EntityIndependent => scan_entity_independent(
+                &self.shards,
+                &self.detector_ranks,
+                haystack,
+                buffer,
+                scan_slot,
+                &mut self.mapped_haystack_pool(scan_slot),
+                selection,
+                goal,
+            ),
+            MatchMode::AllOverlaps => {
+                // Overlapping matches are found out of order, so only an
+                // existence check can stop before the final sort.
+                buffer.stop_at((goal == ScanGoal::Any).then_some(1));
+                buffer.set_shard_total(1);
+                buffer.check_interrupt()?;
+                scan_all_overlaps(
+                    self.all_overlaps
+                        .as_ref()
+                        .expect("all_overlaps matcher must exist for all_overlaps mode"),
+                    &self.detector_ranks,
+                    haystack,
+                    buffer,
+                )?;
+                buffer.finish_shard();
+                Ok(())
+            }
+            MatchMode::GlobalLeftmost => {
+                buffer.stop_at(goal.run_limit());
+                buffer.set_shard_total(1);
+                buffer.check_interrupt()?;
+                scan_global_leftmost(
+                    self.global_leftmost
+                        .as_ref()
+                        .expect("global_leftmost matcher must exist for global_leftmost mode"),
+                    &self.detector_ranks,
+                    haystack,
+                    buffer,
+                    scan_slot,
+                )?;
+                buffer.finish_shard();
+                Ok(())
+            }
+        }
+    }
+
     pub fn scan_bytes_leftmost_from_all_overlaps(
         &self,
         haystack: &[u8],
@@ -716,7 +1402,7 @@ impl NativeEngine {
                 ),
             ));
         }
-        std::str::from_utf8(haystack).map_err(|error| {
+        let text = std::str::from_utf8(haystack).map_err(|error| {
             validation(
                 "/scan_bytes/haystack",
                 format!("Bank.scan_bytes_leftmost_from_all_overlaps requires valid UTF-8 input: {error}"),
@@ -725,20 +1411,8 @@ impl NativeEngine {
         let permit = self.scan_limiter.acquire();
         let scan_slot = permit.slot();
 
-        let mut raw = NativeMatchBuffer::new();
-        let result = scan_all_overlaps(
-            self.all_overlaps
-                .as_ref()
-                .expect("all_overlaps matcher must exist for all_overlaps mode"),
-            haystack,
-            &mut raw,
-        )
-        .and_then(|()| {
-            // MatchKind::All can lose ordered-alternation information inside one
-            // detector, so exact leftmost reconstruction currently reuses the
-            // entity-independent shards after measuring raw overlap scan cost.
-            buffer.clear();
-            scan_entity_independent(&self.shards, haystack, buffer, scan_slot)
+        let result = self.scan_normalized(text, scan_slot, buffer, |haystack, buffer| {
+            self.scan_leftmost_from_all_overlaps_slot(haystack, buffer, scan_slot)
         });
         if result.is_err() {
             buffer.clear();
@@ -747,34 +1421,462 @@ impl NativeEngine {
     }
 }
 
-pub(crate) fn validate_scan_input_size(haystack: &[u8]) -> Result<()> {
-    if haystack.len() > MAX_SCAN_INPUT_BYTES {
-        return Err(validation(
-            "/scan_bytes/haystack",
-            format!(
-                "Bank scan input size {} exceeds the configured limit of {MAX_SCAN_INPUT_BYTES} bytes",
-                haystack.len()
-            ),
-        ));
-    }
+impl NativeEngine {
+    fn scan_chunks(
+        &self,
+        haystack: &[u8],
+        max_matches: Option<usize>,
+        options: ScanOptions<'_>,
+        threads: usize,
+        min_chunk_bytes: usize,
+    ) -> Result<NativeMatchBuffer> {
+        validate_scan_threads("scan_bytes_chunked", threads)?;
+        validate_scan_input_size(haystack)?;
+        let text = std::str::from_utf8(haystack).map_err(|error| {
+            validation(
+                "/scan_bytes/haystack",
+                format!("Bank.scan_bytes requires valid UTF-8 input: {error}"),
+            )
+        })?;
+        let cuts = match self.chunk_overlap {
+            Some(_) if threads > 1 => chunk_cuts(
+                haystack,
+                haystack.len().div_ceil(threads).max(min_chunk_bytes),
+            ),
+            _ => Vec::new(),
+        };
+        if cuts.len() < 2 {
+            return self.scan_bytes_with(haystack, max_matches, options);
+        }
+        let overlap = self
+            .chunk_overlap
+            .expect("only banks with a chunk overlap are cut into chunks");
+        let chunks = scan_claimed(cuts.len(), threads, |index| {
+            let start = cuts[index];
+            let end = match cuts.get(index + 1) {
+                Some(&next) => {
+                    let mut end = next.saturating_add(overlap).min(text.len());
+                    while !text.is_char_boundary(end) {
+                        end += 1;
+                    }
+                    end
+                }
+                None => text.len(),
+            };
+            let mut buffer = NativeMatchBuffer::new();
+            self.scan_into(&haystack[start..end], &mut buffer, options, ScanGoal::All)?;
+            Ok(buffer)
+        })?;
+
+        let mut buffer = match max_matches {
+            Some(max_matches) => NativeMatchBuffer::with_match_limit(max_matches)?,
+            None => NativeMatchBuffer::new(),
+        };
+        if !self.stitch_chunks(&cuts, &chunks, &mut buffer)? {
+            self.scan_into(haystack, &mut buffer, options, ScanGoal::All)?;
+        }
+        Ok(buffer)
+    }
+
+    /// Push the chunk matches a serial scan reports, in projected record order.
+    ///
+    /// Every entity shard, or the whole bank in `global_leftmost` mode, emits
+    /// one leftmost run. A run that reaches past a cut is in step with the next
+    /// chunk once that chunk's own run resumes at or before the same offset.
+    /// Returns `false`, leaving the buffer empty, when a chunk's run skipped
+    /// past that offset and only a serial scan knows what it would find there.
+    fn stitch_chunks(
+        &self,
+        cuts: &[usize],
+        chunks: &[NativeMatchBuffer],
+        buffer: &mut NativeMatchBuffer,
+    ) -> Result<bool> {
+        let run_count = match self.match_mode {
+            MatchMode::EntityIndependent => self.entity_detector_starts.len(),
+            _ => 1,
+        };
+        let run_of = |detector_index: u32| match self.match_mode {
+            MatchMode::EntityIndependent => self
+                .entity_detector_starts
+                .partition_point(|&start| start <= detector_index)
+                .saturating_sub(1),
+            _ => 0,
+        };
+        // Where the serial scan resumes each run, and where this chunk's own
+        // search of that run last resumed.
+        let mut serial_ends = vec![0u64; run_count];
+        let mut chunk_ends = vec![0u64; run_count];
+        let mut in_step = vec![true; run_count];
+        for (chunk_index, chunk) in chunks.iter().enumerate() {
+            let chunk_start = cuts[chunk_index] as u64;
+            let next_cut = cuts
+                .get(chunk_index + 1)
+                .map_or(u64::MAX, |&cut| cut as u64);
+            for run in 0..run_count {
+                chunk_ends[run] = chunk_start;
+                in_step[run] = serial_ends[run] <= chunk_start;
+            }
+            for match_index in 0..chunk.len() {
+                let raw_match = chunk
+                    .get(match_index)
+                    .expect("match index is within the buffer");
+                let start = chunk_start + raw_match.start_byte;
+                let end = chunk_start + raw_match.end_byte;
+                if start >= next_cut {
+                    // The next chunk owns matches from its cut onward.
+                    continue;
+                }
+                let run = run_of(raw_match.detector_index);
+                if !in_step[run] {
+                    if start < serial_ends[run] {
+                        // The serial scan was still inside its previous match here.
+                        chunk_ends[run] = end;
+                        continue;
+                    }
+                    if chunk_ends[run] > serial_ends[run] {
+                        buffer.clear();
+                        return Ok(false);
+                    }
+                    in_step[run] = true;
+                }
+                buffer.push(RawMatch::new(raw_match.detector_index, start, end)?)?;
+                serial_ends[run] = end;
+                chunk_ends[run] = end;
+            }
+            for run in 0..run_count {
+                if !in_step[run]
+                    && serial_ends[run] < next_cut
+                    && chunk_ends[run] > serial_ends[run]
+                {
+                    buffer.clear();
+                    return Ok(false);
+                }
+            }
+        }
+        Ok(true)
+    }
+
+    fn scan_leftmost_from_all_overlaps_slot(
+        &self,
+        haystack: &[u8],
+        buffer: &mut NativeMatchBuffer,
+        scan_slot: usize,
+    ) -> Result<()> {
+        let mut raw = NativeMatchBuffer::new();
+        scan_all_overlaps(
+            self.all_overlaps
+                .as_ref()
+                .expect("all_overlaps matcher must exist for all_overlaps mode"),
+            &self.detector_ranks,
+            haystack,
+            &mut raw,
+        )
+        .and_then(|()| {
+            // MatchKind::All can lose ordered-alternation information inside one
+            // detector, so exact leftmost reconstruction currently reuses the
+            // entity-independent shards after measuring raw overlap scan cost.
+            buffer.clear();
+            scan_entity_independent(
+                &self.shards,
+                &self.detector_ranks,
+                haystack,
+                buffer,
+                scan_slot,
+                &mut self.mapped_haystack_pool(scan_slot),
+                None,
+                ScanGoal::All,
+            )
+        })
+    }
+
+    /// Run `scan` over the bank's normalized view of `text`.
+    ///
+    /// Text that is already in the bank's form is scanned as-is. Otherwise the
+    /// scan reads this slot's normalized copy and its match spans are projected
+    /// back onto `text` before returning.
+    fn scan_normalized(
+        &self,
+        text: &str,
+        scan_slot: usize,
+        buffer: &mut NativeMatchBuffer,
+        scan: impl FnOnce(&[u8], &mut NativeMatchBuffer) -> Result<()>,
+    ) -> Result<()> {
+        if self.normalization == NormalizationForm::None {
+            return scan(text.as_bytes(), buffer);
+        }
+        let mut normalized = self.normalized_haystack(scan_slot);
+        if !normalized.normalize(text, self.normalization) {
+            return scan(text.as_bytes(), buffer);
+        }
+        let result = validate_scan_input_size(normalized.as_bytes())
+            .and_then(|()| scan(normalized.as_bytes(), buffer))
+            .and_then(|()| {
+                buffer.project_spans(&self.detector_ranks, |start, end| {
+                    let (start, end) = normalized.original_span(start as usize, end as usize);
+                    (start as u64, end as u64)
+                })
+            });
+        if normalized.capacity() > MAX_RETAINED_MAPPED_HAYSTACK_BYTES {
+            *normalized = NormalizedHaystack::default();
+        }
+        result
+    }
+
+    fn normalized_haystack(&self, scan_slot: usize) -> MutexGuard<'_, NormalizedHaystack> {
+        // Every normalized scan rewrites the buffer before reading it.
+        self.normalized_haystacks
+            .get(scan_slot)
+            .expect("scan limiter returned an invalid normalized haystack slot")
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+    }
+
+    fn mapped_haystack_pool(&self, scan_slot: usize) -> MutexGuard<'_, MappedHaystackPool> {
+        // Every scan rebuilds the variants it reads, so a pool left behind by a
+        // panicking scan is still safe to reuse.
+        self.mapped_haystacks
+            .get(scan_slot)
+            .expect("scan limiter returned an invalid mapped haystack slot")
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+    }
+}
+
+pub(crate) fn validate_scan_input_size(haystack: &[u8]) -> Result<()> {
+    if haystack.len() > MAX_SCAN_INPUT_BYTES {
+        return Err(validation(
+            "/scan_bytes/haystack",
+            format!(
+                "Bank scan input size {} exceeds the configured limit of {MAX_SCAN_INPUT_BYTES} bytes",
+                haystack.len()
+            ),
+        ));
+    }
+    Ok(())
+}
+
+fn validate_scan_threads(method: &str, threads: usize) -> Result<()> {
+    if threads == 0 || threads > MAX_CONCURRENT_SCANS_PER_ENGINE {
+        return Err(validation(
+            format!("/{method}/threads"),
+            format!(
+                "Bank.{method} threads must be between 1 and {MAX_CONCURRENT_SCANS_PER_ENGINE}; got {threads}"
+            ),
+        ));
+    }
     Ok(())
 }
 
+/// Run `scan` for every index below `count` on up to `threads` scoped workers.
+///
+/// Results come back in index order. Workers claim indexes in order and stop
+/// claiming after a failure, so the returned error is the one a sequential
+/// loop would have reported first.
+fn scan_claimed<T: Send>(
+    count: usize,
+    threads: usize,
+    scan: impl Fn(usize) -> Result<T> + Sync,
+) -> Result<Vec<T>> {
+    let workers = threads.min(count);
+    if workers <= 1 {
+        return (0..count).map(&scan).collect();
+    }
+
+    let next_index = AtomicUsize::new(0);
+    let first_error = AtomicUsize::new(usize::MAX);
+    let mut slots: Vec<Option<Result<T>>> = (0..count).map(|_| None).collect();
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = (0..workers)
+            .map(|_| {
+                scope.spawn(|| {
+                    let mut scanned = Vec::new();
+                    loop {
+                        let index = next_index.fetch_add(1, AtomicOrdering::Relaxed);
+                        if index >= count || index > first_error.load(AtomicOrdering::Relaxed) {
+                            break;
+                        }
+                        let result = scan(index);
+                        if result.is_err() {
+                            first_error.fetch_min(index, AtomicOrdering::Relaxed);
+                        }
+                        scanned.push((index, result));
+                    }
+                    scanned
+                })
+            })
+            .collect();
+        for handle in handles {
+            let scanned = handle
+                .join()
+                .unwrap_or_else(|payload| std::panic::resume_unwind(payload));
+            for (index, result) in scanned {
+                slots[index] = Some(result);
+            }
+        }
+    });
+    // Every index below the first failure was claimed and scanned, so
+    // collection stops at that failure before reaching an unclaimed slot.
+    slots
+        .into_iter()
+        .map(|slot| slot.expect("workers claimed every index before the first failure"))
+        .collect()
+}
+
+/// Return chunk starts for cutting `haystack` about every `chunk_bytes`, which must be positive.
+///
+/// Every start after the first follows ASCII whitespace and precedes a byte
+/// that is not whitespace. It is a UTF-8 boundary, word-boundary assertions
+/// see a non-word character on both sides of it, and it never splits a run of
+/// whitespace. A haystack without such a position past `chunk_bytes` stays whole.
+fn chunk_cuts(haystack: &[u8], chunk_bytes: usize) -> Vec<usize> {
+    let mut cuts = vec![0];
+    let mut target = chunk_bytes;
+    while target < haystack.len() {
+        let Some(offset) = haystack[target - 1..]
+            .windows(2)
+            .position(|pair| pair[0].is_ascii_whitespace() && !pair[1].is_ascii_whitespace())
+        else {
+            break;
+        };
+        let cut = target + offset;
+        cuts.push(cut);
+        target = cut + chunk_bytes;
+    }
+    cuts
+}
+
+/// Bytes a chunk must read past the next chunk's start so that it finds every
+/// match starting inside it, or `None` when the bank cannot scan in chunks.
+///
+/// A chunk's scan only matches like the serial scan when every detector has a
+/// longest match, cannot match the empty string, and does not anchor to the
+/// start of the text or of a line, which a cut would fake. Overlapping and
+/// normalized scans are never chunked.
+fn chunk_scan_overlap(
+    canonical: &CanonicalBank,
+    match_mode: MatchMode,
+    normalization: NormalizationForm,
+) -> Result<Option<usize>> {
+    if match_mode == MatchMode::AllOverlaps || normalization != NormalizationForm::None {
+        return Ok(None);
+    }
+    let mut longest = 0;
+    for entity in &canonical.entities {
+        for (pattern_index, pattern) in entity.patterns.iter().enumerate() {
+            let hir = parse_pattern_with_flags(
+                &entity.name,
+                pattern_index,
+                &pattern.regex,
+                &pattern.flags,
+            )?;
+            let properties = hir.properties();
+            let looks = properties.look_set();
+            if properties.minimum_len() == Some(0)
+                || looks.contains(Look::Start)
+                || looks.contains(Look::StartLF)
+                || looks.contains(Look::StartCRLF)
+            {
+                return Ok(None);
+            }
+            let Some(maximum_len) = properties.maximum_len() else {
+                return Ok(None);
+            };
+            longest = longest.max(maximum_len);
+        }
+    }
+    Ok(Some(longest + CHUNK_LOOKAHEAD_BYTES))
+}
+
 fn scan_entity_independent(
     shards: &[MatcherShard],
+    detector_ranks: &[u32],
     haystack: &[u8],
     buffer: &mut NativeMatchBuffer,
     scan_slot: usize,
+    mapped_haystacks: &mut MappedHaystackPool,
+    selection: Option<&EntitySelection>,
+    goal: ScanGoal,
 ) -> Result<()> {
-    for shard in shards {
+    let mut haystack = ScanHaystack::new(haystack, mapped_haystacks);
+    // Every shard emits one leftmost run in ascending start order, so the
+    // shard runs are merged instead of re-sorting the whole buffer.
+    let mut run_starts = Vec::with_capacity(shards.len());
+    let is_selected =
+        |entity_index: usize| selection.is_none_or(|selection| selection.contains(entity_index));
+    buffer.set_shard_total(
+        (0..shards.len())
+            .filter(|&index| is_selected(index))
+            .count(),
+    );
+    for (entity_index, shard) in shards.iter().enumerate() {
+        // Shards are built one per entity in canonical order, so an unselected
+        // entity is skipped before it reads or maps the haystack.
+        if !is_selected(entity_index) {
+            continue;
+        }
+        let run_start = buffer.len();
+        if goal == ScanGoal::Any && run_start > 0 {
+            break;
+        }
+        // Deadlines and cancellation are checked between shards as well as
+        // between the search windows and every few matches inside one.
+        buffer.check_interrupt()?;
+        run_starts.push(run_start);
+        // The first `n` merged matches take at most `n` from any one run.
+        buffer.stop_at(
+            goal.run_limit()
+                .map(|limit| run_start.saturating_add(limit)),
+        );
         match shard {
-            MatcherShard::Regex(shard) => scan_regex_shard(shard, haystack, buffer, scan_slot)?,
-            MatcherShard::Literal(shard) => scan_literal_shard(shard, haystack, buffer)?,
-            MatcherShard::Layered(shard) => scan_layered_shard(shard, haystack, buffer, scan_slot)?,
+            MatcherShard::Regex(shard) => {
+                scan_regex_shard(shard, haystack.bytes, buffer, scan_slot)?
+            }
+            MatcherShard::Literal(shard) => scan_literal_shard(shard, &mut haystack, buffer)?,
+            MatcherShard::Layered(shard) => {
+                scan_layered_shard(shard, &mut haystack, buffer, scan_slot)?
+            }
         }
+        buffer.finish_shard();
+    }
+    buffer.merge_sorted_runs(&run_starts, detector_ranks)
+}
+
+/// Find the leftmost match starting at or after `cursor`, one window of
+/// [`SCAN_WINDOW_BYTES`] at a time, and check the scan's deadline and
+/// cancellation between windows.
+///
+/// `overlap` bounds a match's length. Each window's search reads that far past
+/// the window so a match starting inside it ends inside the span, and a match
+/// the span finds further on is left for the next window, which finds the same
+/// leftmost match as one search over the rest of the haystack. Spans keep the
+/// surrounding bytes visible to look-around assertions. Without a bound the
+/// search covers the rest of the haystack at once.
+fn search_windows<M>(
+    haystack_len: usize,
+    cursor: usize,
+    overlap: Option<usize>,
+    buffer: &mut NativeMatchBuffer,
+    mut search: impl FnMut(Range<usize>) -> Option<M>,
+    match_start: impl Fn(&M) -> usize,
+) -> Result<Option<M>> {
+    let Some(overlap) = overlap else {
+        return Ok(search(cursor..haystack_len));
+    };
+    let mut window_start = cursor;
+    loop {
+        let window_end = window_start.saturating_add(SCAN_WINDOW_BYTES);
+        let span_end = window_end.saturating_add(overlap);
+        if span_end >= haystack_len {
+            return Ok(search(window_start..haystack_len));
+        }
+        if let Some(found) = search(window_start..span_end) {
+            if match_start(&found) < window_end {
+                return Ok(Some(found));
+            }
+        }
+        window_start = window_end;
+        buffer.check_interrupt()?;
     }
-    buffer.sort();
-    Ok(())
 }
 
 fn scan_regex_shard(
@@ -803,19 +1905,35 @@ fn scan_regex_shard(
 
 fn scan_literal_shard(
     shard: &LiteralMatcherShard,
-    haystack: &[u8],
+    scan_haystack: &mut ScanHaystack<'_>,
     buffer: &mut NativeMatchBuffer,
 ) -> Result<()> {
-    let haystack_text = std::str::from_utf8(haystack)
-        .expect("scan_bytes_into validates UTF-8 before literal dispatch");
-    let mapped = (shard.case_insensitive && requires_ascii_casefold_mapping(haystack_text))
-        .then(|| map_haystack(haystack_text, false, true));
+    if shard.case_insensitive {
+        scan_haystack.prepare(HaystackMapping::AsciiCasefold);
+    }
+    let haystack = scan_haystack.bytes;
+    let mapped = shard
+        .case_insensitive
+        .then(|| scan_haystack.mapped(HaystackMapping::AsciiCasefold))
+        .flatten();
     let matcher_haystack = mapped
-        .as_ref()
         .map(|mapped| mapped.bytes.as_slice())
         .unwrap_or(haystack);
 
-    for raw_match in shard.matcher.find_iter(matcher_haystack) {
+    let mut cursor = 0;
+    while let Some(raw_match) = search_windows(
+        matcher_haystack.len(),
+        cursor,
+        Some(shard.matcher.max_pattern_len()),
+        buffer,
+        |span| {
+            shard
+                .matcher
+                .find(AhoInput::new(matcher_haystack).span(span))
+        },
+        |raw_match| raw_match.start(),
+    )? {
+        cursor = raw_match.end();
         let local_index = raw_match.pattern().as_usize();
         let Some(&detector_index) = shard.local_to_detector.get(local_index) else {
             return Err(validation(
@@ -825,7 +1943,7 @@ fn scan_literal_shard(
                 ),
             ));
         };
-        let (start, end) = match &mapped {
+        let (start, end) = match mapped {
             Some(mapped) => (
                 mapped.original_boundary(raw_match.start()).ok_or_else(|| {
                     validation(
@@ -843,30 +1961,46 @@ fn scan_literal_shard(
             None => (raw_match.start(), raw_match.end()),
         };
         push_utf8_match(buffer, haystack, detector_index, start as u64, end as u64)?;
+        if buffer.is_stopped() {
+            break;
+        }
     }
     Ok(())
 }
 
 fn scan_layered_shard(
     shard: &LayeredMatcherShard,
-    haystack: &[u8],
+    scan_haystack: &mut ScanHaystack<'_>,
     buffer: &mut NativeMatchBuffer,
     scan_slot: usize,
 ) -> Result<()> {
-    let haystack_text = std::str::from_utf8(haystack)
-        .expect("scan_bytes_into validates UTF-8 before dispatching to the layered matcher");
-    let needs_casefold_mapping = requires_ascii_casefold_mapping(haystack_text);
-    let needs_whitespace_mapping = requires_whitespace_mapping(haystack_text);
-    let casefold_haystack = (needs_casefold_mapping
-        && !shard.ascii_case_insensitive_literals.is_empty())
-    .then(|| map_haystack(haystack_text, false, true));
-    let normalized_case_sensitive_haystack = (needs_whitespace_mapping
-        && !shard.normalized_case_sensitive_literals.is_empty())
-    .then(|| map_haystack(haystack_text, true, false));
-    let normalized_case_insensitive_haystack = ((needs_whitespace_mapping
-        || needs_casefold_mapping)
-        && !shard.normalized_ascii_case_insensitive_literals.is_empty())
-    .then(|| map_haystack(haystack_text, true, true));
+    let layer_mappings = [
+        (
+            &shard.ascii_case_insensitive_literals,
+            HaystackMapping::AsciiCasefold,
+        ),
+        (
+            &shard.normalized_case_sensitive_literals,
+            HaystackMapping::NormalizedWhitespace,
+        ),
+        (
+            &shard.normalized_ascii_case_insensitive_literals,
+            HaystackMapping::NormalizedAsciiCasefold,
+        ),
+    ];
+    for (layers, mapping) in layer_mappings {
+        if !layers.is_empty() {
+            scan_haystack.prepare(mapping);
+        }
+    }
+    let scan_haystack = &*scan_haystack;
+    let haystack = scan_haystack.bytes;
+    let haystack_text = scan_haystack.text;
+    let casefold_haystack = scan_haystack.mapped(HaystackMapping::AsciiCasefold);
+    let normalized_case_sensitive_haystack =
+        scan_haystack.mapped(HaystackMapping::NormalizedWhitespace);
+    let normalized_case_insensitive_haystack =
+        scan_haystack.mapped(HaystackMapping::NormalizedAsciiCasefold);
 
     let mut cursor = 0;
     let mut case_sensitive_without_left_boundary = next_literal_candidate(
@@ -875,6 +2009,7 @@ fn scan_layered_shard(
         haystack,
         haystack_text,
         cursor,
+        buffer,
     )?;
     let mut case_sensitive_with_left_boundary = next_literal_candidate(
         &shard.entity,
@@ -882,6 +2017,7 @@ fn scan_layered_shard(
         haystack,
         haystack_text,
         cursor,
+        buffer,
     )?;
     let mut case_insensitive_without_left_boundary = next_literal_candidate_with_mapping(
         &shard.entity,
@@ -891,8 +2027,9 @@ fn scan_layered_shard(
             .as_ref(),
         haystack,
         haystack_text,
-        casefold_haystack.as_ref(),
+        casefold_haystack,
         cursor,
+        buffer,
     )?;
     let mut case_insensitive_with_left_boundary = next_literal_candidate_with_mapping(
         &shard.entity,
@@ -902,8 +2039,9 @@ fn scan_layered_shard(
             .as_ref(),
         haystack,
         haystack_text,
-        casefold_haystack.as_ref(),
+        casefold_haystack,
         cursor,
+        buffer,
     )?;
     let mut normalized_case_sensitive_without_left_boundary = next_literal_candidate_with_mapping(
         &shard.entity,
@@ -913,8 +2051,9 @@ fn scan_layered_shard(
             .as_ref(),
         haystack,
         haystack_text,
-        normalized_case_sensitive_haystack.as_ref(),
+        normalized_case_sensitive_haystack,
         cursor,
+        buffer,
     )?;
     let mut normalized_case_sensitive_with_left_boundary = next_literal_candidate_with_mapping(
         &shard.entity,
@@ -924,8 +2063,9 @@ fn scan_layered_shard(
             .as_ref(),
         haystack,
         haystack_text,
-        normalized_case_sensitive_haystack.as_ref(),
+        normalized_case_sensitive_haystack,
         cursor,
+        buffer,
     )?;
     let mut normalized_case_insensitive_without_left_boundary =
         next_literal_candidate_with_mapping(
@@ -936,8 +2076,9 @@ fn scan_layered_shard(
                 .as_ref(),
             haystack,
             haystack_text,
-            normalized_case_insensitive_haystack.as_ref(),
+            normalized_case_insensitive_haystack,
             cursor,
+            buffer,
         )?;
     let mut normalized_case_insensitive_with_left_boundary = next_literal_candidate_with_mapping(
         &shard.entity,
@@ -947,13 +2088,23 @@ fn scan_layered_shard(
             .as_ref(),
         haystack,
         haystack_text,
-        normalized_case_insensitive_haystack.as_ref(),
+        normalized_case_insensitive_haystack,
         cursor,
+        buffer,
     )?;
     let mut residual_candidates = shard
         .residual_regex_layers
         .iter()
-        .map(|layer| next_regex_candidate(&shard.entity, Some(layer), haystack, cursor, scan_slot))
+        .map(|layer| {
+            next_regex_candidate(
+                &shard.entity,
+                Some(layer),
+                haystack,
+                cursor,
+                buffer,
+                scan_slot,
+            )
+        })
         .collect::<Result<Vec<_>>>()?;
 
     loop {
@@ -984,6 +2135,9 @@ fn scan_layered_shard(
             winner.start as u64,
             winner.end as u64,
         )?;
+        if buffer.is_stopped() {
+            break;
+        }
         cursor = winner.end;
 
         // Keep a losing candidate when it starts beyond the consumed span.
@@ -996,6 +2150,7 @@ fn scan_layered_shard(
                 haystack,
                 haystack_text,
                 cursor,
+                buffer,
             )?;
         }
         if candidate_precedes_cursor(case_sensitive_with_left_boundary, cursor) {
@@ -1005,6 +2160,7 @@ fn scan_layered_shard(
                 haystack,
                 haystack_text,
                 cursor,
+                buffer,
             )?;
         }
         if candidate_precedes_cursor(case_insensitive_without_left_boundary, cursor) {
@@ -1016,8 +2172,9 @@ fn scan_layered_shard(
                     .as_ref(),
                 haystack,
                 haystack_text,
-                casefold_haystack.as_ref(),
+                casefold_haystack,
                 cursor,
+                buffer,
             )?;
         }
         if candidate_precedes_cursor(case_insensitive_with_left_boundary, cursor) {
@@ -1029,8 +2186,9 @@ fn scan_layered_shard(
                     .as_ref(),
                 haystack,
                 haystack_text,
-                casefold_haystack.as_ref(),
+                casefold_haystack,
                 cursor,
+                buffer,
             )?;
         }
         if candidate_precedes_cursor(normalized_case_sensitive_without_left_boundary, cursor) {
@@ -1042,8 +2200,9 @@ fn scan_layered_shard(
                     .as_ref(),
                 haystack,
                 haystack_text,
-                normalized_case_sensitive_haystack.as_ref(),
+                normalized_case_sensitive_haystack,
                 cursor,
+                buffer,
             )?;
         }
         if candidate_precedes_cursor(normalized_case_sensitive_with_left_boundary, cursor) {
@@ -1055,8 +2214,9 @@ fn scan_layered_shard(
                     .as_ref(),
                 haystack,
                 haystack_text,
-                normalized_case_sensitive_haystack.as_ref(),
+                normalized_case_sensitive_haystack,
                 cursor,
+                buffer,
             )?;
         }
         if candidate_precedes_cursor(normalized_case_insensitive_without_left_boundary, cursor) {
@@ -1069,8 +2229,9 @@ fn scan_layered_shard(
                         .as_ref(),
                     haystack,
                     haystack_text,
-                    normalized_case_insensitive_haystack.as_ref(),
+                    normalized_case_insensitive_haystack,
                     cursor,
+                    buffer,
                 )?;
         }
         if candidate_precedes_cursor(normalized_case_insensitive_with_left_boundary, cursor) {
@@ -1082,8 +2243,9 @@ fn scan_layered_shard(
                     .as_ref(),
                 haystack,
                 haystack_text,
-                normalized_case_insensitive_haystack.as_ref(),
+                normalized_case_insensitive_haystack,
                 cursor,
+                buffer,
             )?;
         }
         for (layer, candidate) in shard
@@ -1092,8 +2254,14 @@ fn scan_layered_shard(
             .zip(&mut residual_candidates)
         {
             if candidate_precedes_cursor(*candidate, cursor) {
-                *candidate =
-                    next_regex_candidate(&shard.entity, Some(layer), haystack, cursor, scan_slot)?;
+                *candidate = next_regex_candidate(
+                    &shard.entity,
+                    Some(layer),
+                    haystack,
+                    cursor,
+                    buffer,
+                    scan_slot,
+                )?;
             }
         }
     }
@@ -1112,13 +2280,16 @@ fn candidate_precedes_cursor(candidate: Option<LayerCandidate>, cursor: usize) -
         .unwrap_or(false)
 }
 
-fn map_haystack(
+fn map_haystack_into(
     haystack: &str,
     normalize_whitespace: bool,
     ascii_casefold: bool,
-) -> MappedHaystack {
-    let mut bytes = Vec::with_capacity(haystack.len());
-    let mut checkpoints = Vec::new();
+    mapped: &mut MappedHaystack,
+) {
+    let MappedHaystack { bytes, checkpoints } = mapped;
+    bytes.clear();
+    bytes.reserve(haystack.len());
+    checkpoints.clear();
     let mut characters = haystack.char_indices().peekable();
     while let Some((start, character)) = characters.next() {
         if normalize_whitespace && is_regex_unicode_whitespace(character) {
@@ -1152,12 +2323,10 @@ fn map_haystack(
         let encoded = character.encode_utf8(&mut encoded_buffer).as_bytes();
         bytes.extend_from_slice(encoded);
     }
-    let mapped = MappedHaystack { bytes, checkpoints };
     debug_assert_eq!(
         mapped.original_boundary(mapped.bytes.len()),
         Some(haystack.len())
     );
-    mapped
 }
 
 fn is_regex_unicode_whitespace(character: char) -> bool {
@@ -1211,6 +2380,7 @@ fn next_mapped_literal_candidate(
     layer: Option<&LiteralMatcherLayer>,
     mapped: &MappedHaystack,
     cursor: usize,
+    buffer: &mut NativeMatchBuffer,
 ) -> Result<Option<LayerCandidate>> {
     let Some(layer) = layer else {
         return Ok(None);
@@ -1224,6 +2394,7 @@ fn next_mapped_literal_candidate(
         &mapped.bytes,
         mapped_text,
         mapped_cursor,
+        buffer,
     )?
     else {
         return Ok(None);
@@ -1254,10 +2425,11 @@ fn next_literal_candidate_with_mapping(
     haystack_text: &str,
     mapped: Option<&MappedHaystack>,
     cursor: usize,
+    buffer: &mut NativeMatchBuffer,
 ) -> Result<Option<LayerCandidate>> {
     match mapped {
-        Some(mapped) => next_mapped_literal_candidate(entity, layer, mapped, cursor),
-        None => next_literal_candidate(entity, layer, haystack, haystack_text, cursor),
+        Some(mapped) => next_mapped_literal_candidate(entity, layer, mapped, cursor, buffer),
+        None => next_literal_candidate(entity, layer, haystack, haystack_text, cursor, buffer),
     }
 }
 
@@ -1267,20 +2439,26 @@ fn next_literal_candidate(
     haystack: &[u8],
     haystack_text: &str,
     cursor: usize,
+    buffer: &mut NativeMatchBuffer,
 ) -> Result<Option<LayerCandidate>> {
     let Some(layer) = layer else {
         return Ok(None);
     };
     let mut search_cursor = cursor;
     loop {
-        let Some(raw_match) = layer
-            .matcher
-            .find(AhoInput::new(haystack).span(search_cursor..haystack.len()))
+        let Some(raw_match) = search_windows(
+            haystack.len(),
+            search_cursor,
+            Some(layer.matcher.max_pattern_len()),
+            buffer,
+            |span| layer.matcher.find(AhoInput::new(haystack).span(span)),
+            |raw_match| raw_match.start(),
+        )?
         else {
             return Ok(None);
         };
         let local_index = raw_match.pattern().as_usize();
-        let Some(pattern) = layer.patterns.get(local_index) else {
+        let Some(pattern) = layer.literals.get(local_index) else {
             return Err(validation(
                 format!("/engine/shards/{entity}/literal/patterns"),
                 format!(
@@ -1289,7 +2467,8 @@ fn next_literal_candidate(
             ));
         };
         if literal_boundaries_match(
-            &pattern.literal,
+            pattern.left_unicode_word_boundary,
+            pattern.right_unicode_word_boundary,
             haystack_text,
             raw_match.start(),
             raw_match.end(),
@@ -1333,13 +2512,13 @@ fn indexed_valid_literal_at_start(
         // partitions narrow the range without inspecting the whole layer.
         let lower = current_range.partition_point(|&local_index| {
             lookup.index_comparisons += 1;
-            let literal = layer.patterns[local_index].literal.value.as_bytes();
+            let literal = layer.literals.bytes(local_index as usize);
             literal.len() <= offset
                 || normalized_literal_byte(literal[offset], layer.case_insensitive) < target
         });
         let upper = current_range.partition_point(|&local_index| {
             lookup.index_comparisons += 1;
-            let literal = layer.patterns[local_index].literal.value.as_bytes();
+            let literal = layer.literals.bytes(local_index as usize);
             literal.len() <= offset
                 || normalized_literal_byte(literal[offset], layer.case_insensitive) <= target
         });
@@ -1352,14 +2531,20 @@ fn indexed_valid_literal_at_start(
 
         let matched_len = offset + 1;
         for &local_index in &layer.prefix_index.sorted_pattern_indices[range_start..range_end] {
-            let pattern = &layer.patterns[local_index];
-            let literal_len = pattern.literal.value.len();
+            let pattern = layer.literals.literal(local_index as usize);
+            let literal_len = pattern.value.len();
             if literal_len != matched_len {
                 break;
             }
             lookup.terminal_candidates_examined += 1;
             let end = start + literal_len;
-            if !literal_boundaries_match(&pattern.literal, haystack_text, start, end) {
+            if !literal_boundaries_match(
+                pattern.left_unicode_word_boundary,
+                pattern.right_unicode_word_boundary,
+                haystack_text,
+                start,
+                end,
+            ) {
                 continue;
             }
             let candidate = LayerCandidate {
@@ -1389,13 +2574,14 @@ fn normalized_literal_byte(byte: u8, case_insensitive: bool) -> u8 {
 }
 
 fn literal_boundaries_match(
-    literal: &SimpleLiteralPattern,
+    left_unicode_word_boundary: bool,
+    right_unicode_word_boundary: bool,
     haystack: &str,
     start: usize,
     end: usize,
 ) -> bool {
-    (!literal.left_unicode_word_boundary || is_unicode_word_boundary(haystack, start))
-        && (!literal.right_unicode_word_boundary || is_unicode_word_boundary(haystack, end))
+    (!left_unicode_word_boundary || is_unicode_word_boundary(haystack, start))
+        && (!right_unicode_word_boundary || is_unicode_word_boundary(haystack, end))
 }
 
 fn is_unicode_word_boundary(haystack: &str, at: usize) -> bool {
@@ -1439,14 +2625,27 @@ fn next_regex_candidate(
     layer: Option<&RegexMatcherLayer>,
     haystack: &[u8],
     cursor: usize,
+    buffer: &mut NativeMatchBuffer,
     scan_slot: usize,
 ) -> Result<Option<LayerCandidate>> {
     let Some(layer) = layer else {
         return Ok(None);
     };
     let mut cache = layer.regex.cache(scan_slot);
-    let input = Input::new(haystack).span(cursor..haystack.len());
-    let Some(raw_match) = layer.regex.regex.search_with(&mut cache, &input) else {
+    let Some(raw_match) = search_windows(
+        haystack.len(),
+        cursor,
+        layer.regex.window_overlap,
+        buffer,
+        |span| {
+            layer
+                .regex
+                .regex
+                .search_with(&mut cache, &Input::new(haystack).span(span))
+        },
+        |raw_match| raw_match.start(),
+    )?
+    else {
         return Ok(None);
     };
     layer_candidate(
@@ -1477,7 +2676,7 @@ fn scan_regex_layers_leftmost(
     let mut cursor = 0;
     let mut candidates = layers
         .iter()
-        .map(|layer| next_regex_candidate(entity, Some(layer), haystack, cursor, scan_slot))
+        .map(|layer| next_regex_candidate(entity, Some(layer), haystack, cursor, buffer, scan_slot))
         .collect::<Result<Vec<_>>>()?;
 
     loop {
@@ -1496,12 +2695,15 @@ fn scan_regex_layers_leftmost(
             winner.start as u64,
             winner.end as u64,
         )?;
+        if buffer.is_stopped() {
+            break;
+        }
         cursor = winner.end;
 
         for (layer, candidate) in layers.iter().zip(&mut candidates) {
             if candidate_precedes_cursor(*candidate, cursor) {
                 *candidate =
-                    next_regex_candidate(entity, Some(layer), haystack, cursor, scan_slot)?;
+                    next_regex_candidate(entity, Some(layer), haystack, cursor, buffer, scan_slot)?;
             }
         }
     }
@@ -1553,9 +2755,7 @@ fn scan_regex_matches(
 ) -> Result<()> {
     let mut cache = regex.cache(scan_slot);
     let mut searcher = Searcher::new(Input::new(haystack));
-    while let Some(raw_match) =
-        searcher.advance(|input| Ok::<_, MatchError>(regex.regex.search_with(&mut cache, input)))
-    {
+    while let Some(raw_match) = advance_windowed(&mut searcher, regex, &mut cache, buffer)? {
         let local_index = raw_match.pattern().as_usize();
         let Some(&detector_index) = local_to_detector.get(local_index) else {
             return Err(validation(
@@ -1572,12 +2772,43 @@ fn scan_regex_matches(
             raw_match.start() as u64,
             raw_match.end() as u64,
         )?;
+        if buffer.is_stopped() {
+            break;
+        }
     }
     Ok(())
 }
 
+/// Advance `searcher` to its next match, searching in [`search_windows`].
+fn advance_windowed(
+    searcher: &mut Searcher<'_>,
+    regex: &CachedRegex,
+    cache: &mut RegexCache,
+    buffer: &mut NativeMatchBuffer,
+) -> Result<Option<RegexMatch>> {
+    // The searcher's callback can only fail with a `MatchError`, so an
+    // interrupted window ends the search and its error is returned here.
+    let mut interrupted = Ok(());
+    let found = searcher.advance(|input| {
+        let found = search_windows(
+            input.end(),
+            input.start(),
+            regex.window_overlap,
+            buffer,
+            |span| regex.regex.search_with(cache, &input.clone().span(span)),
+            |raw_match| raw_match.start(),
+        );
+        Ok::<_, MatchError>(found.unwrap_or_else(|error| {
+            interrupted = Err(error);
+            None
+        }))
+    });
+    interrupted.map(|()| found)
+}
+
 fn scan_all_overlaps(
     matcher: &AllOverlapsMatcher,
+    detector_ranks: &[u32],
     haystack: &[u8],
     buffer: &mut NativeMatchBuffer,
 ) -> Result<()> {
@@ -1644,21 +2875,24 @@ fn scan_all_overlaps(
                 "all_overlaps reverse search failed to recover a match start",
             ));
         }
+        if buffer.is_stopped() {
+            break;
+        }
     }
-    buffer.sort();
+    buffer.sort_by_rank(detector_ranks);
     Ok(())
 }
 
 fn scan_global_leftmost(
     matcher: &GlobalLeftmostMatcher,
+    detector_ranks: &[u32],
     haystack: &[u8],
     buffer: &mut NativeMatchBuffer,
     scan_slot: usize,
 ) -> Result<()> {
     let mut cache = matcher.regex.cache(scan_slot);
     let mut searcher = Searcher::new(Input::new(haystack));
-    while let Some(raw_match) = searcher
-        .advance(|input| Ok::<_, MatchError>(matcher.regex.regex.search_with(&mut cache, input)))
+    while let Some(raw_match) = advance_windowed(&mut searcher, &matcher.regex, &mut cache, buffer)?
     {
         let local_index = raw_match.pattern().as_usize();
         let Some(&detector_index) = matcher.local_to_detector.get(local_index) else {
@@ -1676,8 +2910,11 @@ fn scan_global_leftmost(
             raw_match.start() as u64,
             raw_match.end() as u64,
         )?;
+        if buffer.is_stopped() {
+            break;
+        }
     }
-    buffer.sort();
+    buffer.sort_by_rank(detector_ranks);
     Ok(())
 }
 
@@ -1718,27 +2955,49 @@ fn push_utf8_match(
     Ok(())
 }
 
-fn detector_metadata(canonical: &CanonicalBank) -> Result<Vec<DetectorMetadata>> {
-    let mut detectors = Vec::new();
+/// Rank detectors by `(entity, canonical_name, surface_name)` so raw matches
+/// sharing a span come back in the same order as projected Python records.
+fn detector_tie_ranks(canonical: &CanonicalBank) -> Vec<u32> {
+    let mut order = canonical
+        .entities
+        .iter()
+        .flat_map(|entity| {
+            entity.patterns.iter().map(move |pattern| {
+                (
+                    entity.name.as_str(),
+                    pattern.canonical_name.as_str(),
+                    pattern.surface_name.as_str(),
+                )
+            })
+        })
+        .zip(0u32..)
+        .collect::<Vec<_>>();
+    order.sort_by(|(left, _), (right, _)| left.cmp(right));
+    let mut ranks = vec![0; order.len()];
+    for (rank, (_, index)) in order.into_iter().enumerate() {
+        // entity_detector_starts already bounds the detector count to u32.
+        ranks[index as usize] = rank as u32;
+    }
+    ranks
+}
+
+/// Return the first detector index of every entity plus the detector count.
+fn entity_detector_starts(canonical: &CanonicalBank) -> Result<(Vec<u32>, u32)> {
+    let mut starts = Vec::with_capacity(canonical.entities.len());
+    let mut next_detector_index = 0u32;
     for entity in &canonical.entities {
-        for pattern in &entity.patterns {
-            let detector_index = u32::try_from(detectors.len()).map_err(|_| {
+        starts.push(next_detector_index);
+        next_detector_index = u32::try_from(entity.patterns.len())
+            .ok()
+            .and_then(|count| next_detector_index.checked_add(count))
+            .ok_or_else(|| {
                 validation(
                     "/entities",
                     "detector count exceeds u32::MAX and cannot be represented in raw matches",
                 )
             })?;
-            detectors.push(DetectorMetadata {
-                detector_index,
-                entity: entity.name.clone(),
-                canonical_name: pattern.canonical_name.clone(),
-                surface_name: pattern.surface_name.clone(),
-                stable_id: pattern.stable_id.clone(),
-                priority: pattern.priority,
-            });
-        }
     }
-    Ok(detectors)
+    Ok((starts, next_detector_index))
 }
 
 fn compile_all_overlaps(canonical: &CanonicalBank) -> Result<AllOverlapsMatcher> {
@@ -1888,13 +3147,14 @@ fn compile_global_leftmost(canonical: &CanonicalBank) -> Result<GlobalLeftmostMa
         })?;
 
     Ok(GlobalLeftmostMatcher {
-        regex: CachedRegex::new(regex),
+        regex: CachedRegex::new(regex, &patterns),
         local_to_detector,
     })
 }
 
 fn compile_entity_independent(
     canonical: &CanonicalBank,
+    literal_matcher: LiteralMatcher,
 ) -> Result<(Vec<MatcherShard>, RegexResourceProfile)> {
     let mut shards = Vec::with_capacity(canonical.entities.len());
     let mut next_detector_index = 0u32;
@@ -1958,7 +3218,7 @@ fn compile_entity_independent(
             MatcherShard::Regex(RegexMatcherShard {
                 entity: entity.name.clone(),
                 matcher: RegexShardMatcher::Monolithic {
-                    regex: CachedRegex::new(regex),
+                    regex: CachedRegex::new(regex, &patterns),
                     local_to_detector,
                 },
             })
@@ -1994,6 +3254,8 @@ fn compile_entity_independent(
             })
         {
             let case_insensitive = first_literal_case.expect("the entity has literal patterns");
+            // Release the parsed HIR before the automaton build needs its memory.
+            drop(patterns);
             MatcherShard::Literal(compile_literal_shard(
                 &entity.name,
                 literal_patterns
@@ -2006,6 +3268,7 @@ fn compile_entity_independent(
                     .collect(),
                 case_insensitive,
                 local_to_detector,
+                literal_matcher,
             )?)
         } else {
             MatcherShard::Layered(compile_layered_shard(
@@ -2014,6 +3277,7 @@ fn compile_entity_independent(
                 literal_patterns,
                 normalized_whitespace_patterns,
                 local_to_detector,
+                literal_matcher,
                 &mut regex_budget,
             )?)
         };
@@ -2029,6 +3293,7 @@ fn compile_layered_shard(
     literal_patterns: Vec<Option<SimpleLiteralPattern>>,
     normalized_whitespace_patterns: Vec<Option<SimpleLiteralPattern>>,
     local_to_detector: Vec<u32>,
+    literal_matcher: LiteralMatcher,
     regex_budget: &mut RegexResourceBudget,
 ) -> Result<LayeredMatcherShard> {
     let mut case_sensitive_patterns = Vec::new();
@@ -2089,21 +3354,25 @@ fn compile_layered_shard(
             entity_name,
             case_sensitive_patterns,
             false,
+            literal_matcher,
         )?,
         ascii_case_insensitive_literals: compile_literal_layers(
             entity_name,
             case_insensitive_patterns,
             true,
+            literal_matcher,
         )?,
         normalized_case_sensitive_literals: compile_literal_layers(
             entity_name,
             normalized_case_sensitive_patterns,
             false,
+            literal_matcher,
         )?,
         normalized_ascii_case_insensitive_literals: compile_literal_layers(
             entity_name,
             normalized_case_insensitive_patterns,
             true,
+            literal_matcher,
         )?,
         residual_regex_layers: if residual_patterns.is_empty() {
             Vec::new()
@@ -2123,6 +3392,7 @@ fn compile_literal_layers(
     entity_name: &str,
     patterns: Vec<LayerLiteralPattern>,
     case_insensitive: bool,
+    literal_matcher: LiteralMatcher,
 ) -> Result<LiteralMatcherLayers> {
     let mut without_left_boundary = Vec::new();
     let mut with_left_boundary = Vec::new();
@@ -2139,12 +3409,14 @@ fn compile_literal_layers(
             without_left_boundary,
             case_insensitive,
             false,
+            literal_matcher,
         )?,
         with_left_boundary: compile_literal_layer(
             entity_name,
             with_left_boundary,
             case_insensitive,
             true,
+            literal_matcher,
         )?,
     })
 }
@@ -2154,6 +3426,7 @@ fn compile_literal_layer(
     patterns: Vec<LayerLiteralPattern>,
     case_insensitive: bool,
     requires_left_unicode_word_boundary: bool,
+    literal_matcher: LiteralMatcher,
 ) -> Result<Option<LiteralMatcherLayer>> {
     if patterns.is_empty() {
         return Ok(None);
@@ -2161,38 +3434,104 @@ fn compile_literal_layer(
     debug_assert!(patterns.iter().all(|pattern| {
         pattern.literal.left_unicode_word_boundary == requires_left_unicode_word_boundary
     }));
-    let prefix_index = LiteralPrefixIndex::new(&patterns, case_insensitive);
+    let literals = LiteralArena::new(entity_name, patterns)?;
+    let prefix_index = LiteralPrefixIndex::new(&literals, case_insensitive);
     Ok(Some(LiteralMatcherLayer {
         matcher: compile_literal_matcher(
             entity_name,
-            patterns
-                .iter()
-                .map(|pattern| pattern.literal.value.as_str()),
+            (0..literals.len()).map(|local_index| literals.literal(local_index).value),
             case_insensitive,
+            literal_matcher,
         )?,
         case_insensitive,
         requires_left_unicode_word_boundary,
-        patterns,
+        literals,
         prefix_index,
     }))
 }
 
+impl LiteralArena {
+    fn new(entity_name: &str, patterns: Vec<LayerLiteralPattern>) -> Result<Self> {
+        let total_bytes = patterns
+            .iter()
+            .map(|pattern| pattern.literal.value.len())
+            .sum();
+        let mut arena = Self {
+            bytes: String::with_capacity(total_bytes),
+            entries: Vec::with_capacity(patterns.len()),
+        };
+        for pattern in patterns {
+            let too_large = || {
+                memory(
+                    format!("/engine/shards/{entity_name}/literal_arena"),
+                    "literal layer exceeds the u32 arena offset range",
+                )
+            };
+            let offset = u32::try_from(arena.bytes.len()).map_err(|_| too_large())?;
+            let len = u32::try_from(pattern.literal.value.len()).map_err(|_| too_large())?;
+            let pattern_order = u32::try_from(pattern.pattern_order).map_err(|_| too_large())?;
+            offset.checked_add(len).ok_or_else(too_large)?;
+            arena.bytes.push_str(&pattern.literal.value);
+            arena.entries.push(LiteralArenaEntry {
+                offset,
+                len,
+                detector_index: pattern.detector_index,
+                pattern_order,
+                boundary_signature: literal_boundary_signature(&pattern.literal),
+            });
+        }
+        Ok(arena)
+    }
+
+    fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    fn bytes(&self, local_index: usize) -> &[u8] {
+        self.literal(local_index).value.as_bytes()
+    }
+
+    fn get(&self, local_index: usize) -> Option<ArenaLiteral<'_>> {
+        let entry = self.entries.get(local_index)?;
+        let start = entry.offset as usize;
+        Some(ArenaLiteral {
+            value: &self.bytes[start..start + entry.len as usize],
+            detector_index: entry.detector_index,
+            pattern_order: entry.pattern_order as usize,
+            left_unicode_word_boundary: entry.boundary_signature & 1 != 0,
+            right_unicode_word_boundary: entry.boundary_signature & 2 != 0,
+        })
+    }
+
+    fn literal(&self, local_index: usize) -> ArenaLiteral<'_> {
+        self.get(local_index)
+            .expect("literal index is within the layer arena")
+    }
+
+    fn boundary_signature(&self, local_index: usize) -> u8 {
+        self.entries[local_index].boundary_signature
+    }
+
+    fn memory_usage(&self) -> usize {
+        self.bytes.capacity() + self.entries.capacity() * std::mem::size_of::<LiteralArenaEntry>()
+    }
+}
+
 impl LiteralPrefixIndex {
-    fn new(patterns: &[LayerLiteralPattern], case_insensitive: bool) -> Self {
+    fn new(literals: &LiteralArena, case_insensitive: bool) -> Self {
         debug_assert!(
             !case_insensitive
-                || patterns
-                    .iter()
-                    .all(|pattern| pattern.literal.value.is_ascii())
+                || (0..literals.len()).all(|local_index| literals.bytes(local_index).is_ascii())
         );
-        let mut sorted_pattern_indices = (0..patterns.len()).collect::<Vec<_>>();
+        // The arena already bounds every local index to u32.
+        let mut sorted_pattern_indices = (0..literals.len() as u32).collect::<Vec<_>>();
         sorted_pattern_indices.sort_unstable_by(|&left_index, &right_index| {
-            let left = &patterns[left_index];
-            let right = &patterns[right_index];
-            compare_normalized_literals(&left.literal.value, &right.literal.value, case_insensitive)
+            let left = literals.literal(left_index as usize);
+            let right = literals.literal(right_index as usize);
+            compare_normalized_literals(left.value, right.value, case_insensitive)
                 .then_with(|| left.pattern_order.cmp(&right.pattern_order))
         });
-        let mut compact_pattern_indices: Vec<usize> =
+        let mut compact_pattern_indices: Vec<u32> =
             Vec::with_capacity(sorted_pattern_indices.len());
         let mut normalized_group_start = 0;
         for local_index in sorted_pattern_indices {
@@ -2200,8 +3539,8 @@ impl LiteralPrefixIndex {
                 .get(normalized_group_start)
                 .map(|&representative_index| {
                     compare_normalized_literals(
-                        &patterns[representative_index].literal.value,
-                        &patterns[local_index].literal.value,
+                        literals.literal(representative_index as usize).value,
+                        literals.literal(local_index as usize).value,
                         case_insensitive,
                     ) != Ordering::Equal
                 })
@@ -2209,12 +3548,11 @@ impl LiteralPrefixIndex {
             if starts_new_group {
                 normalized_group_start = compact_pattern_indices.len();
             } else {
-                let signature = literal_boundary_signature(&patterns[local_index].literal);
+                let signature = literals.boundary_signature(local_index as usize);
                 if compact_pattern_indices[normalized_group_start..]
                     .iter()
                     .any(|&representative_index| {
-                        literal_boundary_signature(&patterns[representative_index].literal)
-                            == signature
+                        literals.boundary_signature(representative_index as usize) == signature
                     })
                 {
                     continue;
@@ -2414,7 +3752,7 @@ fn compile_bounded_regex_shard(
                 );
             }
             layers.push(RegexMatcherLayer {
-                regex: CachedRegex::new(regex),
+                regex: CachedRegex::new(regex, patterns),
                 local_to_detector: local_to_detector.to_vec(),
                 local_to_pattern_order: pattern_orders.to_vec(),
             });
@@ -2461,11 +3799,13 @@ fn compile_literal_shard(
     literal_patterns: Vec<String>,
     case_insensitive: bool,
     local_to_detector: Vec<u32>,
+    literal_matcher: LiteralMatcher,
 ) -> Result<LiteralMatcherShard> {
     let matcher = compile_literal_matcher(
         entity_name,
         literal_patterns.iter().map(String::as_str),
         case_insensitive,
+        literal_matcher,
     )?;
     Ok(LiteralMatcherShard {
         entity: entity_name.to_string(),
@@ -2479,10 +3819,21 @@ fn compile_literal_matcher<'a>(
     entity_name: &str,
     literal_patterns: impl IntoIterator<Item = &'a str>,
     case_insensitive: bool,
+    literal_matcher: LiteralMatcher,
 ) -> Result<AhoCorasick> {
-    let matcher = AhoCorasickBuilder::new()
+    let mut builder = AhoCorasickBuilder::new();
+    builder
         .match_kind(AhoMatchKind::LeftmostFirst)
-        .ascii_case_insensitive(case_insensitive)
+        .ascii_case_insensitive(case_insensitive);
+    if literal_matcher == LiteralMatcher::Compact {
+        // A contiguous NFA with sparse transitions from the root down stores
+        // each state in a few words instead of a dense DFA row, trading some
+        // scan throughput for memory on very large alias catalogs.
+        builder
+            .kind(Some(AhoCorasickKind::ContiguousNFA))
+            .dense_depth(0);
+    }
+    let matcher = builder
         .build(literal_patterns)
         .map_err(|error| {
             validation(
@@ -2817,6 +4168,7 @@ mod tests {
         NativeEngine::compile(
             &canonical_for_patterns(patterns),
             MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
         )
         .unwrap()
     }
@@ -2869,7 +4221,7 @@ mod tests {
                     .unwrap()
             })
             .collect::<Vec<_>>();
-        let regex = CachedRegex::new(compile_entity_regex("entity", &hirs).unwrap());
+        let regex = CachedRegex::new(compile_entity_regex("entity", &hirs).unwrap(), &hirs);
         let local_to_detector = (0..patterns.len())
             .map(|index| u32::try_from(index).unwrap())
             .collect::<Vec<_>>();
@@ -2916,7 +4268,7 @@ mod tests {
             )
             .build_many_from_hir(&hirs)
             .unwrap();
-        let regex = CachedRegex::new(regex);
+        let regex = CachedRegex::new(regex, &hirs);
         let local_to_detector = (0..patterns.len())
             .map(|index| u32::try_from(index).unwrap())
             .collect::<Vec<_>>();
@@ -3052,7 +4404,7 @@ mod tests {
                 .with_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
                 .len(),
             1
         );
@@ -3088,6 +4440,7 @@ mod tests {
                 })
                 .collect(),
             true,
+            LiteralMatcher::Standard,
         )
         .expect("the literal layer should compile independently");
         assert_eq!(
@@ -3095,7 +4448,7 @@ mod tests {
                 .without_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
                 .len(),
             LITERAL_COUNT
         );
@@ -3111,13 +4464,21 @@ mod tests {
             .expect("the residual regex layer should compile independently");
 
         let canonical = canonical_for_patterns(patterns);
-        let engine = NativeEngine::compile(&canonical, MatchMode::EntityIndependent)
-            .expect("mapped literals and the residual should compile");
-        let replayed = NativeEngine::compile(&canonical, MatchMode::EntityIndependent)
-            .expect("mapped literals and the residual should compile deterministically");
-        let [MatcherShard::Layered(shard)] = engine.shards.as_slice() else {
-            panic!("the mixed fixture should use a layered matcher");
-        };
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .expect("mapped literals and the residual should compile");
+        let replayed = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .expect("mapped literals and the residual should compile deterministically");
+        let [MatcherShard::Layered(shard)] = engine.shards.as_slice() else {
+            panic!("the mixed fixture should use a layered matcher");
+        };
         assert_eq!(shard.residual_regex_layers.len(), 1);
         assert_eq!(
             engine.regex_resource_profile(),
@@ -3528,7 +4889,12 @@ mod tests {
                 },
             ],
         };
-        let engine = NativeEngine::compile(&canonical, MatchMode::EntityIndependent).unwrap();
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
         let expected = vec![
             (0, 0, 3),
             (second_detector, 0, 3),
@@ -3581,7 +4947,7 @@ mod tests {
                 .with_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
                 .len(),
             PATTERN_COUNT
         );
@@ -3596,6 +4962,215 @@ mod tests {
         assert_eq!(engine_raw_matches(&engine, &text), expected);
     }
 
+    #[test]
+    fn compact_literal_matcher_matches_standard_layers_and_reports_resources() {
+        let canonical = canonical_for_patterns(vec![
+            canonical_pattern(r"\b(?:Ann Lee)\b", &[]),
+            canonical_pattern(r"\b(?:ann)\b", &["IGNORECASE"]),
+            canonical_pattern(r"\bMary\s+Ray\b", &[]),
+            canonical_pattern("Lee", &[]),
+            canonical_pattern(r"\d+", &[]),
+        ]);
+        let standard = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        let compact = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Compact,
+        )
+        .unwrap();
+        let text = "Ann Lee met ANN and Mary \t Ray 42 times; Leeward annex";
+
+        let matches = engine_raw_matches(&compact, text);
+        let profile = compact.literal_resource_profile().unwrap();
+
+        assert_eq!(matches, engine_raw_matches(&standard, text));
+        assert_eq!(matches.len(), 5);
+        assert_eq!(profile.literal_matcher, LiteralMatcher::Compact);
+        assert_eq!(profile.literal_matchers, 4);
+        assert_eq!(profile.literal_patterns, 4);
+        assert!(profile.automaton_bytes > 0);
+        assert!(profile.literal_table_bytes > 0);
+        assert_eq!(profile.bytes_per_pattern(), profile.total_bytes() / 4);
+        assert_eq!(compact.detector_location(4), Some((0, 4)));
+        assert_eq!(compact.detector_location(5), None);
+    }
+
+    #[test]
+    fn normalized_banks_scan_normalized_text_and_project_original_spans() {
+        let mut canonical = canonical_for_patterns(vec![
+            canonical_pattern("fine", &[]),
+            canonical_pattern("caf\u{e9}", &[]),
+            canonical_pattern(r"\d+", &[]),
+        ]);
+        canonical.defaults.normalization = "NFKC".to_string();
+        let text = "a \u{fb01}ne cafe\u{301} fine \u{ff14}";
+        let fine = text.find('\u{fb01}').unwrap() as u64;
+        let cafe = text.find("cafe").unwrap() as u64;
+        let plain = text.rfind("fine").unwrap() as u64;
+        let digits = text.find('\u{ff14}').unwrap() as u64;
+        let expected = vec![
+            (0, fine, fine + "\u{fb01}ne".len() as u64),
+            (1, cafe, cafe + "cafe\u{301}".len() as u64),
+            (0, plain, plain + 4),
+            (2, digits, text.len() as u64),
+        ];
+
+        for match_mode in [
+            MatchMode::EntityIndependent,
+            MatchMode::AllOverlaps,
+            MatchMode::GlobalLeftmost,
+        ] {
+            let engine =
+                NativeEngine::compile(&canonical, match_mode, LiteralMatcher::Standard).unwrap();
+
+            assert_eq!(engine.normalization(), NormalizationForm::Nfkc);
+            assert_eq!(
+                engine_raw_matches(&engine, text),
+                expected,
+                "{match_mode:?}"
+            );
+            assert_eq!(engine_raw_matches(&engine, "plain fine"), vec![(0, 6, 10)]);
+        }
+        let engine =
+            NativeEngine::compile(&canonical, MatchMode::AllOverlaps, LiteralMatcher::Standard)
+                .unwrap();
+        let mut buffer = NativeMatchBuffer::new();
+        engine
+            .scan_bytes_leftmost_from_all_overlaps(text.as_bytes(), &mut buffer)
+            .unwrap();
+        assert_eq!(
+            (0..buffer.len())
+                .map(|index| buffer.get(index).unwrap().as_tuple())
+                .collect::<Vec<_>>(),
+            expected
+        );
+    }
+
+    #[test]
+    fn entity_shard_runs_merge_in_projected_record_order() {
+        let mut canonical = canonical_for_patterns(Vec::new());
+        canonical.entities = ["gamma", "alpha", "beta"]
+            .into_iter()
+            .map(|name| CanonicalEntity {
+                stable_id: name.to_string(),
+                name: name.to_string(),
+                patterns: vec![
+                    canonical_pattern("tok", &[]),
+                    canonical_pattern(r"\d+", &[]),
+                ],
+            })
+            .collect();
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        let text = "tok 12 tok 3";
+
+        let raw = engine_raw_matches(&engine, text);
+        let mut resorted = NativeMatchBuffer::new();
+        for &(detector_index, start, end) in &raw {
+            resorted
+                .push(RawMatch::new(detector_index, start, end).unwrap())
+                .unwrap();
+        }
+        resorted.sort_by_rank(&engine.detector_ranks);
+
+        assert_eq!(engine.shards.len(), 3);
+        assert_eq!(raw.len(), 12);
+        assert_eq!(
+            raw.iter()
+                .map(|&(detector_index, start, end)| {
+                    let (entity_index, _) = engine.detector_location(detector_index).unwrap();
+                    (start, end, canonical.entities[entity_index].name.as_str())
+                })
+                .take(6)
+                .collect::<Vec<_>>(),
+            [
+                (0, 3, "alpha"),
+                (0, 3, "beta"),
+                (0, 3, "gamma"),
+                (4, 6, "alpha"),
+                (4, 6, "beta"),
+                (4, 6, "gamma"),
+            ]
+        );
+        assert_eq!(
+            raw,
+            (0..resorted.len())
+                .map(|index| resorted.get(index).unwrap().as_tuple())
+                .collect::<Vec<_>>()
+        );
+    }
+
+    #[test]
+    fn case_insensitive_shards_share_one_mapped_haystack_per_scan() {
+        const ENTITY_COUNT: usize = 12;
+        let mut canonical = canonical_for_patterns(Vec::new());
+        canonical.entities = (0..ENTITY_COUNT)
+            .map(|index| CanonicalEntity {
+                stable_id: format!("entity_{index:02}"),
+                name: format!("entity_{index:02}"),
+                patterns: vec![
+                    canonical_pattern(&format!("seat{index:02}"), &["IGNORECASE"]),
+                    canonical_pattern(&format!(r"\b(?:desk\s+n{index:02})\b"), &["IGNORECASE"]),
+                ],
+            })
+            .collect();
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        let text = (0..ENTITY_COUNT)
+            .map(|index| format!("ſEAT{index:02} Desk\u{00A0}\u{00A0}N{index:02} KELVIN \u{212A}"))
+            .collect::<Vec<_>>()
+            .join(" ");
+
+        let first = engine_raw_matches(&engine, &text);
+        let builds_after_first_scan = engine.mapped_haystack_pool(0).builds;
+        let second = engine_raw_matches(&engine, &text);
+        let pool = engine.mapped_haystack_pool(0);
+
+        assert_eq!(first.len(), ENTITY_COUNT * 2);
+        assert_eq!(first, second);
+        assert!(matches!(engine.shards[0], MatcherShard::Layered(_)));
+        // Casefold-only and whitespace+casefold variants, once per scan rather than once per shard.
+        assert_eq!(builds_after_first_scan, 2);
+        assert_eq!(pool.builds, 4);
+        assert!(pool.mappings[0].bytes.capacity() >= text.len() - 2 * ENTITY_COUNT);
+        assert!(pool.mappings[1].bytes.is_empty());
+        drop(pool);
+        assert_eq!(engine_raw_matches(&engine, "plain ascii"), []);
+        assert_eq!(engine.mapped_haystack_pool(0).builds, 4);
+    }
+
+    #[test]
+    fn oversized_mapped_haystacks_are_not_retained_between_scans() {
+        let engine = engine_for_patterns(vec![canonical_pattern("needle", &["IGNORECASE"])]);
+        let text = format!(
+            "\u{212A}{}NEEDLE",
+            " ".repeat(MAX_RETAINED_MAPPED_HAYSTACK_BYTES)
+        );
+
+        let needle_start = 3 + MAX_RETAINED_MAPPED_HAYSTACK_BYTES as u64;
+
+        assert_eq!(
+            engine_raw_matches(&engine, &text),
+            [(0, needle_start, needle_start + 6)]
+        );
+        let pool = engine.mapped_haystack_pool(0);
+        assert_eq!(pool.builds, 1);
+        assert_eq!(pool.mappings[0].bytes.capacity(), 0);
+    }
+
     #[test]
     fn regex_like_entity_stays_on_regex_shard() {
         let engine = engine_for_patterns(vec![canonical_pattern(r"\d+", &[])]);
@@ -3642,8 +5217,12 @@ mod tests {
                 })
                 .collect(),
         };
-        let nonempty_engine =
-            NativeEngine::compile(&nonempty, MatchMode::EntityIndependent).unwrap();
+        let nonempty_engine = NativeEngine::compile(
+            &nonempty,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
         let nonempty_profile = nonempty_engine.regex_resource_profile().unwrap();
         assert_eq!(
             nonempty_profile.physical_regex_layers,
@@ -3679,8 +5258,12 @@ mod tests {
                 })
                 .collect(),
         };
-        let possibly_empty_engine =
-            NativeEngine::compile(&possibly_empty, MatchMode::EntityIndependent).unwrap();
+        let possibly_empty_engine = NativeEngine::compile(
+            &possibly_empty,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
         let possibly_empty_profile = possibly_empty_engine.regex_resource_profile().unwrap();
         assert_eq!(
             possibly_empty_profile.physical_regex_layers,
@@ -3719,7 +5302,12 @@ mod tests {
                 })
                 .collect(),
         };
-        let error = NativeEngine::compile(&exhausted, MatchMode::EntityIndependent).unwrap_err();
+        let error = NativeEngine::compile(
+            &exhausted,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap_err();
         assert!(error.to_string().contains("regex resource budget exceeded"));
         assert!(error
             .to_string()
@@ -3860,7 +5448,7 @@ mod tests {
         assert_eq!(lookup.terminal_candidates_examined, 1);
         assert!(lookup.prefix_bytes_examined <= text.len());
         assert!(lookup.index_comparisons < 512);
-        assert!(lookup.index_comparisons < layer.patterns.len());
+        assert!(lookup.index_comparisons < layer.literals.len());
 
         let repeated = std::iter::repeat(text)
             .take(64)
@@ -3910,8 +5498,8 @@ mod tests {
         let unbounded_lookup =
             indexed_valid_literal_at_start(unbounded_layer, text.as_bytes(), text, 0);
 
-        assert_eq!(bounded_layer.patterns.len(), 2_048);
-        assert_eq!(unbounded_layer.patterns.len(), 1_024);
+        assert_eq!(bounded_layer.literals.len(), 2_048);
+        assert_eq!(unbounded_layer.literals.len(), 1_024);
         assert_eq!(residual_orders.len(), 1_024);
         assert!(residual_orders
             .iter()
@@ -3978,8 +5566,8 @@ mod tests {
         let text = "a".repeat(literal.len() + 1);
         let lookup = indexed_valid_literal_at_start(bounded_layer, text.as_bytes(), &text, 0);
 
-        assert_eq!(bounded_layer.patterns.len(), 1);
-        assert_eq!(unbounded_layer.patterns.len(), 1);
+        assert_eq!(bounded_layer.literals.len(), 1);
+        assert_eq!(unbounded_layer.literals.len(), 1);
         assert!(bounded_layer.requires_left_unicode_word_boundary);
         assert!(!unbounded_layer.requires_left_unicode_word_boundary);
         assert!(lookup.candidate.is_none());
@@ -4014,9 +5602,10 @@ mod tests {
 
         assert_eq!(
             unbounded_layer
-                .patterns
+                .literals
+                .entries
                 .iter()
-                .map(|pattern| pattern.pattern_order)
+                .map(|entry| entry.pattern_order as usize)
                 .collect::<Vec<_>>(),
             [1]
         );
@@ -4078,9 +5667,10 @@ mod tests {
                 .with_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
+                .entries
                 .iter()
-                .map(|pattern| pattern.pattern_order)
+                .map(|entry| entry.pattern_order as usize)
                 .collect::<Vec<_>>(),
             [0]
         );
@@ -4126,9 +5716,10 @@ mod tests {
                 .with_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
+                .entries
                 .iter()
-                .map(|pattern| pattern.pattern_order)
+                .map(|entry| entry.pattern_order as usize)
                 .collect::<Vec<_>>(),
             [0]
         );
@@ -4138,9 +5729,10 @@ mod tests {
                 .with_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
+                .entries
                 .iter()
-                .map(|pattern| pattern.pattern_order)
+                .map(|entry| entry.pattern_order as usize)
                 .collect::<Vec<_>>(),
             [1]
         );
@@ -4392,6 +5984,78 @@ mod tests {
         });
     }
 
+    #[test]
+    fn bounded_slot_waits_fail_as_busy_and_are_counted() {
+        use std::time::Duration;
+
+        let engine = engine_for_patterns(vec![canonical_pattern("literal", &[])]);
+        assert_eq!(engine_raw_matches(&engine, "literal"), [(0, 0, 7)]);
+        let stats = engine.scan_stats();
+        assert_eq!(
+            (stats.acquisitions, stats.contended, stats.rejected),
+            (1, 0, 0)
+        );
+        assert_eq!(stats.wait_histogram[0], 1);
+
+        let permits = (0..MAX_CONCURRENT_SCANS_PER_ENGINE)
+            .map(|_| engine.scan_limiter.acquire())
+            .collect::<Vec<_>>();
+        let try_only = ScanControl {
+            max_wait: Some(Duration::ZERO),
+            ..ScanControl::default()
+        };
+        let options = ScanOptions {
+            selection: None,
+            control: Some(&try_only),
+        };
+        let error = engine
+            .scan_bytes_with(b"literal", None, options)
+            .unwrap_err();
+        assert!(matches!(
+            error,
+            crate::error::BankError::Busy {
+                slots: MAX_CONCURRENT_SCANS_PER_ENGINE,
+                ..
+            }
+        ));
+        let cancelled = ScanControl {
+            cancel: Some(std::sync::Arc::new(std::sync::atomic::AtomicBool::new(
+                true,
+            ))),
+            ..ScanControl::default()
+        };
+        let error = engine
+            .contains_any(
+                b"literal",
+                ScanOptions {
+                    selection: None,
+                    control: Some(&cancelled),
+                },
+            )
+            .unwrap_err();
+        assert!(matches!(
+            error,
+            crate::error::BankError::Interrupted {
+                reason: crate::error::InterruptReason::Cancelled,
+                shards_total: 0,
+                ..
+            }
+        ));
+        drop(permits);
+
+        let stats = engine.scan_stats();
+        assert_eq!(stats.active, 0);
+        assert_eq!(stats.high_water, MAX_CONCURRENT_SCANS_PER_ENGINE);
+        assert_eq!(
+            stats.acquisitions,
+            1 + MAX_CONCURRENT_SCANS_PER_ENGINE as u64
+        );
+        assert_eq!((stats.contended, stats.rejected), (2, 2));
+        assert_eq!(stats.wait_histogram.iter().sum::<u64>(), stats.acquisitions);
+        let buffer = engine.scan_bytes_with(b"literal", None, options).unwrap();
+        assert_eq!(buffer.len(), 1);
+    }
+
     #[test]
     fn poisoned_limiter_state_is_recovered_without_a_scan_panic() {
         use std::panic::{catch_unwind, AssertUnwindSafe};
@@ -4418,6 +6082,7 @@ mod tests {
         let cached = CachedRegex::new(
             build_entity_regex_with_cache(&patterns, ENTITY_INDEPENDENT_REGEX_CACHE_CAPACITY)
                 .unwrap(),
+            &patterns,
         );
         let other =
             build_entity_regex_with_cache(&other_patterns, ENTITY_INDEPENDENT_REGEX_CACHE_CAPACITY)
@@ -4454,9 +6119,10 @@ mod tests {
                 .without_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
+                .entries
                 .iter()
-                .map(|pattern| pattern.pattern_order)
+                .map(|entry| entry.pattern_order as usize)
                 .collect::<Vec<_>>(),
             [0]
         );
@@ -4514,9 +6180,10 @@ mod tests {
                 .without_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
+                .entries
                 .iter()
-                .map(|pattern| pattern.pattern_order)
+                .map(|entry| entry.pattern_order as usize)
                 .collect::<Vec<_>>(),
             [0]
         );
@@ -4569,8 +6236,15 @@ mod tests {
     #[test]
     fn every_inline_scan_entry_rejects_mapped_unicode_over_the_byte_limit() {
         let canonical = canonical_for_patterns(vec![canonical_pattern("k", &["IGNORECASE"])]);
-        let engine = NativeEngine::compile(&canonical, MatchMode::EntityIndependent).unwrap();
-        let overlap_engine = NativeEngine::compile(&canonical, MatchMode::AllOverlaps).unwrap();
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        let overlap_engine =
+            NativeEngine::compile(&canonical, MatchMode::AllOverlaps, LiteralMatcher::Standard)
+                .unwrap();
         let mut oversized = vec![b'.'; MAX_SCAN_INPUT_BYTES - 2];
         oversized.extend_from_slice("K".as_bytes());
         assert_eq!(oversized.len(), MAX_SCAN_INPUT_BYTES + 1);
@@ -4672,7 +6346,7 @@ mod tests {
                 .with_left_boundary
                 .as_ref()
                 .unwrap()
-                .patterns
+                .literals
                 .len(),
             500
         );
@@ -4806,4 +6480,680 @@ mod tests {
             .to_string()
             .contains("could not compile"));
     }
+
+    #[test]
+    fn batch_scan_matches_single_scans_in_input_order() {
+        let engine = engine_for_patterns(vec![
+            canonical_pattern(r"\b(?:alpha)\b", &[]),
+            canonical_pattern(r"\b(?:John\s+Doe)\b", &[]),
+        ]);
+        let texts: Vec<String> = (0..37)
+            .map(|index| match index % 3 {
+                0 => format!("alpha {index} John  Doe"),
+                1 => String::new(),
+                _ => "alpha ".repeat(index),
+            })
+            .collect();
+        let haystacks: Vec<&[u8]> = texts.iter().map(|text| text.as_bytes()).collect();
+        let expected: Vec<_> = texts
+            .iter()
+            .map(|text| engine_raw_matches(&engine, text))
+            .collect();
+
+        for threads in [1, 4, MAX_CONCURRENT_SCANS_PER_ENGINE] {
+            let buffers = engine
+                .scan_bytes_batch(&haystacks, None, ScanOptions::default(), threads)
+                .unwrap();
+            let actual: Vec<Vec<_>> = buffers
+                .iter()
+                .map(|buffer| {
+                    (0..buffer.len())
+                        .map(|index| buffer.get(index).unwrap().as_tuple())
+                        .collect()
+                })
+                .collect();
+            assert_eq!(actual, expected);
+        }
+        assert!(engine
+            .scan_bytes_batch(&[], None, ScanOptions::default(), 4)
+            .unwrap()
+            .is_empty());
+    }
+
+    #[test]
+    fn batch_scan_reports_the_first_failing_haystack() {
+        let engine = engine_for_patterns(vec![canonical_pattern(r"\b(?:alpha)\b", &[])]);
+        let crowded = "alpha ".repeat(8);
+        let mut haystacks: Vec<&[u8]> = vec![b"alpha"; 40];
+        haystacks[23] = crowded.as_bytes();
+        haystacks[31] = b"\xff";
+
+        for threads in [1, 3, MAX_CONCURRENT_SCANS_PER_ENGINE] {
+            let error = engine
+                .scan_bytes_batch(&haystacks, Some(4), ScanOptions::default(), threads)
+                .unwrap_err();
+            assert!(error.to_string().contains("configured match limit 4"));
+        }
+        let error = engine
+            .scan_bytes_batch(&haystacks[24..], Some(4), ScanOptions::default(), 4)
+            .unwrap_err();
+        assert!(error.to_string().contains("valid UTF-8"));
+        for threads in [0, MAX_CONCURRENT_SCANS_PER_ENGINE + 1] {
+            let error = engine
+                .scan_bytes_batch(&haystacks, None, ScanOptions::default(), threads)
+                .unwrap_err();
+            assert!(error.to_string().contains("threads must be between 1 and"));
+        }
+    }
+
+    fn selected_options(selection: &EntitySelection) -> ScanOptions<'_> {
+        ScanOptions {
+            selection: Some(selection),
+            control: None,
+        }
+    }
+
+    #[test]
+    fn selected_entity_scan_skips_unselected_shards() {
+        let entity = |name: &str, patterns: Vec<CanonicalPattern>| CanonicalEntity {
+            stable_id: name.to_string(),
+            name: name.to_string(),
+            patterns,
+        };
+        let mut canonical = canonical_for_patterns(Vec::new());
+        canonical.entities = vec![
+            entity("first", vec![canonical_pattern("alpha", &[])]),
+            entity("second", vec![canonical_pattern("(?i:k)", &[])]),
+            entity(
+                "third",
+                vec![
+                    canonical_pattern(r"alpha\s+beta", &[]),
+                    canonical_pattern("beta", &[]),
+                ],
+            ),
+        ];
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        let text = "alpha beta K alpha  beta k";
+        let full = engine_raw_matches(&engine, text);
+        let selection = engine.entity_selection(&[2, 0, 2]).unwrap();
+        let buffer = engine
+            .scan_bytes_with(text.as_bytes(), None, selected_options(&selection))
+            .unwrap();
+        let selected: Vec<_> = (0..buffer.len())
+            .map(|index| buffer.get(index).unwrap().as_tuple())
+            .collect();
+
+        let expected: Vec<_> = full
+            .iter()
+            .copied()
+            .filter(|&(detector_index, _, _)| detector_index != 1)
+            .collect();
+        assert_eq!(selected, expected);
+        assert_eq!(selected.len(), 4);
+
+        let only_second = engine.entity_selection(&[1]).unwrap();
+        assert_eq!(
+            engine
+                .scan_bytes_with(text.as_bytes(), Some(2), selected_options(&only_second))
+                .unwrap()
+                .len(),
+            2
+        );
+        assert!(engine
+            .scan_bytes_with(text.as_bytes(), Some(2), selected_options(&selection))
+            .unwrap_err()
+            .to_string()
+            .contains("configured match limit 2"));
+        let texts = [text, "", "beta alpha", "K k K"];
+        let haystacks: Vec<&[u8]> = texts.iter().map(|text| text.as_bytes()).collect();
+        let per_text: Vec<Vec<_>> = haystacks
+            .iter()
+            .map(|haystack| {
+                let buffer = engine
+                    .scan_bytes_with(haystack, None, selected_options(&selection))
+                    .unwrap();
+                (0..buffer.len())
+                    .map(|index| buffer.get(index).unwrap().as_tuple())
+                    .collect()
+            })
+            .collect();
+        for threads in [1, 3] {
+            let batch: Vec<Vec<_>> = engine
+                .scan_bytes_batch(&haystacks, None, selected_options(&selection), threads)
+                .unwrap()
+                .iter()
+                .map(|buffer| {
+                    (0..buffer.len())
+                        .map(|index| buffer.get(index).unwrap().as_tuple())
+                        .collect()
+                })
+                .collect();
+            assert_eq!(batch, per_text);
+        }
+        let empty = engine.entity_selection(&[]).unwrap();
+        assert!(engine
+            .scan_bytes_with(text.as_bytes(), None, selected_options(&empty))
+            .unwrap()
+            .is_empty());
+        assert!(engine
+            .entity_selection(&[3])
+            .unwrap_err()
+            .to_string()
+            .contains("entity index 3 is outside the bank's 3 entities"));
+
+        let overlaps =
+            NativeEngine::compile(&canonical, MatchMode::AllOverlaps, LiteralMatcher::Standard)
+                .unwrap();
+        assert!(overlaps
+            .entity_selection(&[0])
+            .unwrap_err()
+            .to_string()
+            .contains("entity selection requires match_mode entity_independent"));
+    }
+
+    #[test]
+    fn early_exit_scan_modes_agree_with_full_scans() {
+        let entity = |name: &str, patterns: Vec<CanonicalPattern>| CanonicalEntity {
+            stable_id: name.to_string(),
+            name: name.to_string(),
+            patterns,
+        };
+        let mut canonical = canonical_for_patterns(Vec::new());
+        canonical.entities = vec![
+            entity("first", vec![canonical_pattern("alpha", &[])]),
+            entity("second", vec![canonical_pattern("(?i:k)", &[])]),
+            entity(
+                "third",
+                vec![
+                    canonical_pattern(r"alpha\s+beta", &[]),
+                    canonical_pattern("beta", &[]),
+                ],
+            ),
+        ];
+        for match_mode in [
+            MatchMode::EntityIndependent,
+            MatchMode::AllOverlaps,
+            MatchMode::GlobalLeftmost,
+        ] {
+            let engine =
+                NativeEngine::compile(&canonical, match_mode, LiteralMatcher::Standard).unwrap();
+            for text in ["alpha beta K alpha  beta k", "k beta", "nothing here"] {
+                let full = engine_raw_matches(&engine, text);
+                for stop_after in 0..=full.len() + 1 {
+                    let first = engine
+                        .scan_bytes_first(text.as_bytes(), stop_after, ScanOptions::default())
+                        .unwrap();
+                    let first: Vec<_> = (0..first.len())
+                        .map(|index| first.get(index).unwrap().as_tuple())
+                        .collect();
+                    assert_eq!(first, full[..stop_after.min(full.len())], "{match_mode:?}");
+                }
+                assert_eq!(
+                    engine
+                        .contains_any(text.as_bytes(), ScanOptions::default())
+                        .unwrap(),
+                    !full.is_empty()
+                );
+                let mut expected_counts = vec![0; engine.detector_count()];
+                for &(detector_index, _, _) in &full {
+                    expected_counts[detector_index as usize] += 1;
+                }
+                assert_eq!(
+                    engine
+                        .count_bytes(text.as_bytes(), ScanOptions::default())
+                        .unwrap(),
+                    expected_counts
+                );
+            }
+        }
+
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        let only_second = engine.entity_selection(&[1]).unwrap();
+        assert!(!engine
+            .contains_any(b"alpha beta", selected_options(&only_second))
+            .unwrap());
+        assert!(engine
+            .contains_any(b"alpha k", selected_options(&only_second))
+            .unwrap());
+        assert_eq!(
+            engine
+                .count_bytes(b"k alpha K", selected_options(&only_second))
+                .unwrap()
+                .iter()
+                .sum::<u64>(),
+            2
+        );
+    }
+
+    #[test]
+    fn reused_scan_buffers_keep_capacity_and_reset_their_match_limit() {
+        let engine = engine_for_patterns(vec![canonical_pattern("a", &[])]);
+        let mut buffer = NativeMatchBuffer::new();
+
+        engine
+            .scan_bytes_with_into(b"aaaa", &mut buffer, None, ScanOptions::default())
+            .unwrap();
+        assert_eq!(buffer.len(), 4);
+        let capacity = buffer.capacity();
+
+        let error = engine
+            .scan_bytes_with_into(b"aaa", &mut buffer, Some(2), ScanOptions::default())
+            .unwrap_err();
+        assert!(error.to_string().contains("configured match limit 2"));
+        assert!(buffer.is_empty());
+
+        engine
+            .scan_bytes_with_into(b"aaa", &mut buffer, None, ScanOptions::default())
+            .unwrap();
+        assert_eq!(buffer.len(), 3);
+        assert!(buffer.capacity() >= capacity);
+    }
+
+    #[test]
+    fn interrupted_scans_report_progress_and_clear_the_buffer() {
+        let mut canonical = canonical_for_patterns(Vec::new());
+        canonical.entities = (0..4)
+            .map(|index| CanonicalEntity {
+                stable_id: format!("entity_{index}"),
+                name: format!("entity_{index}"),
+                patterns: vec![canonical_pattern("alpha", &[])],
+            })
+            .collect();
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        let text = "alpha ".repeat(200);
+
+        let expired = ScanControl {
+            deadline: Some(std::time::Instant::now()),
+            cancel: None,
+            max_wait: None,
+        };
+        let error = engine
+            .scan_bytes_with(
+                text.as_bytes(),
+                None,
+                ScanOptions {
+                    selection: None,
+                    control: Some(&expired),
+                },
+            )
+            .unwrap_err();
+        assert!(matches!(
+            error,
+            crate::error::BankError::Interrupted {
+                reason: crate::error::InterruptReason::DeadlineExceeded,
+                shards_completed: 0,
+                shards_total: 4,
+                matches: 0,
+                ..
+            }
+        ));
+
+        let cancel = std::sync::Arc::new(std::sync::atomic::AtomicBool::new(true));
+        let cancelled = ScanControl {
+            deadline: None,
+            cancel: Some(cancel.clone()),
+            max_wait: None,
+        };
+        let selection = engine.entity_selection(&[1, 2]).unwrap();
+        let error = engine
+            .count_bytes(
+                text.as_bytes(),
+                ScanOptions {
+                    selection: Some(&selection),
+                    control: Some(&cancelled),
+                },
+            )
+            .unwrap_err();
+        assert!(matches!(
+            error,
+            crate::error::BankError::Interrupted {
+                reason: crate::error::InterruptReason::Cancelled,
+                shards_completed: 0,
+                shards_total: 2,
+                matches: 0,
+                ..
+            }
+        ));
+        assert!(error.to_string().starts_with("scan was cancelled after"));
+
+        cancel.store(false, AtomicOrdering::Relaxed);
+        let mut buffer = NativeMatchBuffer::new();
+        engine
+            .scan_bytes_into(text.as_bytes(), &mut buffer)
+            .unwrap();
+        let controlled = engine
+            .scan_bytes_with(
+                text.as_bytes(),
+                None,
+                ScanOptions {
+                    selection: None,
+                    control: Some(&cancelled),
+                },
+            )
+            .unwrap();
+        assert_eq!(controlled.len(), buffer.len());
+        assert_eq!(controlled.len(), 800);
+    }
+
+    #[test]
+    fn windowed_shard_searches_match_across_windows_and_check_interrupts() {
+        let window = SCAN_WINDOW_BYTES;
+        let mut canonical = canonical_for_patterns(Vec::new());
+        canonical.entities = [
+            ("alpha", vec![canonical_pattern("alpha", &[])]),
+            ("beta", vec![canonical_pattern(r"beta\d{2}\b", &[])]),
+            (
+                "gamma",
+                vec![
+                    canonical_pattern("gamma", &[]),
+                    canonical_pattern(r"gam\d{1,3}", &[]),
+                ],
+            ),
+        ]
+        .into_iter()
+        .map(|(name, patterns)| CanonicalEntity {
+            stable_id: name.to_string(),
+            name: name.to_string(),
+            patterns,
+        })
+        .collect();
+
+        // Matches straddle window ends, `beta423` needs look-ahead past its
+        // digits to fail the word boundary, and the last window has no match.
+        let mut text = vec![b'.'; 4 * window + 100];
+        let tokens = [
+            (window - 3, "alpha", Some(0)),
+            (window + 5, "gamma", Some(2)),
+            (window + 20, "beta42", Some(1)),
+            (2 * window - 4, "beta42", Some(1)),
+            (2 * window + 10, "alpha", Some(0)),
+            (2 * window + 40, "gam1", Some(3)),
+            (3 * window - 20, "beta423", None),
+            (3 * window - 2, "gam123", Some(3)),
+        ];
+        let mut expected = Vec::new();
+        for (start, token, detector) in tokens {
+            text[start..start + token.len()].copy_from_slice(token.as_bytes());
+            if let Some(detector) = detector {
+                expected.push((detector, start as u64, (start + token.len()) as u64));
+            }
+        }
+        let text = String::from_utf8(text).unwrap();
+
+        let cancelled = ScanControl {
+            deadline: None,
+            cancel: Some(std::sync::Arc::new(std::sync::atomic::AtomicBool::new(
+                true,
+            ))),
+            max_wait: None,
+        };
+        let short = &text[..window / 2];
+
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::EntityIndependent,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        assert_eq!(engine_raw_matches(&engine, &text), expected);
+        assert!(matches!(engine.shards[0], MatcherShard::Literal(_)));
+        assert!(matches!(engine.shards[1], MatcherShard::Regex(_)));
+        assert!(matches!(engine.shards[2], MatcherShard::Layered(_)));
+        let mut pool = MappedHaystackPool::default();
+        for (index, shard) in engine.shards.iter().enumerate() {
+            // A cancelled scan still finishes a search that fits one window
+            // and stops between the windows of a longer one.
+            for (haystack, interrupted) in [(short, false), (text.as_str(), true)] {
+                let mut haystack = ScanHaystack::new(haystack.as_bytes(), &mut pool);
+                let mut buffer = NativeMatchBuffer::new();
+                buffer.set_control(Some(&cancelled));
+                let result = match shard {
+                    MatcherShard::Regex(shard) => {
+                        scan_regex_shard(shard, haystack.bytes, &mut buffer, 0)
+                    }
+                    MatcherShard::Literal(shard) => {
+                        scan_literal_shard(shard, &mut haystack, &mut buffer)
+                    }
+                    MatcherShard::Layered(shard) => {
+                        scan_layered_shard(shard, &mut haystack, &mut buffer, 0)
+                    }
+                };
+                assert_eq!(result.is_err(), interrupted, "shard {index}");
+            }
+        }
+
+        let engine = NativeEngine::compile(
+            &canonical,
+            MatchMode::GlobalLeftmost,
+            LiteralMatcher::Standard,
+        )
+        .unwrap();
+        assert_eq!(engine_raw_matches(&engine, &text), expected);
+        let matcher = engine.global_leftmost.as_ref().unwrap();
+        for (haystack, interrupted) in [(short, false), (text.as_str(), true)] {
+            let mut buffer = NativeMatchBuffer::new();
+            buffer.set_control(Some(&cancelled));
+            let result = scan_global_leftmost(
+                matcher,
+                &engine.detector_ranks,
+                haystack.as_bytes(),
+                &mut buffer,
+                0,
+            );
+            assert_eq!(result.is_err(), interrupted);
+        }
+
+        // Searches without a longest match run over the rest of the haystack.
+        let mut buffer = NativeMatchBuffer::new();
+        buffer.set_control(Some(&cancelled));
+        let mut searched = Vec::new();
+        let found = search_windows(
+            text.len(),
+            7,
+            None,
+            &mut buffer,
+            |span| {
+                searched.push(span);
+                None::<usize>
+            },
+            |&start| start,
+        )
+        .unwrap();
+        assert_eq!((found, searched), (None, vec![7..text.len()]));
+    }
+
+    #[test]
+    fn chunked_scans_match_serial_scans_across_every_cut() {
+        let mut canonical = canonical_for_patterns(Vec::new());
+        canonical.entities = [
+            (
+                "company",
+                vec![
+                    canonical_pattern("Acme Corp", &[]),
+                    canonical_pattern("acme", &["IGNORECASE"]),
+                ],
+            ),
+            (
+                "band",
+                vec![
+                    canonical_pattern(r"Pink\sFloyd", &[]),
+                    canonical_pattern(r"Floyd\s\w{3}", &[]),
+                ],
+            ),
+            ("phone", vec![canonical_pattern(r"\b\d{3}-\d{4}\b", &[])]),
+            (
+                "cafe",
+                vec![
+                    canonical_pattern("Café", &[]),
+                    canonical_pattern(r"\bCaf\w\b", &[]),
+                ],
+            ),
+        ]
+        .into_iter()
+        .map(|(name, patterns)| CanonicalEntity {
+            stable_id: name.to_string(),
+            name: name.to_string(),
+            patterns,
+        })
+        .collect();
+        let fragments = [
+            "Acme Corp",
+            "ACME",
+            "Pink",
+            "Floyd",
+            "555-1234",
+            "Café",
+            "Cafe",
+            "x1",
+            "\n",
+            "  ",
+            "\t",
+        ];
+        let text = (0..600)
+            .map(|index| fragments[(index * 7 + index / 5) % fragments.len()])
+            .collect::<Vec<_>>()
+            .join(" ");
+
+        for match_mode in [MatchMode::EntityIndependent, MatchMode::GlobalLeftmost] {
+            let engine =
+                NativeEngine::compile(&canonical, match_mode, LiteralMatcher::Standard).unwrap();
+            // Seven Unicode digits of up to four bytes each plus the hyphen.
+            assert_eq!(engine.chunk_overlap(), Some(29 + CHUNK_LOOKAHEAD_BYTES));
+            let serial = engine
+                .scan_bytes_with(text.as_bytes(), None, ScanOptions::default())
+                .unwrap();
+            let serial = (0..serial.len())
+                .map(|index| serial.get(index).unwrap().as_tuple())
+                .collect::<Vec<_>>();
+            assert!(serial.len() > 200);
+            for min_chunk_bytes in [1, 5, 16, 64, 500] {
+                for threads in [2, 3, 8] {
+                    let chunked = engine
+                        .scan_chunks(
+                            text.as_bytes(),
+                            None,
+                            ScanOptions::default(),
+                            threads,
+                            min_chunk_bytes,
+                        )
+                        .unwrap();
+                    let chunked = (0..chunked.len())
+                        .map(|index| chunked.get(index).unwrap().as_tuple())
+                        .collect::<Vec<_>>();
+                    assert_eq!(
+                        chunked, serial,
+                        "{match_mode:?} {min_chunk_bytes} {threads}"
+                    );
+                }
+            }
+        }
+
+        // A run that reaches past a cut while the next chunk's run skips over
+        // its end is rescanned serially.
+        let engine = engine_for_patterns(vec![
+            canonical_pattern(r"x\sy", &[]),
+            canonical_pattern(r"y\sz", &[]),
+        ]);
+        let acquisitions = engine.scan_stats().acquisitions;
+        let chunked = engine
+            .scan_chunks(b"x\ny\nz", None, ScanOptions::default(), 3, 1)
+            .unwrap();
+        assert_eq!(chunked.get(0).unwrap().as_tuple(), (0, 0, 3));
+        assert_eq!(chunked.len(), 1);
+        assert_eq!(engine.scan_stats().acquisitions, acquisitions + 4);
+
+        let error = engine
+            .scan_chunks(b"x\ny x\ny", Some(1), ScanOptions::default(), 3, 1)
+            .unwrap_err();
+        assert!(error.to_string().contains("configured match limit 1"));
+
+        for regex in ["^alpha", "(?m)^alpha", r"\d+", "a*"] {
+            let engine = engine_for_patterns(vec![canonical_pattern(regex, &[])]);
+            assert_eq!(engine.chunk_overlap(), None, "{regex}");
+        }
+    }
+
+    #[test]
+    fn resolve_overlaps_groups_runs_and_picks_priority_winners() {
+        let compile = |priorities: [i64; 5]| {
+            let mut canonical = canonical_for_patterns(Vec::new());
+            canonical.entities = ["a", "b", "c", "d", "e"]
+                .into_iter()
+                .zip(["New York", "York City", "New York City", "Boston", "Boston"])
+                .zip(priorities)
+                .map(|((name, literal), priority)| CanonicalEntity {
+                    stable_id: name.to_string(),
+                    name: name.to_string(),
+                    patterns: vec![CanonicalPattern {
+                        priority,
+                        ..canonical_pattern(literal, &[])
+                    }],
+                })
+                .collect();
+            NativeEngine::compile(
+                &canonical,
+                MatchMode::EntityIndependent,
+                LiteralMatcher::Standard,
+            )
+            .unwrap()
+        };
+        let text = b"New York City, Boston. York";
+        let group = |first, end, winner| OverlapGroup { first, end, winner };
+
+        let engine = compile([1, 0, 2, 0, 0]);
+        let buffer = engine.scan_bytes(text).unwrap();
+        let matches = (0..buffer.len())
+            .map(|index| buffer.get(index).unwrap().as_tuple())
+            .collect::<Vec<_>>();
+        assert_eq!(
+            matches,
+            vec![(0, 0, 8), (2, 0, 13), (1, 4, 13), (3, 15, 21), (4, 15, 21)]
+        );
+        assert_eq!(
+            engine.resolve_overlaps(&buffer, None).unwrap(),
+            vec![group(0, 3, 2), group(3, 5, 3)]
+        );
+        assert_eq!(
+            engine
+                .resolve_overlaps(&buffer, Some(&[0, 1, 2, 4, 3]))
+                .unwrap(),
+            vec![group(0, 3, 2), group(3, 5, 4)]
+        );
+        // Equal priorities fall back to the longest span.
+        let engine = compile([0, 0, 0, 0, 0]);
+        assert_eq!(
+            engine.resolve_overlaps(&buffer, None).unwrap(),
+            vec![group(0, 3, 1), group(3, 5, 3)]
+        );
+
+        let error = engine.resolve_overlaps(&buffer, Some(&[0, 1])).unwrap_err();
+        assert!(error
+            .to_string()
+            .contains("must hold one rank per detector (5); got 2"));
+        let mut foreign = NativeMatchBuffer::new();
+        foreign.push(RawMatch::new(9, 0, 1).unwrap()).unwrap();
+        let error = engine.resolve_overlaps(&foreign, None).unwrap_err();
+        assert!(error
+            .to_string()
+            .contains("match detector index 9 is outside this bank's 5 detectors"));
+        assert!(engine
+            .resolve_overlaps(&NativeMatchBuffer::new(), None)
+            .unwrap()
+            .is_empty());
+    }
 }
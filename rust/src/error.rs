@@ -1,7 +1,33 @@
-use pyo3::exceptions::{PyMemoryError, PyValueError};
+use pyo3::exceptions::{PyMemoryError, PyTimeoutError, PyValueError};
 use pyo3::PyErr;
+use std::fmt;
 use thiserror::Error;
 
+/// Why a scan stopped before it finished.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub enum InterruptReason {
+    DeadlineExceeded,
+    Cancelled,
+}
+
+impl InterruptReason {
+    pub fn as_str(self) -> &'static str {
+        match self {
+            InterruptReason::DeadlineExceeded => "deadline_exceeded",
+            InterruptReason::Cancelled => "cancelled",
+        }
+    }
+}
+
+impl fmt::Display for InterruptReason {
+    fn fmt(&self, formatter: &mut fmt::Formatter<'_>) -> fmt::Result {
+        formatter.write_str(match self {
+            InterruptReason::DeadlineExceeded => "deadline exceeded",
+            InterruptReason::Cancelled => "was cancelled",
+        })
+    }
+}
+
 #[derive(Debug, Error)]
 pub enum BankError {
     #[error("unsupported source format {0:?}; expected json, yaml, jsonl, or canonical_json")]
@@ -15,6 +41,18 @@ pub enum BankError {
     Validation { path: String, message: String },
     #[error("native memory allocation error at {path}: {message}")]
     Memory { path: String, message: String },
+    #[error(
+        "scan {reason} after {elapsed_ms} ms with {shards_completed} of {shards_total} shards scanned and {matches} matches found"
+    )]
+    Interrupted {
+        reason: InterruptReason,
+        elapsed_ms: u64,
+        shards_completed: usize,
+        shards_total: usize,
+        matches: u64,
+    },
+    #[error("scan rejected after waiting {waited_ms} ms because all {slots} scan slots were busy")]
+    Busy { waited_ms: u64, slots: usize },
 }
 
 pub type Result<T> = std::result::Result<T, BankError>;
@@ -37,6 +75,29 @@ impl From<BankError> for PyErr {
     fn from(error: BankError) -> Self {
         match error {
             BankError::Memory { .. } => PyMemoryError::new_err(error.to_string()),
+            // The progress fields travel as arguments so Python can rebuild a typed error.
+            BankError::Interrupted {
+                reason,
+                elapsed_ms,
+                shards_completed,
+                shards_total,
+                matches,
+            } => PyTimeoutError::new_err((
+                error.to_string(),
+                reason.as_str(),
+                elapsed_ms,
+                shards_completed,
+                shards_total,
+                matches,
+            )),
+            BankError::Busy { waited_ms, .. } => PyTimeoutError::new_err((
+                error.to_string(),
+                "busy",
+                waited_ms,
+                0_usize,
+                0_usize,
+                0_u64,
+            )),
             _ => PyValueError::new_err(error.to_string()),
         }
     }
@@ -29,14 +29,37 @@ pub fn pattern_stable_id(
     format!("pattern:sha256:{}", digest_prefixed(&refs))
 }
 
+#[derive(Serialize)]
+struct BankHashPayload<'a, T: Serialize> {
+    semantic_hash_version: u32,
+    canonical_bank: &'a T,
+    compile_options: Value,
+}
+
+/// Feeds serialized JSON straight into SHA-256 so hashing a large bank never
+/// materializes its payload as a `Value` tree or byte buffer.
+struct HashWriter(Sha256);
+
+impl std::io::Write for HashWriter {
+    fn write(&mut self, bytes: &[u8]) -> std::io::Result<usize> {
+        self.0.update(bytes);
+        Ok(bytes.len())
+    }
+
+    fn flush(&mut self) -> std::io::Result<()> {
+        Ok(())
+    }
+}
+
 pub fn bank_hash<T: Serialize>(canonical_bank: &T, compile_options: &Value) -> String {
-    let payload = serde_json::json!({
-        "semantic_hash_version": 1,
-        "canonical_bank": canonical_bank,
-        "compile_options": canonicalize_json_value(compile_options),
-    });
-    let bytes = serde_json::to_vec(&payload).expect("hash payload must serialize");
-    format!("sha256:{}", digest_bytes(&bytes))
+    let payload = BankHashPayload {
+        semantic_hash_version: 1,
+        canonical_bank,
+        compile_options: canonicalize_json_value(compile_options),
+    };
+    let mut writer = HashWriter(Sha256::new());
+    serde_json::to_writer(&mut writer, &payload).expect("hash payload must serialize");
+    format!("sha256:{}", hex(&writer.0.finalize()))
 }
 
 pub fn canonicalize_json_value(value: &Value) -> Value {
@@ -64,10 +87,6 @@ fn digest_prefixed(fields: &[&str]) -> String {
     hex(&hasher.finalize())
 }
 
-fn digest_bytes(bytes: &[u8]) -> String {
-    hex(&Sha256::digest(bytes))
-}
-
 fn hex(bytes: &[u8]) -> String {
     let mut output = String::with_capacity(bytes.len() * 2);
     for byte in bytes {
@@ -90,6 +109,23 @@ mod tests {
         assert_eq!(bank_hash(&bank, &first), bank_hash(&bank, &second));
     }
 
+    #[test]
+    fn bank_hash_streams_the_versioned_payload_bytes() {
+        let bank = serde_json::json!({"schema": 1, "entities": [{"name": "E"}]});
+        let options = serde_json::json!({"match_mode": "entity_independent"});
+        let payload = serde_json::to_vec(&serde_json::json!({
+            "semantic_hash_version": 1,
+            "canonical_bank": bank,
+            "compile_options": options,
+        }))
+        .unwrap();
+
+        assert_eq!(
+            bank_hash(&bank, &options),
+            format!("sha256:{}", hex(&Sha256::digest(&payload)))
+        );
+    }
+
     #[test]
     fn bank_hash_changes_when_compile_options_change() {
         let bank = serde_json::json!({"schema": 1});
@@ -1,13 +1,19 @@
-use pyo3::exceptions::{PyIndexError, PyOSError, PyRuntimeError, PyValueError};
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyIndexError, PyOSError, PyRuntimeError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::pybacked::{PyBackedBytes, PyBackedStr};
 use pyo3::types::{
-    PyByteArray, PyByteArrayMethods, PyBytes, PyDict, PyList, PySequence, PySequenceMethods,
+    PyByteArray, PyByteArrayMethods, PyBytes, PyDict, PyList, PyMemoryView, PySequence,
+    PySequenceMethods, PyString,
 };
 #[cfg(unix)]
 use std::ffi::CString;
 use std::fs;
 use std::io::Read;
 use std::panic::{catch_unwind, AssertUnwindSafe};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
+use std::time::{Duration, Instant};
 
 mod bank;
 mod engine;
@@ -16,15 +22,17 @@ mod flags;
 mod formats;
 mod ids;
 mod match_buffer;
+mod normalize;
 
 use bank::NativeBank;
 use engine::{
-    validate_scan_input_size, ENTITY_INDEPENDENT_REGEX_CACHE_CAPACITY,
-    MAX_CONCURRENT_SCANS_PER_ENGINE, MAX_ENTITY_INDEPENDENT_REGEX_ACCOUNTED_BYTES,
-    MAX_ENTITY_INDEPENDENT_REGEX_LAYERS_PER_ENTITY, MAX_LAZY_DFA_CACHES_PER_META_REGEX,
-    MAX_PATTERNS_PER_BOUNDED_REGEX_LAYER, MAX_SCAN_INPUT_BYTES, PIKEVM_STACK_NFA_MEMORY_MULTIPLIER,
+    validate_scan_input_size, EntitySelection, ScanLimiterStats, ScanOptions,
+    ENTITY_INDEPENDENT_REGEX_CACHE_CAPACITY, MAX_CONCURRENT_SCANS_PER_ENGINE,
+    MAX_ENTITY_INDEPENDENT_REGEX_ACCOUNTED_BYTES, MAX_ENTITY_INDEPENDENT_REGEX_LAYERS_PER_ENTITY,
+    MAX_LAZY_DFA_CACHES_PER_META_REGEX, MAX_PATTERNS_PER_BOUNDED_REGEX_LAYER, MAX_SCAN_INPUT_BYTES,
+    PIKEVM_STACK_NFA_MEMORY_MULTIPLIER, SCAN_WAIT_HISTOGRAM_BOUNDS_US,
 };
-use match_buffer::{NativeMatchBuffer, RawMatch};
+use match_buffer::{NativeMatchBuffer, RawMatch, ScanControl};
 
 const MAX_SCAN_PATH_BYTES: u64 = MAX_SCAN_INPUT_BYTES as u64;
 #[cfg(unix)]
@@ -122,6 +130,74 @@ fn ffi_boundary<T>(operation: impl FnOnce() -> PyResult<T>) -> PyResult<T> {
     }
 }
 
+/// Scan input borrowed from a Python object without copying it.
+///
+/// `bytes` and `str` are immutable; a `str` lends CPython's UTF-8 form, which is
+/// the string's own storage when it is ASCII. Other objects are borrowed only when
+/// they export a read-only, C-contiguous byte buffer of an immutable exporter, such
+/// as a `memoryview` slice of an `mmap` opened with `ACCESS_READ`; any other buffer
+/// is copied while the interpreter lock is held. The value holds the object or its
+/// buffer export until it is dropped, so the memory stays valid while the scan runs
+/// detached from the interpreter.
+enum ScanInput {
+    Bytes(PyBackedBytes),
+    Str(PyBackedStr),
+    Buffer(PyBuffer<u8>),
+    Copied(Vec<u8>),
+}
+
+impl ScanInput {
+    fn extract(haystack: &Bound<'_, PyAny>) -> PyResult<Self> {
+        if let Ok(bytes) = haystack.cast::<PyBytes>() {
+            return Ok(Self::Bytes(PyBackedBytes::from(bytes.clone())));
+        }
+        if let Ok(text) = haystack.cast::<PyString>() {
+            return Ok(Self::Str(PyBackedStr::try_from(text.clone())?));
+        }
+        let buffer = PyBuffer::<u8>::get(haystack).map_err(|_| {
+            PyTypeError::new_err("Bank scan haystack must be bytes, str, or a byte buffer")
+        })?;
+        if buffer.readonly() && buffer.is_c_contiguous() && immutable_buffer_exporter(haystack)? {
+            return Ok(Self::Buffer(buffer));
+        }
+        // A read-only view of a bytearray still changes when the bytearray does,
+        // and another thread could write it while the scan runs detached.
+        Ok(Self::Copied(buffer.to_vec(haystack.py())?))
+    }
+
+    fn as_bytes(&self) -> &[u8] {
+        match self {
+            Self::Bytes(bytes) => bytes.as_ref(),
+            Self::Str(text) => text.as_bytes(),
+            Self::Copied(bytes) => bytes,
+            Self::Buffer(buffer) if buffer.len_bytes() == 0 => &[],
+            // SAFETY: the export is read-only and C-contiguous, and its exporter is
+            // immutable, so its `len_bytes` bytes start at `buf_ptr` and cannot change;
+            // `self` keeps the export alive for the lifetime of the returned slice.
+            Self::Buffer(buffer) => unsafe {
+                std::slice::from_raw_parts(buffer.buf_ptr().cast::<u8>(), buffer.len_bytes())
+            },
+        }
+    }
+}
+
+fn immutable_buffer_exporter(haystack: &Bound<'_, PyAny>) -> PyResult<bool> {
+    let py = haystack.py();
+    let exporter = if haystack.is_instance_of::<PyMemoryView>() {
+        haystack.getattr("obj")?
+    } else {
+        haystack.clone()
+    };
+    if exporter.is_instance_of::<PyBytes>() {
+        return Ok(true);
+    }
+    let mmap = py.import("mmap")?.getattr("mmap")?;
+    if !exporter.is_instance(&mmap)? {
+        return Ok(false);
+    }
+    Ok(PyBuffer::<u8>::get(&exporter)?.readonly())
+}
+
 #[pyfunction]
 fn _is_word_character(character: &str) -> PyResult<bool> {
     ffi_boundary(|| {
@@ -411,6 +487,14 @@ struct PyBank {
     inner: NativeBank,
 }
 
+impl PyBank {
+    fn selection(&self, entities: Option<Vec<usize>>) -> PyResult<Option<EntitySelection>> {
+        Ok(entities
+            .map(|entities| self.inner.entity_selection(&entities))
+            .transpose()?)
+    }
+}
+
 #[pymethods]
 impl PyBank {
     #[staticmethod]
@@ -441,7 +525,7 @@ impl PyBank {
     }
 
     fn to_canonical_json_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
-        ffi_boundary(|| Ok(PyBytes::new(py, self.inner.canonical_json())))
+        ffi_boundary(|| Ok(PyBytes::new(py, &self.inner.canonical_json())))
     }
 
     fn metadata<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
@@ -481,6 +565,11 @@ impl PyBank {
             )?;
             metadata.set_item("defaults", defaults)?;
 
+            let normalization = PyDict::new(py);
+            normalization.set_item("form", self.inner.normalization().as_str())?;
+            normalization.set_item("unicode_data_version", normalize::unicode_version())?;
+            metadata.set_item("normalization", normalization)?;
+
             let json = py.import("json")?;
             let compile_options_json = serde_json::to_string(self.inner.compile_options())
                 .expect("compile options must serialize");
@@ -502,7 +591,13 @@ impl PyBank {
                 "maximum_concurrent_scans_per_bank",
                 MAX_CONCURRENT_SCANS_PER_ENGINE,
             )?;
+            scan_limits.set_item(
+                "wait_histogram_bounds_us",
+                SCAN_WAIT_HISTOGRAM_BOUNDS_US.to_vec(),
+            )?;
+            scan_limits.set_item("chunk_overlap_bytes", self.inner.chunk_overlap())?;
             metadata.set_item("scan_limits", scan_limits)?;
+            metadata.set_item("scan_stats", scan_stats_dict(py, &self.inner.scan_stats())?)?;
 
             if match_mode.as_str() == "entity_independent" {
                 let resources = self
@@ -585,16 +680,32 @@ impl PyBank {
                     MAX_ENTITY_INDEPENDENT_REGEX_ACCOUNTED_BYTES,
                 )?;
                 metadata.set_item("regex_resources", regex_resources)?;
+
+                let literals = self
+                    .inner
+                    .literal_resource_profile()
+                    .expect("entity-independent mode must expose its literal resource profile");
+                let literal_resources = PyDict::new(py);
+                literal_resources.set_item("scope", "entity_independent_shards")?;
+                literal_resources.set_item("literal_matcher", literals.literal_matcher.as_str())?;
+                literal_resources.set_item("literal_matchers", literals.literal_matchers)?;
+                literal_resources.set_item("literal_patterns", literals.literal_patterns)?;
+                literal_resources.set_item("automaton_bytes", literals.automaton_bytes)?;
+                literal_resources.set_item("literal_table_bytes", literals.literal_table_bytes)?;
+                literal_resources.set_item("accounted_bytes", literals.total_bytes())?;
+                literal_resources
+                    .set_item("accounted_bytes_per_pattern", literals.bytes_per_pattern())?;
+                metadata.set_item("literal_resources", literal_resources)?;
             }
 
             let detectors = PyList::empty(py);
             for detector in self.inner.detectors() {
                 let item = PyDict::new(py);
                 item.set_item("detector_index", detector.detector_index)?;
-                item.set_item("entity", &detector.entity)?;
-                item.set_item("canonical_name", &detector.canonical_name)?;
-                item.set_item("surface_name", &detector.surface_name)?;
-                item.set_item("stable_id", &detector.stable_id)?;
+                item.set_item("entity", detector.entity)?;
+                item.set_item("canonical_name", detector.canonical_name)?;
+                item.set_item("surface_name", detector.surface_name)?;
+                item.set_item("stable_id", detector.stable_id)?;
                 item.set_item("priority", detector.priority)?;
                 detectors.append(item)?;
             }
@@ -606,16 +717,13 @@ impl PyBank {
 
     fn detector_metadata(&self, detector_index: u32) -> PyResult<(String, String, String)> {
         ffi_boundary(|| {
-            let index = usize::try_from(detector_index).map_err(|_| {
-                PyIndexError::new_err(format!("detector index {detector_index} out of range"))
-            })?;
-            let detector = self.inner.detectors().get(index).ok_or_else(|| {
+            let detector = self.inner.detector(detector_index).ok_or_else(|| {
                 PyIndexError::new_err(format!("detector index {detector_index} out of range"))
             })?;
             Ok((
-                detector.entity.clone(),
-                detector.canonical_name.clone(),
-                detector.surface_name.clone(),
+                detector.entity.to_string(),
+                detector.canonical_name.to_string(),
+                detector.surface_name.to_string(),
             ))
         })
     }
@@ -624,10 +732,12 @@ impl PyBank {
     fn scan_bytes(
         &self,
         py: Python<'_>,
-        haystack: &[u8],
+        haystack: &Bound<'_, PyAny>,
         out: Option<Py<PyMatchBuffer>>,
     ) -> PyResult<Py<PyMatchBuffer>> {
         ffi_boundary(|| {
+            let input = ScanInput::extract(haystack)?;
+            let haystack = input.as_bytes();
             let size_result = validate_scan_input_size(haystack).map_err(PyErr::from);
             match out {
                 Some(out) => {
@@ -636,7 +746,9 @@ impl PyBank {
                         std::mem::take(&mut borrowed.inner)
                     };
                     buffer.clear();
+                    // A buffer last used by a bounded `scan_bytes_with` still carries its limit.
                     let scan_result = size_result.and_then(|()| {
+                        buffer.set_match_limit(None)?;
                         py.detach(|| self.inner.scan_bytes_into(haystack, &mut buffer))
                             .map_err(PyErr::from)
                     });
@@ -656,16 +768,256 @@ impl PyBank {
     fn scan_bytes_bounded(
         &self,
         py: Python<'_>,
-        haystack: &[u8],
+        haystack: &Bound<'_, PyAny>,
         max_matches: usize,
     ) -> PyResult<Py<PyMatchBuffer>> {
         ffi_boundary(|| {
+            let input = ScanInput::extract(haystack)?;
+            let haystack = input.as_bytes();
             validate_scan_input_size(haystack).map_err(PyErr::from)?;
             let buffer = py.detach(|| self.inner.scan_bytes_bounded(haystack, max_matches))?;
             Py::new(py, PyMatchBuffer { inner: buffer })
         })
     }
 
+    /// Scan slot admission counters, wait histogram, and the current active scan count.
+    fn scan_stats<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        ffi_boundary(|| scan_stats_dict(py, &self.inner.scan_stats()))
+    }
+
+    /// Entity names in canonical order; the `entities` scan arguments take positions in this list.
+    fn entity_names(&self) -> PyResult<Vec<String>> {
+        ffi_boundary(|| {
+            Ok(self
+                .inner
+                .canonical()
+                .entities
+                .iter()
+                .map(|entity| entity.name.clone())
+                .collect())
+        })
+    }
+
+    /// Check that scans can select `entities` without running a scan.
+    ///
+    /// Fails like a selected scan would: the bank must use `entity_independent`
+    /// and every position must index `entity_names`.
+    fn validate_entities(&self, entities: Vec<usize>) -> PyResult<()> {
+        ffi_boundary(|| {
+            self.selection(Some(entities))?;
+            Ok(())
+        })
+    }
+
+    /// Scan with an optional entity selection, match limit, deadline, cancel token, and slot wait bound.
+    ///
+    /// With `out`, the matches replace the contents of that buffer, which keeps
+    /// its capacity across scans; a failed scan leaves it empty.
+    #[pyo3(signature = (haystack, entities=None, max_matches=None, deadline_ms=None, cancel=None, max_wait_ms=None, out=None))]
+    fn scan_bytes_with(
+        &self,
+        py: Python<'_>,
+        haystack: &Bound<'_, PyAny>,
+        entities: Option<Vec<usize>>,
+        max_matches: Option<usize>,
+        deadline_ms: Option<u64>,
+        cancel: Option<PyRef<'_, PyCancelToken>>,
+        max_wait_ms: Option<u64>,
+        out: Option<Py<PyMatchBuffer>>,
+    ) -> PyResult<Py<PyMatchBuffer>> {
+        ffi_boundary(|| {
+            let input = ScanInput::extract(haystack)?;
+            let haystack = input.as_bytes();
+            let control = scan_control(deadline_ms, cancel.as_deref(), max_wait_ms);
+            let selection = self.selection(entities)?;
+            let options = scan_options(selection.as_ref(), control.as_ref());
+            match out {
+                Some(out) => {
+                    let mut buffer = {
+                        let mut borrowed = out.bind(py).borrow_mut();
+                        std::mem::take(&mut borrowed.inner)
+                    };
+                    let scan_result = py.detach(|| {
+                        self.inner
+                            .scan_bytes_with_into(haystack, &mut buffer, max_matches, options)
+                    });
+                    out.bind(py).borrow_mut().inner = buffer;
+                    scan_result?;
+                    Ok(out)
+                }
+                None => {
+                    validate_scan_input_size(haystack).map_err(PyErr::from)?;
+                    let buffer =
+                        py.detach(|| self.inner.scan_bytes_with(haystack, max_matches, options))?;
+                    Py::new(py, PyMatchBuffer { inner: buffer })
+                }
+            }
+        })
+    }
+
+    /// Scan one long haystack as concurrent chunks on up to `threads` workers.
+    ///
+    /// The result equals `scan_bytes_with`; banks without a chunk overlap scan serially.
+    #[pyo3(signature = (haystack, threads, entities=None, max_matches=None, deadline_ms=None, cancel=None, max_wait_ms=None))]
+    fn scan_bytes_chunked(
+        &self,
+        py: Python<'_>,
+        haystack: &Bound<'_, PyAny>,
+        threads: usize,
+        entities: Option<Vec<usize>>,
+        max_matches: Option<usize>,
+        deadline_ms: Option<u64>,
+        cancel: Option<PyRef<'_, PyCancelToken>>,
+        max_wait_ms: Option<u64>,
+    ) -> PyResult<Py<PyMatchBuffer>> {
+        ffi_boundary(|| {
+            let input = ScanInput::extract(haystack)?;
+            let haystack = input.as_bytes();
+            let control = scan_control(deadline_ms, cancel.as_deref(), max_wait_ms);
+            let selection = self.selection(entities)?;
+            let buffer = py.detach(|| {
+                self.inner.scan_bytes_chunked(
+                    haystack,
+                    max_matches,
+                    scan_options(selection.as_ref(), control.as_ref()),
+                    threads,
+                )
+            })?;
+            Py::new(py, PyMatchBuffer { inner: buffer })
+        })
+    }
+
+    /// Return `(first, end, winner)` for every run of overlapping matches in `buffer`.
+    ///
+    /// `first..end` are buffer indices; `winner` is the match the priority policy keeps.
+    #[pyo3(signature = (buffer, tie_ranks=None))]
+    fn resolve_overlaps(
+        &self,
+        buffer: PyRef<'_, PyMatchBuffer>,
+        tie_ranks: Option<Vec<u32>>,
+    ) -> PyResult<Vec<(usize, usize, usize)>> {
+        ffi_boundary(|| {
+            let groups = self
+                .inner
+                .resolve_overlaps(&buffer.inner, tie_ranks.as_deref())?;
+            Ok(groups
+                .into_iter()
+                .map(|group| (group.first, group.end, group.winner))
+                .collect())
+        })
+    }
+
+    /// Return the first `stop_after` matches of a full scan, stopping the scan early.
+    #[pyo3(signature = (haystack, stop_after, entities=None, deadline_ms=None, cancel=None, max_wait_ms=None))]
+    fn scan_bytes_first(
+        &self,
+        py: Python<'_>,
+        haystack: &Bound<'_, PyAny>,
+        stop_after: usize,
+        entities: Option<Vec<usize>>,
+        deadline_ms: Option<u64>,
+        cancel: Option<PyRef<'_, PyCancelToken>>,
+        max_wait_ms: Option<u64>,
+    ) -> PyResult<Py<PyMatchBuffer>> {
+        ffi_boundary(|| {
+            let input = ScanInput::extract(haystack)?;
+            let haystack = input.as_bytes();
+            validate_scan_input_size(haystack).map_err(PyErr::from)?;
+            let control = scan_control(deadline_ms, cancel.as_deref(), max_wait_ms);
+            let selection = self.selection(entities)?;
+            let buffer = py.detach(|| {
+                self.inner.scan_bytes_first(
+                    haystack,
+                    stop_after,
+                    scan_options(selection.as_ref(), control.as_ref()),
+                )
+            })?;
+            Py::new(py, PyMatchBuffer { inner: buffer })
+        })
+    }
+
+    /// Report whether the haystack has any match, ending the scan at the first one.
+    #[pyo3(signature = (haystack, entities=None, deadline_ms=None, cancel=None, max_wait_ms=None))]
+    fn contains_any(
+        &self,
+        py: Python<'_>,
+        haystack: &Bound<'_, PyAny>,
+        entities: Option<Vec<usize>>,
+        deadline_ms: Option<u64>,
+        cancel: Option<PyRef<'_, PyCancelToken>>,
+        max_wait_ms: Option<u64>,
+    ) -> PyResult<bool> {
+        ffi_boundary(|| {
+            let input = ScanInput::extract(haystack)?;
+            let haystack = input.as_bytes();
+            validate_scan_input_size(haystack).map_err(PyErr::from)?;
+            let control = scan_control(deadline_ms, cancel.as_deref(), max_wait_ms);
+            let selection = self.selection(entities)?;
+            Ok(py.detach(|| {
+                self.inner
+                    .contains_any(haystack, scan_options(selection.as_ref(), control.as_ref()))
+            })?)
+        })
+    }
+
+    /// Count matches per detector index without building a match buffer.
+    #[pyo3(signature = (haystack, entities=None, deadline_ms=None, cancel=None, max_wait_ms=None))]
+    fn count_bytes(
+        &self,
+        py: Python<'_>,
+        haystack: &Bound<'_, PyAny>,
+        entities: Option<Vec<usize>>,
+        deadline_ms: Option<u64>,
+        cancel: Option<PyRef<'_, PyCancelToken>>,
+        max_wait_ms: Option<u64>,
+    ) -> PyResult<Vec<u64>> {
+        ffi_boundary(|| {
+            let input = ScanInput::extract(haystack)?;
+            let haystack = input.as_bytes();
+            validate_scan_input_size(haystack).map_err(PyErr::from)?;
+            let control = scan_control(deadline_ms, cancel.as_deref(), max_wait_ms);
+            let selection = self.selection(entities)?;
+            Ok(py.detach(|| {
+                self.inner
+                    .count_bytes(haystack, scan_options(selection.as_ref(), control.as_ref()))
+            })?)
+        })
+    }
+
+    #[pyo3(signature = (haystacks, max_matches=None, threads=1, entities=None))]
+    fn scan_bytes_batch(
+        &self,
+        py: Python<'_>,
+        haystacks: Vec<Bound<'_, PyAny>>,
+        max_matches: Option<usize>,
+        threads: usize,
+        entities: Option<Vec<usize>>,
+    ) -> PyResult<Vec<Py<PyMatchBuffer>>> {
+        ffi_boundary(|| {
+            let inputs = haystacks
+                .iter()
+                .map(ScanInput::extract)
+                .collect::<PyResult<Vec<_>>>()?;
+            let slices: Vec<&[u8]> = inputs.iter().map(ScanInput::as_bytes).collect();
+            for haystack in &slices {
+                validate_scan_input_size(haystack).map_err(PyErr::from)?;
+            }
+            let selection = self.selection(entities)?;
+            let buffers = py.detach(|| {
+                self.inner.scan_bytes_batch(
+                    &slices,
+                    max_matches,
+                    scan_options(selection.as_ref(), None),
+                    threads,
+                )
+            })?;
+            buffers
+                .into_iter()
+                .map(|inner| Py::new(py, PyMatchBuffer { inner }))
+                .collect()
+        })
+    }
+
     #[pyo3(signature = (haystack, out=None))]
     fn scan_bytes_leftmost_from_all_overlaps(
         &self,
@@ -683,6 +1035,7 @@ impl PyBank {
                     };
                     buffer.clear();
                     let scan_result = size_result.and_then(|()| {
+                        buffer.set_match_limit(None)?;
                         py.detach(|| {
                             self.inner
                                 .scan_bytes_leftmost_from_all_overlaps(haystack, &mut buffer)
@@ -721,6 +1074,7 @@ impl PyBank {
                 };
                 let scan_result = py.detach(|| {
                     buffer.clear();
+                    buffer.set_match_limit(None)?;
                     let haystack = read_scan_path(path)?;
                     self.inner.scan_bytes_into(&haystack, &mut buffer)?;
                     Ok::<(), PyErr>(())
@@ -739,15 +1093,29 @@ impl PyBank {
         })
     }
 
+    /// Scan a file and return its matches with its bytes; `threads` above 1 scans it in chunks.
+    ///
+    /// With `entities`, only the selected entities' shards are scanned.
+    #[pyo3(signature = (path, threads=1, entities=None))]
     fn scan_path_with_bytes<'py>(
         &self,
         py: Python<'py>,
         path: &str,
+        threads: usize,
+        entities: Option<Vec<usize>>,
     ) -> PyResult<(Py<PyMatchBuffer>, Bound<'py, PyBytes>)> {
         ffi_boundary(|| {
+            let selection = self.selection(entities)?;
+            let options = scan_options(selection.as_ref(), None);
             let (buffer, haystack) = py.detach(|| {
                 let haystack = read_scan_path(path)?;
-                let buffer = self.inner.scan_bytes(&haystack).map_err(PyErr::from)?;
+                let buffer = if threads == 1 {
+                    self.inner.scan_bytes_with(&haystack, None, options)
+                } else {
+                    self.inner
+                        .scan_bytes_chunked(&haystack, None, options, threads)
+                }
+                .map_err(PyErr::from)?;
                 Ok::<(NativeMatchBuffer, Vec<u8>), PyErr>((buffer, haystack))
             })?;
             Ok((
@@ -789,6 +1157,75 @@ fn read_scan_path(path: &str) -> PyResult<Vec<u8>> {
     Ok(haystack)
 }
 
+/// Shared flag that cancels every scan it is passed to once set.
+#[pyclass(name = "CancelToken", frozen)]
+struct PyCancelToken {
+    flag: Arc<AtomicBool>,
+}
+
+#[pymethods]
+impl PyCancelToken {
+    #[new]
+    fn new() -> Self {
+        PyCancelToken {
+            flag: Arc::new(AtomicBool::new(false)),
+        }
+    }
+
+    fn cancel(&self) {
+        self.flag.store(true, Ordering::Relaxed);
+    }
+
+    #[getter]
+    fn cancelled(&self) -> bool {
+        self.flag.load(Ordering::Relaxed)
+    }
+}
+
+/// Deadlines start counting when the call is made, before the GIL is released.
+fn scan_control(
+    deadline_ms: Option<u64>,
+    cancel: Option<&PyCancelToken>,
+    max_wait_ms: Option<u64>,
+) -> Option<ScanControl> {
+    if deadline_ms.is_none() && cancel.is_none() && max_wait_ms.is_none() {
+        return None;
+    }
+    Some(ScanControl {
+        deadline: deadline_ms.and_then(|ms| Instant::now().checked_add(Duration::from_millis(ms))),
+        cancel: cancel.map(|token| Arc::clone(&token.flag)),
+        max_wait: max_wait_ms.map(Duration::from_millis),
+    })
+}
+
+fn scan_stats_dict<'py>(py: Python<'py>, stats: &ScanLimiterStats) -> PyResult<Bound<'py, PyDict>> {
+    let dict = PyDict::new(py);
+    dict.set_item("max_concurrent_scans", MAX_CONCURRENT_SCANS_PER_ENGINE)?;
+    dict.set_item("active", stats.active)?;
+    dict.set_item("high_water", stats.high_water)?;
+    dict.set_item("acquisitions", stats.acquisitions)?;
+    dict.set_item("contended", stats.contended)?;
+    dict.set_item("rejected", stats.rejected)?;
+    dict.set_item("total_wait_us", stats.total_wait_us)?;
+    dict.set_item("max_wait_us", stats.max_wait_us)?;
+    let histogram = PyList::empty(py);
+    for (index, count) in stats.wait_histogram.iter().enumerate() {
+        let bucket = PyDict::new(py);
+        bucket.set_item("le_us", SCAN_WAIT_HISTOGRAM_BOUNDS_US.get(index).copied())?;
+        bucket.set_item("count", *count)?;
+        histogram.append(bucket)?;
+    }
+    dict.set_item("wait_histogram", histogram)?;
+    Ok(dict)
+}
+
+fn scan_options<'a>(
+    selection: Option<&'a EntitySelection>,
+    control: Option<&'a ScanControl>,
+) -> ScanOptions<'a> {
+    ScanOptions { selection, control }
+}
+
 #[pyclass(name = "MatchBuffer")]
 struct PyMatchBuffer {
     inner: NativeMatchBuffer,
@@ -890,8 +1327,10 @@ fn _engine(module: &Bound<'_, PyModule>) -> PyResult<()> {
         "BUILD_SOURCE_SHA256",
         env!("NERB_NATIVE_BUILD_SOURCE_SHA256"),
     )?;
+    module.add("RAW_MATCH_BYTES", std::mem::size_of::<RawMatch>())?;
     module.add_class::<PyBank>()?;
     module.add_class::<PyMatchBuffer>()?;
+    module.add_class::<PyCancelToken>()?;
     module.add_function(wrap_pyfunction!(_is_word_character, module)?)?;
     module.add_function(wrap_pyfunction!(_close_fd_once, module)?)?;
     module.add_function(wrap_pyfunction!(_fsync_fd_commit, module)?)?;
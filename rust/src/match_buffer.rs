@@ -1,6 +1,53 @@
-use crate::error::{memory, validation, Result};
+use crate::error::{memory, validation, BankError, InterruptReason, Result};
+use std::cmp::Reverse;
+use std::collections::binary_heap::PeekMut;
+use std::collections::BinaryHeap;
+use std::sync::atomic::{AtomicBool, Ordering as AtomicOrdering};
+use std::sync::Arc;
+use std::time::{Duration, Instant};
 
 const MAX_PRE_SCAN_MATCH_BUFFER_CAPACITY: usize = 1_000_000;
+// Reading the clock per match would cost more than most literal matches.
+const INTERRUPT_CHECK_INTERVAL: u32 = 64;
+
+/// Deadline and cancellation flag that one scan checks while it collects matches.
+///
+/// `max_wait` bounds only the wait for a scan slot; a scan that gets no slot
+/// in time fails as busy instead of queueing behind the running scans.
+#[derive(Clone, Debug, Default)]
+pub struct ScanControl {
+    pub deadline: Option<Instant>,
+    pub cancel: Option<Arc<AtomicBool>>,
+    pub max_wait: Option<Duration>,
+}
+
+impl ScanControl {
+    fn is_unbounded(&self) -> bool {
+        self.deadline.is_none() && self.cancel.is_none()
+    }
+
+    pub(crate) fn interrupt_reason(&self) -> Option<InterruptReason> {
+        if self
+            .cancel
+            .as_ref()
+            .is_some_and(|cancel| cancel.load(AtomicOrdering::Relaxed))
+        {
+            return Some(InterruptReason::Cancelled);
+        }
+        self.deadline
+            .is_some_and(|deadline| Instant::now() >= deadline)
+            .then_some(InterruptReason::DeadlineExceeded)
+    }
+}
+
+#[derive(Clone, Debug)]
+struct ScanProgress {
+    control: ScanControl,
+    started: Instant,
+    shards_total: usize,
+    shards_completed: usize,
+    unchecked_pushes: u32,
+}
 
 #[derive(Clone, Copy, Debug, PartialEq, Eq)]
 pub struct RawMatch {
@@ -29,10 +76,24 @@ impl RawMatch {
     }
 }
 
+/// One run of overlapping matches and the match the priority policy keeps.
+///
+/// `first..end` indexes the matches of the run in buffer order; every other
+/// match of the run is dropped in favour of `winner`.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct OverlapGroup {
+    pub first: usize,
+    pub end: usize,
+    pub winner: usize,
+}
+
 #[derive(Clone, Debug)]
 pub struct NativeMatchBuffer {
     matches: Vec<RawMatch>,
     max_matches: usize,
+    stop_len: Option<usize>,
+    counts: Option<Vec<u64>>,
+    progress: Option<Box<ScanProgress>>,
 }
 
 impl Default for NativeMatchBuffer {
@@ -40,6 +101,9 @@ impl Default for NativeMatchBuffer {
         Self {
             matches: Vec::new(),
             max_matches: MAX_PRE_SCAN_MATCH_BUFFER_CAPACITY,
+            stop_len: None,
+            counts: None,
+            progress: None,
         }
     }
 }
@@ -55,15 +119,112 @@ impl NativeMatchBuffer {
         try_reserve_exact(&mut matches, capacity)?;
         Ok(Self {
             matches,
-            max_matches: MAX_PRE_SCAN_MATCH_BUFFER_CAPACITY,
+            ..Self::default()
         })
     }
 
     pub fn with_match_limit(max_matches: usize) -> Result<Self> {
         validate_capacity(max_matches)?;
         Ok(Self {
-            matches: Vec::new(),
             max_matches,
+            ..Self::default()
+        })
+    }
+
+    /// Replace the match limit of a reused buffer; `None` restores the default.
+    pub fn set_match_limit(&mut self, max_matches: Option<usize>) -> Result<()> {
+        self.max_matches = match max_matches {
+            Some(max_matches) => {
+                validate_capacity(max_matches)?;
+                max_matches
+            }
+            None => MAX_PRE_SCAN_MATCH_BUFFER_CAPACITY,
+        };
+        Ok(())
+    }
+
+    /// Build a buffer that tallies pushed matches per detector instead of storing them.
+    ///
+    /// A counting buffer stays empty, so neither the pre-scan capacity nor a
+    /// match limit bounds how many matches it can count.
+    pub fn counting(detector_count: usize) -> Self {
+        Self {
+            counts: Some(vec![0; detector_count]),
+            ..Self::default()
+        }
+    }
+
+    /// Return the per-detector tallies of a counting buffer.
+    pub fn counts(&self) -> Option<&[u64]> {
+        self.counts.as_deref()
+    }
+
+    /// Let leftmost scans stop collecting once the buffer holds `len` matches.
+    pub fn stop_at(&mut self, len: Option<usize>) {
+        self.stop_len = len;
+    }
+
+    pub fn is_stopped(&self) -> bool {
+        self.stop_len.is_some_and(|len| self.matches.len() >= len)
+    }
+
+    pub fn truncate(&mut self, len: usize) {
+        self.matches.truncate(len);
+    }
+
+    /// Start checking `control` while this buffer collects one scan's matches.
+    ///
+    /// `None` or a control without a deadline or cancellation flag turns the
+    /// checks off.
+    pub fn set_control(&mut self, control: Option<&ScanControl>) {
+        self.progress = control
+            .filter(|control| !control.is_unbounded())
+            .map(|control| {
+                Box::new(ScanProgress {
+                    control: control.clone(),
+                    started: Instant::now(),
+                    shards_total: 0,
+                    shards_completed: 0,
+                    unchecked_pushes: 0,
+                })
+            });
+    }
+
+    /// Record how many shards the controlled scan will visit.
+    pub fn set_shard_total(&mut self, shards_total: usize) {
+        if let Some(progress) = &mut self.progress {
+            progress.shards_total = shards_total;
+            progress.shards_completed = 0;
+        }
+    }
+
+    pub fn finish_shard(&mut self) {
+        if let Some(progress) = &mut self.progress {
+            progress.shards_completed += 1;
+        }
+    }
+
+    /// Fail with the scan's progress once its deadline passed or it was cancelled.
+    pub fn check_interrupt(&mut self) -> Result<()> {
+        let Some(progress) = &mut self.progress else {
+            return Ok(());
+        };
+        progress.unchecked_pushes = 0;
+        let Some(reason) = progress.control.interrupt_reason() else {
+            return Ok(());
+        };
+        let elapsed_ms = u64::try_from(progress.started.elapsed().as_millis()).unwrap_or(u64::MAX);
+        let (shards_completed, shards_total) = (progress.shards_completed, progress.shards_total);
+        let matches = match &self.counts {
+            Some(counts) => counts.iter().sum(),
+            None => self.matches.len() as u64,
+        };
+        Err(BankError::Interrupted {
+            reason,
+            elapsed_ms,
+            shards_completed,
+            shards_total,
+            matches,
         })
     }
 
@@ -96,6 +257,26 @@ impl NativeMatchBuffer {
     }
 
     pub fn push(&mut self, raw_match: RawMatch) -> Result<()> {
+        if let Some(progress) = &mut self.progress {
+            progress.unchecked_pushes += 1;
+            if progress.unchecked_pushes >= INTERRUPT_CHECK_INTERVAL {
+                self.check_interrupt()?;
+            }
+        }
+        if let Some(counts) = &mut self.counts {
+            let detector_index = raw_match.detector_index;
+            let Some(count) = usize::try_from(detector_index)
+                .ok()
+                .and_then(|index| counts.get_mut(index))
+            else {
+                return Err(validation(
+                    "/match_buffer/counts",
+                    format!("detector index {detector_index} is outside the counted detectors"),
+                ));
+            };
+            *count += 1;
+            return Ok(());
+        }
         let requested = self.matches.len().checked_add(1).ok_or_else(|| {
             memory(
                 "/match_buffer",
@@ -122,10 +303,169 @@ impl NativeMatchBuffer {
         });
     }
 
+    /// Sort by byte offsets, breaking span ties by each detector's rank.
+    ///
+    /// `ranks` is indexed by detector index; a detector without a rank sorts
+    /// after every ranked detector sharing its span.
+    pub fn sort_by_rank(&mut self, ranks: &[u32]) {
+        self.matches
+            .sort_by_key(|raw_match| ranked_key(raw_match, ranks));
+    }
+
+    /// Rewrite every span through `project` and restore [`Self::sort_by_rank`] order.
+    ///
+    /// `project` must not reorder positions. Matches that it collapses onto
+    /// the same detector and span are kept once.
+    pub fn project_spans(
+        &mut self,
+        ranks: &[u32],
+        project: impl Fn(u64, u64) -> (u64, u64),
+    ) -> Result<()> {
+        for raw_match in &mut self.matches {
+            let (start_byte, end_byte) = project(raw_match.start_byte, raw_match.end_byte);
+            *raw_match = RawMatch::new(raw_match.detector_index, start_byte, end_byte)?;
+        }
+        if !self
+            .matches
+            .is_sorted_by_key(|raw_match| ranked_key(raw_match, ranks))
+        {
+            self.sort_by_rank(ranks);
+        }
+        self.matches.dedup();
+        Ok(())
+    }
+
+    /// Merge consecutive runs into the order produced by [`Self::sort_by_rank`].
+    ///
+    /// `run_starts` lists the first index of every run in ascending order.
+    /// Runs that are already ordered, as leftmost scans emit them, are merged
+    /// with a heap in `O(n log k)`; an unordered run is sorted in place first.
+    pub fn merge_sorted_runs(&mut self, run_starts: &[usize], ranks: &[u32]) -> Result<()> {
+        let mut runs = Vec::new();
+        try_reserve_runs(&mut runs, run_starts.len())?;
+        for (run_index, &start) in run_starts.iter().enumerate() {
+            let end = run_starts
+                .get(run_index + 1)
+                .copied()
+                .unwrap_or(self.matches.len());
+            if start > end || end > self.matches.len() {
+                return Err(validation(
+                    "/match_buffer/runs",
+                    format!("match run {start}..{end} is outside the match buffer"),
+                ));
+            }
+            if start == end {
+                continue;
+            }
+            let run = &mut self.matches[start..end];
+            if !run.is_sorted_by_key(|raw_match| ranked_key(raw_match, ranks)) {
+                run.sort_by_key(|raw_match| ranked_key(raw_match, ranks));
+            }
+            runs.push((start, end));
+        }
+        if runs.len() < 2 {
+            return Ok(());
+        }
+
+        let mut heap = BinaryHeap::new();
+        heap.try_reserve_exact(runs.len()).map_err(|error| {
+            memory(
+                "/match_buffer",
+                format!("could not reserve match run heap capacity: {error}"),
+            )
+        })?;
+        for (run_index, &(start, _end)) in runs.iter().enumerate() {
+            heap.push(Reverse((
+                ranked_key(&self.matches[start], ranks),
+                run_index,
+            )));
+        }
+        let mut merged = Vec::new();
+        try_reserve_exact(&mut merged, self.matches.len())?;
+        // Replacing the heap top in place sifts once per match instead of a
+        // separate pop and push.
+        while let Some(mut top) = heap.peek_mut() {
+            let Reverse((_key, run_index)) = *top;
+            let (cursor, end) = &mut runs[run_index];
+            merged.push(self.matches[*cursor]);
+            *cursor += 1;
+            if *cursor < *end {
+                *top = Reverse((ranked_key(&self.matches[*cursor], ranks), run_index));
+            } else {
+                PeekMut::pop(top);
+            }
+        }
+        self.matches = merged;
+        Ok(())
+    }
+
     pub fn get(&self, index: usize) -> Option<RawMatch> {
         self.matches.get(index).copied()
     }
 
+    /// Group span-ordered matches into runs that overlap and pick each run's winner.
+    ///
+    /// A match joins the current run while it starts before the run's furthest
+    /// end. Only runs of two or more matches are returned. The winner has the
+    /// lowest `priorities` value, then the longest span, then the leftmost
+    /// start, then the lowest `ranks` value; both slices are indexed by
+    /// detector index.
+    pub fn overlap_groups(&self, priorities: &[i64], ranks: &[u32]) -> Result<Vec<OverlapGroup>> {
+        let detector_count = priorities.len().min(ranks.len());
+        if let Some(raw_match) = self
+            .matches
+            .iter()
+            .find(|raw_match| raw_match.detector_index as usize >= detector_count)
+        {
+            return Err(validation(
+                "/match_buffer/detector_index",
+                format!(
+                    "match detector index {} is outside this bank's {detector_count} detectors",
+                    raw_match.detector_index
+                ),
+            ));
+        }
+        let key = |index: usize| {
+            let raw_match = &self.matches[index];
+            let detector = raw_match.detector_index as usize;
+            (
+                priorities[detector],
+                Reverse(raw_match.end_byte - raw_match.start_byte),
+                raw_match.start_byte,
+                ranks[detector],
+                index,
+            )
+        };
+
+        let mut groups = Vec::new();
+        let mut first = 0;
+        let mut current_end = 0;
+        for index in 0..=self.matches.len() {
+            let next = self.matches.get(index);
+            if let Some(raw_match) = next {
+                if index > first && raw_match.start_byte < current_end {
+                    current_end = current_end.max(raw_match.end_byte);
+                    continue;
+                }
+            }
+            if index - first > 1 {
+                let winner = (first..index)
+                    .min_by_key(|&candidate| key(candidate))
+                    .expect("overlap runs hold at least two matches");
+                groups.push(OverlapGroup {
+                    first,
+                    end: index,
+                    winner,
+                });
+            }
+            if let Some(raw_match) = next {
+                first = index;
+                current_end = raw_match.end_byte;
+            }
+        }
+        Ok(groups)
+    }
+
     fn validate_match_limit(&self, requested: usize) -> Result<()> {
         if requested > self.max_matches {
             return Err(memory(
@@ -152,6 +492,29 @@ fn validate_capacity(capacity: usize) -> Result<()> {
     Ok(())
 }
 
+fn ranked_key(raw_match: &RawMatch, ranks: &[u32]) -> (u64, u64, u32, u32) {
+    let rank = usize::try_from(raw_match.detector_index)
+        .ok()
+        .and_then(|index| ranks.get(index))
+        .copied()
+        .unwrap_or(u32::MAX);
+    (
+        raw_match.start_byte,
+        raw_match.end_byte,
+        rank,
+        raw_match.detector_index,
+    )
+}
+
+fn try_reserve_runs(runs: &mut Vec<(usize, usize)>, additional: usize) -> Result<()> {
+    runs.try_reserve_exact(additional).map_err(|error| {
+        memory(
+            "/match_buffer",
+            format!("could not reserve match run capacity: {error}"),
+        )
+    })
+}
+
 fn try_reserve_exact(matches: &mut Vec<RawMatch>, additional: usize) -> Result<()> {
     matches.try_reserve_exact(additional).map_err(|error| {
         memory(
@@ -223,6 +586,54 @@ mod tests {
         assert!(error.to_string().contains("exceeds pre-scan limit"));
     }
 
+    #[test]
+    fn match_buffer_merges_runs_by_offsets_and_detector_rank() {
+        let mut buffer = NativeMatchBuffer::new();
+        for (detector_index, start, end) in [
+            (0, 0, 3),
+            (0, 4, 7),
+            (1, 0, 3),
+            (1, 8, 9),
+            (2, 5, 6),
+            (2, 0, 3),
+        ] {
+            buffer
+                .push(RawMatch::new(detector_index, start, end).unwrap())
+                .unwrap();
+        }
+        let ranks = [2, 0, 1];
+
+        buffer.merge_sorted_runs(&[0, 2, 4, 6], &ranks).unwrap();
+        let merged = (0..buffer.len())
+            .map(|index| buffer.get(index).unwrap().as_tuple())
+            .collect::<Vec<_>>();
+        let mut sorted = buffer.clone();
+        sorted.sort_by_rank(&ranks);
+
+        assert_eq!(
+            merged,
+            [
+                (1, 0, 3),
+                (2, 0, 3),
+                (0, 0, 3),
+                (0, 4, 7),
+                (2, 5, 6),
+                (1, 8, 9)
+            ]
+        );
+        assert_eq!(
+            merged,
+            (0..sorted.len())
+                .map(|index| sorted.get(index).unwrap().as_tuple())
+                .collect::<Vec<_>>()
+        );
+        assert!(buffer
+            .merge_sorted_runs(&[0, 7], &ranks)
+            .unwrap_err()
+            .to_string()
+            .contains("outside the match buffer"));
+    }
+
     #[test]
     fn match_buffer_sorts_by_offsets_and_detector_index() {
         let mut buffer = NativeMatchBuffer::new();
@@ -252,6 +663,72 @@ mod tests {
         assert!(buffer.capacity() >= 2);
     }
 
+    #[test]
+    fn counting_buffer_tallies_detectors_without_storing_matches() {
+        let mut buffer = NativeMatchBuffer::counting(3);
+        for detector_index in [2, 0, 2] {
+            buffer
+                .push(RawMatch::new(detector_index, 0, 1).unwrap())
+                .unwrap();
+        }
+
+        assert!(buffer.is_empty());
+        assert_eq!(buffer.counts(), Some(&[1, 0, 2][..]));
+        assert!(buffer
+            .push(RawMatch::new(3, 0, 1).unwrap())
+            .unwrap_err()
+            .to_string()
+            .contains("outside the counted detectors"));
+    }
+
+    #[test]
+    fn match_buffer_reports_stop_length() {
+        let mut buffer = NativeMatchBuffer::new();
+        buffer.stop_at(Some(1));
+        assert!(!buffer.is_stopped());
+        buffer.push(RawMatch::new(0, 0, 1).unwrap()).unwrap();
+        assert!(buffer.is_stopped());
+        buffer.stop_at(None);
+        assert!(!buffer.is_stopped());
+    }
+
+    #[test]
+    fn controlled_buffer_reports_progress_when_cancelled() {
+        let cancel = Arc::new(AtomicBool::new(false));
+        let mut buffer = NativeMatchBuffer::new();
+        buffer.set_control(Some(&ScanControl {
+            deadline: None,
+            cancel: Some(Arc::clone(&cancel)),
+            max_wait: None,
+        }));
+        buffer.set_shard_total(3);
+        buffer.push(RawMatch::new(0, 0, 1).unwrap()).unwrap();
+        buffer.finish_shard();
+        buffer.check_interrupt().unwrap();
+
+        cancel.store(true, AtomicOrdering::Relaxed);
+        let error = buffer.check_interrupt().unwrap_err();
+
+        assert!(matches!(
+            error,
+            BankError::Interrupted {
+                reason: InterruptReason::Cancelled,
+                shards_completed: 1,
+                shards_total: 3,
+                matches: 1,
+                ..
+            }
+        ));
+        assert!(error.to_string().contains("scan was cancelled after"));
+        for _ in 0..INTERRUPT_CHECK_INTERVAL - 1 {
+            buffer.push(RawMatch::new(0, 0, 1).unwrap()).unwrap();
+        }
+        assert!(buffer.push(RawMatch::new(0, 0, 1).unwrap()).is_err());
+
+        buffer.set_control(Some(&ScanControl::default()));
+        buffer.check_interrupt().unwrap();
+    }
+
     #[test]
     fn match_buffer_enforces_configured_match_limit_while_collecting() {
         let mut buffer = NativeMatchBuffer::with_match_limit(2).unwrap();
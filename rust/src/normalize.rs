@@ -0,0 +1,269 @@
+use crate::error::{validation, Result};
+use std::borrow::Cow;
+use unicode_normalization::char::canonical_combining_class;
+use unicode_normalization::{is_nfc_quick, is_nfkc_quick, IsNormalized, UnicodeNormalization};
+
+/// Unicode normalization form a bank applies to its patterns and scanned text.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub enum NormalizationForm {
+    #[default]
+    None,
+    Nfc,
+    Nfkc,
+}
+
+impl NormalizationForm {
+    pub fn parse(value: &str, path: &str) -> Result<Self> {
+        match value {
+            "none" => Ok(Self::None),
+            "NFC" => Ok(Self::Nfc),
+            "NFKC" => Ok(Self::Nfkc),
+            _ => Err(validation(
+                path,
+                format!(
+                    "unicode normalization must be \"none\", \"NFC\", or \"NFKC\"; got {value:?}"
+                ),
+            )),
+        }
+    }
+
+    pub fn as_str(self) -> &'static str {
+        match self {
+            Self::None => "none",
+            Self::Nfc => "NFC",
+            Self::Nfkc => "NFKC",
+        }
+    }
+
+    /// Return `text` in this form, borrowing it when it is already normalized.
+    pub fn normalize(self, text: &str) -> Cow<'_, str> {
+        if self.is_normalized(text) {
+            return Cow::Borrowed(text);
+        }
+        let mut normalized = String::with_capacity(text.len());
+        self.extend(&mut normalized, text);
+        if normalized == text {
+            Cow::Borrowed(text)
+        } else {
+            Cow::Owned(normalized)
+        }
+    }
+
+    fn is_normalized(self, text: &str) -> bool {
+        if text.is_ascii() {
+            return true;
+        }
+        match self {
+            Self::None => true,
+            Self::Nfc => is_nfc_quick(text.chars()) == IsNormalized::Yes,
+            Self::Nfkc => is_nfkc_quick(text.chars()) == IsNormalized::Yes,
+        }
+    }
+
+    fn extend(self, output: &mut String, text: &str) {
+        match self {
+            Self::None => output.push_str(text),
+            Self::Nfc => output.extend(text.nfc()),
+            Self::Nfkc => output.extend(text.nfkc()),
+        }
+    }
+}
+
+/// Version of the Unicode tables the native normalizer was built with.
+pub fn unicode_version() -> String {
+    let (major, minor, update) = unicode_normalization::UNICODE_VERSION;
+    format!("{major}.{minor}.{update}")
+}
+
+/// Normalized copy of one scan's haystack plus the spans it rewrote.
+///
+/// Text is normalized one combining cluster at a time, so every rewritten
+/// cluster maps back to exactly one original span. Only rewritten clusters are
+/// recorded; everything between them is a byte-for-byte copy whose offset shift
+/// follows from the previous replacement.
+#[derive(Debug, Default)]
+pub(crate) struct NormalizedHaystack {
+    text: String,
+    replacements: Vec<NormalizedReplacement>,
+    cluster: String,
+}
+
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+struct NormalizedReplacement {
+    normalized_start: usize,
+    normalized_end: usize,
+    original_start: usize,
+    original_end: usize,
+}
+
+impl NormalizedHaystack {
+    /// Normalize `text` into this buffer.
+    ///
+    /// Returns `false`, leaving the buffer empty, when `text` is already in
+    /// `form` and can be scanned directly.
+    pub(crate) fn normalize(&mut self, text: &str, form: NormalizationForm) -> bool {
+        self.text.clear();
+        self.replacements.clear();
+        if form.is_normalized(text) {
+            return false;
+        }
+
+        let mut copied = 0;
+        let mut cluster_start = 0;
+        for (index, character) in text.char_indices().skip(1) {
+            if canonical_combining_class(character) == 0 {
+                self.normalize_cluster(text, cluster_start, index, &mut copied, form);
+                cluster_start = index;
+            }
+        }
+        self.normalize_cluster(text, cluster_start, text.len(), &mut copied, form);
+        if self.replacements.is_empty() {
+            self.text.clear();
+            return false;
+        }
+        self.text.push_str(&text[copied..]);
+        true
+    }
+
+    fn normalize_cluster(
+        &mut self,
+        text: &str,
+        start: usize,
+        end: usize,
+        copied: &mut usize,
+        form: NormalizationForm,
+    ) {
+        let cluster = &text[start..end];
+        if form.is_normalized(cluster) {
+            return;
+        }
+        self.cluster.clear();
+        form.extend(&mut self.cluster, cluster);
+        if self.cluster == cluster {
+            return;
+        }
+
+        self.text.push_str(&text[*copied..start]);
+        let normalized_start = self.text.len();
+        self.text.push_str(&self.cluster);
+        let normalized_end = self.text.len();
+        *copied = end;
+        self.replacements.push(NormalizedReplacement {
+            normalized_start,
+            normalized_end,
+            original_start: start,
+            original_end: end,
+        });
+    }
+
+    pub(crate) fn as_bytes(&self) -> &[u8] {
+        self.text.as_bytes()
+    }
+
+    pub(crate) fn capacity(&self) -> usize {
+        self.text.capacity()
+    }
+
+    /// Map a match span in the normalized text back to the original text.
+    ///
+    /// A span that starts or ends inside a rewritten cluster widens to cover
+    /// the whole original cluster.
+    pub(crate) fn original_span(&self, start: usize, end: usize) -> (usize, usize) {
+        (self.original_start(start), self.original_end(end))
+    }
+
+    fn original_start(&self, normalized: usize) -> usize {
+        let index = self
+            .replacements
+            .partition_point(|replacement| replacement.normalized_end <= normalized);
+        match self.replacements.get(index) {
+            Some(replacement) if replacement.normalized_start <= normalized => {
+                replacement.original_start
+            }
+            _ => self.shifted(index, normalized),
+        }
+    }
+
+    fn original_end(&self, normalized: usize) -> usize {
+        let index = self
+            .replacements
+            .partition_point(|replacement| replacement.normalized_end < normalized);
+        match self.replacements.get(index) {
+            Some(replacement) if replacement.normalized_start < normalized => {
+                replacement.original_end
+            }
+            _ => self.shifted(index, normalized),
+        }
+    }
+
+    /// Map an offset in the copied run after replacement `index - 1`.
+    fn shifted(&self, index: usize, normalized: usize) -> usize {
+        match index
+            .checked_sub(1)
+            .map(|previous| self.replacements[previous])
+        {
+            Some(previous) => normalized - previous.normalized_end + previous.original_end,
+            None => normalized,
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn normalized(text: &str, form: NormalizationForm) -> NormalizedHaystack {
+        let mut haystack = NormalizedHaystack::default();
+        assert!(haystack.normalize(text, form));
+        haystack
+    }
+
+    #[test]
+    fn normalized_text_skips_ascii_and_already_normalized_input() {
+        let mut haystack = NormalizedHaystack::default();
+
+        assert!(!haystack.normalize("plain ASCII", NormalizationForm::Nfkc));
+        assert!(!haystack.normalize("caf\u{e9}", NormalizationForm::Nfc));
+        assert!(!haystack.normalize("\u{fb01}ne", NormalizationForm::Nfc));
+        assert!(haystack.as_bytes().is_empty());
+    }
+
+    #[test]
+    fn normalized_text_projects_spans_back_to_original_clusters() {
+        let text = "a \u{fb01}ne cafe\u{301} \u{ff21}\u{ff22} z";
+        let haystack = normalized(text, NormalizationForm::Nfkc);
+        let normalized_text = std::str::from_utf8(haystack.as_bytes()).unwrap();
+
+        assert_eq!(normalized_text, "a fine caf\u{e9} AB z");
+        assert_eq!(haystack.replacements.len(), 4);
+        let project = |needle: &str| {
+            let start = normalized_text.find(needle).unwrap();
+            let (start, end) = haystack.original_span(start, start + needle.len());
+            &text[start..end]
+        };
+        assert_eq!(project("fine"), "\u{fb01}ne");
+        assert_eq!(project("ine"), "\u{fb01}ne");
+        assert_eq!(project("f"), "\u{fb01}");
+        assert_eq!(project("caf\u{e9}"), "cafe\u{301}");
+        assert_eq!(project("AB"), "\u{ff21}\u{ff22}");
+        assert_eq!(project("B z"), "\u{ff22} z");
+        assert_eq!(project("a "), "a ");
+        assert_eq!(haystack.original_span(0, 0), (0, 0));
+        assert_eq!(
+            haystack.original_span(normalized_text.len(), normalized_text.len()),
+            (text.len(), text.len())
+        );
+    }
+
+    #[test]
+    fn normalized_text_composes_only_within_combining_clusters() {
+        let haystack = normalized("e\u{301}\u{1100}\u{1161}", NormalizationForm::Nfc);
+
+        // Hangul jamo are separate starter clusters, matching the Python
+        // reference transform, so only the combining accent is composed.
+        assert_eq!(haystack.as_bytes(), "\u{e9}\u{1100}\u{1161}".as_bytes());
+        assert_eq!(NormalizationForm::Nfc.normalize("\u{fb01}"), "\u{fb01}");
+        assert_eq!(NormalizationForm::Nfkc.normalize("\u{fb01}"), "fi");
+        assert!(NormalizationForm::parse("NFD", "/unicode_normalization").is_err());
+    }
+}
@@ -1,7 +1,14 @@
 from pathlib import Path
 
 from .bank import BankError, BankLoadError, BankSchemaError, bank_stats, canonicalize_bank, hash_bank, load_bank
-from .benchmarks import benchmark_bank, benchmark_fixture_profiles, make_benchmark_fixture_profile, regress_bank
+from .benchmark_history import benchmark_history_report, load_benchmark_history, record_benchmark_history
+from .benchmarks import (
+    benchmark_bank,
+    benchmark_fixture_profiles,
+    benchmark_literal_scale,
+    make_benchmark_fixture_profile,
+    regress_bank,
+)
 from .config import (
     DEFAULT_CONFIG_ENV_VAR,
     DEFAULT_CONFIG_FILENAME,
@@ -16,16 +23,29 @@ from .config import (
     validate_pattern_config,
     validate_regex_flags,
 )
+from .corpus import extract_corpus
 from .deanonymization import (
     anonymize_config_file,
     anonymize_config_text,
     anonymize_file,
+    anonymize_stream,
     anonymize_text,
     deanonymize_file,
     deanonymize_text,
 )
 from .diff import diff_banks
-from .engine import Bank, bank_cache_info, clear_bank_cache
+from .engine import (
+    Bank,
+    CancellationToken,
+    ScanBusyError,
+    Scanner,
+    ScanTimeoutError,
+    bank_cache_info,
+    clear_bank_cache,
+    clear_scan_result_cache,
+    configure_scan_result_cache,
+    scan_result_cache_info,
+)
 from .evals import eval_bank
 from .extraction import (
     ExtractionError,
@@ -38,8 +58,17 @@ from .extraction import (
     extract_text,
 )
 from .patches import BankPatchError, apply_bank_patches
+from .record_file import (
+    RecordFileDocument,
+    RecordFileError,
+    RecordFileWriter,
+    iter_record_file,
+    read_record_file,
+    write_record_file,
+)
 from .schema import BANK_SCHEMA, ID_PATTERN, REGEX_FLAG_ORDER, SCHEMA_VERSION, validate_bank_schema
 from .validation import validate_bank
+from .workloads import generate_workload
 
 __version__ = "0.0.12"
 
@@ -58,11 +87,20 @@ __all__ = [
     "Bank",
     "benchmark_bank",
     "benchmark_fixture_profiles",
+    "benchmark_history_report",
+    "benchmark_literal_scale",
+    "CancellationToken",
     "ConfigError",
     "DEFAULT_CONFIG_ENV_VAR",
     "DEFAULT_CONFIG_FILENAME",
     "FLAGS_KEY",
     "PatternConfig",
+    "RecordFileDocument",
+    "RecordFileError",
+    "RecordFileWriter",
+    "ScanBusyError",
+    "Scanner",
+    "ScanTimeoutError",
     "ExtractionError",
     "__version__",
     "add_entity_pattern",
@@ -70,34 +108,45 @@ __all__ = [
     "anonymize_config_file",
     "anonymize_config_text",
     "anonymize_file",
+    "anonymize_stream",
     "anonymize_text",
     "bank_stats",
     "bank_cache_info",
     "canonicalize_bank",
     "clear_bank_cache",
+    "clear_scan_result_cache",
+    "configure_scan_result_cache",
     "diff_banks",
     "deanonymize_file",
     "deanonymize_text",
     "extract_batch",
+    "extract_corpus",
     "extract_file",
     "extract_report",
     "extract_report_batch",
     "extract_report_file",
     "extract_text",
+    "generate_workload",
     "eval_bank",
     "explain_match",
     "hash_bank",
+    "iter_record_file",
     "load_bank",
+    "load_benchmark_history",
     "load_config",
     "make_benchmark_fixture_profile",
     "package_path",
+    "read_record_file",
     "repo_path",
     "remove_entity_pattern",
+    "record_benchmark_history",
     "regress_bank",
     "resolve_default_config_path",
     "save_config",
+    "scan_result_cache_info",
     "validate_bank_schema",
     "validate_bank",
     "validate_pattern_config",
     "validate_regex_flags",
+    "write_record_file",
 ]
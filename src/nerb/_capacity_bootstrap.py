@@ -21,9 +21,11 @@ _SOURCE_MODULES = frozenset(
     {
         "_capacity_bootstrap",
         "bank",
+        "benchmark_history",
         "benchmarks",
         "cli",
         "config",
+        "corpus",
         "deanonymization",
         "diagnostics",
         "diff",
@@ -54,12 +56,14 @@ _SOURCE_MODULES = frozenset(
         "mcp_server",
         "normalization",
         "patches",
+        "record_file",
         "records",
         "replacements",
         "replacements_schema",
         "reports",
         "schema",
         "validation",
+        "workloads",
     }
 )
 
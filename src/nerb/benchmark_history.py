@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping, Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from typing import Any
+
+from .benchmarks import BENCHMARK_TIERS
+from .engines import ExtractionError
+
+__all__ = [
+    "BENCHMARK_HISTORY_ENV_VAR",
+    "BENCHMARK_HISTORY_FILENAME",
+    "benchmark_environment_fingerprint",
+    "benchmark_history_report",
+    "load_benchmark_history",
+    "record_benchmark_history",
+]
+
+BENCHMARK_HISTORY_ENV_VAR = "NERB_BENCHMARK_HISTORY_DIR"
+BENCHMARK_HISTORY_FILENAME = "benchmark-history.jsonl"
+BENCHMARK_HISTORY_SAMPLE_SCHEMA_VERSION = "nerb.benchmark_history_sample.v1"
+BENCHMARK_HISTORY_REPORT_SCHEMA_VERSION = "nerb.benchmark_history_report.v1"
+DEFAULT_HISTORY_NOISE_MULTIPLIER = 3.0
+DEFAULT_HISTORY_MIN_RELATIVE_BAND = 0.05
+DEFAULT_HISTORY_MIN_BASELINE_SAMPLES = 3
+DEFAULT_HISTORY_WINDOW = 10
+MAD_NORMAL_CONSISTENCY = 1.4826
+TIER_HISTORY_METRICS = {
+    "bytes_per_second": "higher_is_better",
+    "documents_per_second": "higher_is_better",
+    "p50_seconds": "lower_is_better",
+    "p95_seconds": "lower_is_better",
+    "p99_seconds": "lower_is_better",
+}
+COMPILE_HISTORY_METRICS = {
+    "cold_seconds": "lower_is_better",
+    "warm_cached_compile_seconds": "lower_is_better",
+}
+
+
+def benchmark_environment_fingerprint(environment: Mapping[str, Any]) -> str:
+    """Hash the public ``benchmark_bank`` environment block into a stable history key."""
+    payload = json.dumps(dict(environment), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return "sha256:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def record_benchmark_history(
+    result: Mapping[str, Any],
+    *,
+    history_dir: str | Path,
+    label: str | None = None,
+    recorded_at: str | None = None,
+) -> list[dict[str, Any]]:
+    """Append ``benchmark_bank`` or ``regress_bank`` results to the local JSONL benchmark history."""
+    if not isinstance(result, Mapping):
+        raise TypeError("record_benchmark_history requires a benchmark or regression result mapping.")
+    timestamp = recorded_at or _utc_now()
+    benchmarks = result.get("benchmarks")
+    if isinstance(benchmarks, Mapping):
+        samples = [
+            _history_sample(benchmarks[role], label=label, role=role, recorded_at=timestamp)
+            for role in ("old", "new")
+            if isinstance(benchmarks.get(role), Mapping)
+        ]
+    else:
+        samples = [_history_sample(result, label=label, role=None, recorded_at=timestamp)]
+
+    history_path = _history_path(history_dir)
+    payload = "".join(
+        json.dumps(sample, sort_keys=True, separators=(",", ":"), allow_nan=False) + "\n" for sample in samples
+    )
+    try:
+        history_path.parent.mkdir(parents=True, exist_ok=True)
+        with history_path.open("a", encoding="utf-8") as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+    except OSError as exc:
+        raise ExtractionError(f"Could not append benchmark history at {history_path}: {exc.strerror or exc}.") from exc
+    return samples
+
+
+def load_benchmark_history(
+    history_dir: str | Path,
+    *,
+    bank_hash: str | None = None,
+    profile_id: str | None = None,
+    engine_version: str | None = None,
+) -> list[dict[str, Any]]:
+    """Load stored benchmark samples in append order, optionally filtered by history key fields."""
+    history_path = _history_path(history_dir)
+    if not history_path.exists():
+        return []
+
+    try:
+        lines = history_path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError) as exc:
+        raise ExtractionError(f"Could not read benchmark history at {history_path}.") from exc
+
+    samples: list[dict[str, Any]] = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            sample = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ExtractionError(f"Benchmark history line {line_number} is not valid JSON: {exc.msg}.") from exc
+        if not isinstance(sample, dict) or sample.get("schema_version") != BENCHMARK_HISTORY_SAMPLE_SCHEMA_VERSION:
+            raise ExtractionError(f"Benchmark history line {line_number} is not a benchmark history sample.")
+        key = sample.get("key", {})
+        if bank_hash is not None and key.get("bank_hash") != bank_hash:
+            continue
+        if profile_id is not None and key.get("profile_id") != profile_id:
+            continue
+        if engine_version is not None and key.get("engine_version") != engine_version:
+            continue
+        samples.append(sample)
+    return samples
+
+
+def benchmark_history_report(
+    history_dir: str | Path,
+    *,
+    bank_hash: str | None = None,
+    profile_id: str | None = None,
+    noise_multiplier: float = DEFAULT_HISTORY_NOISE_MULTIPLIER,
+    min_relative_band: float = DEFAULT_HISTORY_MIN_RELATIVE_BAND,
+    min_baseline_samples: int = DEFAULT_HISTORY_MIN_BASELINE_SAMPLES,
+    window: int = DEFAULT_HISTORY_WINDOW,
+) -> dict[str, Any]:
+    """Report per-tier trends and flag the latest sample when it leaves the stored noise band.
+
+    Samples are grouped by bank hash, environment fingerprint, and profile id so that successive engine versions of
+    the same bank on the same host form one series. The noise band is the median of up to ``window`` preceding samples
+    plus or minus ``noise_multiplier`` scaled median absolute deviations, never narrower than ``min_relative_band``.
+    """
+    _ensure_positive_number(noise_multiplier, "noise_multiplier")
+    if not isinstance(min_relative_band, (int, float)) or isinstance(min_relative_band, bool) or min_relative_band < 0:
+        raise ExtractionError("Benchmark history min_relative_band must be a non-negative number.")
+    _ensure_positive_history_int(min_baseline_samples, "min_baseline_samples")
+    _ensure_positive_history_int(window, "window")
+
+    samples = load_benchmark_history(history_dir, bank_hash=bank_hash, profile_id=profile_id)
+    grouped: dict[tuple[str, str, str | None], list[dict[str, Any]]] = {}
+    for sample in samples:
+        key = sample["key"]
+        grouped.setdefault((key["bank_hash"], key["environment_fingerprint"], key["profile_id"]), []).append(sample)
+
+    series: list[dict[str, Any]] = []
+    regressions: list[dict[str, Any]] = []
+    for (series_bank_hash, environment_fingerprint, series_profile_id), series_samples in grouped.items():
+        metrics: dict[str, Any] = {}
+        for metric_name, direction, values in _series_metric_values(series_samples):
+            trend = _metric_trend(
+                values,
+                direction,
+                noise_multiplier=float(noise_multiplier),
+                min_relative_band=float(min_relative_band),
+                min_baseline_samples=min_baseline_samples,
+                window=window,
+            )
+            metrics[metric_name] = trend
+            if trend["status"] == "regressed":
+                regressions.append(
+                    {
+                        "bank_hash": series_bank_hash,
+                        "environment_fingerprint": environment_fingerprint,
+                        "profile_id": series_profile_id,
+                        "metric": metric_name,
+                        "latest": trend["latest"],
+                        "baseline_median": trend["baseline_median"],
+                        "noise_band": trend["noise_band"],
+                        "engine_version": series_samples[-1]["key"]["engine_version"],
+                    }
+                )
+        latest = series_samples[-1]
+        series.append(
+            {
+                "key": {
+                    "bank_hash": series_bank_hash,
+                    "environment_fingerprint": environment_fingerprint,
+                    "profile_id": series_profile_id,
+                },
+                "bank_id": latest["bank_id"],
+                "sample_count": len(series_samples),
+                "engine_versions": sorted({sample["key"]["engine_version"] for sample in series_samples}),
+                "latest_engine_version": latest["key"]["engine_version"],
+                "first_recorded_at": series_samples[0]["recorded_at"],
+                "latest_recorded_at": latest["recorded_at"],
+                "metrics": metrics,
+            }
+        )
+
+    return {
+        "schema_version": BENCHMARK_HISTORY_REPORT_SCHEMA_VERSION,
+        "history_path": str(_history_path(history_dir)),
+        "sample_count": len(samples),
+        "filters": {"bank_hash": bank_hash, "profile_id": profile_id},
+        "noise": {
+            "method": "median_absolute_deviation",
+            "noise_multiplier": float(noise_multiplier),
+            "min_relative_band": float(min_relative_band),
+            "min_baseline_samples": min_baseline_samples,
+            "window": window,
+        },
+        "series": series,
+        "regressions": regressions,
+        "regressed": bool(regressions),
+    }
+
+
+def _history_sample(
+    result: Mapping[str, Any],
+    *,
+    label: str | None,
+    role: str | None,
+    recorded_at: str,
+) -> dict[str, Any]:
+    try:
+        bank = result["bank"]
+        engine = result["engine"]
+        options = result["options"]
+        environment = result["environment"]
+        compile_report = result["compile"]
+        tiers = result["tiers"]
+    except KeyError as exc:
+        raise ExtractionError(f"Benchmark result is missing the {exc.args[0]!r} section.") from None
+
+    return {
+        "schema_version": BENCHMARK_HISTORY_SAMPLE_SCHEMA_VERSION,
+        "recorded_at": recorded_at,
+        "label": label,
+        "role": role,
+        "key": {
+            "bank_hash": bank["hash"],
+            "engine_version": engine["version"],
+            "environment_fingerprint": benchmark_environment_fingerprint(environment),
+            "profile_id": options.get("benchmark_profile_id"),
+        },
+        "bank_id": bank["id"],
+        "bank_version": bank["version"],
+        "environment": dict(environment),
+        "options": dict(options),
+        "metrics": {
+            "compile": {metric: compile_report.get(metric) for metric in COMPILE_HISTORY_METRICS},
+            "tiers": {tier: _tier_history_metrics(tiers[tier]) for tier in BENCHMARK_TIERS if tier in tiers},
+        },
+    }
+
+
+def _tier_history_metrics(tier: Mapping[str, Any]) -> dict[str, Any]:
+    throughput = tier.get("throughput", {})
+    latency = tier.get("latency", {})
+    return {
+        "record_count": tier.get("record_count"),
+        "bytes_per_second": throughput.get("bytes_per_second"),
+        "documents_per_second": throughput.get("documents_per_second"),
+        "p50_seconds": latency.get("p50_seconds"),
+        "p95_seconds": latency.get("p95_seconds"),
+        "p99_seconds": latency.get("p99_seconds"),
+    }
+
+
+def _series_metric_values(samples: Sequence[Mapping[str, Any]]) -> list[tuple[str, str, list[float | None]]]:
+    metrics: list[tuple[str, str, list[float | None]]] = []
+    for metric, direction in COMPILE_HISTORY_METRICS.items():
+        metrics.append(
+            (
+                f"compile.{metric}",
+                direction,
+                [_optional_float(sample["metrics"]["compile"].get(metric)) for sample in samples],
+            )
+        )
+    for tier in BENCHMARK_TIERS:
+        for metric, direction in TIER_HISTORY_METRICS.items():
+            metrics.append(
+                (
+                    f"{tier}.{metric}",
+                    direction,
+                    [_optional_float(sample["metrics"]["tiers"].get(tier, {}).get(metric)) for sample in samples],
+                )
+            )
+    return metrics
+
+
+def _metric_trend(
+    values: Sequence[float | None],
+    direction: str,
+    *,
+    noise_multiplier: float,
+    min_relative_band: float,
+    min_baseline_samples: int,
+    window: int,
+) -> dict[str, Any]:
+    latest = values[-1] if values else None
+    baseline = [value for value in values[:-1] if value is not None][-window:]
+    trend: dict[str, Any] = {
+        "direction": direction,
+        "sample_count": sum(1 for value in values if value is not None),
+        "latest": latest,
+        "previous": baseline[-1] if baseline else None,
+        "baseline_sample_count": len(baseline),
+        "baseline_median": None,
+        "baseline_mad": None,
+        "noise_band": None,
+        "change_ratio": None,
+        "status": "insufficient_samples",
+    }
+    if latest is None or len(baseline) < min_baseline_samples:
+        return trend
+
+    center = float(median(baseline))
+    mad = float(median(abs(value - center) for value in baseline))
+    half_width = max(noise_multiplier * MAD_NORMAL_CONSISTENCY * mad, min_relative_band * abs(center))
+    low, high = center - half_width, center + half_width
+    if latest > high:
+        status = "regressed" if direction == "lower_is_better" else "improved"
+    elif latest < low:
+        status = "improved" if direction == "lower_is_better" else "regressed"
+    else:
+        status = "stable"
+    trend.update(
+        {
+            "baseline_median": _round(center),
+            "baseline_mad": _round(mad),
+            "noise_band": [_round(low), _round(high)],
+            "change_ratio": round(latest / center, 6) if center else None,
+            "status": status,
+        }
+    )
+    return trend
+
+
+def _history_path(history_dir: str | Path) -> Path:
+    return Path(history_dir).expanduser() / BENCHMARK_HISTORY_FILENAME
+
+
+def _optional_float(value: Any) -> float | None:
+    if value is None or isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _round(value: float) -> float:
+    return round(value, 9)
+
+
+def _ensure_positive_number(value: Any, name: str) -> None:
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or not value > 0:
+        raise ExtractionError(f"Benchmark history {name} must be a positive number.")
+
+
+def _ensure_positive_history_int(value: Any, name: str) -> None:
+    if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+        raise ExtractionError(f"Benchmark history {name} must be a positive integer.")
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import importlib
+import json
 import math
 import platform
 import re
 import sys
 import time
-from collections.abc import Mapping, Sequence
+import tracemalloc
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, cast
@@ -13,17 +17,22 @@ from typing import Any, cast
 from .bank import bank_stats, canonicalize_bank, hash_bank
 from .diagnostics import REGEX_EXPENSIVE_PROBE, REGEX_EXPENSIVE_STATIC, Diagnostic
 from .diff import diff_banks
-from .engine import bank_cache_info, clear_bank_cache
+from .engine import Bank, bank_cache_info, clear_bank_cache, scan_result_cache_info
 from .engines import CompiledBank, ExtractionError, compile_bank_with_report
 from .evals import eval_bank
 from .extraction import _prepare_batch_documents
-from .records import record_sort_key
 from .validation import VALIDATION_LEVELS, validate_bank
 
+try:  # pragma: no cover - import availability is platform-dependent.
+    _resource: Any = importlib.import_module("resource")
+except ImportError:  # pragma: no cover - exercised on platforms without resource.
+    _resource = None
+
 __all__ = [
     "BENCHMARK_PROFILE_IDS",
     "benchmark_bank",
     "benchmark_fixture_profiles",
+    "benchmark_literal_scale",
     "make_benchmark_fixture_profile",
     "make_synthetic_bank",
     "regress_bank",
@@ -32,12 +41,45 @@ __all__ = [
 DEFAULT_BENCHMARK_ITERATIONS = 3
 DEFAULT_STRESS_MULTIPLIER = 8
 DEFAULT_MAX_PATTERN_EXAMPLES = 12
+DEFAULT_BENCHMARK_MAX_THREADS = 4
 BENCHMARK_TIERS = ("baseline", "target", "stress")
-BENCHMARK_PROFILE_IDS = ("small", "literal_heavy", "regex_heavy", "mixed", "adversarial_smoke")
+BENCHMARK_PROFILE_IDS = (
+    "small",
+    "literal_heavy",
+    "regex_heavy",
+    "mixed",
+    "adversarial_smoke",
+    "non_ascii_dense",
+    "dense_matches",
+)
 BENCHMARK_PROFILE_SCHEMA_VERSION = "nerb.benchmark_profile.v1"
 BENCHMARK_PROFILE_MANIFEST_SCHEMA_VERSION = "nerb.benchmark_profiles.v1"
 BENCHMARK_SMOKE_SUITE_ID = "rust_engine_smoke"
 SYNTHETIC_BANK_TIMESTAMP = "2026-06-03T00:00:00Z"
+THREAD_SCALING_TIER = "target"
+SCAN_MODES_TIER = "stress"
+SCAN_MODE_STOP_AFTER = 10
+_NON_ASCII_DENSE_ENTITIES = 24
+_NON_ASCII_DENSE_NAMES_PER_ENTITY = 2
+_DENSE_MATCH_ENTITIES = 16
+_DENSE_MATCH_TOKENS = 128
+LITERAL_MATCHERS = ("standard", "compact")
+LITERAL_SCALE_SCHEMA_VERSION = "nerb.literal_scale_benchmark.v1"
+DEFAULT_LITERAL_SCALE_PATTERNS = 1_000_000
+DEFAULT_LITERAL_SCALE_SCAN_HITS = 2_000
+LATENCY_HISTOGRAM_BOUNDS_SECONDS = (
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
 
 
 @dataclass(frozen=True)
@@ -45,6 +87,7 @@ class BenchmarkOptions:
     iterations: int
     stress_multiplier: int
     max_pattern_examples: int
+    max_threads: int
     validation_level: str
     profile_id: str | None
 
@@ -150,11 +193,14 @@ def make_benchmark_fixture_profile(profile_id: str) -> dict[str, Any]:
     options = _benchmark_profile_options(profile_id)
     benchmark_options = _resolve_benchmark_options(options)
     bank = _benchmark_profile_bank(profile_id)
-    documents = (
-        _adversarial_document_tiers(benchmark_options)
-        if profile_id == "adversarial_smoke"
-        else _synthetic_document_tiers([bank], benchmark_options)
-    )
+    if profile_id == "adversarial_smoke":
+        documents = _adversarial_document_tiers(benchmark_options)
+    elif profile_id == "non_ascii_dense":
+        documents = _non_ascii_dense_document_tiers(benchmark_options)
+    elif profile_id == "dense_matches":
+        documents = _dense_match_document_tiers(benchmark_options)
+    else:
+        documents = _synthetic_document_tiers([bank], benchmark_options)
 
     return {
         "schema_version": BENCHMARK_PROFILE_SCHEMA_VERSION,
@@ -176,7 +222,7 @@ def benchmark_bank(
     documents: Sequence[Mapping[str, Any]] | Mapping[str, Any] | None = None,
     options: Mapping[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Measure cold compile cost and warm extraction throughput for a JSON bank."""
+    """Measure cold compile cost, warm extraction latency/throughput, memory, and thread scaling for a JSON bank."""
     if not isinstance(bank, Mapping):
         raise TypeError("benchmark_bank requires a mapping bank object.")
 
@@ -200,6 +246,13 @@ def benchmark_bank(
     tiers = {
         tier: _measure_tier(compiled, document_tiers[tier], raw_options, benchmark_options) for tier in BENCHMARK_TIERS
     }
+    thread_scaling = _measure_thread_scaling(
+        compiled,
+        document_tiers[THREAD_SCALING_TIER],
+        raw_options,
+        benchmark_options,
+    )
+    scan_modes = _measure_scan_modes(compiled, document_tiers[SCAN_MODES_TIER], raw_options, benchmark_options)
     profile = _bank_profile(canonical_bank)
 
     return {
@@ -223,6 +276,7 @@ def benchmark_bank(
             "iterations": benchmark_options.iterations,
             "stress_multiplier": benchmark_options.stress_multiplier,
             "max_pattern_examples": benchmark_options.max_pattern_examples,
+            "max_threads": benchmark_options.max_threads,
             "validation_level": benchmark_options.validation_level,
             "benchmark_profile_id": benchmark_options.profile_id,
         },
@@ -235,12 +289,90 @@ def benchmark_bank(
         ),
         "compile": compile_report,
         "tiers": tiers,
-        "summary": _benchmark_summary(tiers, compile_report, profile, benchmark_options),
+        "thread_scaling": thread_scaling,
+        "scan_modes": scan_modes,
+        "summary": _benchmark_summary(tiers, thread_scaling, compile_report, profile, benchmark_options),
         "environment": _benchmark_environment(),
         "diagnostics": _benchmark_diagnostics(validation),
     }
 
 
+def benchmark_literal_scale(
+    pattern_count: int = DEFAULT_LITERAL_SCALE_PATTERNS,
+    *,
+    entity_count: int = 1,
+    literal_matcher: str = "compact",
+    word_boundaries: bool = True,
+    scan_hits: int = DEFAULT_LITERAL_SCALE_SCAN_HITS,
+) -> dict[str, Any]:
+    """Compile a synthetic literal alias catalog natively and report its memory per pattern and scan cost."""
+    _ensure_positive_int(pattern_count, "pattern_count")
+    _ensure_positive_int(entity_count, "entity_count")
+    _ensure_positive_int(scan_hits, "scan_hits")
+    if entity_count > pattern_count:
+        raise ExtractionError("Literal scale entity_count must not exceed pattern_count.")
+    if literal_matcher not in LITERAL_MATCHERS:
+        raise ExtractionError(f"Literal scale literal_matcher must be one of: {', '.join(LITERAL_MATCHERS)}.")
+    if not isinstance(word_boundaries, bool):
+        raise ExtractionError("Literal scale word_boundaries must be a boolean.")
+
+    source_start = time.perf_counter()
+    source = _literal_scale_source(pattern_count, entity_count)
+    source_seconds = time.perf_counter() - source_start
+    source_bytes = len(source)
+    compile_options = json.dumps({"literal_matcher": literal_matcher, "word_boundaries": word_boundaries})
+
+    rss_before, rss_status = _peak_rss()
+    compile_start = time.perf_counter()
+    try:
+        bank = Bank.from_source_bytes(
+            source,
+            format_hint="json",
+            compile_options_json=compile_options,
+            use_cache=False,
+        )
+    except (MemoryError, ValueError) as exc:
+        raise ExtractionError(f"Literal scale bank failed to compile: {exc}") from exc
+    compile_seconds = time.perf_counter() - compile_start
+    rss_after, _rss_status = _peak_rss()
+    del source
+
+    text, expected_records = _literal_scale_text(pattern_count, scan_hits)
+    scan_start = time.perf_counter()
+    records = bank.scan_bytes(text)
+    scan_seconds = time.perf_counter() - scan_start
+    metadata = bank.metadata()
+
+    return {
+        "schema_version": LITERAL_SCALE_SCHEMA_VERSION,
+        "options": {
+            "pattern_count": pattern_count,
+            "entity_count": entity_count,
+            "literal_matcher": literal_matcher,
+            "word_boundaries": word_boundaries,
+            "scan_hits": scan_hits,
+        },
+        "source": {"bytes": source_bytes, "build_seconds": _seconds(source_seconds)},
+        "compile": {
+            "seconds": _seconds(compile_seconds),
+            "peak_rss_bytes": rss_after,
+            "peak_rss_growth_bytes": (
+                rss_after - rss_before if rss_after is not None and rss_before is not None else None
+            ),
+            "peak_rss_status": rss_status,
+        },
+        "literal_resources": metadata.get("literal_resources"),
+        "scan": {
+            "text_bytes": len(text),
+            "seconds": _seconds(scan_seconds),
+            "records": len(records),
+            "expected_records": expected_records,
+            "bytes_per_second": _rate(len(text), scan_seconds),
+        },
+        "environment": _benchmark_environment(),
+    }
+
+
 def regress_bank(
     old_bank: Mapping[str, Any],
     new_bank: Mapping[str, Any],
@@ -302,6 +434,7 @@ def _resolve_benchmark_options(options: Mapping[str, Any]) -> BenchmarkOptions:
         ),
         stress_multiplier=_positive_int_option(options, "stress_multiplier", DEFAULT_STRESS_MULTIPLIER),
         max_pattern_examples=_positive_int_option(options, "max_pattern_examples", DEFAULT_MAX_PATTERN_EXAMPLES),
+        max_threads=_positive_int_option(options, "benchmark_max_threads", DEFAULT_BENCHMARK_MAX_THREADS),
         validation_level=validation_level,
         profile_id=raw_profile_id,
     )
@@ -353,6 +486,34 @@ def _benchmark_profile_manifest(profile_id: str) -> dict[str, Any]:
             "tags": ["dense_hits", "overlap", "alternation", "near_miss", "ci_smoke"],
             "bank_shape": {"name_count": 5, "pattern_count": 8, "entity_count": 3, "literal_ratio": 0.5},
         },
+        "non_ascii_dense": {
+            "description": (
+                "Many case-insensitive and whitespace-normalized entity shards over dense non-ASCII text that needs "
+                "Unicode casefold and whitespace mapping."
+            ),
+            "workload": "non_ascii_dense",
+            "tags": ["non_ascii", "casefold", "normalize_whitespace", "entity_shards", "dense_hits", "ci_smoke"],
+            "bank_shape": {
+                "name_count": _NON_ASCII_DENSE_ENTITIES * _NON_ASCII_DENSE_NAMES_PER_ENTITY,
+                "patterns_per_name": 2,
+                "entity_count": _NON_ASCII_DENSE_ENTITIES,
+                "literal_ratio": 1.0,
+            },
+        },
+        "dense_matches": {
+            "description": (
+                "Every entity shard matches every token, producing thousands of records per document with many "
+                "cross-entity span ties to merge and project."
+            ),
+            "workload": "dense_matches",
+            "tags": ["dense_hits", "entity_shards", "span_ties", "ci_smoke"],
+            "bank_shape": {
+                "name_count": _DENSE_MATCH_ENTITIES * 2,
+                "patterns_per_name": 1,
+                "entity_count": _DENSE_MATCH_ENTITIES,
+                "literal_ratio": 0.5,
+            },
+        },
     }
     spec = dict(specs[profile_id])
     spec["id"] = profile_id
@@ -397,6 +558,10 @@ def _benchmark_profile_options(profile_id: str) -> dict[str, Any]:
 def _benchmark_profile_bank(profile_id: str) -> dict[str, Any]:
     if profile_id == "adversarial_smoke":
         return _adversarial_smoke_bank()
+    if profile_id == "non_ascii_dense":
+        return _non_ascii_dense_bank()
+    if profile_id == "dense_matches":
+        return _dense_match_bank()
 
     shape = _benchmark_profile_manifest(profile_id)["bank_shape"]
     return make_synthetic_bank(
@@ -512,6 +677,90 @@ def _adversarial_smoke_bank() -> dict[str, Any]:
     }
 
 
+def _non_ascii_dense_bank() -> dict[str, Any]:
+    entities: dict[str, Any] = {}
+    for entity_index in range(_NON_ASCII_DENSE_ENTITIES):
+        names: dict[str, Any] = {}
+        for name_index in range(_NON_ASCII_DENSE_NAMES_PER_ENTITY):
+            token = f"{entity_index:02d}{name_index}"
+            casefold = _profile_literal_pattern(f"Kelvin Seat {token}", priority=100)
+            casefold["case_sensitive"] = False
+            spaced = _profile_literal_pattern(f"Desk Row {token}", priority=90)
+            spaced["case_sensitive"] = False
+            spaced["normalize_whitespace"] = True
+            names[f"name_{token}"] = {
+                "canonical": f"Seat {token}",
+                "description": "Case-insensitive seat with a whitespace-normalized desk alias.",
+                "status": "active",
+                "patterns": {"casefold": casefold, "spaced": spaced},
+                "metadata": {},
+            }
+        entities[f"entity_{entity_index:02d}"] = {
+            "description": "Non-ASCII dense benchmark entity.",
+            "status": "active",
+            "regex_flags": [],
+            "names": names,
+            "metadata": {},
+        }
+    return {
+        "schema_version": "nerb.bank.v1",
+        "id": "benchmark_non_ascii_dense",
+        "name": "Benchmark Non-ASCII Dense Bank",
+        "description": "Case-insensitive, whitespace-normalized entity shards for non-ASCII scan mapping costs.",
+        "version": "2026.06.04",
+        "status": "active",
+        "created_at": SYNTHETIC_BANK_TIMESTAMP,
+        "updated_at": SYNTHETIC_BANK_TIMESTAMP,
+        "unicode_normalization": "none",
+        "default_regex_flags": [],
+        "entities": entities,
+        "metadata": {"benchmark_profile_id": "non_ascii_dense"},
+    }
+
+
+def _dense_match_bank() -> dict[str, Any]:
+    entities: dict[str, Any] = {}
+    for entity_index in range(_DENSE_MATCH_ENTITIES):
+        entities[f"entity_{entity_index:02d}"] = {
+            "description": "Dense-match benchmark entity.",
+            "status": "active",
+            "regex_flags": [],
+            "names": {
+                "prefix": {
+                    "canonical": f"Token Prefix {entity_index:02d}",
+                    "description": "Literal token prefix shared by every entity.",
+                    "status": "active",
+                    "patterns": {"literal": _profile_literal_pattern("tok", priority=100)},
+                    "metadata": {},
+                },
+                "suffix": {
+                    "canonical": f"Token Suffix {entity_index:02d}",
+                    "description": "Two-digit token suffix shared by every entity.",
+                    "status": "active",
+                    "patterns": {
+                        "digits": _profile_regex_pattern(r"\d{2}\b", benchmark_text="tok42", priority=90),
+                    },
+                    "metadata": {},
+                },
+            },
+            "metadata": {},
+        }
+    return {
+        "schema_version": "nerb.bank.v1",
+        "id": "benchmark_dense_matches",
+        "name": "Benchmark Dense Match Bank",
+        "description": "Entity shards that all match every token of a dense document.",
+        "version": "2026.06.04",
+        "status": "active",
+        "created_at": SYNTHETIC_BANK_TIMESTAMP,
+        "updated_at": SYNTHETIC_BANK_TIMESTAMP,
+        "unicode_normalization": "none",
+        "default_regex_flags": [],
+        "entities": entities,
+        "metadata": {"benchmark_profile_id": "dense_matches"},
+    }
+
+
 def _profile_literal_pattern(value: str, *, priority: int) -> dict[str, Any]:
     pattern = _synthetic_literal_pattern(value)
     pattern["description"] = "Benchmark fixture literal pattern."
@@ -546,6 +795,68 @@ def _adversarial_document_tiers(options: BenchmarkOptions) -> dict[str, list[Map
     }
 
 
+def _non_ascii_dense_document_tiers(options: BenchmarkOptions) -> dict[str, list[Mapping[str, Any]]]:
+    tokens = [
+        f"{entity_index:02d}{name_index}"
+        for entity_index in range(_NON_ASCII_DENSE_ENTITIES)
+        for name_index in range(_NON_ASCII_DENSE_NAMES_PER_ENTITY)
+    ]
+    # U+212A KELVIN SIGN and U+017F LONG S fold to ASCII letters; NBSP and ideographic spaces need whitespace mapping.
+    casefold = " ".join(f"\u212aELVIN \u017fEAT {token} café" for token in tokens)
+    spaced = " ".join(f"DESK\u00a0\u3000ROW {token} naïve" for token in tokens)
+    mixed = f"{casefold} {spaced}"
+    return {
+        "baseline": [{"document_id": "non_ascii_baseline", "text": f"Señor \u212aelvin \u017feat {tokens[0]}"}],
+        "target": [
+            {"document_id": "non_ascii_casefold", "text": casefold},
+            {"document_id": "non_ascii_whitespace", "text": spaced},
+            {"document_id": "non_ascii_mixed", "text": mixed},
+        ],
+        "stress": [{"document_id": "non_ascii_stress", "text": " ".join([mixed] * options.stress_multiplier)}],
+    }
+
+
+def _dense_match_document_tiers(options: BenchmarkOptions) -> dict[str, list[Mapping[str, Any]]]:
+    tokens = " ".join(f"tok{index % 100:02d}" for index in range(_DENSE_MATCH_TOKENS))
+    sparse = " ".join(f"tok{index % 100:02d} filler" for index in range(_DENSE_MATCH_TOKENS // 2))
+    return {
+        "baseline": [{"document_id": "dense_match_baseline", "text": "tok00"}],
+        "target": [
+            {"document_id": "dense_match_tokens", "text": tokens},
+            {"document_id": "dense_match_sparse", "text": sparse},
+        ],
+        "stress": [{"document_id": "dense_match_stress", "text": " ".join([tokens] * options.stress_multiplier)}],
+    }
+
+
+def _literal_scale_alias(index: int) -> str:
+    return f"Person {index:07d} Example"
+
+
+def _literal_scale_source(pattern_count: int, entity_count: int) -> bytes:
+    # Stream the detector map as bytes; a million-entry Python mapping would
+    # dominate the memory this benchmark is trying to measure.
+    chunks = [b"{"]
+    for entity_index in range(entity_count):
+        if entity_index:
+            chunks.append(b",")
+        chunks.append(f'"ALIAS_{entity_index:03d}":{{'.encode())
+        chunks.append(
+            ",".join(
+                f'"alias_{index:07d}":"{_literal_scale_alias(index)}"'
+                for index in range(entity_index, pattern_count, entity_count)
+            ).encode()
+        )
+        chunks.append(b"}")
+    chunks.append(b"}")
+    return b"".join(chunks)
+
+
+def _literal_scale_text(pattern_count: int, scan_hits: int) -> tuple[bytes, int]:
+    aliases = (_literal_scale_alias((hit * 7919) % pattern_count) for hit in range(scan_hits))
+    return " and ".join(aliases).encode(), scan_hits
+
+
 def _synthetic_literal_pattern(value: str) -> dict[str, Any]:
     return {
         "kind": "literal",
@@ -815,13 +1126,17 @@ def _measure_tier(
     prepare_seconds = time.perf_counter() - prepare_start
     document_summaries: list[dict[str, Any]] = []
     run_record_counts: list[int] = []
+    latencies_ns: list[int] = []
+    rss_scope = "tier" if _reset_peak_rss() else "process"
+    rss_before = _peak_rss()
 
     start = time.perf_counter()
     for iteration in range(benchmark_options.iterations):
         run_record_count = 0
         for document_id, source, text in prepared_documents:
+            document_start = time.perf_counter_ns()
             records = compiled.finditer(text)
-            records.sort(key=record_sort_key)
+            latencies_ns.append(time.perf_counter_ns() - document_start)
             run_record_count += len(records)
             if iteration == 0:
                 document_summaries.append(
@@ -833,6 +1148,7 @@ def _measure_tier(
                 )
         run_record_counts.append(run_record_count)
     elapsed_seconds = time.perf_counter() - start
+    rss_after = _peak_rss()
 
     record_count = run_record_counts[0] if run_record_counts else 0
     document_bytes = [int(document["source"]["bytes"]) for document in document_summaries]
@@ -864,13 +1180,275 @@ def _measure_tier(
             "bytes_per_second": _rate(total_bytes, elapsed_seconds),
             "records_per_second": _rate(total_records, elapsed_seconds),
         },
+        "latency": _latency_profile(latencies_ns),
+        "memory": _tier_memory(compiled, prepared_documents, document_summaries, rss_before, rss_after, rss_scope),
+    }
+
+
+def _measure_thread_scaling(
+    compiled: CompiledBank,
+    documents: Sequence[Mapping[str, Any]],
+    extraction_options: Mapping[str, Any],
+    benchmark_options: BenchmarkOptions,
+) -> dict[str, Any]:
+    prepared_documents, combined_bytes = _prepare_batch_documents(documents, options=extraction_options)
+    texts = [text for _document_id, _source, text in prepared_documents] * benchmark_options.iterations
+    total_bytes = combined_bytes * benchmark_options.iterations
+
+    def scan(text: str) -> tuple[int, int]:
+        document_start = time.perf_counter_ns()
+        records = compiled.finditer(text)
+        return len(records), time.perf_counter_ns() - document_start
+
+    cells: list[dict[str, Any]] = []
+    single_thread_seconds: float | None = None
+    for threads in range(1, benchmark_options.max_threads + 1):
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="nerb-benchmark") as executor:
+            start = time.perf_counter()
+            results = list(executor.map(scan, texts))
+            elapsed_seconds = time.perf_counter() - start
+        if threads == 1:
+            single_thread_seconds = elapsed_seconds
+        speedup = (
+            round(single_thread_seconds / elapsed_seconds, 6)
+            if single_thread_seconds is not None and elapsed_seconds > 0
+            else None
+        )
+        total_records = sum(record_count for record_count, _latency_ns in results)
+        cells.append(
+            {
+                "threads": threads,
+                "document_count": len(texts),
+                "record_count": total_records,
+                "elapsed_seconds": _seconds(elapsed_seconds),
+                "throughput": {
+                    "documents_per_second": _rate(len(texts), elapsed_seconds),
+                    "bytes_per_second": _rate(total_bytes, elapsed_seconds),
+                    "records_per_second": _rate(total_records, elapsed_seconds),
+                },
+                "speedup": speedup,
+                "efficiency": round(speedup / threads, 6) if speedup is not None else None,
+                "latency": _latency_profile([latency_ns for _record_count, latency_ns in results]),
+            }
+        )
+
+    speedups = [cell["speedup"] for cell in cells if cell["speedup"] is not None]
+    return {
+        "tier": THREAD_SCALING_TIER,
+        "shared_bank": True,
+        "max_threads": benchmark_options.max_threads,
+        "native_scan_slots": _native_scan_slots(compiled),
+        "iterations": benchmark_options.iterations,
+        "record_count_stable": len({cell["record_count"] for cell in cells}) <= 1,
+        "best_speedup": max(speedups, default=None),
+        "cells": cells,
+        "note": (
+            "Native scans release the GIL; Python record projection and sorting do not, so speedup is bounded by the "
+            "projection share of each scan and by the per-bank native scan slots."
+        ),
     }
 
 
+def _measure_scan_modes(
+    compiled: CompiledBank,
+    documents: Sequence[Mapping[str, Any]],
+    extraction_options: Mapping[str, Any],
+    benchmark_options: BenchmarkOptions,
+) -> dict[str, Any]:
+    prepared_documents, combined_bytes = _prepare_batch_documents(documents, options=extraction_options)
+    texts = [text for _document_id, _source, text in prepared_documents]
+    native_bank = compiled.native_bank
+    result: dict[str, Any] = {
+        "tier": SCAN_MODES_TIER,
+        "iterations": benchmark_options.iterations,
+        "document_count": len(texts),
+        "bytes": combined_bytes,
+        "stop_after": SCAN_MODE_STOP_AFTER,
+        "cells": [],
+    }
+    if native_bank is None:
+        return result
+
+    # Each mode returns the matches it kept, so cells show how much work the early exits skipped.
+    # The scanner mode repeats the full scan through one reused Scanner.
+    scanner = native_bank.scanner()
+    modes: list[tuple[str, Callable[[str], int]]] = [
+        ("scan", lambda text: len(native_bank.scan_text(text))),
+        ("scanner", lambda text: len(scanner.scan_text(text))),
+        ("stop_after", lambda text: len(native_bank.scan_text(text, stop_after=SCAN_MODE_STOP_AFTER))),
+        ("contains_any", lambda text: int(native_bank.contains_any(text))),
+        ("count", lambda text: int(native_bank.count(text)["total"])),
+    ]
+    total_documents = len(texts) * benchmark_options.iterations
+    total_bytes = combined_bytes * benchmark_options.iterations
+    scan_seconds: float | None = None
+    for mode, scan in modes:
+        latencies_ns: list[int] = []
+        matches = 0
+        start = time.perf_counter()
+        for iteration in range(benchmark_options.iterations):
+            for text in texts:
+                document_start = time.perf_counter_ns()
+                kept = scan(text)
+                latencies_ns.append(time.perf_counter_ns() - document_start)
+                if iteration == 0:
+                    matches += kept
+        elapsed_seconds = time.perf_counter() - start
+        if mode == "scan":
+            scan_seconds = elapsed_seconds
+        result["cells"].append(
+            {
+                "mode": mode,
+                "matches": matches,
+                "elapsed_seconds": _seconds(elapsed_seconds),
+                "throughput": {
+                    "documents_per_second": _rate(total_documents, elapsed_seconds),
+                    "bytes_per_second": _rate(total_bytes, elapsed_seconds),
+                },
+                "speedup_vs_scan": (
+                    round(scan_seconds / elapsed_seconds, 6)
+                    if scan_seconds is not None and elapsed_seconds > 0
+                    else None
+                ),
+                "latency": _latency_profile(latencies_ns),
+            }
+        )
+    return result
+
+
+def _latency_profile(latencies_ns: Sequence[int]) -> dict[str, Any]:
+    ordered = sorted(latencies_ns)
+    histogram: list[dict[str, Any]] = [{"le_seconds": bound, "count": 0} for bound in LATENCY_HISTOGRAM_BOUNDS_SECONDS]
+    histogram.append({"le_seconds": None, "count": 0})
+    for latency_ns in ordered:
+        latency_seconds = latency_ns / 1_000_000_000
+        for bucket in histogram:
+            if bucket["le_seconds"] is None or latency_seconds <= bucket["le_seconds"]:
+                bucket["count"] += 1
+                break
+    return {
+        "sample_count": len(ordered),
+        "percentile_method": "nearest_rank",
+        "min_seconds": _nanoseconds(ordered[0]) if ordered else None,
+        "mean_seconds": _seconds(sum(ordered) / len(ordered) / 1_000_000_000) if ordered else None,
+        "p50_seconds": _nanoseconds(_nearest_rank(ordered, 0.50)) if ordered else None,
+        "p95_seconds": _nanoseconds(_nearest_rank(ordered, 0.95)) if ordered else None,
+        "p99_seconds": _nanoseconds(_nearest_rank(ordered, 0.99)) if ordered else None,
+        "max_seconds": _nanoseconds(ordered[-1]) if ordered else None,
+        "histogram": histogram,
+    }
+
+
+def _nearest_rank(values: Sequence[int], probability: float) -> int:
+    index = max(0, math.ceil(probability * len(values)) - 1)
+    return values[index]
+
+
+def _tier_memory(
+    compiled: CompiledBank,
+    prepared_documents: Sequence[tuple[str, Mapping[str, Any], str]],
+    document_summaries: Sequence[Mapping[str, Any]],
+    rss_before: tuple[int | None, str],
+    rss_after: tuple[int | None, str],
+    rss_scope: str,
+) -> dict[str, Any]:
+    peak_rss_before, _status_before = rss_before
+    peak_rss_bytes, peak_rss_status = rss_after
+    peak_document_records = max((int(document["record_count"]) for document in document_summaries), default=0)
+    python_peak_bytes, python_status = _python_allocation_peak(compiled, prepared_documents)
+    return {
+        "peak_rss_bytes": peak_rss_bytes,
+        "peak_rss_status": peak_rss_status,
+        "peak_rss_scope": rss_scope,
+        "peak_rss_growth_bytes": (
+            peak_rss_bytes - peak_rss_before if peak_rss_bytes is not None and peak_rss_before is not None else None
+        ),
+        "native_match_buffer": {
+            "peak_document_records": peak_document_records,
+            **_native_match_buffer_capacity(compiled, prepared_documents),
+            "method": "capacity of one Scanner match buffer reused over one untimed pass of the tier documents",
+        },
+        "python_allocations": {
+            "peak_bytes": python_peak_bytes,
+            "status": python_status,
+            "method": "tracemalloc peak over one untimed pass of the tier documents",
+        },
+    }
+
+
+def _native_match_buffer_capacity(
+    compiled: CompiledBank,
+    prepared_documents: Sequence[tuple[str, Mapping[str, Any], str]],
+) -> dict[str, Any]:
+    if compiled.native_bank is None:
+        return {"capacity_matches": 0, "capacity_bytes": 0, "status": "no_native_bank"}
+    # Cached scans return match tuples without touching the scanner's buffer.
+    if scan_result_cache_info()["enabled"]:
+        return {"capacity_matches": None, "capacity_bytes": None, "status": "skipped_scan_result_cache"}
+    scanner = compiled.native_bank.scanner()
+    capacity = 0
+    for _document_id, _source, text in prepared_documents:
+        capacity = int(scanner.scan_text_raw(text).capacity())
+    raw_match_bytes = int(importlib.import_module("nerb._engine").RAW_MATCH_BYTES)
+    return {"capacity_matches": capacity, "capacity_bytes": capacity * raw_match_bytes, "status": "supported"}
+
+
+def _python_allocation_peak(
+    compiled: CompiledBank,
+    prepared_documents: Sequence[tuple[str, Mapping[str, Any], str]],
+) -> tuple[int | None, str]:
+    if tracemalloc.is_tracing():
+        return None, "skipped_external_tracemalloc"
+    tracemalloc.start()
+    try:
+        for _document_id, _source, text in prepared_documents:
+            compiled.finditer(text)
+        _current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_bytes, "supported"
+
+
+def _reset_peak_rss() -> bool:
+    """Restart the process peak RSS at the current RSS, which Linux allows through ``clear_refs``."""
+    if sys.platform != "linux":
+        return False
+    try:
+        Path("/proc/self/clear_refs").write_text("5", encoding="ascii")
+    except OSError:
+        return False
+    return True
+
+
+def _peak_rss() -> tuple[int | None, str]:
+    if _resource is None or sys.platform not in {"linux", "darwin"}:
+        return None, "unsupported_platform"
+    try:
+        raw_value = _resource.getrusage(_resource.RUSAGE_SELF).ru_maxrss
+    except (OSError, ValueError):
+        return None, "resource_unavailable"
+    if isinstance(raw_value, bool) or not isinstance(raw_value, int) or raw_value < 0:
+        return None, "invalid_value"
+    return raw_value * (1024 if sys.platform == "linux" else 1), "supported"
+
+
+def _native_scan_slots(compiled: CompiledBank) -> int | None:
+    if compiled.native_bank is None:
+        return None
+    scan_limits = compiled.native_bank.metadata().get("scan_limits")
+    if not isinstance(scan_limits, Mapping):
+        return None
+    return cast(int | None, scan_limits.get("maximum_concurrent_scans_per_bank"))
+
+
 def _seconds(value: float) -> float:
     return round(value, 9)
 
 
+def _nanoseconds(value: int) -> float:
+    return _seconds(value / 1_000_000_000)
+
+
 def _rate(amount: int, elapsed_seconds: float) -> float | None:
     if elapsed_seconds <= 0:
         return None
@@ -984,6 +1562,7 @@ def _matcher_profiles(compiled: CompiledBank) -> list[dict[str, Any]]:
             "entity_count": metadata["entity_count"],
             "pattern_count": metadata["pattern_count"],
             "match_mode": metadata["match_mode"]["name"],
+            "literal_resources": metadata.get("literal_resources"),
         }
     ]
 
@@ -1000,6 +1579,7 @@ def _native_stage_report(compile_detail: Mapping[str, Any]) -> Mapping[str, Any]
 
 def _benchmark_summary(
     tiers: Mapping[str, Mapping[str, Any]],
+    thread_scaling: Mapping[str, Any],
     compile_report: Mapping[str, Any],
     profile: Mapping[str, Any],
     options: BenchmarkOptions,
@@ -1020,6 +1600,20 @@ def _benchmark_summary(
         "target_documents_per_second": target_throughput["documents_per_second"],
         "target_bytes_per_second": target_throughput["bytes_per_second"],
         "target_records_per_second": target_throughput["records_per_second"],
+        "target_p50_seconds": target["latency"]["p50_seconds"],
+        "target_p95_seconds": target["latency"]["p95_seconds"],
+        "target_p99_seconds": target["latency"]["p99_seconds"],
+        "target_max_seconds": target["latency"]["max_seconds"],
+        "peak_rss_bytes": max(
+            (
+                tier["memory"]["peak_rss_bytes"]
+                for tier in tiers.values()
+                if tier["memory"]["peak_rss_bytes"] is not None
+            ),
+            default=None,
+        ),
+        "thread_scaling_max_threads": thread_scaling["max_threads"],
+        "thread_scaling_best_speedup": thread_scaling["best_speedup"],
     }
 
 
@@ -1174,6 +1768,8 @@ def _tier_performance_delta(old_tier: Mapping[str, Any], new_tier: Mapping[str,
             new_throughput["records_per_second"],
             old_throughput["records_per_second"],
         ),
+        "p99_seconds_delta": _difference(new_tier["latency"]["p99_seconds"], old_tier["latency"]["p99_seconds"]),
+        "p99_seconds_ratio": _ratio(new_tier["latency"]["p99_seconds"], old_tier["latency"]["p99_seconds"]),
     }
 
 
@@ -2,12 +2,14 @@ import json
 import os
 import sys
 import tempfile
-from collections.abc import Mapping, Sequence
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as package_version
 from pathlib import Path
-from typing import Any, NoReturn, cast
+from typing import Any, BinaryIO, NoReturn, cast
 
 import typer
 import yaml
@@ -25,6 +27,15 @@ from .bank import (
 from .bank import (
     read_bank_json as _read_bank_json,
 )
+from .benchmark_history import (
+    BENCHMARK_HISTORY_ENV_VAR,
+    DEFAULT_HISTORY_MIN_BASELINE_SAMPLES,
+    DEFAULT_HISTORY_NOISE_MULTIPLIER,
+    DEFAULT_HISTORY_WINDOW,
+    benchmark_history_report,
+    record_benchmark_history,
+)
+from .benchmarks import LITERAL_MATCHERS, benchmark_literal_scale
 from .benchmarks import benchmark_bank as _benchmark_bank
 from .benchmarks import regress_bank as _regress_bank
 from .config import (
@@ -41,10 +52,13 @@ from .config import (
     validate_pattern_config,
     validate_regex_flags,
 )
+from .corpus import DEFAULT_CORPUS_SHARD_DOCUMENTS
+from .corpus import extract_corpus as _json_extract_corpus
 from .deanonymization import (
     DeanonymizationError,
     _anonymize_config_file_with_db_update,
     _anonymize_config_text_with_db_update,
+    _anonymize_file_stream_with_db_update,
     _anonymize_file_with_db_update,
     _anonymize_text_with_db_update,
 )
@@ -53,7 +67,7 @@ from .deanonymization import deanonymize_text as _deanonymize_text
 from .deanonymization import finalize_replacement_db_update as _finalize_replacement_db_update
 from .diagnostics import JSON_PARSE
 from .diff import diff_banks as _diff_banks
-from .engine import Bank
+from .engine import MAX_SCAN_THREADS, Bank, _compile_config_entity_bank, configure_scan_result_cache
 from .engines import DEFAULT_MAX_TEXT_BYTES
 from .enron_annotations import (
     EnronAnnotationError,
@@ -70,7 +84,7 @@ from .enron_bank_workflow import (
     build_enron_intelligence_bank,
     verify_enron_bank_build,
 )
-from .enron_conformance import EnronConformanceError, evaluate_enron_conformance_files
+from .enron_conformance import EnronConformanceError, EnronConformanceOptions, evaluate_enron_conformance_files
 from .enron_performance import (
     DEFAULT_CONCURRENCY as DEFAULT_ENRON_PERFORMANCE_CONCURRENCY,
 )
@@ -132,7 +146,9 @@ from .enron_quality import (
     evaluate_enron_quality_files,
 )
 from .enron_splitting import (
+    DEFAULT_NEAR_INDEX_MEMORY_BYTES,
     DEFAULT_SPLIT_SEED,
+    HARD_MAX_NEAR_INDEX_MEMORY_BYTES,
     EnronSplitOptions,
     split_enron_preparation,
     verify_enron_splits,
@@ -152,6 +168,7 @@ from .extraction import (
     extract_text as _json_extract_text,
 )
 from .patches import apply_bank_patches as _apply_bank_patches
+from .record_file import RecordFileDocument, RecordFileError, RecordFileWriter, iter_record_file
 from .replacements import (
     ReplacementDbError,
     create_replacement_db,
@@ -165,12 +182,15 @@ from .replacements import (
 from .schema import ID_RE
 from .validation import rust_empty_match_diagnostics
 from .validation import validate_bank as _validate_bank
+from .workloads import WORKLOAD_DOCUMENT_FORMATS, generate_workload
 
 COMMAND_ERROR_EXIT_CODE = 1
 OUTPUT_FORMATS = {"json", "jsonl", "table"}
+BATCH_OUTPUT_FORMATS = {*OUTPUT_FORMATS, "records"}
 AUTHORING_OUTPUT_FORMATS = {"json", "text"}
 RECORD_COLUMNS = ["entity", "canonical_name", "surface_name", "string", "start", "end", "offset_unit"]
 BATCH_RECORD_COLUMNS = ["document_id", *RECORD_COLUMNS]
+BATCH_PENDING_DOCUMENTS_PER_JOB = 4
 DIAGNOSTIC_ERROR = "error"
 DIAGNOSTIC_WARNING = "warning"
 
@@ -193,7 +213,8 @@ app.add_typer(replacement_db_app, name="replacement-db")
 class _BatchDocument:
     document_id: str
     source: dict[str, str]
-    content: str | bytes
+    content: str | bytes | None = None
+    path: Path | None = None
 
 
 def _installed_version() -> str:
@@ -218,6 +239,66 @@ def _config_option() -> Any:
     )
 
 
+def _benchmark_history_dir_option() -> Any:
+    return typer.Option(
+        None,
+        "--history-dir",
+        help=f"Benchmark history directory. Defaults to ${BENCHMARK_HISTORY_ENV_VAR} when set.",
+    )
+
+
+def _scan_threads_option() -> Any:
+    return typer.Option(
+        1,
+        "--scan-threads",
+        min=1,
+        max=MAX_SCAN_THREADS,
+        help="Native threads scanning each document batch; results are identical for every count.",
+    )
+
+
+def _scan_cache_bytes_option() -> Any:
+    return typer.Option(
+        0,
+        "--scan-cache-bytes",
+        min=0,
+        help="Memory budget for reusing scan results of byte-identical documents; 0 disables the cache.",
+    )
+
+
+def _enable_scan_result_cache(max_bytes: int) -> None:
+    if max_bytes > 0:
+        configure_scan_result_cache(max_bytes)
+
+
+def _resolve_benchmark_history_dir(history_dir: Path | None) -> Path | None:
+    if history_dir is not None:
+        return history_dir.expanduser()
+    env_dir = os.environ.get(BENCHMARK_HISTORY_ENV_VAR)
+    return Path(env_dir).expanduser() if env_dir else None
+
+
+def _with_benchmark_history(
+    payload: dict[str, Any],
+    history_dir: Path | None,
+    label: str | None,
+) -> dict[str, Any]:
+    resolved_dir = _resolve_benchmark_history_dir(history_dir)
+    if resolved_dir is None or not ("tiers" in payload or "benchmarks" in payload):
+        return payload
+    samples = _run_json_helper(
+        lambda: {"samples": record_benchmark_history(payload, history_dir=resolved_dir, label=label)}
+    )["samples"]
+    return {
+        **payload,
+        "history": {
+            "history_dir": str(resolved_dir),
+            "recorded_samples": len(samples),
+            "keys": [sample["key"] for sample in samples],
+        },
+    }
+
+
 def _command_config_path(ctx: typer.Context, config: Path | None) -> Path:
     if config is not None:
         return resolve_default_config_path(config)
@@ -774,6 +855,42 @@ def _write_output_text(output_path: Path, text: str, *, force: bool) -> None:
         _exit_error(f"Could not write output at {path}: {exc}")
 
 
+def _write_streamed_output(
+    output_path: Path,
+    action: Callable[[BinaryIO], dict[str, Any]],
+    *,
+    force: bool,
+    save_db: bool,
+) -> dict[str, Any]:
+    path = _ensure_output_writable(output_path, force=force)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "wb",
+            dir=path.parent,
+            prefix=f".{path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            temp_path = Path(file.name)
+            payload = action(cast(BinaryIO, file))
+            if payload.get("valid") is False:
+                return payload
+            _refuse_unsaved_assignment_output(payload, save_db=save_db)
+            file.flush()
+            os.fsync(file.fileno())
+
+        temp_path.replace(path)
+        temp_path = None
+    except OSError as exc:
+        _exit_error(f"Could not write output at {path}: {exc}")
+    finally:
+        if temp_path is not None:
+            temp_path.unlink(missing_ok=True)
+    payload["output"] = {**payload.get("output", {}), "path": str(path), "written": True}
+    return payload
+
+
 def _ensure_output_writable(output_path: Path, *, force: bool) -> Path:
     path = output_path.expanduser()
     if path.exists() and not force:
@@ -1057,31 +1174,30 @@ def _read_document_bytes(document: Path) -> bytes:
     return document_bytes
 
 
-def _read_manifest_document_paths(manifest: Path) -> list[Path]:
+def _iter_manifest_document_paths(manifest: Path) -> Iterator[Path]:
     manifest_path = _ensure_explicit_file(manifest, "Manifest")
+    listed = False
     try:
-        manifest_text = manifest_path.read_text(encoding="utf-8")
+        with manifest_path.open(encoding="utf-8") as manifest_file:
+            for line_number, raw_line in enumerate(manifest_file, start=1):
+                line = raw_line.strip()
+                if not line:
+                    continue
+                path = Path(line).expanduser()
+                if not path.is_absolute():
+                    path = manifest_path.parent / path
+                if not path.exists():
+                    _exit_error(f"Manifest document path on line {line_number} does not exist at {path}.")
+                if not path.is_file():
+                    _exit_error(f"Manifest document path on line {line_number} is not a file: {path}.")
+                listed = True
+                yield path
     except UnicodeDecodeError as exc:
         _exit_error(f"Manifest file is not valid UTF-8 at {manifest_path}: {exc}")
     except OSError as exc:
         _exit_error(f"Could not read manifest at {manifest_path}: {exc}")
-
-    document_paths = []
-    for line_number, raw_line in enumerate(manifest_text.splitlines(), start=1):
-        line = raw_line.strip()
-        if not line:
-            continue
-        path = Path(line).expanduser()
-        if not path.is_absolute():
-            path = manifest_path.parent / path
-        if not path.exists():
-            _exit_error(f"Manifest document path on line {line_number} does not exist at {path}.")
-        if not path.is_file():
-            _exit_error(f"Manifest document path on line {line_number} is not a file: {path}.")
-        document_paths.append(path)
-    if not document_paths:
+    if not listed:
         _exit_error(f"Manifest file at {manifest_path} does not list any document paths.")
-    return document_paths
 
 
 def _parse_pattern_definition(raw_value: str) -> tuple[str, str]:
@@ -1148,11 +1264,7 @@ def _compile_config_bank(
     word_boundaries: bool,
 ) -> Bank:
     try:
-        bank = Bank.from_config(
-            pattern_config,
-            selected_entity=selected_entity,
-            word_boundaries=word_boundaries,
-        )
+        bank = _compile_config_entity_bank(pattern_config, selected_entity, word_boundaries=word_boundaries)
     except ValueError as exc:
         _exit_error(f"Could not compile detectors with the Rust engine: {exc}")
     diagnostics = rust_empty_match_diagnostics(bank)
@@ -1271,65 +1383,165 @@ def _batch_documents(
     *,
     read_stdin: bool,
     manifest: Path | None,
-) -> list[_BatchDocument]:
-    documents = []
+) -> Iterator[_BatchDocument]:
+    """Yield batch inputs lazily; file contents are read when each document is scanned."""
+    if not document_paths and manifest is None and not read_stdin:
+        _exit_error("Provide at least one batch input source: DOCUMENT, --manifest, or --stdin.")
+
     for document_path in document_paths:
         path = document_path.expanduser()
-        documents.append(
-            _BatchDocument(
-                document_id=str(path),
-                source={"type": "file", "path": str(path)},
-                content=_read_document_bytes(path),
-            )
-        )
+        yield _BatchDocument(document_id=str(path), source={"type": "file", "path": str(path)}, path=path)
 
     if manifest is not None:
-        for manifest_document_path in _read_manifest_document_paths(manifest):
-            documents.append(
-                _BatchDocument(
-                    document_id=str(manifest_document_path),
-                    source={"type": "file", "path": str(manifest_document_path)},
-                    content=_read_document_bytes(manifest_document_path),
-                )
+        for manifest_document_path in _iter_manifest_document_paths(manifest):
+            yield _BatchDocument(
+                document_id=str(manifest_document_path),
+                source={"type": "file", "path": str(manifest_document_path)},
+                path=manifest_document_path,
             )
 
     if read_stdin:
-        documents.append(
-            _BatchDocument(
-                document_id="stdin",
-                source={"type": "stdin"},
-                content=_read_stdin_bytes(),
-            )
-        )
+        yield _BatchDocument(document_id="stdin", source={"type": "stdin"}, content=_read_stdin_bytes())
 
-    if not documents:
-        _exit_error("Provide at least one batch input source: DOCUMENT, --manifest, or --stdin.")
-    return documents
+
+def _scan_batch_document(bank: Bank, document: _BatchDocument) -> dict[str, Any]:
+    content = _read_document_bytes(document.path) if document.path is not None else document.content
+    if content is None:
+        _exit_error(f"Batch document {document.document_id} has no content.")
+    records = _scan_records(bank, content)
+    return {
+        "document_id": document.document_id,
+        "source": document.source,
+        "records": records,
+        "record_count": len(records),
+    }
 
 
-def _batch_payload(bank: Bank, documents: list[_BatchDocument]) -> dict[str, Any]:
-    document_payloads = []
-    record_count = 0
-    for document in documents:
-        records = _scan_records(bank, document.content)
-        record_count += len(records)
-        document_payloads.append(
-            {
-                "document_id": document.document_id,
-                "source": document.source,
-                "records": records,
-                "record_count": len(records),
-            }
-        )
+def _iter_batch_payloads(
+    bank: Bank,
+    documents: Iterable[_BatchDocument],
+    *,
+    jobs: int = 1,
+    ordered: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Scan documents and yield each document payload as soon as it may be emitted.
+
+    With ``jobs > 1`` documents are read and scanned on a thread pool sharing one
+    ``Bank``; native scans release the GIL. At most ``jobs`` times
+    ``BATCH_PENDING_DOCUMENTS_PER_JOB`` documents are in flight, so a slow output
+    consumer throttles input reading instead of buffering the whole batch.
+    ``ordered`` yields payloads in input order; otherwise they follow completion.
+    """
+    if jobs == 1:
+        for document in documents:
+            yield _scan_batch_document(bank, document)
+        return
+
+    max_pending = jobs * BATCH_PENDING_DOCUMENTS_PER_JOB
+    pending: deque[Future[dict[str, Any]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="nerb-extract-batch")
+    try:
+        for document in documents:
+            pending.append(executor.submit(_scan_batch_document, bank, document))
+            while len(pending) >= max_pending:
+                yield from _completed_batch_payloads(pending, ordered=ordered)
+        while pending:
+            yield from _completed_batch_payloads(pending, ordered=ordered)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _completed_batch_payloads(pending: deque[Future[dict[str, Any]]], *, ordered: bool) -> Iterator[dict[str, Any]]:
+    if ordered:
+        yield pending.popleft().result()
+        return
+
+    done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+    for future in [future for future in pending if future in done]:
+        pending.remove(future)
+        yield future.result()
+
 
+def _batch_summary(bank: Bank, document_count: int, record_count: int) -> dict[str, Any]:
     return {
-        "documents": document_payloads,
-        "document_count": len(document_payloads),
+        "document_count": document_count,
         "record_count": record_count,
         "cache": bank.cache_metadata(),
     }
 
 
+def _batch_payload(
+    bank: Bank,
+    documents: Iterable[_BatchDocument],
+    *,
+    jobs: int = 1,
+    ordered: bool = True,
+) -> dict[str, Any]:
+    document_payloads = list(_iter_batch_payloads(bank, documents, jobs=jobs, ordered=ordered))
+    summary = _batch_summary(
+        bank,
+        len(document_payloads),
+        sum(document["record_count"] for document in document_payloads),
+    )
+    return {"documents": document_payloads, **summary}
+
+
+def _echo_batch_stream(
+    bank: Bank,
+    documents: Iterable[_BatchDocument],
+    *,
+    jobs: int,
+    ordered: bool,
+) -> None:
+    """Emit one JSONL line per document as it completes, then one summary line."""
+    document_count = 0
+    record_count = 0
+    for document in _iter_batch_payloads(bank, documents, jobs=jobs, ordered=ordered):
+        typer.echo(json.dumps(document, ensure_ascii=False))
+        document_count += 1
+        record_count += document["record_count"]
+    typer.echo(json.dumps({"summary": _batch_summary(bank, document_count, record_count)}, ensure_ascii=False))
+
+
+def _write_batch_record_file(
+    bank: Bank,
+    documents: Iterable[_BatchDocument],
+    output_path: Path,
+    *,
+    jobs: int,
+    ordered: bool,
+) -> dict[str, Any]:
+    """Stream document records into a binary record file and return the batch summary."""
+    document_count = 0
+    record_count = 0
+    try:
+        with output_path.expanduser().open("wb") as stream:
+            writer = RecordFileWriter(stream)
+            for document in _iter_batch_payloads(bank, documents, jobs=jobs, ordered=ordered):
+                writer.write_document(
+                    document["document_id"],
+                    document["records"],
+                    metadata={"source": document["source"]},
+                )
+                document_count += 1
+                record_count += document["record_count"]
+    except OSError as exc:
+        _exit_error(f"Could not write record file at {output_path}: {exc}")
+    except RecordFileError as exc:
+        _exit_error(str(exc))
+    return {"output": str(output_path), **_batch_summary(bank, document_count, record_count)}
+
+
+def _record_file_document_payload(document: RecordFileDocument) -> dict[str, Any]:
+    records = document.records()
+    return {
+        "document_id": document.document_id,
+        "source": (document.metadata or {}).get("source"),
+        "records": records,
+        "record_count": len(records),
+    }
+
+
 def _format_batch_table(payload: dict[str, Any]) -> str:
     rows = []
     for document in payload["documents"]:
@@ -1359,11 +1571,6 @@ def _echo_batch_payload(payload: dict[str, Any], output_format: str) -> None:
         typer.echo(json.dumps(payload, ensure_ascii=False))
         return
 
-    if normalized_format == "jsonl":
-        for document in payload["documents"]:
-            typer.echo(json.dumps(document, ensure_ascii=False))
-        return
-
     typer.echo(_format_batch_table(payload))
 
 
@@ -1960,6 +2167,50 @@ def extract_json_bank_file(
     _echo_json(_run_json_helper(lambda: _json_extract_file(bank, document_path)))
 
 
+@app.command("extract-corpus")
+def extract_json_bank_corpus(
+    bank_path: Path = typer.Option(..., "--bank", help="JSON bank path."),
+    root: Path = typer.Option(..., "--root", help="Directory tree of UTF-8 documents to scan."),
+    output_dir: Path = typer.Option(..., "--output-dir", help="Directory for record shards and the checkpoint."),
+    glob: str = typer.Option("*", "--glob", help="Relative-path glob selecting documents under --root."),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Worker threads scanning documents concurrently."),
+    shard_size: int = typer.Option(
+        DEFAULT_CORPUS_SHARD_DOCUMENTS,
+        "--shard-size",
+        min=1,
+        help="Maximum documents per JSONL record shard.",
+    ),
+    resume: bool = typer.Option(
+        True,
+        "--resume/--no-resume",
+        help="Skip files already recorded in an existing checkpoint; --no-resume refuses to reuse one.",
+    ),
+    scan_cache_bytes: int = _scan_cache_bytes_option(),
+) -> None:
+    """Extract a directory tree into sharded JSONL with a resumable checkpoint."""
+    bank, _path, invalid_payload = _load_json_bank_for_command(bank_path)
+    if invalid_payload is not None:
+        _echo_json(invalid_payload)
+        return
+    if bank is None:
+        _exit_error(f"Could not load bank at {bank_path}.")
+    _enable_scan_result_cache(scan_cache_bytes)
+
+    _echo_json(
+        _run_json_helper(
+            lambda: _json_extract_corpus(
+                bank,
+                root,
+                output_dir=output_dir,
+                glob=glob,
+                jobs=jobs,
+                shard_documents=shard_size,
+                resume=resume,
+            )
+        )
+    )
+
+
 @app.command("extract-report")
 def extract_json_bank_report(
     bank_path: Path = typer.Option(..., "--bank", help="JSON bank path."),
@@ -2071,6 +2322,11 @@ def anonymize_json_bank_file(
         help="Missing assignment policy: diagnostic, fail, or skip.",
     ),
     max_text_bytes: int | None = typer.Option(None, "--max-text-bytes", help="Maximum UTF-8 source bytes."),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        help="Scan the file in windows of --max-text-bytes and write --output as it goes.",
+    ),
 ) -> None:
     """Anonymize one explicit UTF-8 document file with a JSON bank."""
     bank, _bank_path, invalid_bank_payload = _load_json_bank_for_command(bank_path)
@@ -2090,6 +2346,8 @@ def anonymize_json_bank_file(
         _exit_error(f"Could not load replacement database at {path}.")
 
     document_path = _ensure_explicit_file(file_path, "Document")
+    if stream and output_path is None:
+        _exit_error("--stream writes the transformed text only to --output; pass --output.")
     _reject_output_path_collision(
         output_path,
         {"replacement database": path, "bank": bank_path, "input document": document_path},
@@ -2105,6 +2363,29 @@ def anonymize_json_bank_file(
     )
     base_hash = hash_replacement_db(replacement_db)
     base_version = int(replacement_db["version"])
+    if stream and output_path is not None:
+        _echo_json(
+            _write_streamed_output(
+                output_path,
+                lambda output: _saved_anonymize_payload(
+                    lambda resolved_options: _anonymize_file_stream_with_db_update(
+                        bank,
+                        document_path,
+                        output,
+                        replacement_db,
+                        options=resolved_options,
+                    ),
+                    db_path=path,
+                    base_hash=base_hash,
+                    base_version=base_version,
+                    options=options,
+                    save_db=save_db,
+                ),
+                force=force,
+                save_db=save_db,
+            )
+        )
+        return
     payload = _saved_anonymize_payload(
         lambda resolved_options: _anonymize_file_with_db_update(
             bank,
@@ -2405,8 +2686,15 @@ def benchmark_json_bank(
     bank_path: Path = typer.Option(..., "--bank", help="JSON bank path."),
     benchmark_iterations: int | None = typer.Option(None, "--benchmark-iterations", help="Benchmark iterations."),
     stress_multiplier: int | None = typer.Option(None, "--stress-multiplier", help="Benchmark stress multiplier."),
+    max_threads: int | None = typer.Option(
+        None,
+        "--max-threads",
+        help="Largest thread count in the shared-bank thread-scaling sweep.",
+    ),
+    history_dir: Path | None = _benchmark_history_dir_option(),
+    history_label: str | None = typer.Option(None, "--history-label", help="Label stored with the history sample."),
 ) -> None:
-    """Benchmark JSON-bank compile and extraction throughput."""
+    """Benchmark JSON-bank compile cost, extraction latency/throughput, memory, and thread scaling."""
     bank, _path, invalid_payload = _load_json_bank_for_command(bank_path)
     if invalid_payload is not None:
         _echo_json(invalid_payload)
@@ -2419,7 +2707,134 @@ def benchmark_json_bank(
         options["benchmark_iterations"] = benchmark_iterations
     if stress_multiplier is not None:
         options["stress_multiplier"] = stress_multiplier
-    _echo_json(_run_json_helper(lambda: _benchmark_bank(bank, options=options or None)))
+    if max_threads is not None:
+        options["benchmark_max_threads"] = max_threads
+    payload = _run_json_helper(lambda: _benchmark_bank(bank, options=options or None))
+    _echo_json(_with_benchmark_history(payload, history_dir, history_label))
+
+
+@app.command("benchmark-literal-scale")
+def benchmark_literal_scale_command(
+    pattern_count: int = typer.Option(1_000_000, "--patterns", help="Synthetic literal aliases to compile."),
+    entity_count: int = typer.Option(1, "--entities", help="Entities the aliases are spread across."),
+    literal_matcher: str = typer.Option(
+        "compact",
+        "--literal-matcher",
+        help=f"Literal matcher representation: {' or '.join(LITERAL_MATCHERS)}.",
+    ),
+    word_boundaries: bool = typer.Option(
+        True,
+        "--word-boundaries/--no-word-boundaries",
+        help="Wrap every alias in Unicode word boundaries.",
+    ),
+    scan_hits: int = typer.Option(2_000, "--scan-hits", help="Aliases planted in the scanned document."),
+) -> None:
+    """Measure native memory per pattern, compile time, and scan cost for a large literal alias catalog."""
+    _echo_json(
+        _run_json_helper(
+            lambda: benchmark_literal_scale(
+                pattern_count,
+                entity_count=entity_count,
+                literal_matcher=literal_matcher,
+                word_boundaries=word_boundaries,
+                scan_hits=scan_hits,
+            )
+        )
+    )
+
+
+@app.command("benchmark-history")
+def benchmark_history(
+    history_dir: Path | None = _benchmark_history_dir_option(),
+    bank_hash: str | None = typer.Option(None, "--bank-hash", help="Only report series for this bank hash."),
+    profile_id: str | None = typer.Option(None, "--profile-id", help="Only report series for this profile id."),
+    noise_multiplier: float = typer.Option(
+        DEFAULT_HISTORY_NOISE_MULTIPLIER,
+        "--noise-multiplier",
+        help="Scaled median absolute deviations allowed before a change is flagged.",
+    ),
+    window: int = typer.Option(DEFAULT_HISTORY_WINDOW, "--window", help="Preceding samples in the baseline."),
+    min_samples: int = typer.Option(
+        DEFAULT_HISTORY_MIN_BASELINE_SAMPLES,
+        "--min-samples",
+        help="Baseline samples required before a metric is judged.",
+    ),
+) -> None:
+    """Report stored benchmark trends and fail when the latest sample regresses beyond noise."""
+    resolved_dir = _resolve_benchmark_history_dir(history_dir)
+    if resolved_dir is None:
+        _exit_error(f"Pass --history-dir or set {BENCHMARK_HISTORY_ENV_VAR}.")
+    payload = _run_json_helper(
+        lambda: benchmark_history_report(
+            resolved_dir,
+            bank_hash=bank_hash,
+            profile_id=profile_id,
+            noise_multiplier=noise_multiplier,
+            min_baseline_samples=min_samples,
+            window=window,
+        )
+    )
+    _echo_json(payload)
+    if payload.get("regressed") is not False:
+        raise typer.Exit(COMMAND_ERROR_EXIT_CODE)
+
+
+@app.command("generate-workload")
+def generate_synthetic_workload(
+    output_dir: Path = typer.Option(..., "--output-dir", help="Directory for bank.json, documents, and workload.json."),
+    entity_count: int = typer.Option(..., "--entities", help="Number of entities."),
+    names_per_entity: int = typer.Option(..., "--names-per-entity", help="Names generated under each entity."),
+    patterns_per_name: int = typer.Option(..., "--patterns-per-name", help="Patterns generated under each name."),
+    literal_ratio: float = typer.Option(1.0, "--literal-ratio", help="Fraction of literal patterns; rest are regex."),
+    case_insensitive_ratio: float = typer.Option(
+        0.0,
+        "--case-insensitive-ratio",
+        help="Fraction of patterns matched case-insensitively.",
+    ),
+    word_boundary_ratio: float = typer.Option(
+        0.0,
+        "--word-boundary-ratio",
+        help="Fraction of patterns with word boundaries.",
+    ),
+    normalize_whitespace_ratio: float = typer.Option(
+        0.0,
+        "--normalize-whitespace-ratio",
+        help="Fraction of patterns that accept any whitespace run between tokens.",
+    ),
+    document_count: int = typer.Option(100, "--documents", help="Number of corpus documents."),
+    document_bytes: int = typer.Option(4096, "--document-bytes", help="Approximate UTF-8 bytes per document."),
+    match_density: float = typer.Option(1.0, "--match-density", help="Planted pattern hits per KiB of text."),
+    seed: int = typer.Option(0, "--seed", help="Generator seed; equal seeds produce identical files."),
+    document_format: str = typer.Option(
+        "jsonl",
+        "--document-format",
+        help=f"Corpus layout: {' or '.join(WORKLOAD_DOCUMENT_FORMATS)}.",
+    ),
+    bank_id: str = typer.Option("synthetic_workload_bank", "--bank-id", help="Generated bank id."),
+    overwrite: bool = typer.Option(False, "--overwrite", help="Replace an existing workload in --output-dir."),
+) -> None:
+    """Stream a seeded synthetic bank and document corpus to disk for engine stress testing."""
+    _echo_json(
+        _run_json_helper(
+            lambda: generate_workload(
+                output_dir,
+                entity_count=entity_count,
+                names_per_entity=names_per_entity,
+                patterns_per_name=patterns_per_name,
+                literal_ratio=literal_ratio,
+                case_insensitive_ratio=case_insensitive_ratio,
+                word_boundary_ratio=word_boundary_ratio,
+                normalize_whitespace_ratio=normalize_whitespace_ratio,
+                document_count=document_count,
+                document_bytes=document_bytes,
+                match_density=match_density,
+                seed=seed,
+                document_format=document_format,
+                bank_id=bank_id,
+                overwrite=overwrite,
+            )
+        )
+    )
 
 
 @app.command("prepare-enron")
@@ -2468,6 +2883,13 @@ def prepare_enron(
         min=1,
         help="Maximum structured recipients retained per header field; truncation is counted.",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        max=64,
+        help="Worker processes that clean unique rows; artifacts are identical for every worker count.",
+    ),
     allow_unignored_output: bool = typer.Option(
         False,
         "--allow-unignored-output",
@@ -2488,6 +2910,7 @@ def prepare_enron(
         max_subject_chars=max_subject_chars,
         max_subject_bytes=max_subject_bytes,
         max_recipients_per_field=max_recipients_per_field,
+        workers=workers,
         allow_unignored_output=allow_unignored_output,
     )
     try:
@@ -2552,6 +2975,13 @@ def split_enron(
         min=1,
         help="Fail-closed budget for raw band-join emissions and unique radius-3 near-duplicate comparisons.",
     ),
+    near_index_memory_bytes: int = typer.Option(
+        DEFAULT_NEAR_INDEX_MEMORY_BYTES,
+        "--near-index-memory-bytes",
+        min=0,
+        max=HARD_MAX_NEAR_INDEX_MEMORY_BYTES,
+        help="Memory budget for the in-memory near-duplicate band index; larger indexes use the SQLite spool.",
+    ),
     fixture_mode: bool = typer.Option(
         False,
         "--fixture-mode",
@@ -2572,6 +3002,7 @@ def split_enron(
         seed=seed,
         sample_per_role=sample_per_role,
         max_near_candidate_pairs=max_near_candidate_pairs,
+        near_index_memory_bytes=near_index_memory_bytes,
         fixture_mode=fixture_mode,
         allow_unignored_output=allow_unignored_output,
     )
@@ -2709,6 +3140,13 @@ def build_enron_bank(
         "--allow-unignored-output",
         help="Explicitly permit private output outside ignored repository paths.",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        max=64,
+        help="Worker processes that project train records during mining; artifacts are identical for every count.",
+    ),
 ) -> None:
     """Mine train-only candidates, run three validation iterations, and commit a private bank."""
 
@@ -2719,6 +3157,7 @@ def build_enron_bank(
         cmu_catalog_bindings_path=cmu_catalog_bindings_path,
         created_at=created_at,
         allow_unignored_output=allow_unignored_output,
+        workers=workers,
     )
     try:
         payload = build_enron_intelligence_bank(options)
@@ -3153,6 +3592,7 @@ def eval_enron_quality(
         "--unsupported-slices",
         help="Optional strict JSONL declaring unavailable requested slice dimensions.",
     ),
+    scan_threads: int = _scan_threads_option(),
 ) -> None:
     """Run the compile-once aggregate-only Enron quality executor."""
 
@@ -3168,6 +3608,7 @@ def eval_enron_quality(
             records_path=records_path,
             slice_specs_path=slice_specs_path,
             unsupported_slice_specs_path=unsupported_slice_specs_path,
+            scan_threads=scan_threads,
         )
     except EnronQualityError as exc:
         _exit_error(str(exc))
@@ -3222,6 +3663,7 @@ def eval_enron_conformance(
         "--allow-unignored-output",
         help="Explicitly permit a private output outside ignored repository paths.",
     ),
+    scan_threads: int = _scan_threads_option(),
 ) -> None:
     """Gate every active pattern against approved positives and adversarial negatives."""
 
@@ -3237,6 +3679,7 @@ def eval_enron_conformance(
             positive_cases_path,
             negative_cases_path,
             output_dir,
+            options=EnronConformanceOptions(scan_threads=scan_threads),
             allow_unignored_output=allow_unignored_output,
         )
     except EnronConformanceError as exc:
@@ -3252,6 +3695,8 @@ def regress_json_bank(
     new_bank_path: Path = typer.Option(..., "--new-bank", help="New JSON bank path."),
     benchmark_iterations: int | None = typer.Option(None, "--benchmark-iterations", help="Benchmark iterations."),
     stress_multiplier: int | None = typer.Option(None, "--stress-multiplier", help="Benchmark stress multiplier."),
+    history_dir: Path | None = _benchmark_history_dir_option(),
+    history_label: str | None = typer.Option(None, "--history-label", help="Label stored with the history samples."),
 ) -> None:
     """Run diff, eval, and benchmark regression checks for two JSON banks."""
     old_bank, old_path, old_invalid = _load_json_bank_for_command(old_bank_path)
@@ -3269,6 +3714,7 @@ def regress_json_bank(
     if stress_multiplier is not None:
         options["stress_multiplier"] = stress_multiplier
     payload = _run_json_helper(lambda: _regress_bank(old_bank, new_bank, options=options))
+    payload = _with_benchmark_history(payload, history_dir, history_label)
     _echo_json(payload)
     gates = payload.get("gates")
     if not isinstance(gates, Mapping) or gates.get("passed") is not True:
@@ -3344,13 +3790,24 @@ def extract_batch(
         "json",
         "--format",
         "-f",
-        help="Output format: json, jsonl, or table.",
+        help=(
+            "Output format: json, jsonl, records, or table. jsonl streams one line per document plus a summary "
+            "line; records writes a binary record file to --output."
+        ),
     ),
+    output_path: Path | None = typer.Option(None, "--output", "-o", help="Record file path for --format records."),
     word_boundaries: bool = typer.Option(
         False,
         "--word-boundaries",
         help="Add regex word boundaries around configured detector patterns.",
     ),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Documents to read and scan concurrently."),
+    ordered: bool = typer.Option(
+        True,
+        "--ordered/--unordered",
+        help="Emit documents in input order, or as soon as each finishes.",
+    ),
+    scan_cache_bytes: int = _scan_cache_bytes_option(),
     config: Path | None = _config_option(),
 ) -> None:
     """Extract configured named entities from multiple explicit documents."""
@@ -3364,12 +3821,53 @@ def extract_batch(
         inline_detectors=inline_detectors or [],
         selected_entity=selected_entity,
     )
+    normalized_format = _normalize_format_choice(output_format, BATCH_OUTPUT_FORMATS)
+    if (normalized_format == "records") != (output_path is not None):
+        _exit_error("Use --output exactly when --format is records.")
     bank = _compile_config_bank(pattern_config, selected_entity, word_boundaries=word_boundaries)
-    payload = _batch_payload(
-        bank,
-        _batch_documents(documents or [], read_stdin=read_stdin, manifest=manifest),
-    )
-    _echo_batch_payload(payload, output_format)
+    _enable_scan_result_cache(scan_cache_bytes)
+    batch_documents = _batch_documents(documents or [], read_stdin=read_stdin, manifest=manifest)
+    if output_path is not None:
+        summary = _write_batch_record_file(bank, batch_documents, output_path, jobs=jobs, ordered=ordered)
+        typer.echo(json.dumps(summary, ensure_ascii=False))
+        return
+    if normalized_format == "jsonl":
+        _echo_batch_stream(bank, batch_documents, jobs=jobs, ordered=ordered)
+        return
+    payload = _batch_payload(bank, batch_documents, jobs=jobs, ordered=ordered)
+    _echo_batch_payload(payload, normalized_format)
+
+
+@app.command("read-records")
+def read_records(
+    record_file: Path = typer.Argument(..., help="Binary record file written by extract-batch --format records."),
+    output_format: str = typer.Option(
+        "json",
+        "--format",
+        "-f",
+        help="Output format: json, jsonl, or table. jsonl emits one line per document.",
+    ),
+) -> None:
+    """Materialize the records stored in a binary record file."""
+    normalized_format = _normalize_output_format(output_format)
+    path = _ensure_explicit_file(record_file, "Record file")
+    try:
+        with path.open("rb") as stream:
+            if normalized_format == "jsonl":
+                for document in iter_record_file(stream):
+                    typer.echo(json.dumps(_record_file_document_payload(document), ensure_ascii=False))
+                return
+            document_payloads = [_record_file_document_payload(document) for document in iter_record_file(stream)]
+    except OSError as exc:
+        _exit_error(f"Could not read record file at {path}: {exc}")
+    except RecordFileError as exc:
+        _exit_error(f"Could not read record file at {path}: {exc}")
+    payload = {
+        "documents": document_payloads,
+        "document_count": len(document_payloads),
+        "record_count": sum(document["record_count"] for document in document_payloads),
+    }
+    _echo_batch_payload(payload, normalized_format)
 
 
 @app.command("test")
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+# Standard library
+import json
+import os
+from collections import deque
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+# Project
+from .engine import ScanTimeoutError
+from .engines import CompiledBank, ExtractionError, compile_bank, resolve_extraction_options
+from .extraction import (
+    _bank_metadata,
+    _engine_metadata,
+    _ensure_bank_status_extractable,
+    _ensure_entity_ids_known,
+    _read_utf8_file,
+)
+
+__all__ = [
+    "CORPUS_CHECKPOINT_FILENAME",
+    "DEFAULT_CORPUS_SHARD_DOCUMENTS",
+    "extract_corpus",
+]
+
+CORPUS_CHECKPOINT_FILENAME = "checkpoint.jsonl"
+CORPUS_CHECKPOINT_SCHEMA_VERSION = 1
+CORPUS_SHARD_PREFIX = "records-"
+CORPUS_SHARD_SUFFIX = ".jsonl"
+DEFAULT_CORPUS_SHARD_DOCUMENTS = 10_000
+CORPUS_PENDING_DOCUMENTS_PER_JOB = 4
+
+
+def extract_corpus(
+    bank: Mapping[str, Any],
+    root: str | Path,
+    *,
+    output_dir: str | Path,
+    glob: str = "*",
+    jobs: int = 1,
+    shard_documents: int = DEFAULT_CORPUS_SHARD_DOCUMENTS,
+    resume: bool = True,
+    options: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Extract JSON-bank records from every matching file under a directory tree.
+
+    Files are discovered lazily in sorted path order and scanned on ``jobs``
+    threads against one compiled bank. Each document becomes one JSONL line in
+    ``records-NNNNN.jsonl`` shards of at most ``shard_documents`` documents, and
+    is then appended to ``checkpoint.jsonl``. A resumed run truncates shards to
+    their last checkpointed line and skips every checkpointed file.
+    """
+    if not isinstance(jobs, int) or isinstance(jobs, bool) or jobs < 1:
+        raise ExtractionError("Corpus extraction jobs must be a positive integer.")
+    if not isinstance(shard_documents, int) or isinstance(shard_documents, bool) or shard_documents < 1:
+        raise ExtractionError("Corpus extraction shard_documents must be a positive integer.")
+    if not isinstance(glob, str) or not glob:
+        raise ExtractionError("Corpus extraction glob must be a non-empty string.")
+
+    root_path = Path(root).expanduser()
+    if not root_path.is_dir():
+        raise ExtractionError(f"Corpus root {str(root_path)!r} must be a directory.")
+    output_path = Path(output_dir).expanduser()
+    try:
+        output_path.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise ExtractionError(f"Could not create corpus output directory {str(output_path)!r}: {exc}.") from exc
+
+    resolved = resolve_extraction_options(options)
+    compiled, cache_hit = compile_bank(bank, options=options)
+    _ensure_bank_status_extractable(compiled.bank, resolved.include_statuses)
+    _ensure_entity_ids_known(compiled.bank, resolved.entity_ids)
+
+    header: dict[str, Any] = {
+        "schema_version": CORPUS_CHECKPOINT_SCHEMA_VERSION,
+        "bank_hash": compiled.bank_hash,
+        "glob": glob,
+    }
+    if resolved.entity_ids is not None:
+        header["entity_ids"] = list(resolved.entity_ids)
+    completed, next_shard = _prepare_checkpoint(output_path, header, resume=resume)
+    skipped_count = len(completed)
+
+    writer = _ShardWriter(output_path, next_shard, shard_documents)
+    document_count = 0
+    record_count = 0
+    error_count = 0
+    try:
+        paths = (
+            path
+            for path in _iter_corpus_files(root_path, glob, exclude=output_path)
+            if _relative_path(root_path, path) not in completed
+        )
+        for line in _iter_corpus_lines(
+            compiled,
+            root_path,
+            paths,
+            jobs=jobs,
+            max_text_bytes=resolved.max_text_bytes,
+            entity_ids=resolved.entity_ids,
+            deadline_ms=resolved.deadline_ms,
+        ):
+            writer.write(line)
+            document_count += 1
+            record_count += line.get("record_count", 0)
+            error_count += "error" in line
+    finally:
+        writer.close()
+
+    return {
+        "bank": _bank_metadata(compiled),
+        "engine": _engine_metadata(compiled, cache_hit),
+        "source": {"type": "corpus", "root": str(root_path), "glob": glob},
+        "output": {
+            "directory": str(output_path),
+            "checkpoint": CORPUS_CHECKPOINT_FILENAME,
+            "shards": writer.shards,
+        },
+        "summary": {
+            "document_count": document_count,
+            "record_count": record_count,
+            "error_count": error_count,
+            "skipped_count": skipped_count,
+        },
+    }
+
+
+def _iter_corpus_files(root: Path, glob: str, *, exclude: Path) -> Iterator[Path]:
+    """Yield regular files under ``root`` whose relative path matches ``glob``.
+
+    Directories are listed one at a time in sorted order, so discovery is lazy
+    and two runs over the same tree visit files in the same order.
+    """
+    excluded = exclude.resolve()
+    for directory, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(name for name in dirnames if (Path(directory) / name).resolve() != excluded)
+        for filename in sorted(filenames):
+            path = Path(directory) / filename
+            if PurePosixPath(_relative_path(root, path)).match(glob) and path.is_file():
+                yield path
+
+
+def _relative_path(root: Path, path: Path) -> str:
+    return path.relative_to(root).as_posix()
+
+
+def _iter_corpus_lines(
+    compiled: CompiledBank,
+    root: Path,
+    paths: Iterator[Path],
+    *,
+    jobs: int,
+    max_text_bytes: int,
+    entity_ids: tuple[str, ...] | None = None,
+    deadline_ms: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Scan ``paths`` and yield one output line per document in discovery order."""
+    if jobs == 1:
+        for path in paths:
+            yield _scan_corpus_file(
+                compiled,
+                root,
+                path,
+                max_text_bytes=max_text_bytes,
+                entity_ids=entity_ids,
+                deadline_ms=deadline_ms,
+            )
+        return
+
+    max_pending = jobs * CORPUS_PENDING_DOCUMENTS_PER_JOB
+    pending: deque[Future[dict[str, Any]]] = deque()
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="nerb-extract-corpus")
+    try:
+        for path in paths:
+            pending.append(
+                executor.submit(
+                    _scan_corpus_file,
+                    compiled,
+                    root,
+                    path,
+                    max_text_bytes=max_text_bytes,
+                    entity_ids=entity_ids,
+                    deadline_ms=deadline_ms,
+                )
+            )
+            while len(pending) >= max_pending:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _scan_corpus_file(
+    compiled: CompiledBank,
+    root: Path,
+    path: Path,
+    *,
+    max_text_bytes: int,
+    entity_ids: tuple[str, ...] | None = None,
+    deadline_ms: int | None = None,
+) -> dict[str, Any]:
+    relative_path = _relative_path(root, path)
+    try:
+        text, byte_count = _read_utf8_file(path, max_bytes=max_text_bytes)
+        records = compiled.finditer(text, entity_ids=entity_ids, deadline_ms=deadline_ms)
+    except (ExtractionError, ScanTimeoutError) as exc:
+        return {"path": relative_path, "error": str(exc)}
+    return {
+        "path": relative_path,
+        "length": len(text),
+        "bytes": byte_count,
+        "record_count": len(records),
+        "records": records,
+    }
+
+
+def _prepare_checkpoint(output_dir: Path, header: dict[str, Any], *, resume: bool) -> tuple[set[str], int]:
+    """Load or start the checkpoint and trim shards to their checkpointed lines.
+
+    Returns the completed relative paths and the first unused shard index.
+    """
+    checkpoint_path = output_dir / CORPUS_CHECKPOINT_FILENAME
+    shard_paths = sorted(output_dir.glob(f"{CORPUS_SHARD_PREFIX}*{CORPUS_SHARD_SUFFIX}"))
+    if not checkpoint_path.exists():
+        if shard_paths:
+            raise ExtractionError(
+                f"Corpus output directory {str(output_dir)!r} contains record shards but no checkpoint."
+            )
+        _write_bytes(checkpoint_path, _json_line({"checkpoint": header}), mode="wb")
+        return set(), 0
+    if not resume:
+        raise ExtractionError(
+            f"Corpus output directory {str(output_dir)!r} already has a checkpoint; resume or use a new directory."
+        )
+
+    entries = _read_checkpoint(checkpoint_path, header)
+    shard_ends: dict[str, int] = {}
+    for entry in entries:
+        shard_ends[entry["shard"]] = max(shard_ends.get(entry["shard"], 0), entry["end"])
+
+    next_shard = 0
+    for shard_path in shard_paths:
+        end = shard_ends.get(shard_path.name, 0)
+        try:
+            if end == 0:
+                shard_path.unlink()
+                continue
+            with shard_path.open("r+b") as file:
+                file.truncate(end)
+        except OSError as exc:
+            raise ExtractionError(f"Could not trim corpus record shard {str(shard_path)!r}: {exc}.") from exc
+        next_shard = max(next_shard, _shard_index(shard_path.name) + 1)
+    return {entry["path"] for entry in entries}, next_shard
+
+
+def _read_checkpoint(checkpoint_path: Path, header: dict[str, Any]) -> list[dict[str, Any]]:
+    try:
+        data = checkpoint_path.read_bytes()
+    except OSError as exc:
+        raise ExtractionError(f"Could not read corpus checkpoint {str(checkpoint_path)!r}: {exc}.") from exc
+
+    complete_end = data.rfind(b"\n") + 1
+    if complete_end < len(data):
+        # The previous run stopped mid-line; drop the partial entry.
+        _write_bytes(checkpoint_path, data[:complete_end], mode="wb")
+    lines = data[:complete_end].splitlines()
+    try:
+        parsed = [json.loads(line) for line in lines]
+    except json.JSONDecodeError as exc:
+        raise ExtractionError(f"Corpus checkpoint {str(checkpoint_path)!r} is not valid JSONL: {exc.msg}.") from exc
+    if not parsed or not isinstance(parsed[0], dict) or parsed[0].get("checkpoint") != header:
+        raise ExtractionError(
+            f"Corpus checkpoint {str(checkpoint_path)!r} was written for a different bank or glob; "
+            "use a new output directory."
+        )
+    return parsed[1:]
+
+
+def _shard_index(name: str) -> int:
+    index = name.removeprefix(CORPUS_SHARD_PREFIX).removesuffix(CORPUS_SHARD_SUFFIX)
+    if not index.isdigit():
+        raise ExtractionError(f"Corpus record shard name {name!r} is not recognized.")
+    return int(index)
+
+
+def _shard_name(index: int) -> str:
+    return f"{CORPUS_SHARD_PREFIX}{index:05d}{CORPUS_SHARD_SUFFIX}"
+
+
+def _json_line(payload: Mapping[str, Any]) -> bytes:
+    return (json.dumps(payload, ensure_ascii=False, sort_keys=True) + "\n").encode("utf-8")
+
+
+def _write_bytes(path: Path, data: bytes, *, mode: str) -> None:
+    try:
+        with path.open(mode) as file:
+            file.write(data)
+    except OSError as exc:
+        raise ExtractionError(f"Could not write corpus output {str(path)!r}: {exc}.") from exc
+
+
+class _ShardWriter:
+    """Append document lines to rolling shards and checkpoint each one after it is flushed."""
+
+    def __init__(self, output_dir: Path, next_shard: int, shard_documents: int) -> None:
+        self._output_dir = output_dir
+        self._next_shard = next_shard
+        self._shard_documents = shard_documents
+        self._shard_file: Any = None
+        self._shard_name = ""
+        self._shard_count = 0
+        self._checkpoint_file: Any = None
+        self.shards: list[str] = []
+
+    def write(self, line: Mapping[str, Any]) -> None:
+        try:
+            if self._shard_file is None or self._shard_count >= self._shard_documents:
+                self._open_next_shard()
+            self._shard_file.write(_json_line(line))
+            self._shard_file.flush()
+            self._shard_count += 1
+            if self._checkpoint_file is None:
+                self._checkpoint_file = (self._output_dir / CORPUS_CHECKPOINT_FILENAME).open("ab")
+            entry = {"path": line["path"], "shard": self._shard_name, "end": self._shard_file.tell()}
+            self._checkpoint_file.write(_json_line(entry))
+            self._checkpoint_file.flush()
+        except OSError as exc:
+            raise ExtractionError(f"Could not write corpus output in {str(self._output_dir)!r}: {exc}.") from exc
+
+    def _open_next_shard(self) -> None:
+        if self._shard_file is not None:
+            self._shard_file.close()
+        self._shard_name = _shard_name(self._next_shard)
+        self._next_shard += 1
+        self._shard_file = (self._output_dir / self._shard_name).open("xb")
+        self._shard_count = 0
+        self.shards.append(self._shard_name)
+
+    def close(self) -> None:
+        for file in (self._shard_file, self._checkpoint_file):
+            if file is not None:
+                file.close()
+        self._shard_file = None
+        self._checkpoint_file = None
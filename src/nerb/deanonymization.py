@@ -5,17 +5,24 @@ import hashlib
 import json
 import re
 import unicodedata
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, NoReturn, cast
+from typing import Any, BinaryIO, NoReturn, cast
 
 from .config import PatternConfig
 from .diagnostics import DIAGNOSTIC_ERROR, DIAGNOSTIC_WARNING, Diagnostic, diagnostic, has_errors
 from .engine import Bank
 from .engines import ExtractionError, resolve_extraction_options
-from .extraction import _ensure_byte_limit, _file_source_metadata, _read_utf8_file, _text_size_bytes, extract_report
+from .extraction import (
+    _ensure_byte_limit,
+    _file_size,
+    _file_source_metadata,
+    _read_utf8_file,
+    _text_size_bytes,
+    extract_report,
+)
 from .replacements import (
     _effective_policy,
     _render_redaction_template,
@@ -24,6 +31,7 @@ from .replacements import (
     validate_replacement_db,
 )
 from .replacements_schema import MAX_STORED_ORIGINAL_SURFACES
+from .reports import _ReportStream, _ReportWindow
 from .schema import ID_RE, SCHEMA_VERSION, UNICODE_NORMALIZATION_VALUES, validate_bank_schema
 from .validation import rust_empty_match_diagnostics
 
@@ -36,6 +44,7 @@ __all__ = [
     "AppliedByteEdit",
     "allocate_assignment",
     "anonymize_file",
+    "anonymize_stream",
     "anonymize_config_file",
     "anonymize_config_text",
     "anonymize_text",
@@ -1073,8 +1082,14 @@ def _allocate_assignment_with_policy(
     now: str | None = None,
     source_surface_limit: int = MAX_STORED_ORIGINAL_SURFACES,
     policy_override: Mapping[str, Any] | None = None,
+    db_validated: bool = False,
 ) -> AssignmentAllocation:
-    db = _validate_replacement_db_for_allocation(replacement_db)
+    # An anonymization run validates its DB copy once and then allocates every record into that copy.
+    db = (
+        cast(dict[str, Any], replacement_db)
+        if db_validated
+        else _validate_replacement_db_for_allocation(replacement_db)
+    )
     entity_id = _record_entity_id(record)
     policy = _effective_policy(db, entity_id)
     if policy_override is not None:
@@ -1192,6 +1207,50 @@ def _anonymize_resolved_run(
     replacement_db: Mapping[str, Any],
     options: _AnonymizeOptions,
 ) -> _AnonymizeRun:
+    current_db = _validated_anonymize_db(replacement_db, options)
+    diagnostics = [
+        _sanitize_diagnostic(cast(Diagnostic, dict(item)), options)
+        for item in report.get("diagnostics", [])
+        if isinstance(item, Mapping)
+    ]
+    records = [
+        cast(Mapping[str, Any], resolved["record"])
+        for resolved in report.get("resolved_records", [])
+        if isinstance(resolved, Mapping) and isinstance(resolved.get("record"), Mapping)
+    ]
+    edit_items, current_db, modified = _allocate_edit_items(
+        records, current_db, options, assignment_refs={}, diagnostics=diagnostics
+    )
+    rewrite = apply_byte_replacements(text, [cast(ByteEdit, item["edit"]) for item in edit_items])
+    applied_replacements = [
+        _applied_replacement_payload(item, applied_edit, options)
+        for item, applied_edit in zip(edit_items, rewrite.applied_edits, strict=True)
+    ]
+
+    response = {
+        "schema_version": ANONYMIZE_RESPONSE_SCHEMA_VERSION,
+        "bank": _safe_bank_metadata(report, options),
+        "replacement_db": _safe_replacement_db_metadata(current_db, modified=modified, options=options),
+        "source": _safe_source_metadata(
+            cast(
+                Mapping[str, Any],
+                report.get("source", {"type": "text", "length": len(text), "bytes": len(text.encode("utf-8"))}),
+            ),
+            options,
+        ),
+        "text": rewrite.text,
+        "applied_replacements": applied_replacements,
+        "summary": {
+            "record_count": len(report.get("resolved_records", [])),
+            "applied_count": len(applied_replacements),
+            "diagnostic_count": len(diagnostics),
+        },
+        "diagnostics": diagnostics,
+    }
+    return _AnonymizeRun(response=response, replacement_db=current_db)
+
+
+def _validated_anonymize_db(replacement_db: Mapping[str, Any], options: _AnonymizeOptions) -> dict[str, Any]:
     db_error: DeanonymizationError | None = None
     try:
         current_db = _validate_replacement_db_for_allocation(replacement_db)
@@ -1199,21 +1258,28 @@ def _anonymize_resolved_run(
         db_error = exc
     if db_error is not None:
         _raise_anonymize_error("Replacement database is invalid.", db_error.diagnostics, options, raw_error=db_error)
+    return current_db
 
-    diagnostics = [
-        _sanitize_diagnostic(cast(Diagnostic, dict(item)), options)
-        for item in report.get("diagnostics", [])
-        if isinstance(item, Mapping)
-    ]
-    assignment_refs: dict[str, str] = {}
+
+def _allocate_edit_items(
+    records: Iterable[Mapping[str, Any]],
+    current_db: dict[str, Any],
+    options: _AnonymizeOptions,
+    *,
+    assignment_refs: dict[str, str],
+    diagnostics: list[Diagnostic],
+    offset: int = 0,
+) -> tuple[list[dict[str, Any]], dict[str, Any], bool]:
+    """Allocate assignments for resolved records in order and return span-sorted edit items.
+
+    Edits are relative to ``offset``. Returns the edit items, the updated DB copy, and
+    whether any assignment was created.
+    """
     edit_items: list[dict[str, Any]] = []
     modified = False
     policy_override = _mode_policy_override(options)
 
-    for resolved in report.get("resolved_records", []):
-        if not isinstance(resolved, Mapping) or not isinstance(resolved.get("record"), Mapping):
-            continue
-        record = cast(Mapping[str, Any], resolved["record"])
+    for record in records:
         allocation_error: DeanonymizationError | None = None
         try:
             allocation = _allocate_assignment_with_policy(
@@ -1221,6 +1287,7 @@ def _anonymize_resolved_run(
                 current_db,
                 source_surface_limit=options.source_surface_limit,
                 policy_override=policy_override,
+                db_validated=True,
             )
             entity_id = _record_entity_id(record)
         except DeanonymizationError as exc:
@@ -1272,8 +1339,8 @@ def _anonymize_resolved_run(
         edit_items.append(
             {
                 "edit": ByteEdit(
-                    int(record["start"]),
-                    int(record["end"]),
+                    int(record["start"]) - offset,
+                    int(record["end"]) - offset,
                     replacement_value,
                     expected=record.get("string") if isinstance(record.get("string"), str) else None,
                 ),
@@ -1286,33 +1353,9 @@ def _anonymize_resolved_run(
         modified = modified or allocation.created
 
     edit_items.sort(key=lambda item: (item["edit"].start, item["edit"].end))
-    rewrite = apply_byte_replacements(text, [cast(ByteEdit, item["edit"]) for item in edit_items])
-    applied_replacements = [
-        _applied_replacement_payload(item, applied_edit, options)
-        for item, applied_edit in zip(edit_items, rewrite.applied_edits, strict=True)
-    ]
-
-    response = {
-        "schema_version": ANONYMIZE_RESPONSE_SCHEMA_VERSION,
-        "bank": _safe_bank_metadata(report, options),
-        "replacement_db": _safe_replacement_db_metadata(current_db, modified=modified, options=options),
-        "source": _safe_source_metadata(
-            cast(
-                Mapping[str, Any],
-                report.get("source", {"type": "text", "length": len(text), "bytes": len(text.encode("utf-8"))}),
-            ),
-            options,
-        ),
-        "text": rewrite.text,
-        "applied_replacements": applied_replacements,
-        "summary": {
-            "record_count": len(report.get("resolved_records", [])),
-            "applied_count": len(applied_replacements),
-            "diagnostic_count": len(diagnostics),
-        },
-        "diagnostics": diagnostics,
-    }
-    return _AnonymizeRun(response=response, replacement_db=current_db)
+    if modified:
+        current_db = canonicalize_replacement_db(current_db)
+    return edit_items, current_db, modified
 
 
 def _anonymize_resolved_report(
@@ -1957,6 +2000,156 @@ def _anonymize_file_with_db_update(
     return result.response, result.replacement_db
 
 
+def anonymize_stream(
+    bank: Mapping[str, Any],
+    source: BinaryIO,
+    output: BinaryIO,
+    replacement_db: Mapping[str, Any],
+    *,
+    options: Mapping[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Anonymize a UTF-8 byte stream window by window, writing the transformed bytes to ``output``.
+
+    The written bytes equal the ``text`` that ``anonymize_text`` returns for the whole stream. Memory stays bounded
+    by one ``max_text_bytes`` window, so the response omits ``text`` and ``applied_replacements``.
+    """
+    return _anonymize_stream_with_db_update(bank, source, output, replacement_db, options=options)[0]
+
+
+def _anonymize_stream_with_db_update(
+    bank: Mapping[str, Any],
+    source: BinaryIO,
+    output: BinaryIO,
+    replacement_db: Mapping[str, Any],
+    *,
+    options: Mapping[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the stream anonymization response plus the updated replacement DB from one pass."""
+    resolved_options = _resolve_anonymize_options(options)
+    result = _anonymize_stream_run(bank, source, output, replacement_db, resolved_options, {"type": "stream"})
+    return result.response, result.replacement_db
+
+
+def _anonymize_file_stream_with_db_update(
+    bank: Mapping[str, Any],
+    file_path: str | Path,
+    output: BinaryIO,
+    replacement_db: Mapping[str, Any],
+    *,
+    options: Mapping[str, Any] | None = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return the streamed file anonymization response plus the updated replacement DB from one file pass."""
+    path = Path(file_path).expanduser()
+    resolved_options = _resolve_anonymize_options(options)
+    extraction_error: ExtractionError | None = None
+    try:
+        _file_size(path)
+        source = _open_stream_file(path)
+    except ExtractionError as exc:
+        extraction_error = exc
+    if extraction_error is not None:
+        _raise_extraction_error(extraction_error, resolved_options)
+    with source:
+        result = _anonymize_stream_run(
+            bank,
+            source,
+            output,
+            replacement_db,
+            resolved_options,
+            {"type": "file", "path": str(path)},
+        )
+    return result.response, result.replacement_db
+
+
+def _open_stream_file(path: Path) -> BinaryIO:
+    try:
+        return path.open("rb")
+    except OSError as exc:
+        raise ExtractionError(f"Could not read extraction source file {str(path)!r}: {exc}.") from exc
+
+
+def _anonymize_stream_run(
+    bank: Mapping[str, Any],
+    source: BinaryIO,
+    output: BinaryIO,
+    replacement_db: Mapping[str, Any],
+    options: _AnonymizeOptions,
+    source_metadata: Mapping[str, Any],
+) -> _AnonymizeRun:
+    extraction_error: ExtractionError | None = None
+    try:
+        stream = _ReportStream(bank, source, options=options.extraction_options)
+    except ExtractionError as exc:
+        extraction_error = exc
+    if extraction_error is not None:
+        _raise_extraction_error(extraction_error, options)
+    current_db = _validated_anonymize_db(replacement_db, options)
+
+    windows = iter(stream)
+    assignment_refs: dict[str, str] = {}
+    allocation_diagnostics: list[Diagnostic] = []
+    modified = False
+    record_count = 0
+    applied_count = 0
+    output_bytes = 0
+    while (window := _next_stream_window(windows, options)) is not None:
+        edit_items, current_db, created = _allocate_edit_items(
+            window.resolved_records,
+            current_db,
+            options,
+            assignment_refs=assignment_refs,
+            diagnostics=allocation_diagnostics,
+            offset=window.start,
+        )
+        rewritten = apply_byte_replacements(window.text, [cast(ByteEdit, item["edit"]) for item in edit_items])
+        output_bytes += _write_stream_output(output, rewritten.text.encode("utf-8"))
+        modified = modified or created
+        record_count += len(window.resolved_records)
+        applied_count += len(edit_items)
+
+    diagnostics = [_sanitize_diagnostic(cast(Diagnostic, dict(item)), options) for item in stream.diagnostics()]
+    diagnostics.extend(allocation_diagnostics)
+    response = {
+        "schema_version": ANONYMIZE_RESPONSE_SCHEMA_VERSION,
+        "bank": _safe_bank_metadata({"bank": stream.bank}, options),
+        "replacement_db": _safe_replacement_db_metadata(current_db, modified=modified, options=options),
+        "source": _safe_source_metadata(
+            {**source_metadata, "length": stream.length, "bytes": stream.byte_count},
+            options,
+        ),
+        "output": {"bytes": output_bytes, "windows": stream.window_count},
+        "summary": {
+            "record_count": record_count,
+            "applied_count": applied_count,
+            "diagnostic_count": len(diagnostics),
+        },
+        "diagnostics": diagnostics,
+    }
+    return _AnonymizeRun(response=response, replacement_db=current_db)
+
+
+def _next_stream_window(windows: Iterator[_ReportWindow], options: _AnonymizeOptions) -> _ReportWindow | None:
+    extraction_error: ExtractionError | None = None
+    try:
+        window = next(windows, None)
+    except ExtractionError as exc:
+        extraction_error = exc
+    if extraction_error is not None:
+        _raise_extraction_error(extraction_error, options)
+    return window
+
+
+def _write_stream_output(output: BinaryIO, data: bytes) -> int:
+    try:
+        output.write(data)
+    except OSError as exc:
+        raise DeanonymizationError(
+            "Anonymized output could not be written.",
+            [_error("anonymize.output_error", "/output", f"Anonymized output could not be written: {exc}.")],
+        ) from exc
+    return len(data)
+
+
 def anonymize_config_text(
     pattern_config: PatternConfig,
     text: str,
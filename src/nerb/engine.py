@@ -3,28 +3,49 @@ from __future__ import annotations
 import importlib
 import json
 import math
+import mmap
 import sys
 import sysconfig
 import time
 from collections import OrderedDict
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from hashlib import sha256
 from pathlib import Path
 from stat import S_ISREG
-from threading import RLock
+from threading import RLock, get_ident
 from typing import Any, Literal
 
 from .config import FLAGS_KEY, PatternConfig
 
 OffsetUnit = Literal["byte", "char"]
 
-__all__ = ["Bank", "BankCacheKey", "bank_cache_info", "clear_bank_cache"]
+__all__ = [
+    "Bank",
+    "BankCacheKey",
+    "CancellationToken",
+    "ScanBusyError",
+    "Scanner",
+    "ScanTimeoutError",
+    "bank_cache_info",
+    "clear_bank_cache",
+    "clear_scan_result_cache",
+    "configure_scan_result_cache",
+    "scan_result_cache_info",
+]
 
 DEFAULT_BANK_CACHE_MAX_ENTRIES = 128
 DEFAULT_BANK_SOURCE_CACHE_MAX_ENTRIES = DEFAULT_BANK_CACHE_MAX_ENTRIES * 2
 DEFAULT_MAX_BANK_SOURCE_BYTES = 64 * 1024 * 1024
 DEFAULT_MAX_SCAN_INPUT_BYTES = 10 * 1024 * 1024
+# Mirrors the native per-bank scan permit count.
+MAX_SCAN_THREADS = 8
+# The scan result cache is opt-in; a zero byte budget disables it.
+DEFAULT_SCAN_RESULT_CACHE_MAX_BYTES = 0
+# Approximate CPython footprint of one cached entry and of one stored match triple.
+_SCAN_RESULT_ENTRY_BYTES = 256
+_SCAN_RESULT_MATCH_BYTES = 128
 
 
 @dataclass(frozen=True)
@@ -79,6 +100,69 @@ _CACHE_HITS = 0
 _CACHE_MISSES = 0
 
 
+@dataclass(frozen=True)
+class _ScanResultCacheKey:
+    bank: BankCacheKey
+    document_sha256: bytes
+    document_bytes: int
+    max_matches: int | None
+    entities: tuple[int, ...] | None
+
+
+_ScanTriples = tuple[tuple[int, int, int], ...]
+# What the native scans borrow without copying: bytes, a read-only byte
+# memoryview, or an ASCII str, whose code points are its UTF-8 bytes.
+_ScanInput = bytes | memoryview | str
+
+_SCAN_RESULT_CACHE_LOCK = RLock()
+_SCAN_RESULT_CACHE: OrderedDict[_ScanResultCacheKey, _ScanTriples] = OrderedDict()
+_SCAN_RESULT_CACHE_MAX_BYTES = DEFAULT_SCAN_RESULT_CACHE_MAX_BYTES
+_SCAN_RESULT_CACHE_BYTES = 0
+_SCAN_RESULT_CACHE_HITS = 0
+_SCAN_RESULT_CACHE_MISSES = 0
+_SCAN_RESULT_CACHE_EVICTIONS = 0
+
+
+class ScanTimeoutError(TimeoutError):
+    """A bank scan stopped because its deadline passed or its token was cancelled.
+
+    ``reason`` is ``"deadline_exceeded"`` or ``"cancelled"``. ``progress`` holds the
+    scan's ``elapsed_ms``, ``shards_completed``, ``shards_total``, and ``matches`` found
+    when it stopped; the partial matches themselves are discarded.
+    """
+
+    def __init__(self, message: str, *, reason: str, progress: Mapping[str, int]) -> None:
+        super().__init__(message)
+        self.reason = reason
+        self.progress = dict(progress)
+
+
+class ScanBusyError(ScanTimeoutError):
+    """A bank scan with ``max_wait_ms`` found every scan slot busy for that long.
+
+    ``reason`` is ``"busy"`` and ``progress["elapsed_ms"]`` is the time spent waiting;
+    the scan itself never started.
+    """
+
+
+class CancellationToken:
+    """Cancel bank scans from another thread.
+
+    Pass the token as ``cancel=`` to any number of scans. ``cancel()`` makes each of
+    them raise ``ScanTimeoutError`` at its next check; a cancelled token stays cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._native = importlib.import_module("nerb._engine").CancelToken()
+
+    def cancel(self) -> None:
+        self._native.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return bool(self._native.cancelled)
+
+
 class Bank:
     """High-level Python wrapper around the native Rust NERB bank."""
 
@@ -87,6 +171,8 @@ class Bank:
         self._cache_key = cache_key
         self._cache_hit = cache_hit
         self._detector_projection: dict[int, tuple[str, str, str]] = {}
+        self._entity_positions: dict[str, int] | None = None
+        self._selected_entities: tuple[int, ...] | None = None
 
     @classmethod
     def from_source_bytes(
@@ -371,37 +457,362 @@ class Bank:
     def metadata(self) -> dict[str, Any]:
         return dict(self._native.metadata())
 
+    def scan_stats(self) -> dict[str, Any]:
+        """Return the native scan slot counters, shared by every view of this compiled bank.
+
+        ``active`` and ``high_water`` count concurrent scans; ``acquisitions``,
+        ``contended``, and ``rejected`` count slot requests since the bank was compiled.
+        ``wait_histogram`` buckets the admitted waits by their ``le_us`` bound.
+        """
+        return dict(self._native.scan_stats())
+
+    def try_scan(
+        self,
+        haystack: str | bytes | bytearray | memoryview,
+        *,
+        max_matches: int | None = None,
+        entities: Iterable[str] | None = None,
+        stop_after: int | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Scan ``haystack`` only if a scan slot is free right now, otherwise return ``None``.
+
+        Text and bytes return the byte-offset records of ``scan_text`` and ``scan_bytes``.
+        A cached result is returned even when every slot is busy.
+        """
+        options: dict[str, Any] = {
+            "max_matches": max_matches,
+            "entities": entities,
+            "stop_after": stop_after,
+            "deadline_ms": deadline_ms,
+            "cancel": cancel,
+            "max_wait_ms": 0,
+        }
+        try:
+            if isinstance(haystack, str):
+                return self.scan_text(haystack, **options)
+            return self.scan_bytes(haystack, **options)
+        except ScanBusyError:
+            return None
+
     def scan_bytes(
         self,
         haystack: bytes | bytearray | memoryview,
         *,
         max_matches: int | None = None,
+        entities: Iterable[str] | None = None,
+        stop_after: int | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
+        threads: int = 1,
+    ) -> list[dict[str, Any]]:
+        """Scan ``haystack`` and return projected byte-offset match records.
+
+        With ``threads`` above 1, a long document is cut into chunks that up to
+        ``threads`` native workers scan at once. The records equal a serial scan's.
+        """
+        return self._scan_bytes_records(
+            _borrow_scan_bytes(haystack, "Bank.scan_bytes"),
+            max_matches=max_matches,
+            entities=self._scan_entities(entities),
+            stop_after=stop_after,
+            control=_scan_control(deadline_ms, cancel, max_wait_ms),
+            threads=threads,
+        )
+
+    def scan_text(
+        self,
+        text: str,
+        *,
+        offsets: OffsetUnit = "byte",
+        max_matches: int | None = None,
+        entities: Iterable[str] | None = None,
+        stop_after: int | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
     ) -> list[dict[str, Any]]:
-        if not isinstance(haystack, (bytes, bytearray, memoryview)):
-            raise TypeError("Bank.scan_bytes haystack must be bytes-like.")
-        if isinstance(haystack, bytes):
-            input_bytes = len(haystack)
-            if input_bytes > DEFAULT_MAX_SCAN_INPUT_BYTES:
-                raise ValueError(
-                    f"Bank scan input size {input_bytes} exceeds the configured limit of "
-                    f"{DEFAULT_MAX_SCAN_INPUT_BYTES} bytes"
+        """Scan ``text`` and return projected match records.
+
+        ``stop_after`` returns only the first ``stop_after`` records and ends the native
+        scan once it has found them, instead of failing the way ``max_matches`` does.
+        A scan still running ``deadline_ms`` milliseconds after the call, or whose
+        ``cancel`` token is cancelled, raises ``ScanTimeoutError``. A scan that waits
+        longer than ``max_wait_ms`` for a free scan slot raises ``ScanBusyError``.
+        """
+        return self._scan_text_records(
+            text,
+            "Bank.scan_text",
+            offsets=offsets,
+            max_matches=max_matches,
+            entities=self._scan_entities(entities),
+            stop_after=stop_after,
+            control=_scan_control(deadline_ms, cancel, max_wait_ms),
+        )
+
+    def scan_text_raw(
+        self,
+        text: str,
+        *,
+        max_matches: int | None = None,
+        entities: Iterable[str] | None = None,
+        stop_after: int | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
+    ) -> Any:
+        """Scan ``text`` and return the native ``MatchBuffer`` without projecting records.
+
+        Each entry is a ``(detector_index, start_byte, end_byte)`` tuple in projected
+        record order; ``detector`` resolves the index to its names.
+        """
+        return self._scan_native_bytes(
+            _checked_scan_text(text, "Bank.scan_text_raw"),
+            max_matches=max_matches,
+            entities=self._scan_entities(entities),
+            stop_after=stop_after,
+            control=_scan_control(deadline_ms, cancel, max_wait_ms),
+        )
+
+    def scan_text_raw_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        max_matches: int | None = None,
+        threads: int = 1,
+    ) -> list[Any]:
+        """Scan several texts in one native call and return one ``MatchBuffer`` per text.
+
+        The GIL is released once for the whole batch, and up to ``threads`` native
+        workers share it. A failure raises the error of the first failing text.
+        """
+        _validate_scan_threads(threads)
+        if max_matches is not None:
+            _validate_max_matches(max_matches)
+        encoded = [_checked_scan_text(text, "Bank.scan_text_raw_batch") for text in texts]
+        entities = self._selected_entities
+        result_keys = [self._scan_result_key(text_bytes, max_matches, entities) for text_bytes in encoded]
+        results: list[Any] = [None] * len(encoded)
+        pending: list[int] = []
+        for index, result_key in enumerate(result_keys):
+            cached = _cached_scan_result(result_key) if result_key is not None else None
+            if cached is None:
+                pending.append(index)
+            else:
+                results[index] = cached
+        if pending:
+            # Cache hits cannot fail, so the first failing pending text is still the
+            # first failing text of the whole batch.
+            buffers = self._native.scan_bytes_batch(
+                [encoded[index] for index in pending],
+                max_matches,
+                threads,
+                None if entities is None else list(entities),
+            )
+            for index, raw in zip(pending, buffers, strict=True):
+                result_key = result_keys[index]
+                results[index] = raw if result_key is None else _store_scan_result(result_key, raw)
+        return results
+
+    def entity_names(self) -> tuple[str, ...]:
+        """Return the bank's entity names in canonical order."""
+        return tuple(str(name) for name in self._native.entity_names())
+
+    def select_entities(self, entities: Iterable[str]) -> Bank:
+        """Return a view of this bank whose scans only report ``entities``.
+
+        The view shares this bank's compiled native bank and cache key. Its scans skip
+        the native shards of every other entity, so selecting a subset costs no compile
+        and no memory. Selection requires the ``entity_independent`` match mode.
+        """
+        selected = self._resolve_entities(entities)
+        # Rejects banks whose match mode cannot skip entities, without taking a scan slot.
+        self._native.validate_entities(list(selected))
+        view = Bank(self._native, cache_key=self._cache_key, cache_hit=self._cache_hit)
+        view._detector_projection = self._detector_projection
+        view._entity_positions = self._entity_positions
+        view._selected_entities = selected
+        return view
+
+    def scanner(self) -> Scanner:
+        """Return a ``Scanner`` that reuses one native match buffer across this bank's scans."""
+        return Scanner(self)
+
+    def contains_any(
+        self,
+        haystack: str | bytes | bytearray | memoryview,
+        *,
+        entities: Iterable[str] | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
+    ) -> bool:
+        """Return whether ``haystack`` has any match, ending the native scan at the first one.
+
+        Matches are neither stored nor projected, and the result cache is not consulted.
+        """
+        text_bytes = _scan_input_bytes(haystack, "Bank.contains_any")
+        selected = self._scan_entities(entities)
+        control = _scan_control(deadline_ms, cancel, max_wait_ms)
+        with _native_scan_interrupts():
+            return bool(self._native.contains_any(text_bytes, None if selected is None else list(selected), **control))
+
+    def count(
+        self,
+        haystack: str | bytes | bytearray | memoryview,
+        *,
+        entities: Iterable[str] | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
+    ) -> dict[str, Any]:
+        """Count ``haystack`` matches per entity and per detector without building records.
+
+        The counts equal those of ``scan_bytes``; entities and detectors without matches
+        are left out.
+        """
+        text_bytes = _scan_input_bytes(haystack, "Bank.count")
+        selected = self._scan_entities(entities)
+        control = _scan_control(deadline_ms, cancel, max_wait_ms)
+        with _native_scan_interrupts():
+            counts = self._native.count_bytes(text_bytes, None if selected is None else list(selected), **control)
+        by_entity: dict[str, int] = {}
+        detectors: list[dict[str, Any]] = []
+        for detector_index, count in enumerate(counts):
+            if not count:
+                continue
+            entity, canonical_name, surface_name = self.detector(detector_index)
+            by_entity[entity] = by_entity.get(entity, 0) + count
+            detectors.append(
+                {
+                    "entity": entity,
+                    "canonical_name": canonical_name,
+                    "surface_name": surface_name,
+                    "count": count,
+                }
+            )
+        return {"total": sum(by_entity.values()), "entities": by_entity, "detectors": detectors}
+
+    def detector(self, detector_index: int) -> tuple[str, str, str]:
+        """Return ``(entity, canonical_name, surface_name)`` for a raw match detector index."""
+        detector = self._detector_projection.get(detector_index)
+        if detector is None:
+            entity, canonical_name, surface_name = self._native.detector_metadata(detector_index)
+            detector = (str(entity), str(canonical_name), str(surface_name))
+            self._detector_projection[detector_index] = detector
+        return detector
+
+    def resolve_overlaps(self, raw: Any, *, tie_ranks: Sequence[int] | None = None) -> list[tuple[int, int, int]]:
+        """Group the overlapping matches of a ``MatchBuffer`` and pick each group's winner.
+
+        Returns ``(first, end, winner)`` buffer indices for every run of two or more
+        matches that each start before the run's furthest end. The winner has the
+        lowest pattern priority, then the longest span, then the leftmost start, then
+        the lowest ``tie_ranks[detector_index]``, which defaults to the order of
+        matches sharing a span.
+        """
+        ranks = None if tie_ranks is None else list(tie_ranks)
+        return [(first, end, winner) for first, end, winner in self._native.resolve_overlaps(raw, ranks)]
+
+    def _scan_entities(self, entities: Iterable[str] | None) -> tuple[int, ...] | None:
+        if entities is None:
+            return self._selected_entities
+        return self._resolve_entities(entities)
+
+    def _resolve_entities(self, entities: Iterable[str]) -> tuple[int, ...]:
+        """Resolve entity names to canonical positions, narrowed by this view's selection."""
+        if isinstance(entities, (str, bytes)) or not isinstance(entities, Iterable):
+            raise TypeError("Bank scan entities must be an iterable of entity names.")
+        positions = self._entity_positions
+        if positions is None:
+            positions = {str(name): position for position, name in enumerate(self._native.entity_names())}
+            self._entity_positions = positions
+        selected: set[int] = set()
+        for entity in entities:
+            position = positions.get(entity) if isinstance(entity, str) else None
+            if position is None:
+                raise ValueError(f"Bank has no entity {entity!r}.")
+            selected.add(position)
+        if self._selected_entities is not None:
+            selected.intersection_update(self._selected_entities)
+        return tuple(sorted(selected))
+
+    def _scan_native_bytes(
+        self,
+        text_bytes: _ScanInput,
+        *,
+        max_matches: int | None,
+        entities: tuple[int, ...] | None = None,
+        stop_after: int | None = None,
+        control: Mapping[str, Any] | None = None,
+        out: Any = None,
+        threads: int = 1,
+    ) -> Any:
+        """Scan through the result cache; with ``out``, a native scan writes into that ``MatchBuffer``."""
+        if max_matches is not None:
+            _validate_max_matches(max_matches)
+        _validate_scan_threads(threads)
+        control = control or {}
+        if stop_after is not None:
+            if isinstance(stop_after, bool) or not isinstance(stop_after, int) or stop_after <= 0:
+                raise ValueError("Bank scan stop_after must be a positive integer.")
+            if max_matches is not None:
+                raise ValueError("Bank scans accept max_matches or stop_after, not both.")
+            if threads > 1:
+                raise ValueError("Bank scans accept stop_after or threads, not both.")
+            # A truncated scan is not a document's full result, so it bypasses the result cache.
+            with _native_scan_interrupts():
+                return self._native.scan_bytes_first(
+                    text_bytes, stop_after, None if entities is None else list(entities), **control
+                )
+        result_key = self._scan_result_key(text_bytes, max_matches, entities)
+        if result_key is not None:
+            cached = _cached_scan_result(result_key)
+            if cached is not None:
+                return cached
+        if threads > 1:
+            # Chunked scans return a serial scan's matches, so they share its cache entry.
+            with _native_scan_interrupts():
+                raw = self._native.scan_bytes_chunked(
+                    text_bytes, threads, None if entities is None else list(entities), max_matches, **control
                 )
-            text_bytes = haystack
+        elif entities is not None or control or (out is not None and max_matches is not None):
+            if out is not None:
+                control = {**control, "out": out}
+            with _native_scan_interrupts():
+                raw = self._native.scan_bytes_with(
+                    text_bytes, None if entities is None else list(entities), max_matches, **control
+                )
+        elif max_matches is None:
+            raw = self._native.scan_bytes(text_bytes) if out is None else self._native.scan_bytes(text_bytes, out)
         else:
-            view = memoryview(haystack)
-            try:
-                input_bytes = view.nbytes
-                if input_bytes > DEFAULT_MAX_SCAN_INPUT_BYTES:
-                    raise ValueError(
-                        f"Bank scan input size {input_bytes} exceeds the configured limit of "
-                        f"{DEFAULT_MAX_SCAN_INPUT_BYTES} bytes"
-                    )
-                # Keep the export alive through the snapshot so a mutable
-                # bytearray cannot be resized between admission and copying.
-                text_bytes = view.tobytes()
-            finally:
-                view.release()
-        raw = self._scan_native_bytes(text_bytes, max_matches=max_matches)
+            raw = self._native.scan_bytes_bounded(text_bytes, max_matches)
+        if result_key is None:
+            return raw
+        return _store_scan_result(result_key, raw)
+
+    def _scan_bytes_records(
+        self,
+        text_bytes: bytes | memoryview,
+        *,
+        max_matches: int | None,
+        entities: tuple[int, ...] | None,
+        stop_after: int | None,
+        control: Mapping[str, Any],
+        out: Any = None,
+        threads: int = 1,
+    ) -> list[dict[str, Any]]:
+        raw = self._scan_native_bytes(
+            text_bytes,
+            max_matches=max_matches,
+            entities=entities,
+            stop_after=stop_after,
+            control=control,
+            out=out,
+            threads=threads,
+        )
         return _project_raw_matches(
             self._detector_projection,
             self._native.detector_metadata,
@@ -410,46 +821,67 @@ class Bank:
             offset_unit="byte",
         )
 
-    def scan_text(
+    def _scan_text_records(
         self,
         text: str,
+        caller: str,
         *,
-        offsets: OffsetUnit = "byte",
-        max_matches: int | None = None,
+        offsets: OffsetUnit,
+        max_matches: int | None,
+        entities: tuple[int, ...] | None,
+        stop_after: int | None,
+        control: Mapping[str, Any],
+        out: Any = None,
     ) -> list[dict[str, Any]]:
         if not isinstance(text, str):
-            raise TypeError("Bank.scan_text text must be a string.")
+            raise TypeError(f"{caller} text must be a string.")
         if offsets not in {"byte", "char"}:
-            raise ValueError('Bank.scan_text offsets must be "byte" or "char".')
-        if len(text) > DEFAULT_MAX_SCAN_INPUT_BYTES:
-            raise ValueError(
-                f"Bank scan input has {len(text)} code points, which necessarily exceeds the configured limit of "
-                f"{DEFAULT_MAX_SCAN_INPUT_BYTES} bytes"
-            )
-
-        text_bytes = text.encode("utf-8")
-        raw = self._scan_native_bytes(text_bytes, max_matches=max_matches)
+            raise ValueError(f'{caller} offsets must be "byte" or "char".')
+        source = _checked_scan_text(text, caller)
+        raw = self._scan_native_bytes(
+            source, max_matches=max_matches, entities=entities, stop_after=stop_after, control=control, out=out
+        )
         records = _project_raw_matches(
             self._detector_projection,
             self._native.detector_metadata,
             raw,
-            text_bytes,
+            source,
             offset_unit="byte",
         )
         if offsets == "byte":
             return records
+        if source is text:
+            # ASCII byte offsets are already char offsets.
+            return [{**record, "offset_unit": "char"} for record in records]
         return _project_char_offsets(records, text)
 
-    def _scan_native_bytes(self, text_bytes: bytes, *, max_matches: int | None) -> Any:
-        if max_matches is None:
-            return self._native.scan_bytes(text_bytes)
-        if isinstance(max_matches, bool) or not isinstance(max_matches, int) or max_matches <= 0:
-            raise ValueError("Bank scan max_matches must be a positive integer.")
-        return self._native.scan_bytes_bounded(text_bytes, max_matches)
+    def _scan_result_key(
+        self,
+        text_bytes: _ScanInput,
+        max_matches: int | None,
+        entities: tuple[int, ...] | None,
+    ) -> _ScanResultCacheKey | None:
+        # Uncached banks have no stable identity to key results on.
+        if _SCAN_RESULT_CACHE_MAX_BYTES <= 0 or self._cache_key is None:
+            return None
+        if isinstance(text_bytes, str):
+            text_bytes = text_bytes.encode("utf-8")
+        return _ScanResultCacheKey(
+            bank=self._cache_key,
+            document_sha256=sha256(text_bytes).digest(),
+            document_bytes=len(text_bytes),
+            max_matches=max_matches,
+            entities=entities,
+        )
 
-    def scan_path(self, path: str | Path) -> list[dict[str, Any]]:
+    def scan_path(self, path: str | Path, *, threads: int = 1) -> list[dict[str, Any]]:
+        """Read and scan the file at ``path``; ``threads`` above 1 scans it in chunks like ``scan_bytes``."""
+        _validate_scan_threads(threads)
         source_path = Path(path).expanduser()
-        raw, source = self._native.scan_path_with_bytes(str(source_path))
+        entities = self._selected_entities
+        raw, source = self._native.scan_path_with_bytes(
+            str(source_path), threads, None if entities is None else list(entities)
+        )
         return _project_raw_matches(
             self._detector_projection,
             self._native.detector_metadata,
@@ -459,6 +891,121 @@ class Bank:
         )
 
 
+class Scanner:
+    """Scan many documents with one bank while reusing one native match buffer.
+
+    Every scan writes its matches into the scanner's ``MatchBuffer``, which keeps its
+    capacity, so a loop over many short documents stops allocating native match
+    storage once the buffer has grown. Detector names come from the bank's shared
+    projection cache. A scanner belongs to the thread that created it; create one
+    per thread with ``Bank.scanner()``.
+    """
+
+    def __init__(self, bank: Bank) -> None:
+        if not isinstance(bank, Bank):
+            raise TypeError("Scanner bank must be a nerb.Bank.")
+        self._bank = bank
+        self._buffer = importlib.import_module("nerb._engine").MatchBuffer()
+        self._owner_thread = get_ident()
+
+    @property
+    def bank(self) -> Bank:
+        return self._bank
+
+    def scan_text(
+        self,
+        text: str,
+        *,
+        offsets: OffsetUnit = "byte",
+        max_matches: int | None = None,
+        entities: Iterable[str] | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Scan ``text`` like ``Bank.scan_text``."""
+        bank = self._checked_bank()
+        return bank._scan_text_records(
+            text,
+            "Scanner.scan_text",
+            offsets=offsets,
+            max_matches=max_matches,
+            entities=bank._scan_entities(entities),
+            stop_after=None,
+            control=_scan_control(deadline_ms, cancel, max_wait_ms),
+            out=self._buffer,
+        )
+
+    def scan_bytes(
+        self,
+        haystack: bytes | bytearray | memoryview,
+        *,
+        max_matches: int | None = None,
+        entities: Iterable[str] | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Scan ``haystack`` like ``Bank.scan_bytes``."""
+        bank = self._checked_bank()
+        return bank._scan_bytes_records(
+            _borrow_scan_bytes(haystack, "Scanner.scan_bytes"),
+            max_matches=max_matches,
+            entities=bank._scan_entities(entities),
+            stop_after=None,
+            control=_scan_control(deadline_ms, cancel, max_wait_ms),
+            out=self._buffer,
+        )
+
+    def scan_text_raw(
+        self,
+        text: str,
+        *,
+        max_matches: int | None = None,
+        entities: Iterable[str] | None = None,
+        deadline_ms: int | None = None,
+        cancel: CancellationToken | None = None,
+        max_wait_ms: int | None = None,
+    ) -> Any:
+        """Scan ``text`` and return the scanner's ``MatchBuffer``, which the next scan overwrites.
+
+        A scan answered by the result cache returns the cached match tuples instead.
+        """
+        bank = self._checked_bank()
+        return bank._scan_native_bytes(
+            _checked_scan_text(text, "Scanner.scan_text_raw"),
+            max_matches=max_matches,
+            entities=bank._scan_entities(entities),
+            control=_scan_control(deadline_ms, cancel, max_wait_ms),
+            out=self._buffer,
+        )
+
+    def _checked_bank(self) -> Bank:
+        if get_ident() != self._owner_thread:
+            raise RuntimeError("A Scanner can only be used by the thread that created it.")
+        return self._bank
+
+
+def _compile_config_entity_bank(
+    pattern_config: PatternConfig,
+    selected_entity: str | None,
+    *,
+    word_boundaries: bool = False,
+) -> Bank:
+    """Compile the whole config once and select ``selected_entity`` at scan time.
+
+    Every single-entity extraction then shares the config's one cached bank. A config
+    whose other entities cannot be used this way falls back to compiling the entity alone.
+    """
+    try:
+        bank = Bank.from_config(pattern_config, word_boundaries=word_boundaries)
+        return bank if selected_entity is None else bank.select_entities([selected_entity])
+    except ValueError:
+        if selected_entity is None:
+            raise
+    return Bank.from_config(pattern_config, selected_entity=selected_entity, word_boundaries=word_boundaries)
+
+
 def clear_bank_cache() -> None:
     global _CACHE_HITS, _CACHE_MISSES
     with _BANK_CACHE_LOCK:
@@ -481,6 +1028,86 @@ def bank_cache_info() -> dict[str, Any]:
         }
 
 
+def configure_scan_result_cache(max_bytes: int) -> None:
+    """Set the byte budget of the document scan result cache.
+
+    Repeated scans of byte-identical documents against the same cached bank reuse the
+    stored native match triples. A budget of ``0`` disables the cache and drops every
+    stored result; a smaller budget evicts least recently used results until it fits.
+    """
+    global _SCAN_RESULT_CACHE_MAX_BYTES
+    if isinstance(max_bytes, bool) or not isinstance(max_bytes, int) or max_bytes < 0:
+        raise ValueError("Scan result cache max_bytes must be a non-negative integer.")
+    with _SCAN_RESULT_CACHE_LOCK:
+        _SCAN_RESULT_CACHE_MAX_BYTES = max_bytes
+        _evict_scan_results_if_needed()
+
+
+def clear_scan_result_cache() -> None:
+    global _SCAN_RESULT_CACHE_BYTES, _SCAN_RESULT_CACHE_HITS, _SCAN_RESULT_CACHE_MISSES, _SCAN_RESULT_CACHE_EVICTIONS
+    with _SCAN_RESULT_CACHE_LOCK:
+        _SCAN_RESULT_CACHE.clear()
+        _SCAN_RESULT_CACHE_BYTES = 0
+        _SCAN_RESULT_CACHE_HITS = 0
+        _SCAN_RESULT_CACHE_MISSES = 0
+        _SCAN_RESULT_CACHE_EVICTIONS = 0
+
+
+def scan_result_cache_info() -> dict[str, Any]:
+    with _SCAN_RESULT_CACHE_LOCK:
+        return {
+            "enabled": _SCAN_RESULT_CACHE_MAX_BYTES > 0,
+            "size": len(_SCAN_RESULT_CACHE),
+            "bytes": _SCAN_RESULT_CACHE_BYTES,
+            "max_bytes": _SCAN_RESULT_CACHE_MAX_BYTES,
+            "hits": _SCAN_RESULT_CACHE_HITS,
+            "misses": _SCAN_RESULT_CACHE_MISSES,
+            "evictions": _SCAN_RESULT_CACHE_EVICTIONS,
+        }
+
+
+def _cached_scan_result(key: _ScanResultCacheKey) -> _ScanTriples | None:
+    global _SCAN_RESULT_CACHE_HITS, _SCAN_RESULT_CACHE_MISSES
+    with _SCAN_RESULT_CACHE_LOCK:
+        cached = _SCAN_RESULT_CACHE.get(key)
+        if cached is None:
+            _SCAN_RESULT_CACHE_MISSES += 1
+            return None
+        _SCAN_RESULT_CACHE.move_to_end(key)
+        _SCAN_RESULT_CACHE_HITS += 1
+        return cached
+
+
+def _store_scan_result(key: _ScanResultCacheKey, raw: Any) -> _ScanTriples:
+    global _SCAN_RESULT_CACHE_BYTES
+    matches: list[tuple[int, int, int]] = []
+    for index in range(len(raw)):
+        detector_index, start, end = raw[index]
+        matches.append((detector_index, start, end))
+    triples = tuple(matches)
+    size = _scan_result_size(triples)
+    with _SCAN_RESULT_CACHE_LOCK:
+        # A result larger than the whole budget would only flush the cache.
+        if size > _SCAN_RESULT_CACHE_MAX_BYTES or key in _SCAN_RESULT_CACHE:
+            return triples
+        _SCAN_RESULT_CACHE[key] = triples
+        _SCAN_RESULT_CACHE_BYTES += size
+        _evict_scan_results_if_needed()
+    return triples
+
+
+def _scan_result_size(triples: _ScanTriples) -> int:
+    return _SCAN_RESULT_ENTRY_BYTES + _SCAN_RESULT_MATCH_BYTES * len(triples)
+
+
+def _evict_scan_results_if_needed() -> None:
+    global _SCAN_RESULT_CACHE_BYTES, _SCAN_RESULT_CACHE_EVICTIONS
+    while _SCAN_RESULT_CACHE and _SCAN_RESULT_CACHE_BYTES > _SCAN_RESULT_CACHE_MAX_BYTES:
+        _key, evicted = _SCAN_RESULT_CACHE.popitem(last=False)
+        _SCAN_RESULT_CACHE_BYTES -= _scan_result_size(evicted)
+        _SCAN_RESULT_CACHE_EVICTIONS += 1
+
+
 def _record_cache_hit() -> None:
     global _CACHE_HITS
     _CACHE_HITS += 1
@@ -711,14 +1338,140 @@ def _flag_list(raw_flags: Any) -> list[str]:
     return [str(raw_flags)]
 
 
+def _validate_max_matches(max_matches: int) -> None:
+    if isinstance(max_matches, bool) or not isinstance(max_matches, int) or max_matches <= 0:
+        raise ValueError("Bank scan max_matches must be a positive integer.")
+
+
+def _validate_scan_threads(threads: int) -> None:
+    if isinstance(threads, bool) or not isinstance(threads, int) or not 1 <= threads <= MAX_SCAN_THREADS:
+        raise ValueError(f"Bank scan threads must be an integer between 1 and {MAX_SCAN_THREADS}.")
+
+
+def _scan_control(
+    deadline_ms: int | None, cancel: CancellationToken | None, max_wait_ms: int | None = None
+) -> dict[str, Any]:
+    """Validate scan deadline, cancel, and slot wait arguments into native keyword arguments."""
+    control: dict[str, Any] = {}
+    if deadline_ms is not None:
+        if isinstance(deadline_ms, bool) or not isinstance(deadline_ms, int) or deadline_ms <= 0:
+            raise ValueError("Bank scan deadline_ms must be a positive integer.")
+        control["deadline_ms"] = deadline_ms
+    if cancel is not None:
+        if not isinstance(cancel, CancellationToken):
+            raise TypeError("Bank scan cancel must be a CancellationToken.")
+        control["cancel"] = cancel._native
+    if max_wait_ms is not None:
+        if isinstance(max_wait_ms, bool) or not isinstance(max_wait_ms, int) or max_wait_ms < 0:
+            raise ValueError("Bank scan max_wait_ms must be a non-negative integer.")
+        control["max_wait_ms"] = max_wait_ms
+    return control
+
+
+@contextmanager
+def _native_scan_interrupts() -> Iterator[None]:
+    """Re-raise native scan interrupts, which carry their progress as arguments, as ``ScanTimeoutError``.
+
+    A scan rejected for want of a free slot becomes ``ScanBusyError``.
+    """
+    try:
+        yield
+    except TimeoutError as exc:
+        if isinstance(exc, ScanTimeoutError) or len(exc.args) != 6:
+            raise
+        message, reason, elapsed_ms, shards_completed, shards_total, matches = exc.args
+        error_type = ScanBusyError if reason == "busy" else ScanTimeoutError
+        raise error_type(
+            str(message),
+            reason=str(reason),
+            progress={
+                "elapsed_ms": int(elapsed_ms),
+                "shards_completed": int(shards_completed),
+                "shards_total": int(shards_total),
+                "matches": int(matches),
+            },
+        ) from None
+
+
+def _borrow_scan_bytes(haystack: bytes | bytearray | memoryview, caller: str) -> bytes | memoryview:
+    """Return scan input the native scan can borrow, copying mutable buffers.
+
+    ``bytes`` and read-only C-contiguous views of immutable exporters, such as
+    memoryview slices of an ``mmap`` opened with ``ACCESS_READ``, are scanned in
+    place. Any other buffer is copied, since another thread could change it while
+    the scan runs without the GIL, even through a read-only view of it.
+    """
+    if not isinstance(haystack, (bytes, bytearray, memoryview)):
+        raise TypeError(f"{caller} haystack must be bytes-like.")
+    if isinstance(haystack, bytes):
+        input_bytes = len(haystack)
+        if input_bytes > DEFAULT_MAX_SCAN_INPUT_BYTES:
+            raise ValueError(
+                f"Bank scan input size {input_bytes} exceeds the configured limit of "
+                f"{DEFAULT_MAX_SCAN_INPUT_BYTES} bytes"
+            )
+        return haystack
+    view = memoryview(haystack)
+    input_bytes = view.nbytes
+    if input_bytes > DEFAULT_MAX_SCAN_INPUT_BYTES:
+        view.release()
+        raise ValueError(
+            f"Bank scan input size {input_bytes} exceeds the configured limit of {DEFAULT_MAX_SCAN_INPUT_BYTES} bytes"
+        )
+    if view.readonly and view.c_contiguous and _immutable_buffer_exporter(view.obj):
+        return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+    try:
+        # Keep the export alive through the snapshot so a mutable
+        # bytearray cannot be resized between admission and copying.
+        return view.tobytes()
+    finally:
+        view.release()
+
+
+def _immutable_buffer_exporter(exporter: object) -> bool:
+    # A read-only view says nothing about its exporter:
+    # memoryview(bytearray(...)).toreadonly() still changes when the bytearray does.
+    if isinstance(exporter, bytes):
+        return True
+    if isinstance(exporter, mmap.mmap):
+        with memoryview(exporter) as mapping:
+            return mapping.readonly
+    return False
+
+
+def _scan_input_bytes(haystack: str | bytes | bytearray | memoryview, caller: str) -> _ScanInput:
+    if isinstance(haystack, str):
+        return _checked_scan_text(haystack, caller)
+    return _borrow_scan_bytes(haystack, caller)
+
+
+def _checked_scan_text(text: str, caller: str) -> str | bytes:
+    if not isinstance(text, str):
+        raise TypeError(f"{caller} text must be a string.")
+    if len(text) > DEFAULT_MAX_SCAN_INPUT_BYTES:
+        raise ValueError(
+            f"Bank scan input has {len(text)} code points, which necessarily exceeds the configured limit of "
+            f"{DEFAULT_MAX_SCAN_INPUT_BYTES} bytes"
+        )
+    return _scan_text_input(text)
+
+
+def _scan_text_input(text: str) -> str | bytes:
+    # CPython stores an ASCII str as its own UTF-8 bytes, so the native scan
+    # borrows it directly; other text is encoded once.
+    return text if text.isascii() else text.encode("utf-8")
+
+
 def _project_raw_matches(
     detector_projection: dict[int, tuple[str, str, str]],
     detector_metadata: Callable[[int], tuple[str, str, str]],
     raw: Any,
-    text_bytes: bytes,
+    text_bytes: _ScanInput,
     *,
     offset_unit: OffsetUnit,
 ) -> list[dict[str, Any]]:
+    # The native scan returns raw matches ordered by (start, end, entity,
+    # canonical_name, surface_name), so the projection preserves that order.
     records: list[dict[str, Any]] = []
     for index in range(len(raw)):
         detector_index, start, end = raw[index]
@@ -728,22 +1481,23 @@ def _project_raw_matches(
             detector = (str(entity), str(canonical_name), str(surface_name))
             detector_projection[detector_index] = detector
         entity, canonical_name, surface_name = detector
+        matched = text_bytes[start:end]
         records.append(
             {
                 "entity": entity,
                 "canonical_name": canonical_name,
                 "surface_name": surface_name,
-                "string": text_bytes[start:end].decode("utf-8"),
+                "string": matched if isinstance(matched, str) else str(matched, "utf-8"),
                 "start": start,
                 "end": end,
                 "offset_unit": offset_unit,
             }
         )
-    records.sort(key=_record_sort_key)
     return records
 
 
 def _project_char_offsets(records: list[dict[str, Any]], text: str) -> list[dict[str, Any]]:
+    # Byte-to-char projection is strictly increasing, so byte order is kept.
     byte_to_char = _byte_to_char_offset_map(text)
     projected: list[dict[str, Any]] = []
     for record in records:
@@ -758,7 +1512,6 @@ def _project_char_offsets(records: list[dict[str, Any]], text: str) -> list[dict
                 "offset_unit": "char",
             }
         )
-    projected.sort(key=_record_sort_key)
     return projected
 
 
@@ -769,14 +1522,3 @@ def _byte_to_char_offset_map(text: str) -> dict[int, int]:
         byte_offset += len(character.encode("utf-8"))
         byte_to_char[byte_offset] = char_offset
     return byte_to_char
-
-
-def _record_sort_key(record: Mapping[str, Any]) -> tuple[int, int, str, str, str, str]:
-    return (
-        int(record["start"]),
-        int(record["end"]),
-        str(record["entity"]),
-        str(record["canonical_name"]),
-        str(record["surface_name"]),
-        str(record["string"]),
-    )
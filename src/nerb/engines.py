@@ -5,7 +5,7 @@ import importlib
 import json
 import time
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, cast
@@ -13,7 +13,7 @@ from typing import Any, cast
 from .bank import bank_stats, canonicalize_bank, hash_bank
 from .diagnostics import DIAGNOSTIC_ERROR, Diagnostic, diagnostic, has_errors
 from .engine import Bank
-from .records import MatchRecord, record_sort_key
+from .records import MatchRecord, sort_span_ordered_records
 from .schema import STATUS_VALUES, validate_bank_schema
 
 DEFAULT_INCLUDE_STATUSES = ("active",)
@@ -168,6 +168,8 @@ class ResolvedExtractionOptions:
     max_text_bytes: int
     max_batch_documents: int
     max_batch_text_bytes: int
+    entity_ids: tuple[str, ...] | None = None
+    deadline_ms: int | None = None
 
 
 @dataclass(frozen=True)
@@ -179,6 +181,10 @@ class _DetectorIdentity:
     canonical_name: str
 
 
+_IdentitySpan = tuple[int, int, _DetectorIdentity]
+_OverlapGroup = tuple[int, int, int]
+
+
 @dataclass(frozen=True)
 class CompiledBank:
     bank: dict[str, Any]
@@ -192,18 +198,168 @@ class CompiledBank:
     native_bank: Bank | None
     cache_metadata: dict[str, Any]
     detector_index: Mapping[tuple[str, str, str], _DetectorIdentity]
-
-    def finditer(self, text: str, *, max_matches: int | None = None) -> list[MatchRecord]:
+    _span_identities: dict[int, _DetectorIdentity] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _native_entity_ids: set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _tie_ranks: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def finditer(
+        self,
+        text: str,
+        *,
+        max_matches: int | None = None,
+        entity_ids: Sequence[str] | None = None,
+        deadline_ms: int | None = None,
+    ) -> list[MatchRecord]:
+        """Return enriched records, restricted to ``entity_ids`` when given.
+
+        Entity selection happens at scan time on this bank's one native bank. A scan
+        that runs longer than ``deadline_ms`` raises ``ScanTimeoutError``.
+        """
         if self.native_bank is None:
             return []
 
-        records = [
-            _enrich_json_bank_record(record, self.detector_index)
-            for record in self.native_bank.scan_text(text, max_matches=max_matches)
+        scanned = self.native_bank.scan_text(
+            text,
+            max_matches=max_matches,
+            entities=self._native_entities(entity_ids),
+            deadline_ms=deadline_ms,
+        )
+        records = [_enrich_json_bank_record(record, self.detector_index) for record in scanned]
+        sort_span_ordered_records(records)
+        return records
+
+    def finditer_resolved(
+        self,
+        text: str,
+        *,
+        max_matches: int | None = None,
+        entity_ids: Sequence[str] | None = None,
+        deadline_ms: int | None = None,
+    ) -> tuple[list[MatchRecord], list[_OverlapGroup]]:
+        """Return ``finditer`` records with their priority overlap groups.
+
+        Each group is ``(first, end, winner)``: ``records[first:end]`` overlap and
+        ``records[winner]`` is the record the priority policy keeps. The native bank
+        resolves the groups from the scan's match buffer.
+        """
+        if self.native_bank is None:
+            return [], []
+
+        raw = self.native_bank.scan_text_raw(
+            text,
+            max_matches=max_matches,
+            entities=self._native_entities(entity_ids),
+            deadline_ms=deadline_ms,
+        )
+        groups = self.native_bank.resolve_overlaps(raw, tie_ranks=self._detector_tie_ranks())
+        records = self._buffer_records(raw, text)
+        winners = [records[winner] for _first, _end, winner in groups]
+        sort_span_ordered_records(records)
+        # Sorting a span run never moves a record out of its overlap group.
+        return records, [
+            (first, end, next(index for index in range(first, end) if records[index] is winner))
+            for (first, end, _winner), winner in zip(groups, winners, strict=True)
         ]
-        records.sort(key=record_sort_key)
+
+    def contains_any(self, text: str, *, entity_ids: Sequence[str] | None = None) -> bool:
+        """Return whether ``finditer`` would return any record, stopping at the first match."""
+        if self.native_bank is None:
+            return False
+        return self.native_bank.contains_any(text, entities=self._native_entities(entity_ids))
+
+    def finditer_spans(self, text: str, *, max_matches: int | None = None) -> list[_IdentitySpan]:
+        """Return ``finditer`` matches as ``(start, end, identity)`` without building records.
+
+        Offsets are UTF-8 bytes, the matched string is ``text[start:end]`` of the
+        encoded text, and the order is exactly the ``finditer`` order.
+        """
+        if self.native_bank is None:
+            return []
+        return self._identity_spans(self.native_bank.scan_text_raw(text, max_matches=max_matches))
+
+    def finditer_spans_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        max_matches: int | None = None,
+        threads: int = 1,
+    ) -> list[list[_IdentitySpan]]:
+        """Scan several texts in one native call; each result equals ``finditer_spans``."""
+        if self.native_bank is None:
+            return [[] for _text in texts]
+        buffers = self.native_bank.scan_text_raw_batch(texts, max_matches=max_matches, threads=threads)
+        return [self._identity_spans(raw) for raw in buffers]
+
+    def _native_entities(self, entity_ids: Sequence[str] | None) -> tuple[str, ...] | None:
+        # Entities without extractable patterns have no native shard and match nothing.
+        if entity_ids is None:
+            return None
+        native_entities = self._native_entity_ids
+        if not native_entities:
+            native_entities.update(cast(Bank, self.native_bank).entity_names())
+        return tuple(entity_id for entity_id in entity_ids if entity_id in native_entities)
+
+    def _buffer_records(self, raw: Any, text: str) -> list[MatchRecord]:
+        # Records keep the match buffer order; callers restore record_sort_key order.
+        native_bank = cast(Bank, self.native_bank)
+        source = text.encode("utf-8")
+        records: list[MatchRecord] = []
+        for index in range(len(raw)):
+            detector, start, end = raw[index]
+            entity, canonical_name, surface_name = native_bank.detector(detector)
+            identity = self._identity(detector)
+            records.append(
+                {
+                    "entity": entity,
+                    "canonical_name": canonical_name,
+                    "surface_name": surface_name,
+                    "string": str(source[start:end], "utf-8"),
+                    "start": start,
+                    "end": end,
+                    "offset_unit": "byte",
+                    "entity_id": identity.entity_id,
+                    "name_id": identity.name_id,
+                    "pattern_id": identity.pattern_id,
+                    "pattern_kind": identity.pattern_kind,
+                    "captures": {},
+                }
+            )
         return records
 
+    def _identity(self, detector: int) -> _DetectorIdentity:
+        identity = self._span_identities.get(detector)
+        if identity is None:
+            identity = _detector_identity(cast(Bank, self.native_bank).detector(detector), self.detector_index)
+            self._span_identities[detector] = identity
+        return identity
+
+    def _detector_tie_ranks(self) -> list[int]:
+        # Native tie ranks follow the bank's names; reports break ties on JSON ids.
+        ranks = self._tie_ranks
+        if not ranks:
+            detector_count = len(cast(Bank, self.native_bank).metadata()["detectors"])
+            identities = [self._identity(detector) for detector in range(detector_count)]
+            order = sorted(
+                range(detector_count),
+                key=lambda detector: (
+                    identities[detector].entity_id,
+                    identities[detector].name_id,
+                    identities[detector].pattern_id,
+                ),
+            )
+            ranks.extend([0] * detector_count)
+            for rank, detector in enumerate(order):
+                ranks[detector] = rank
+        return ranks
+
+    def _identity_spans(self, raw: Any) -> list[_IdentitySpan]:
+        spans: list[_IdentitySpan] = []
+        for index in range(len(raw)):
+            detector, start, end = raw[index]
+            spans.append((start, end, self._identity(detector)))
+        _sort_span_ordered_identities(spans)
+        return spans
+
 
 def resolve_extraction_options(options: Mapping[str, Any] | None) -> ResolvedExtractionOptions:
     options = options or {}
@@ -239,6 +395,20 @@ def resolve_extraction_options(options: Mapping[str, Any] | None) -> ResolvedExt
             )
         del engine_options_dict["match_mode"]
 
+    entity_ids = options.get("entity_ids")
+    if entity_ids is not None:
+        if (
+            not isinstance(entity_ids, Sequence)
+            or isinstance(entity_ids, (str, bytes))
+            or not all(isinstance(entity_id, str) for entity_id in entity_ids)
+        ):
+            raise ExtractionError("Extraction option entity_ids must be a sequence of entity ID strings.")
+        entity_ids = tuple(sorted(set(entity_ids)))
+
+    deadline_ms = options.get("deadline_ms")
+    if deadline_ms is not None:
+        deadline_ms = _positive_int_option(options, "deadline_ms", deadline_ms)
+
     return ResolvedExtractionOptions(
         include_statuses=statuses,
         engine=engine,
@@ -246,6 +416,8 @@ def resolve_extraction_options(options: Mapping[str, Any] | None) -> ResolvedExt
         max_text_bytes=_positive_int_option(options, "max_text_bytes", DEFAULT_MAX_TEXT_BYTES),
         max_batch_documents=_positive_int_option(options, "max_batch_documents", DEFAULT_MAX_BATCH_DOCUMENTS),
         max_batch_text_bytes=_positive_int_option(options, "max_batch_text_bytes", DEFAULT_MAX_BATCH_TEXT_BYTES),
+        entity_ids=entity_ids,
+        deadline_ms=deadline_ms,
     )
 
 
@@ -657,6 +829,32 @@ def _json_bank_detector_index(bank: Mapping[str, Any]) -> dict[tuple[str, str, s
     return index
 
 
+def _detector_identity(
+    key: tuple[str, str, str],
+    detector_index: Mapping[tuple[str, str, str], _DetectorIdentity],
+) -> _DetectorIdentity:
+    identity = detector_index.get(key)
+    if identity is None:
+        raise ExtractionError(
+            f"Rust engine record could not be mapped back to JSON-bank detector metadata: {key[0]}/{key[1]}/{key[2]}."
+        )
+    return identity
+
+
+def _sort_span_ordered_identities(spans: list[_IdentitySpan]) -> None:
+    # Mirrors sort_span_ordered_records: the matched string is fixed by the
+    # span, so the id triple is the whole tie order inside one span run.
+    run_start = 0
+    for index in range(1, len(spans) + 1):
+        if index == len(spans) or spans[index][:2] != spans[run_start][:2]:
+            if index - run_start > 1:
+                spans[run_start:index] = sorted(
+                    spans[run_start:index],
+                    key=lambda span: (span[2].entity_id, span[2].name_id, span[2].pattern_id),
+                )
+            run_start = index
+
+
 def _enrich_json_bank_record(
     record: Mapping[str, Any],
     detector_index: Mapping[tuple[str, str, str], _DetectorIdentity],
@@ -666,12 +864,7 @@ def _enrich_json_bank_record(
         str(record["canonical_name"]),
         str(record["surface_name"]),
     )
-    identity = detector_index.get(key)
-    if identity is None:
-        raise ExtractionError(
-            f"Rust engine record could not be mapped back to JSON-bank detector metadata: {key[0]}/{key[1]}/{key[2]}."
-        )
-
+    identity = _detector_identity(key, detector_index)
     return {
         **dict(record),
         "entity_id": identity.entity_id,
@@ -10,11 +10,14 @@ from __future__ import annotations
 
 import hashlib
 import json
+import multiprocessing
 import re
 import sqlite3
 import unicodedata
-from collections import Counter, defaultdict
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal, cast
@@ -32,9 +35,16 @@ BANK_BUILD_ITERATION_SCHEMA_VERSION = "nerb.enron_bank_build_iteration.v2"
 BANK_BUILD_TIMESTAMP = "2026-07-10T00:00:00Z"
 DEFAULT_MAX_CANDIDATE_SPOOL_BYTES = 12 * 1024**3
 MIN_CANDIDATE_SPOOL_BYTES = 64 * 1024
+DEFAULT_MINING_WORKERS = 1
+HARD_MAX_MINING_WORKERS = 64
 
 _SHA256_PREFIX = "sha256:"
 _RESOURCE_CHECKPOINT_INTERVAL = 10_000
+_MINING_COMMIT_RECORDS = 10_000
+_MINING_FLUSH_RECORDS = 2_000
+_MINING_PROJECTION_BATCH_RECORDS = 256
+_MINING_PROJECTION_BATCHES_PER_WORKER = 2
+_encode_json_string = json.encoder.encode_basestring  # type: ignore[attr-defined]
 _EMAIL_RE = re.compile(
     r"^[a-z0-9_][a-z0-9.!#$%&'*+/=?^_`{|}~-]*@(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+"
     r"[a-z](?:[a-z0-9-]{0,61}[a-z0-9])?$",
@@ -296,16 +306,14 @@ class _EvidenceAccumulator:
             )
             self.last_seen = observed_at if self.last_seen is None or observed_at > self.last_seen else self.last_seen
         self.digest.update(
-            _canonical_json_bytes(
-                {
-                    "document_id": document_id,
-                    "group_id": group_id,
-                    "observed_at": observed_at,
-                    "occurrences": occurrences,
-                    "related": related,
-                    "surface": surface,
-                    "source_type": source_type,
-                }
+            _observation_digest_bytes(
+                document_id=document_id,
+                group_id=group_id,
+                observed_at=observed_at,
+                occurrences=occurrences,
+                related=related,
+                surface=surface,
+                source_type=source_type,
             )
         )
 
@@ -335,12 +343,20 @@ def mine_enron_candidates(
     max_spool_bytes: int = DEFAULT_MAX_CANDIDATE_SPOOL_BYTES,
     resource_checkpoint: Callable[[], object] | None = None,
     activity_callback: Callable[[], None] | None = None,
+    workers: int = DEFAULT_MINING_WORKERS,
 ) -> CandidatePool:
-    """Stream verified train records into a bounded private SQLite spool."""
+    """Stream verified train records into a bounded private SQLite spool.
+
+    Records are projected to observations on ``workers`` processes, pre-aggregated
+    per document, and written in bounded batches. Results, limits, and evidence
+    digests match the serial single-worker run.
+    """
 
     _validate_policy(policy)
     if type(max_spool_bytes) is not int or max_spool_bytes < MIN_CANDIDATE_SPOOL_BYTES:
         raise EnronBankBuildError("Candidate mining spool byte limit is invalid.")
+    if type(workers) is not int or not 1 <= workers <= HARD_MAX_MINING_WORKERS:
+        raise EnronBankBuildError(f"Candidate mining workers must be an integer from 1 to {HARD_MAX_MINING_WORKERS}.")
     if resource_checkpoint is not None and not callable(resource_checkpoint):
         raise EnronBankBuildError("Candidate mining resource checkpoint is invalid.")
     if activity_callback is not None and not callable(activity_callback):
@@ -405,95 +421,44 @@ def mine_enron_candidates(
         if resource_checkpoint is not None:
             resource_checkpoint()
         ingest_activity = _BuilderActivityReporter(activity_callback)
-        for record, membership in records_and_memberships:
+        batch = _MiningBatch()
+        for projection in _iter_train_projections(records_and_memberships, policy, workers=workers):
+            if isinstance(projection, EnronBankBuildError):
+                raise projection
             records += 1
-            if records > policy.max_train_records:
-                raise EnronBankBuildError("Train record count exceeds the bank-build limit.")
-            document_id, group_id, observed_at, entries, body_aliases = _train_record_projection(
-                record, membership, policy
-            )
-            source_projection = _canonical_json_bytes(
-                {
-                    "document_id": document_id,
-                    "group_id": group_id,
-                    "observed_at": observed_at,
-                    "structured_entries": len(entries),
-                    "sender_body_aliases": len(body_aliases),
-                }
-            )
-            try:
-                connection.execute(
-                    "INSERT INTO source_projections(document_id, payload) VALUES (?, ?)",
-                    (document_id, source_projection),
-                )
-            except sqlite3.IntegrityError:
-                raise EnronBankBuildError("Train split contains a duplicate document identifier.") from None
-            projected: list[tuple[str, str, str, str, str]] = []
-            for _field_name, name, address in entries:
-                normalized_address = _normalize_email(address)
-                if normalized_address:
-                    projected.append(("contact", normalized_address, normalized_address, "", "structured_header"))
-                    domain = normalized_address.rsplit("@", 1)[1]
-                    projected.append(("organization_domain", domain, domain, "", "structured_header"))
-                person_surface = _person_literal_surface(name)
-                normalized_name = _normalize_person_name(person_surface)
-                if normalized_name and normalized_address:
-                    projected.append(
-                        (
-                            "person_alias",
-                            _person_literal_catalog_key(person_surface),
-                            person_surface,
-                            normalized_address,
-                            "structured_display_name",
-                        )
-                    )
-            for name, address in body_aliases:
-                person_surface = _person_literal_surface(name)
-                normalized_name = _normalize_person_name(person_surface)
-                normalized_address = _normalize_email(address)
-                if normalized_name and normalized_address:
-                    projected.append(
-                        (
-                            "person_alias",
-                            _person_literal_catalog_key(person_surface),
-                            person_surface,
-                            normalized_address,
-                            "sender_body_local_link",
-                        )
-                    )
-            for kind, normalized_value, surface, related, source_type in projected:
+            document_id = projection.document_id
+            if document_id in batch.document_ids:
+                raise EnronBankBuildError("Train split contains a duplicate document identifier.")
+            batch.document_ids.add(document_id)
+            batch.source_projections.append((document_id, projection.source_projection))
+            for observation in projection.observations:
                 observations += 1
                 if observations > policy.max_observations:
                     raise EnronBankBuildError("Candidate observations exceed the bank-build limit.")
+                _kind, normalized_value, surface, related, _source_type = observation
                 if max(len(value.encode("utf-8")) for value in (normalized_value, surface, related)) > (
                     policy.max_candidate_value_bytes
                 ):
                     raise EnronBankBuildError("Candidate value exceeds the bank-build byte limit.")
-                cursor = connection.execute(
-                    "INSERT OR IGNORE INTO candidate_values(kind, normalized_value) VALUES (?, ?)",
-                    (kind, normalized_value),
-                )
-                if cursor.rowcount:
-                    unique_candidates += 1
-                    if unique_candidates > policy.max_unique_candidates:
-                        raise EnronBankBuildError("Unique candidates exceed the bank-build limit.")
-                connection.execute(
-                    """
-                    INSERT INTO observations(
-                        kind, normalized_value, surface, related, source_type,
-                        document_id, group_id, observed_at, occurrences
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, 1)
-                    ON CONFLICT(kind, normalized_value, surface, related, source_type, document_id)
-                    DO UPDATE SET occurrences = occurrences + 1
-                    """,
-                    (kind, normalized_value, surface, related, source_type, document_id, group_id, observed_at),
+            for observation, occurrences in Counter(projection.observations).items():
+                batch.candidate_values.add(observation[:2])
+                batch.observations.append(
+                    (*observation, document_id, projection.group_id, projection.observed_at, occurrences)
                 )
             ingest_activity.worked()
-            if records % 10_000 == 0:
+            if records % _MINING_FLUSH_RECORDS == 0:
+                unique_candidates += _flush_mining_batch(connection, batch)
+                if unique_candidates > policy.max_unique_candidates:
+                    raise EnronBankBuildError("Unique candidates exceed the bank-build limit.")
+                batch = _MiningBatch()
+            if records % _MINING_COMMIT_RECORDS == 0:
                 connection.commit()
                 if resource_checkpoint is not None:
                     resource_checkpoint()
                 connection.execute("BEGIN IMMEDIATE")
+        unique_candidates += _flush_mining_batch(connection, batch)
+        if unique_candidates > policy.max_unique_candidates:
+            raise EnronBankBuildError("Unique candidates exceed the bank-build limit.")
         connection.commit()
         ingest_activity.boundary()
         if resource_checkpoint is not None:
@@ -595,6 +560,181 @@ def _read_candidate_evidence(
     return tuple(finished)
 
 
+@dataclass(frozen=True, slots=True)
+class _TrainRecordObservations:
+    document_id: str
+    group_id: str
+    observed_at: str | None
+    source_projection: bytes
+    observations: tuple[tuple[str, str, str, str, str], ...]
+
+
+@dataclass(slots=True)
+class _MiningBatch:
+    document_ids: set[str] = field(default_factory=set)
+    source_projections: list[tuple[str, bytes]] = field(default_factory=list)
+    candidate_values: set[tuple[str, str]] = field(default_factory=set)
+    observations: list[tuple[Any, ...]] = field(default_factory=list)
+
+
+def _flush_mining_batch(connection: sqlite3.Connection, batch: _MiningBatch) -> int:
+    """Write one pre-aggregated batch and return how many candidate values were new."""
+
+    try:
+        connection.executemany(
+            "INSERT INTO source_projections(document_id, payload) VALUES (?, ?)",
+            batch.source_projections,
+        )
+    except sqlite3.IntegrityError:
+        raise EnronBankBuildError("Train split contains a duplicate document identifier.") from None
+    cursor = connection.executemany(
+        "INSERT OR IGNORE INTO candidate_values(kind, normalized_value) VALUES (?, ?)",
+        sorted(batch.candidate_values),
+    )
+    new_candidates = max(cursor.rowcount, 0)
+    connection.executemany(
+        """
+        INSERT INTO observations(
+            kind, normalized_value, surface, related, source_type,
+            document_id, group_id, observed_at, occurrences
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(kind, normalized_value, surface, related, source_type, document_id)
+        DO UPDATE SET occurrences = occurrences + excluded.occurrences
+        """,
+        batch.observations,
+    )
+    return new_candidates
+
+
+def _iter_train_projections(
+    records_and_memberships: Iterable[tuple[Mapping[str, Any], Mapping[str, Any]]],
+    policy: EnronBankPolicy,
+    *,
+    workers: int,
+) -> Iterator[_TrainRecordObservations | EnronBankBuildError]:
+    """Yield each record's observations, or its error, in input order.
+
+    Errors are yielded instead of raised so the caller reports the first failing
+    record exactly as the serial loop would, even when later records were
+    already projected by a worker.
+    """
+
+    if workers == 1:
+        for count, (record, membership) in enumerate(records_and_memberships, start=1):
+            if count > policy.max_train_records:
+                yield EnronBankBuildError("Train record count exceeds the bank-build limit.")
+                return
+            yield _train_record_observations(record, membership, policy)
+        return
+
+    max_batches = workers * _MINING_PROJECTION_BATCHES_PER_WORKER
+    pending: deque[Future[list[_TrainRecordObservations | EnronBankBuildError]]] = deque()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_initialize_mining_worker,
+        initargs=(policy,),
+    )
+    try:
+        rows: list[tuple[Mapping[str, Any], Mapping[str, Any]]] = []
+        limit_error: EnronBankBuildError | None = None
+        for count, row in enumerate(records_and_memberships, start=1):
+            if count > policy.max_train_records:
+                limit_error = EnronBankBuildError("Train record count exceeds the bank-build limit.")
+                break
+            rows.append(row)
+            if len(rows) >= _MINING_PROJECTION_BATCH_RECORDS:
+                pending.append(executor.submit(_project_mining_worker_batch, rows))
+                rows = []
+            while len(pending) >= max_batches:
+                yield from _mining_batch_result(pending.popleft())
+        if rows:
+            pending.append(executor.submit(_project_mining_worker_batch, rows))
+        while pending:
+            yield from _mining_batch_result(pending.popleft())
+        if limit_error is not None:
+            yield limit_error
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _mining_batch_result(
+    future: Future[list[_TrainRecordObservations | EnronBankBuildError]],
+) -> list[_TrainRecordObservations | EnronBankBuildError]:
+    try:
+        return future.result()
+    except BrokenProcessPool:
+        raise EnronBankBuildError("A candidate mining worker exited unexpectedly.") from None
+
+
+_WORKER_POLICY: EnronBankPolicy | None = None
+
+
+def _initialize_mining_worker(policy: EnronBankPolicy) -> None:
+    global _WORKER_POLICY
+    _WORKER_POLICY = policy
+
+
+def _project_mining_worker_batch(
+    rows: list[tuple[Mapping[str, Any], Mapping[str, Any]]],
+) -> list[_TrainRecordObservations | EnronBankBuildError]:
+    policy = _WORKER_POLICY
+    assert policy is not None
+    return [_train_record_observations(record, membership, policy) for record, membership in rows]
+
+
+def _train_record_observations(
+    record: Mapping[str, Any], membership: Mapping[str, Any], policy: EnronBankPolicy
+) -> _TrainRecordObservations | EnronBankBuildError:
+    try:
+        document_id, group_id, observed_at, entries, body_aliases = _train_record_projection(record, membership, policy)
+    except EnronBankBuildError as exc:
+        return exc
+    source_projection = _canonical_json_bytes(
+        {
+            "document_id": document_id,
+            "group_id": group_id,
+            "observed_at": observed_at,
+            "structured_entries": len(entries),
+            "sender_body_aliases": len(body_aliases),
+        }
+    )
+    projected: list[tuple[str, str, str, str, str]] = []
+    for _field_name, name, address in entries:
+        normalized_address = _normalize_email(address)
+        if normalized_address:
+            projected.append(("contact", normalized_address, normalized_address, "", "structured_header"))
+            domain = normalized_address.rsplit("@", 1)[1]
+            projected.append(("organization_domain", domain, domain, "", "structured_header"))
+        person_surface = _person_literal_surface(name)
+        normalized_name = _normalize_person_name(person_surface)
+        if normalized_name and normalized_address:
+            projected.append(
+                (
+                    "person_alias",
+                    _person_literal_catalog_key(person_surface),
+                    person_surface,
+                    normalized_address,
+                    "structured_display_name",
+                )
+            )
+    for name, address in body_aliases:
+        person_surface = _person_literal_surface(name)
+        normalized_name = _normalize_person_name(person_surface)
+        normalized_address = _normalize_email(address)
+        if normalized_name and normalized_address:
+            projected.append(
+                (
+                    "person_alias",
+                    _person_literal_catalog_key(person_surface),
+                    person_surface,
+                    normalized_address,
+                    "sender_body_local_link",
+                )
+            )
+    return _TrainRecordObservations(document_id, group_id, observed_at, source_projection, tuple(projected))
+
+
 def _train_record_projection(
     record: Mapping[str, Any], membership: Mapping[str, Any], policy: EnronBankPolicy
 ) -> tuple[
@@ -1784,6 +1924,40 @@ def _canonical_json_bytes(value: Any) -> bytes:
         raise EnronBankBuildError("Bank-build value is not canonical finite UTF-8 JSON.") from None
 
 
+def _observation_digest_bytes(
+    *,
+    document_id: str,
+    group_id: str,
+    observed_at: str | None,
+    occurrences: int,
+    related: str,
+    surface: str,
+    source_type: str,
+) -> bytes:
+    """Return ``_canonical_json_bytes`` of one observation without building a dict."""
+
+    try:
+        return (
+            '{"document_id":'
+            + _encode_json_string(document_id)
+            + ',"group_id":'
+            + _encode_json_string(group_id)
+            + ',"observed_at":'
+            + ("null" if observed_at is None else _encode_json_string(observed_at))
+            + ',"occurrences":'
+            + str(int(occurrences))
+            + ',"related":'
+            + _encode_json_string(related)
+            + ',"source_type":'
+            + _encode_json_string(source_type)
+            + ',"surface":'
+            + _encode_json_string(surface)
+            + "}"
+        ).encode("utf-8")
+    except UnicodeEncodeError:
+        raise EnronBankBuildError("Bank-build value is not canonical finite UTF-8 JSON.") from None
+
+
 def _canonical_hash(value: Any) -> str:
     return _SHA256_PREFIX + hashlib.sha256(_canonical_json_bytes(value)).hexdigest()
 
@@ -35,6 +35,7 @@ from .enron_bank_builder import (
     CANDIDATE_FUNNEL_SCHEMA_VERSION,
     CANDIDATE_SCHEMA_VERSION,
     DEFAULT_MAX_CANDIDATE_SPOOL_BYTES,
+    DEFAULT_MINING_WORKERS,
     ITERATION_POLICIES,
     CandidatePool,
     CuratedIteration,
@@ -549,6 +550,7 @@ class EnronBankBuildOptions:
     created_at: str = BANK_BUILD_TIMESTAMP
     policy: EnronBankPolicy = EnronBankPolicy()
     allow_unignored_output: bool = False
+    workers: int = DEFAULT_MINING_WORKERS
     progress_callback: Callable[[int], None] | None = None
     activity_callback: Callable[[], None] | None = None
     cleanup_successor: PrivateRun | None = dataclass_field(default=None, repr=False, compare=False)
@@ -784,6 +786,7 @@ def build_enron_intelligence_bank(options: EnronBankBuildOptions) -> dict[str, A
                 max_spool_bytes=_MAX_PRIVATE_SQLITE_BYTES,
                 resource_checkpoint=mining_checkpoint,
                 activity_callback=activity.boundary,
+                workers=options.workers,
             )
             progress.finish()
             implementation_sha256 = _builder_implementation_sha256()
@@ -16,7 +16,7 @@ import quopri
 import re
 import unicodedata
 from collections import Counter
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from email.errors import HeaderParseError
 from email.header import decode_header
@@ -122,6 +122,16 @@ _BIDI_CONTROLS = frozenset(
 _REMOVED_ZERO_WIDTH = frozenset({"\u200b", "\u2060", "\ufeff"})
 _PRESERVED_JOIN_CONTROLS = frozenset({"\u200c", "\u200d"})
 _UNICODE_LINE_SEPARATORS = frozenset({"\u0085", "\u2028", "\u2029"})
+# Every character the grouping filter can drop or replace: C0/C1 controls other than newline, bidi and zero-width
+# controls, join controls, and the ranges in ``_is_default_ignorable``.  All other characters pass through unchanged.
+_GROUPING_FILTER_CANDIDATE_RE = re.compile(
+    "["
+    "\x00-\x09\x0b-\x1f\x7f-\x9f"
+    "\u00ad\u034f\u061c\u115f\u1160\u17b4\u17b5\u180b-\u180f\u200b-\u200f\u202a-\u202e\u2060-\u206f"
+    "\u3164\ufe00-\ufe0f\ufeff\uffa0\ufff0-\ufff8"
+    "\U0001bca0-\U0001bca3\U0001d173-\U0001d17a\U000e0000-\U000e0fff"
+    "]"
+)
 
 _COUNTER_NAMES = (
     "base64_decoded",
@@ -1379,24 +1389,14 @@ def clean_email_body(value: str, max_chars: int, max_utf8_bytes: int) -> Cleaned
 def normalize_grouping_text(value: str) -> str:
     """Return a bounded compatibility/case-normalized grouping fingerprint text."""
 
+    return _normalize_grouping_text(value, _filter_grouping_characters)
+
+
+def _normalize_grouping_text(value: str, filter_characters: Callable[[str], str]) -> str:
     encoded = _validate_text(value, _MAX_GROUPING_CHARS, _MAX_GROUPING_UTF8_BYTES)
     counters: Counter[str] = Counter()
     value = _normalize_line_endings(value, counters)
-
-    filtered: list[str] = []
-    for index, character in enumerate(value):
-        if (
-            character in _BIDI_CONTROLS
-            or character in _REMOVED_ZERO_WIDTH
-            or _is_default_ignorable(character)
-            or _is_identifier_join_control(value, index)
-        ):
-            continue
-        if character != "\n" and unicodedata.category(character) == "Cc":
-            filtered.append(" ")
-        else:
-            filtered.append(character)
-    filtered_value = "".join(filtered)
+    filtered_value = filter_characters(value)
     nfkc = unicodedata.normalize("NFKC", filtered_value)
     folded = nfkc.casefold()
     if len(folded) > _MAX_GROUPING_CHARS or len(folded) > len(value) * _MAX_GROUPING_EXPANSION:
@@ -1408,6 +1408,34 @@ def normalize_grouping_text(value: str) -> str:
     return grouping
 
 
+def _grouping_character_replacement(value: str, index: int) -> str:
+    character = value[index]
+    if (
+        character in _BIDI_CONTROLS
+        or character in _REMOVED_ZERO_WIDTH
+        or _is_default_ignorable(character)
+        or _is_identifier_join_control(value, index)
+    ):
+        return ""
+    if character != "\n" and unicodedata.category(character) == "Cc":
+        return " "
+    return character
+
+
+def _filter_grouping_characters(value: str) -> str:
+    """Apply the grouping character filter only at candidate positions; other characters are unchanged."""
+
+    if _GROUPING_FILTER_CANDIDATE_RE.search(value) is None:
+        return value
+    return _GROUPING_FILTER_CANDIDATE_RE.sub(lambda match: _grouping_character_replacement(value, match.start()), value)
+
+
+def _filter_grouping_characters_scalar(value: str) -> str:
+    """Reference per-character grouping filter used for parity checks."""
+
+    return "".join(_grouping_character_replacement(value, index) for index in range(len(value)))
+
+
 _THREAD_PREFIX_RE = re.compile(r"\A\s*(?:re|fw|fwd)\s*(?:\[\d+\])?\s*:\s*", re.IGNORECASE)
 
 
@@ -13,13 +13,14 @@ import heapq
 import json
 import re
 from collections import deque
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, TextIO, cast
 
 from . import enron_contract
 from .bank import bank_stats, hash_bank
+from .engine import MAX_SCAN_THREADS
 from .engines import CompiledBank, compile_bank, extraction_execution_sha256
 from .enron_activity import ACTIVITY_RECORD_INTERVAL
 from .enron_contract import validate_enron_conformance_output
@@ -41,6 +42,8 @@ DEFAULT_MAX_ARTIFACT_BYTES = 512 * 1024 * 1024
 DEFAULT_MAX_CASE_TEXT_BYTES = 10 * 1024 * 1024
 DEFAULT_MAX_EXPECTED_PER_CASE = 10_000
 DEFAULT_MAX_MATCHES_PER_CASE = 100_000
+DEFAULT_SCAN_BATCH_CASES = 256
+_SCAN_BATCH_TEXT_CHARS = 32 * 1024 * 1024
 
 ADVERSARIAL_TAGS = frozenset(
     {
@@ -108,6 +111,8 @@ class EnronConformanceOptions:
     max_case_text_bytes: int = DEFAULT_MAX_CASE_TEXT_BYTES
     max_expected_per_case: int = DEFAULT_MAX_EXPECTED_PER_CASE
     max_matches_per_case: int = DEFAULT_MAX_MATCHES_PER_CASE
+    scan_batch_cases: int = DEFAULT_SCAN_BATCH_CASES
+    scan_threads: int = 1
 
 
 @dataclass(frozen=True)
@@ -123,6 +128,12 @@ class _ActivePattern:
         return (self.entity_id, self.name_id, self.pattern_id)
 
 
+# (entity_id, name_id, pattern_id, pattern_kind, canonical_name, start, end).
+# The matched string is implied by the byte span, which normalization already
+# checked against each expected string.
+_CaseSpan = tuple[str, str, str, str, str, int, int]
+
+
 @dataclass(frozen=True)
 class _Evaluation:
     public: dict[str, Any]
@@ -363,11 +374,10 @@ def _evaluate(
     wrong_canonical = 0
     supported_patterns: set[tuple[str, str, str]] = set()
     positive_details: list[dict[str, Any]] = []
-    for case in normalized_positive:
+    for case, spans in zip(normalized_positive, _scan_cases(compiled, normalized_positive, options), strict=True):
         activity.worked()
-        records = _scan_case(compiled, str(case["text"]), options)
         expected = cast(list[dict[str, Any]], case["expected"])
-        statuses = _classify_expected(expected, records)
+        statuses = _classify_expected(expected, spans)
         correctly_mapped += statuses.count("correct")
         missed += statuses.count("missed")
         wrong_canonical += statuses.count("wrong_canonical")
@@ -397,10 +407,9 @@ def _evaluate(
 
     unexpected_negative_matches = 0
     negative_details: list[dict[str, Any]] = []
-    for case in normalized_negative:
+    for case, spans in zip(normalized_negative, _scan_cases(compiled, normalized_negative, options), strict=True):
         activity.worked()
-        records = _scan_case(compiled, str(case["text"]), options)
-        unexpected = bool(records)
+        unexpected = bool(spans)
         unexpected_negative_matches += int(unexpected)
         if capture_private_audit:
             negative_details.append(
@@ -409,7 +418,7 @@ def _evaluate(
                     "case_id": case["case_id"],
                     "kind": "negative",
                     "unexpected_match": unexpected,
-                    "record_count": len(records),
+                    "record_count": len(spans),
                 }
             )
 
@@ -477,6 +486,12 @@ def _validate_options(options: EnronConformanceOptions) -> None:
     ):
         if isinstance(limit, bool) or not isinstance(limit, int) or limit <= 0:
             raise EnronConformanceError("Conformance resource limits must be positive integers.")
+    batch_cases = options.scan_batch_cases
+    if isinstance(batch_cases, bool) or not isinstance(batch_cases, int) or batch_cases <= 0:
+        raise EnronConformanceError("Conformance scan batch size must be a positive integer.")
+    threads = options.scan_threads
+    if isinstance(threads, bool) or not isinstance(threads, int) or not 1 <= threads <= MAX_SCAN_THREADS:
+        raise EnronConformanceError(f"Conformance scan threads must be between 1 and {MAX_SCAN_THREADS}.")
 
 
 def _active_pattern_catalog(compiled: CompiledBank) -> dict[tuple[str, str, str], _ActivePattern]:
@@ -712,33 +727,76 @@ def _validate_case_set(positive: Sequence[Mapping[str, Any]], negative: Sequence
         raise EnronConformanceError("Conformance cases require a boundary-negative adversarial case.")
 
 
-def _scan_case(compiled: CompiledBank, text: str, options: EnronConformanceOptions) -> list[dict[str, Any]]:
+def _scan_cases(
+    compiled: CompiledBank,
+    cases: Sequence[Mapping[str, Any]],
+    options: EnronConformanceOptions,
+) -> Iterator[list[_CaseSpan]]:
+    """Yield each case's byte spans, scanning bounded chunks in one native call."""
+
+    batch: list[str] = []
+    batch_chars = 0
+    for case in cases:
+        text = str(case["text"])
+        if batch and (len(batch) >= options.scan_batch_cases or batch_chars + len(text) > _SCAN_BATCH_TEXT_CHARS):
+            yield from _scan_case_batch(compiled, batch, options)
+            batch, batch_chars = [], 0
+        batch.append(text)
+        batch_chars += len(text)
+    if batch:
+        yield from _scan_case_batch(compiled, batch, options)
+
+
+def _scan_case_batch(
+    compiled: CompiledBank,
+    texts: Sequence[str],
+    options: EnronConformanceOptions,
+) -> list[list[_CaseSpan]]:
+    # The native batch reports the first failing case, so errors match a
+    # case-by-case scan. Spans carry UTF-8 byte offsets by construction.
     try:
-        records = compiled.finditer(text, max_matches=options.max_matches_per_case)
+        batch = compiled.finditer_spans_batch(
+            texts,
+            max_matches=options.max_matches_per_case,
+            threads=options.scan_threads,
+        )
     except MemoryError:
         raise EnronConformanceError("Conformance scan exceeded the per-case match limit.") from None
     except Exception:
         raise EnronConformanceError("Conformance case could not be scanned safely.") from None
-    if len(records) > options.max_matches_per_case:
+    if any(len(spans) > options.max_matches_per_case for spans in batch):
         raise EnronConformanceError("Conformance scan exceeded the per-case match limit.")
-    if any(record.get("offset_unit") != "byte" for record in records):
-        raise EnronConformanceError("Conformance scan did not return UTF-8 byte offsets.")
-    return records
+    return [
+        [
+            (
+                identity.entity_id,
+                identity.name_id,
+                identity.pattern_id,
+                identity.pattern_kind,
+                identity.canonical_name,
+                start,
+                end,
+            )
+            for start, end, identity in spans
+        ]
+        for spans in batch
+    ]
 
 
 def _classify_expected(
-    expected: Sequence[Mapping[str, Any]], actual: Sequence[Mapping[str, Any]]
+    expected: Sequence[Mapping[str, Any]], actual: Sequence[_CaseSpan]
 ) -> list[Literal["correct", "missed", "wrong_canonical"]]:
     statuses: list[Literal["correct", "missed", "wrong_canonical"] | None] = [None] * len(expected)
+    expected_spans = [_expected_case_span(item) for item in expected]
     unused = set(range(len(actual)))
-    exact_index: dict[tuple[Any, ...], deque[int]] = {}
-    for actual_index, record in enumerate(actual):
-        exact_index.setdefault(_exact_record_key(record), deque()).append(actual_index)
+    exact_index: dict[_CaseSpan, deque[int]] = {}
+    for actual_index, span in enumerate(actual):
+        exact_index.setdefault(span, deque()).append(actual_index)
 
     # Reserve all exact matches first so a wrong-canonical candidate cannot
     # consume a prediction that exactly satisfies another overlapping target.
-    for expected_index, item in enumerate(expected):
-        candidates = exact_index.get(_exact_record_key(item))
+    for expected_index, expected_span in enumerate(expected_spans):
+        candidates = exact_index.get(expected_span)
         while candidates and candidates[0] not in unused:
             candidates.popleft()
         if candidates:
@@ -748,9 +806,9 @@ def _classify_expected(
 
     wrong_indices: dict[tuple[Any, ...], dict[tuple[Any, Any], deque[int]]] = {}
     for actual_index in sorted(unused):
-        record = actual[actual_index]
-        occurrence_key = _occurrence_record_key(record)
-        identity = (record.get("name_id"), record.get("canonical_name"))
+        span = actual[actual_index]
+        occurrence_key = _occurrence_key(span)
+        identity = (span[1], span[4])
         wrong_indices.setdefault(occurrence_key, {}).setdefault(identity, deque()).append(actual_index)
     wrong_heaps: dict[tuple[Any, ...], list[tuple[int, tuple[Any, Any]]]] = {
         occurrence_key: [(indices[0], identity) for identity, indices in by_identity.items()]
@@ -759,13 +817,13 @@ def _classify_expected(
     for heap in wrong_heaps.values():
         heapq.heapify(heap)
 
-    for expected_index, item in enumerate(expected):
+    for expected_index, expected_span in enumerate(expected_spans):
         if statuses[expected_index] is not None:
             continue
-        occurrence_key = _occurrence_record_key(item)
+        occurrence_key = _occurrence_key(expected_span)
         by_identity = wrong_indices.get(occurrence_key, {})
         heap = wrong_heaps.get(occurrence_key, [])
-        expected_identity = (item.get("name_id"), item.get("canonical_name"))
+        expected_identity = (expected_span[1], expected_span[4])
         held_expected: tuple[int, tuple[Any, Any]] | None = None
         wrong_match_index: int | None = None
         while heap:
@@ -790,24 +848,20 @@ def _classify_expected(
     return cast(list[Literal["correct", "missed", "wrong_canonical"]], statuses)
 
 
-def _exact_record_key(value: Mapping[str, Any]) -> tuple[Any, ...]:
-    return tuple(
-        value.get(field)
-        for field in (
-            "entity_id",
-            "name_id",
-            "pattern_id",
-            "pattern_kind",
-            "canonical_name",
-            "string",
-            "start",
-            "end",
-        )
+def _expected_case_span(item: Mapping[str, Any]) -> _CaseSpan:
+    return (
+        item["entity_id"],
+        item["name_id"],
+        item["pattern_id"],
+        item["pattern_kind"],
+        item["canonical_name"],
+        item["start"],
+        item["end"],
     )
 
 
-def _occurrence_record_key(value: Mapping[str, Any]) -> tuple[Any, ...]:
-    return tuple(value.get(field) for field in ("entity_id", "string", "start", "end"))
+def _occurrence_key(span: _CaseSpan) -> tuple[str, int, int]:
+    return (span[0], span[5], span[6])
 
 
 def _expected_sort_key(item: Mapping[str, Any]) -> tuple[Any, ...]:
@@ -5,6 +5,7 @@ import heapq
 import importlib
 import json
 import math
+import multiprocessing
 import os
 import platform
 import re
@@ -16,9 +17,11 @@ import time
 import unicodedata
 import zlib
 from collections import Counter, deque
-from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Collection, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import ExitStack, contextmanager, nullcontext
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from dataclasses import field as dataclass_field
 from datetime import datetime, timezone
 from email.errors import HeaderParseError
@@ -38,6 +41,8 @@ from .enron_cleaning import (
     GROUPING_TEXT_POLICY_SHA256,
     GROUPING_TEXT_POLICY_VERSION,
     EnronCleaningError,
+    _filter_grouping_characters_scalar,
+    _normalize_grouping_text,
     clean_email_body,
     clean_subject,
     normalize_grouping_text,
@@ -54,6 +59,11 @@ from .enron_private_io import (
     open_private_directory_input,
 )
 
+try:  # pragma: no cover - import availability depends on the optional NumPy install.
+    _numpy: Any = importlib.import_module("numpy")
+except ImportError:  # pragma: no cover - exercised when NumPy is not installed.
+    _numpy = None
+
 PREPARED_RECORD_SCHEMA_VERSION = "nerb.enron_prepared_record.v2"
 PROFILE_SCHEMA_VERSION = "nerb.enron_preparation_profile.v2"
 RUN_MANIFEST_SCHEMA_VERSION = "nerb.enron_preparation_manifest.v2"
@@ -80,6 +90,8 @@ HARD_MAX_SUBJECT_CHARS = 65_536
 HARD_MAX_SUBJECT_BYTES = 256 * 1024
 HARD_MAX_RECIPIENTS_PER_FIELD = 8_192
 HARD_MAX_PREPARED_LINE_BYTES = 384 * 1024 * 1024
+DEFAULT_PREPARATION_WORKERS = 1
+HARD_MAX_PREPARATION_WORKERS = 64
 
 _PREPARED_FILENAME = "prepared.jsonl"
 _REJECTIONS_FILENAME = "rejections.jsonl"
@@ -117,6 +129,10 @@ _SIMHASH_COUNTER_MASK = (1 << _SIMHASH_COUNTER_BITS) - 1
 _SIMHASH_BYTE_EXPANSIONS = tuple(
     sum(((byte >> bit) & 1) << (bit * _SIMHASH_COUNTER_BITS) for bit in range(8)) for byte in range(256)
 )
+_NEAR_SHINGLE_HASH_PREFIX = hashlib.sha256(b"nerb/enron/near-shingle/v2\0")
+_NEAR_DUPLICATE_CALIBRATION_VIEWS = 64
+_PREPARATION_BATCH_ROWS = 32
+_PREPARATION_BATCHES_PER_WORKER = 4
 _DATE_STATUSES = frozenset({"valid", "out_of_range", "missing", "invalid", "ambiguous_timezone"})
 _ALLOWED_TRANSFORM_COUNTERS = frozenset(CLEANING_COUNTER_NAMES) | frozenset(
     {f"subject_{name}" for name in CLEANING_COUNTER_NAMES}
@@ -258,6 +274,7 @@ class EnronPreparationOptions:
     max_subject_chars: int = DEFAULT_MAX_SUBJECT_CHARS
     max_subject_bytes: int = DEFAULT_MAX_SUBJECT_BYTES
     max_recipients_per_field: int = DEFAULT_MAX_RECIPIENTS_PER_FIELD
+    workers: int = DEFAULT_PREPARATION_WORKERS
     allow_unignored_output: bool = False
     progress_callback: Callable[[int], None] | None = None
     activity_callback: Callable[[], None] | None = None
@@ -375,6 +392,61 @@ class _ActivityReporter:
             raise EnronPreparationError("Preparation activity callback failed.") from None
 
 
+@dataclass(slots=True)
+class _NearDuplicateProfile:
+    """Time near-duplicate features for the run summary without changing any prepared artifact.
+
+    The first views are also computed by the reference implementation, which both measures the batched speedup on
+    real rows and fails closed if the two implementations ever disagree.
+    """
+
+    views: int = 0
+    seconds: float = 0.0
+    calibration_views: int = 0
+    calibration_seconds: float = 0.0
+    reference_seconds: float = 0.0
+
+    def features(self, text: str) -> dict[str, Any]:
+        started = time.perf_counter()
+        features = _near_duplicate_features(text)
+        elapsed = time.perf_counter() - started
+        self.views += 1
+        self.seconds += elapsed
+        if self.calibration_views < _NEAR_DUPLICATE_CALIBRATION_VIEWS:
+            started = time.perf_counter()
+            reference = _near_duplicate_features_reference(text)
+            self.reference_seconds += time.perf_counter() - started
+            self.calibration_seconds += elapsed
+            self.calibration_views += 1
+            if reference != features:
+                raise EnronPreparationError("Batched near-duplicate features diverged from the reference.")
+        return features
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "backend": "python" if _numpy is None else "numpy",
+            "views": self.views,
+            "seconds": round(self.seconds, 6),
+            "calibration": {
+                "views": self.calibration_views,
+                "reference_seconds": round(self.reference_seconds, 6),
+                "batched_seconds": round(self.calibration_seconds, 6),
+                "speedup": (
+                    round(self.reference_seconds / self.calibration_seconds, 3)
+                    if self.calibration_seconds > 0
+                    else None
+                ),
+            },
+        }
+
+    def merge(self, other: _NearDuplicateProfile) -> None:
+        self.views += other.views
+        self.seconds += other.seconds
+        self.calibration_views += other.calibration_views
+        self.calibration_seconds += other.calibration_seconds
+        self.reference_seconds += other.reference_seconds
+
+
 class _DuplicateJsonKey(ValueError):
     pass
 
@@ -387,6 +459,7 @@ def prepare_enron_source(options: EnronPreparationOptions) -> dict[str, Any]:
     """Prepare a pinned Enron-like source into a deterministic private run."""
     _validate_options(options)
     activity = _ActivityReporter(options.activity_callback)
+    near_duplicate_profile = _NearDuplicateProfile()
     implementation_sha256 = _implementation_sha256()
     runtime_provenance = {
         "python_implementation": platform.python_implementation(),
@@ -405,7 +478,13 @@ def prepare_enron_source(options: EnronPreparationOptions) -> dict[str, Any]:
             try:
                 source = _source_context(options)
                 activity.boundary()
-                ingest = _ingest_source(connection, source.events, options, activity_reporter=activity)
+                ingest = _ingest_source(
+                    connection,
+                    source.events,
+                    options,
+                    activity_reporter=activity,
+                    near_duplicate_profile=near_duplicate_profile,
+                )
                 activity.boundary()
                 with run.open_text(_PREPARED_FILENAME) as prepared_file:
                     prepared_descriptor, view_descriptors, aggregates = _write_prepared_records(
@@ -483,6 +562,8 @@ def prepare_enron_source(options: EnronPreparationOptions) -> dict[str, Any]:
         "rejection_artifact_sha256": rejection_descriptor["sha256"],
         "manifest_sha256": manifest_sha256,
         "elapsed_seconds": round(time.perf_counter() - started, 6),
+        "workers": options.workers,
+        "near_duplicate_features": near_duplicate_profile.report(),
     }
 
 
@@ -900,6 +981,12 @@ def _validate_options(options: EnronPreparationOptions) -> None:
     for name, maximum in hard_limits.items():
         if getattr(options, name) > maximum:
             raise EnronPreparationError(f"{name} exceeds the supported safety limit.")
+    if (
+        isinstance(options.workers, bool)
+        or not isinstance(options.workers, int)
+        or not 1 <= options.workers <= HARD_MAX_PREPARATION_WORKERS
+    ):
+        raise EnronPreparationError(f"workers must be an integer from 1 to {HARD_MAX_PREPARATION_WORKERS}.")
 
 
 def _source_context(options: EnronPreparationOptions) -> _SourceContext:
@@ -1016,8 +1103,64 @@ def _ingest_source(
     options: EnronPreparationOptions,
     *,
     activity_reporter: _ActivityReporter | None = None,
+    near_duplicate_profile: _NearDuplicateProfile | None = None,
 ) -> dict[str, Any]:
     counters: Counter[str] = Counter()
+    input_records = 0
+    entries = _ingest_entries(events, options, activity_reporter)
+    if options.workers == 1:
+        for entry in entries:
+            _commit_ingest_entry(
+                connection,
+                entry,
+                options,
+                counters,
+                lambda pending: _prepare_ingest_outcome(
+                    pending,
+                    options,
+                    near_duplicate_profile=near_duplicate_profile,
+                ),
+            )
+            input_records = entry.ordinal
+    else:
+        with _ParallelRowPreparation(connection, options, counters, near_duplicate_profile) as preparation:
+            for entry in entries:
+                preparation.submit(entry)
+            input_records = preparation.finish()
+    if options.progress_callback is not None and input_records > 0 and input_records % PROGRESS_RECORD_INTERVAL != 0:
+        options.progress_callback(input_records)
+    connection.commit()
+    return {
+        "input_records": input_records,
+        "ingestion_counters": dict(sorted(counters.items())),
+        "source_multiset_sha256": _source_multiset_hash(connection, activity_reporter=activity_reporter),
+    }
+
+
+@dataclass(slots=True)
+class _IngestEntry:
+    ordinal: int
+    source_digest: str
+    rejection_code: str | None = None
+    validated: _ValidatedRow | None = None
+    source_bytes: bytes = b""
+    source_sha256: str = ""
+    batch: _PreparationBatch | None = None
+    batch_index: int = 0
+
+
+@dataclass(slots=True)
+class _PreparationBatch:
+    rows: list[tuple[_ValidatedRow, str]]
+    future: Future[tuple[list[_PreparedUnique | str], int, _NearDuplicateProfile]] | None = None
+    outcomes: list[_PreparedUnique | str] | None = None
+
+
+def _ingest_entries(
+    events: Iterable[_InputEvent],
+    options: EnronPreparationOptions,
+    activity_reporter: _ActivityReporter | None,
+) -> Iterator[_IngestEntry]:
     input_records = 0
     event_iterator = iter(events)
     while options.max_rows is None or input_records < options.max_rows:
@@ -1029,103 +1172,267 @@ def _ingest_source(
         if activity_reporter is not None:
             activity_reporter.worked()
         if event.error_code is not None:
-            counters[event.error_code] += 1
-            _record_source_item(connection, event.source_digest)
-            _record_rejection(connection, event.source_digest, event.error_code)
-            _report_ingest_progress(options, input_records)
+            yield _IngestEntry(input_records, event.source_digest, rejection_code=event.error_code)
             continue
         assert event.row is not None
         validated, validation_error = _validate_source_row(event.row)
         if validated is None:
-            counters[validation_error or "invalid_source_schema"] += 1
-            digest = _source_mapping_digest(event.row)
-            _record_source_item(connection, digest)
-            _record_rejection(connection, digest, validation_error or "invalid_source_schema")
-            _report_ingest_progress(options, input_records)
+            yield _IngestEntry(
+                input_records,
+                _source_mapping_digest(event.row),
+                rejection_code=validation_error or "invalid_source_schema",
+            )
             continue
         source_bytes = _canonical_source_bytes(validated.source_projection)
         source_sha256 = _domain_hash("nerb/enron/source-record/v2", source_bytes)
-        source_digest = "sha256:" + source_sha256
-        _record_source_item(connection, source_digest)
-        existing = connection.execute(
-            "SELECT source_bytes, source_sha512, occurrence_count FROM records WHERE source_sha256 = ?",
-            (source_digest,),
-        ).fetchone()
-        if existing is not None:
-            source_sha512 = hashlib.sha512(source_bytes).digest()
-            if int(existing[0]) != len(source_bytes) or bytes(existing[1]) != source_sha512:
-                raise EnronPreparationError("A source-record digest collision was detected.")
-            connection.execute(
-                "UPDATE records SET occurrence_count = occurrence_count + 1 WHERE source_sha256 = ?",
-                (source_digest,),
-            )
-            counters["duplicate_source_rows"] += 1
-            _report_ingest_progress(options, input_records)
-            continue
+        yield _IngestEntry(
+            input_records,
+            "sha256:" + source_sha256,
+            validated=validated,
+            source_bytes=source_bytes,
+            source_sha256=source_sha256,
+        )
 
-        try:
-            prepared = _prepare_unique_row(validated, source_digest, options)
-        except EnronCleaningError as exc:
-            reason = getattr(exc, "code", "cleaning_error")
-            if not isinstance(reason, str) or not re.fullmatch(r"[a-z0-9_]{1,64}", reason):
-                reason = "cleaning_error"
-            body_truncated, subject_truncated = _preclean_truncation_flags(validated, options)
-            counters[f"cleaning_rejected_{reason}"] += 1
-            if body_truncated:
-                counters["body_truncated_before_rejection"] += 1
-            if subject_truncated:
-                counters["subject_truncated_before_rejection"] += 1
-            _record_rejection(
-                connection,
-                source_digest,
-                f"cleaning_{reason}",
-                body_truncated=body_truncated,
-                subject_truncated=subject_truncated,
-            )
-            _report_ingest_progress(options, input_records)
-            continue
-        document_id = _document_id(options.dataset_id, options.dataset_revision, source_sha256)
-        payload = dict(prepared.payload)
-        payload["document_id"] = document_id
-        payload["source"] = {
-            **dict(payload["source"]),
-            "source_record_sha256": source_digest,
-            "identical_occurrence_count": 1,
-        }
+
+def _commit_ingest_entry(
+    connection: sqlite3.Connection,
+    entry: _IngestEntry,
+    options: EnronPreparationOptions,
+    counters: Counter[str],
+    prepare: Callable[[_IngestEntry], _PreparedUnique | str],
+) -> None:
+    source_digest = entry.source_digest
+    _record_source_item(connection, source_digest)
+    if entry.rejection_code is not None:
+        counters[entry.rejection_code] += 1
+        _record_rejection(connection, source_digest, entry.rejection_code)
+        _report_ingest_progress(options, entry.ordinal)
+        return
+    assert entry.validated is not None
+    source_bytes = entry.source_bytes
+    existing = connection.execute(
+        "SELECT source_bytes, source_sha512, occurrence_count FROM records WHERE source_sha256 = ?",
+        (source_digest,),
+    ).fetchone()
+    if existing is not None:
+        source_sha512 = hashlib.sha512(source_bytes).digest()
+        if int(existing[0]) != len(source_bytes) or bytes(existing[1]) != source_sha512:
+            raise EnronPreparationError("A source-record digest collision was detected.")
         connection.execute(
-            """
-            INSERT INTO records (
-                document_id, source_sha256, source_bytes, source_sha512, payload_json_zlib,
-                occurrence_count,
-                date_utc, exact_content_sha256, message_id_sha256, thread_subject_sha256,
-                current_near_duplicate_available, full_near_duplicate_available, mailbox_owner_available
-            ) VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                document_id,
-                source_digest,
-                len(source_bytes),
-                hashlib.sha512(source_bytes).digest(),
-                zlib.compress(_canonical_json(payload).encode("utf-8"), level=1),
-                prepared.date_utc,
-                prepared.exact_content_sha256,
-                prepared.message_id_sha256,
-                prepared.thread_subject_sha256,
-                int(prepared.current_near_duplicate_available),
-                int(prepared.full_near_duplicate_available),
-                int(prepared.mailbox_owner_available),
-            ),
+            "UPDATE records SET occurrence_count = occurrence_count + 1 WHERE source_sha256 = ?",
+            (source_digest,),
         )
-        counters["accepted_unique_rows"] += 1
-        _report_ingest_progress(options, input_records)
-    if options.progress_callback is not None and input_records > 0 and input_records % PROGRESS_RECORD_INTERVAL != 0:
-        options.progress_callback(input_records)
-    connection.commit()
-    return {
-        "input_records": input_records,
-        "ingestion_counters": dict(sorted(counters.items())),
-        "source_multiset_sha256": _source_multiset_hash(connection, activity_reporter=activity_reporter),
+        counters["duplicate_source_rows"] += 1
+        _report_ingest_progress(options, entry.ordinal)
+        return
+
+    prepared = prepare(entry)
+    if isinstance(prepared, str):
+        body_truncated, subject_truncated = _preclean_truncation_flags(entry.validated, options)
+        counters[f"cleaning_rejected_{prepared}"] += 1
+        if body_truncated:
+            counters["body_truncated_before_rejection"] += 1
+        if subject_truncated:
+            counters["subject_truncated_before_rejection"] += 1
+        _record_rejection(
+            connection,
+            source_digest,
+            f"cleaning_{prepared}",
+            body_truncated=body_truncated,
+            subject_truncated=subject_truncated,
+        )
+        _report_ingest_progress(options, entry.ordinal)
+        return
+    document_id = _document_id(options.dataset_id, options.dataset_revision, entry.source_sha256)
+    payload = dict(prepared.payload)
+    payload["document_id"] = document_id
+    payload["source"] = {
+        **dict(payload["source"]),
+        "source_record_sha256": source_digest,
+        "identical_occurrence_count": 1,
     }
+    connection.execute(
+        """
+        INSERT INTO records (
+            document_id, source_sha256, source_bytes, source_sha512, payload_json_zlib,
+            occurrence_count,
+            date_utc, exact_content_sha256, message_id_sha256, thread_subject_sha256,
+            current_near_duplicate_available, full_near_duplicate_available, mailbox_owner_available
+        ) VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            document_id,
+            source_digest,
+            len(source_bytes),
+            hashlib.sha512(source_bytes).digest(),
+            zlib.compress(_canonical_json(payload).encode("utf-8"), level=1),
+            prepared.date_utc,
+            prepared.exact_content_sha256,
+            prepared.message_id_sha256,
+            prepared.thread_subject_sha256,
+            int(prepared.current_near_duplicate_available),
+            int(prepared.full_near_duplicate_available),
+            int(prepared.mailbox_owner_available),
+        ),
+    )
+    counters["accepted_unique_rows"] += 1
+    _report_ingest_progress(options, entry.ordinal)
+
+
+def _prepare_ingest_outcome(
+    entry: _IngestEntry,
+    options: EnronPreparationOptions,
+    *,
+    near_duplicate_profile: _NearDuplicateProfile | None = None,
+) -> _PreparedUnique | str:
+    assert entry.validated is not None
+    return _prepare_row_outcome(
+        entry.validated,
+        entry.source_digest,
+        options,
+        near_duplicate_profile=near_duplicate_profile,
+    )
+
+
+def _prepare_row_outcome(
+    row: _ValidatedRow,
+    source_digest: str,
+    options: EnronPreparationOptions,
+    *,
+    near_duplicate_profile: _NearDuplicateProfile | None = None,
+) -> _PreparedUnique | str:
+    """Return the prepared row, or its bounded cleaning rejection reason."""
+    try:
+        return _prepare_unique_row(row, source_digest, options, near_duplicate_profile=near_duplicate_profile)
+    except EnronCleaningError as exc:
+        reason = getattr(exc, "code", "cleaning_error")
+        if not isinstance(reason, str) or not re.fullmatch(r"[a-z0-9_]{1,64}", reason):
+            reason = "cleaning_error"
+        return reason
+
+
+class _ParallelRowPreparation:
+    """Clean unique rows in worker processes while the spool writer commits them in source order.
+
+    Rows are cleaned in batches, but every spool write still happens here, in input order, exactly as the serial loop
+    would make it. A row that duplicates one still in flight waits for that first outcome instead of being cleaned
+    twice. The writer stops reading the source once a bounded number of batches or rows are pending, so a slow spool
+    applies back-pressure to the reader instead of queuing the corpus in memory.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        options: EnronPreparationOptions,
+        counters: Counter[str],
+        near_duplicate_profile: _NearDuplicateProfile | None,
+    ) -> None:
+        self._connection = connection
+        self._options = options
+        self._counters = counters
+        self._near_duplicate_profile = near_duplicate_profile
+        self._max_batches = options.workers * _PREPARATION_BATCHES_PER_WORKER
+        self._max_pending = self._max_batches * _PREPARATION_BATCH_ROWS
+        self._pending: deque[_IngestEntry] = deque()
+        self._submitted: deque[_PreparationBatch] = deque()
+        self._in_flight: dict[str, _IngestEntry] = {}
+        self._batch = _PreparationBatch([])
+        self._worker_profiles: dict[int, _NearDuplicateProfile] = {}
+        self._committed = 0
+        worker_options = replace(options, progress_callback=None, activity_callback=None, cleanup_successor=None)
+        self._executor = ProcessPoolExecutor(
+            max_workers=options.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_preparation_worker,
+            initargs=(worker_options,),
+        )
+
+    def __enter__(self) -> _ParallelRowPreparation:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def submit(self, entry: _IngestEntry) -> None:
+        if entry.validated is not None:
+            first = self._in_flight.get(entry.source_digest)
+            if first is not None:
+                entry.batch, entry.batch_index = first.batch, first.batch_index
+            elif not self._spooled(entry.source_digest):
+                entry.batch, entry.batch_index = self._batch, len(self._batch.rows)
+                self._batch.rows.append((entry.validated, entry.source_digest))
+                self._in_flight[entry.source_digest] = entry
+                if len(self._batch.rows) >= _PREPARATION_BATCH_ROWS:
+                    self._flush()
+        self._pending.append(entry)
+        while len(self._pending) > self._max_pending or len(self._submitted) > self._max_batches:
+            self._commit_oldest()
+
+    def finish(self) -> int:
+        while self._pending:
+            self._commit_oldest()
+        if self._near_duplicate_profile is not None:
+            for profile in self._worker_profiles.values():
+                self._near_duplicate_profile.merge(profile)
+        return self._committed
+
+    def _spooled(self, source_digest: str) -> bool:
+        row = self._connection.execute(
+            "SELECT 1 FROM records WHERE source_sha256 = ?",
+            (source_digest,),
+        ).fetchone()
+        return row is not None
+
+    def _flush(self) -> None:
+        batch = self._batch
+        batch.future = self._executor.submit(_prepare_worker_batch, batch.rows)
+        self._submitted.append(batch)
+        self._batch = _PreparationBatch([])
+
+    def _commit_oldest(self) -> None:
+        entry = self._pending.popleft()
+        if entry.batch is not None and entry.batch.future is None:
+            self._flush()
+        _commit_ingest_entry(self._connection, entry, self._options, self._counters, self._outcome)
+        if self._in_flight.get(entry.source_digest) is entry:
+            del self._in_flight[entry.source_digest]
+        self._committed = entry.ordinal
+
+    def _outcome(self, entry: _IngestEntry) -> _PreparedUnique | str:
+        batch = entry.batch
+        assert batch is not None and batch.future is not None
+        if batch.outcomes is None:
+            try:
+                outcomes, worker_id, profile = batch.future.result()
+            except BrokenProcessPool:
+                raise EnronPreparationError("A preparation worker exited unexpectedly.") from None
+            batch.outcomes = outcomes
+            batch.rows = []
+            self._worker_profiles[worker_id] = profile
+            while self._submitted and self._submitted[0].outcomes is not None:
+                self._submitted.popleft()
+        return batch.outcomes[entry.batch_index]
+
+
+_WORKER_OPTIONS: EnronPreparationOptions | None = None
+_WORKER_NEAR_DUPLICATE_PROFILE = _NearDuplicateProfile()
+
+
+def _initialize_preparation_worker(options: EnronPreparationOptions) -> None:
+    global _WORKER_OPTIONS
+    _WORKER_OPTIONS = options
+
+
+def _prepare_worker_batch(
+    rows: list[tuple[_ValidatedRow, str]],
+) -> tuple[list[_PreparedUnique | str], int, _NearDuplicateProfile]:
+    options = _WORKER_OPTIONS
+    assert options is not None
+    outcomes = [
+        _prepare_row_outcome(row, source_digest, options, near_duplicate_profile=_WORKER_NEAR_DUPLICATE_PROFILE)
+        for row, source_digest in rows
+    ]
+    return outcomes, os.getpid(), _WORKER_NEAR_DUPLICATE_PROFILE
 
 
 def _report_ingest_progress(options: EnronPreparationOptions, input_records: int) -> None:
@@ -1215,6 +1522,8 @@ def _prepare_unique_row(
     row: _ValidatedRow,
     source_sha256: str,
     options: EnronPreparationOptions,
+    *,
+    near_duplicate_profile: _NearDuplicateProfile | None = None,
 ) -> _PreparedUnique:
     stats: Counter[str] = Counter()
     decoded_subject, subject_decode_stats = _decode_header_text_with_audit(row.subject)
@@ -1273,11 +1582,12 @@ def _prepare_unique_row(
     if embedded_message_ids_truncated:
         stats["embedded_message_ids_truncated"] += 1
     current_near_text = current_body_core or current_body
-    current_near_duplicate = _near_duplicate_features(current_near_text)
+    near_duplicate_features = (
+        _near_duplicate_features if near_duplicate_profile is None else near_duplicate_profile.features
+    )
+    current_near_duplicate = near_duplicate_features(current_near_text)
     full_near_duplicate = (
-        current_near_duplicate
-        if full_visible_body == current_near_text
-        else _near_duplicate_features(full_visible_body)
+        current_near_duplicate if full_visible_body == current_near_text else near_duplicate_features(full_visible_body)
     )
 
     view_metadata = {
@@ -2369,7 +2679,16 @@ def _embedded_message_id_features(text: str) -> tuple[list[str], bool]:
 
 
 def _near_duplicate_features(text: str) -> dict[str, Any]:
-    normalized = normalize_grouping_text(text)
+    tokens = _TOKEN_RE.findall(normalize_grouping_text(text))
+    if not tokens:
+        return _empty_near_duplicate_features()
+    return _near_duplicate_payload(len(tokens), _near_duplicate_shingle_hashes(tokens))
+
+
+def _near_duplicate_features_reference(text: str) -> dict[str, Any]:
+    """Reference streaming implementation used to verify and calibrate the batched near-duplicate features."""
+
+    normalized = _normalize_grouping_text(text, _filter_grouping_characters_scalar)
     window: deque[str] = deque(maxlen=3)
     selected: set[int] = set()
     largest_first: list[int] = []
@@ -2390,16 +2709,54 @@ def _near_duplicate_features(text: str) -> dict[str, Any]:
             selected.remove(removed)
             selected.add(shingle_hash)
     if not token_count:
-        return {
-            "policy_sha256": GROUPING_POLICY_SHA256,
-            "token_count": 0,
-            "shingle_count": 0,
-            "simhash64": None,
-            "band_sha256s": [],
-        }
+        return _empty_near_duplicate_features()
     if not selected:
         selected.add(_hash64("near-shingle", "\x1f".join(window)))
-    signature = _simhash64_majority(selected)
+    return _near_duplicate_payload(token_count, selected, majority=_simhash64_majority_scalar)
+
+
+def _near_duplicate_shingle_hashes(tokens: Sequence[str]) -> Collection[int]:
+    """Hash each distinct 3-token shingle once and keep the 4,096 smallest hashes."""
+
+    if len(tokens) < 3:
+        return [_near_shingle_hash("\x1f".join(tokens))]
+    new_digest = _NEAR_SHINGLE_HASH_PREFIX.copy
+    hashes: set[int] = set()
+    for shingle in {"\x1f".join(shingle) for shingle in zip(tokens, tokens[1:], tokens[2:])}:
+        digest = new_digest()
+        digest.update(shingle.encode())
+        hashes.add(int.from_bytes(digest.digest()[:8], "big"))
+    if len(hashes) <= 4096:
+        return list(hashes)
+    if _numpy is None:
+        return heapq.nsmallest(4096, hashes)
+    array = _numpy.fromiter(hashes, dtype="<u8", count=len(hashes))
+    return _numpy.partition(array, 4095)[:4096]
+
+
+def _near_shingle_hash(value: str) -> int:
+    digest = _NEAR_SHINGLE_HASH_PREFIX.copy()
+    digest.update(value.encode())
+    return int.from_bytes(digest.digest()[:8], "big")
+
+
+def _empty_near_duplicate_features() -> dict[str, Any]:
+    return {
+        "policy_sha256": GROUPING_POLICY_SHA256,
+        "token_count": 0,
+        "shingle_count": 0,
+        "simhash64": None,
+        "band_sha256s": [],
+    }
+
+
+def _near_duplicate_payload(
+    token_count: int,
+    selected: Collection[int],
+    *,
+    majority: Callable[[Collection[int]], int] | None = None,
+) -> dict[str, Any]:
+    signature = (majority or _simhash64_majority)(selected)
     simhash = f"{signature:016x}"
     bands = [
         _private_feature_hash("near-band", f"{index}:{simhash[index * 4 : (index + 1) * 4]}") for index in range(4)
@@ -2413,7 +2770,24 @@ def _near_duplicate_features(text: str) -> dict[str, Any]:
     }
 
 
-def _simhash64_majority(values: set[int]) -> int:
+def _simhash64_majority(values: Collection[int]) -> int:
+    """Return bitwise majority with ties set, bit-slicing all values at once with NumPy when it is installed."""
+
+    if _numpy is None:
+        return _simhash64_majority_scalar(values)
+    if len(values) == 0 or len(values) > 4096:
+        raise EnronPreparationError("Near-duplicate shingle inventory is invalid.")
+    array = (
+        values.astype("<u8", copy=False)
+        if isinstance(values, _numpy.ndarray)
+        else _numpy.fromiter(values, dtype="<u8", count=len(values))
+    )
+    bits = _numpy.unpackbits(array.view(_numpy.uint8).reshape(-1, 8), axis=1, bitorder="little")
+    majority = bits.sum(axis=0, dtype=_numpy.uint32) >= (len(values) + 1) // 2
+    return int.from_bytes(_numpy.packbits(majority, bitorder="little").tobytes(), "little")
+
+
+def _simhash64_majority_scalar(values: Collection[int]) -> int:
     """Return bitwise majority with ties set, using bounded bit-sliced counters."""
 
     if not values or len(values) > 4096:
@@ -4074,6 +4448,7 @@ __all__ = [
     "DEFAULT_DATASET_REVISION",
     "DEFAULT_DATASET_SPLIT",
     "DEFAULT_OUTPUT_DIR",
+    "DEFAULT_PREPARATION_WORKERS",
     "DATE_POLICY_SHA256",
     "EnronPreparationError",
     "EnronPreparationOptions",
@@ -27,7 +27,7 @@ from typing import Any, NoReturn
 
 from . import enron_contract
 from .bank import hash_bank
-from .engine import DEFAULT_MAX_SCAN_INPUT_BYTES
+from .engine import DEFAULT_MAX_SCAN_INPUT_BYTES, MAX_SCAN_THREADS
 from .engines import compile_bank, extraction_semantics_sha256
 from .enron_activity import ACTIVITY_RECORD_INTERVAL
 from .enron_contract import (
@@ -74,6 +74,8 @@ DEFAULT_MAX_QUALITY_MEMBERSHIPS_TOTAL = 5_000_000
 DEFAULT_MAX_QUALITY_SLICES = 256
 DEFAULT_MAX_QUALITY_DIAGNOSTICS = 100
 DEFAULT_MAX_QUALITY_SPOOL_BYTES = 2 * 1024**3
+DEFAULT_QUALITY_SCAN_BATCH_DOCUMENTS = 256
+_SCAN_BATCH_TEXT_CHARS = 32 * 1024 * 1024
 _METADATA_COMMITMENT_MODULUS = 1 << 512
 
 _DOCUMENT_FIELDS = frozenset({"document_id", "text", "text_view", "split_role"})
@@ -648,6 +650,7 @@ class EnronQualitySession:
         "_prediction_count",
         "_prediction_digest",
         "_result",
+        "_scan_threads",
         "_spec_by_id",
         "_specs",
         "_spool_identity",
@@ -674,6 +677,7 @@ class EnronQualitySession:
         max_memberships_total: int,
         max_spool_bytes: int,
         activity_callback: Callable[[], None] | None,
+        scan_threads: int = 1,
     ) -> None:
         self._compiled = compiled
         self._specs = specs
@@ -704,6 +708,7 @@ class EnronQualitySession:
         self._max_memberships_total = max_memberships_total
         self._max_spool_bytes = max_spool_bytes
         self._activity_callback = activity_callback
+        self._scan_threads = scan_threads
         self._diagnostics = _DiagnosticReservoir(max_diagnostics)
         self._accumulators = {spec.id: _SliceAccumulator() for spec in specs}
         self._prediction_count = 0
@@ -800,6 +805,42 @@ class EnronQualitySession:
 
         return self._consume(document, gold_spans, slice_ids, return_predictions=True)
 
+    def consume_batch(
+        self,
+        items: Sequence[tuple[Mapping[str, Any], Iterable[Mapping[str, Any]], Sequence[str]]],
+    ) -> None:
+        """Consume ``(document, gold_spans, slice_ids)`` items after one batched native scan.
+
+        The result is identical to calling ``consume`` for each item in order.
+        If the batch scan fails, the documents are rescanned one at a time so
+        the first failing document reports the same error ``consume`` would.
+        """
+
+        self._require_active()
+        for (document, gold_spans, slice_ids), spans in zip(items, self._scan_batch(items), strict=True):
+            self._consume(document, gold_spans, slice_ids, return_predictions=False, spans=spans)
+
+    def _scan_batch(
+        self,
+        items: Sequence[tuple[Mapping[str, Any], Iterable[Mapping[str, Any]], Sequence[str]]],
+    ) -> list[list[Any] | None]:
+        texts = [document.get("text") if isinstance(document, Mapping) else None for document, _gold, _slices in items]
+        positions = [index for index, text in enumerate(texts) if isinstance(text, str)]
+        scanned: list[list[Any] | None] = [None] * len(items)
+        if not positions:
+            return scanned
+        try:
+            batch = self._compiled.finditer_spans_batch(
+                [texts[index] for index in positions],
+                max_matches=self._max_predictions_per_document,
+                threads=self._scan_threads,
+            )
+        except Exception:
+            return scanned
+        for index, spans in zip(positions, batch, strict=True):
+            scanned[index] = spans
+        return scanned
+
     def _consume(
         self,
         document: Mapping[str, Any],
@@ -807,6 +848,7 @@ class EnronQualitySession:
         slice_ids: Sequence[str],
         *,
         return_predictions: bool,
+        spans: Sequence[Any] | None = None,
     ) -> tuple[dict[str, Any], ...]:
         """Implement the single scan shared by aggregate and audit callers."""
 
@@ -829,11 +871,18 @@ class EnronQualitySession:
             _validate_stream_coverage(prepared_document, prepared_gold, assigned_specs, self._specs)
             _validate_catalog_identities(prepared_gold, self._active_patterns)
             self._record_commitment_metadata(prepared_document, prepared_gold, prepared_slice_ids)
-            predictions = _scan_document(
-                self._compiled,
-                prepared_document,
-                max_predictions=self._max_predictions_per_document,
-            )
+            if spans is None:
+                predictions = _scan_document(
+                    self._compiled,
+                    prepared_document,
+                    max_predictions=self._max_predictions_per_document,
+                )
+            else:
+                predictions = _span_predictions(
+                    prepared_document,
+                    spans,
+                    max_predictions=self._max_predictions_per_document,
+                )
             self._prediction_count += len(predictions)
             if self._prediction_count > self._max_predictions_total:
                 raise EnronQualityError("Quality scan exceeded the cumulative prediction limit.")
@@ -1115,8 +1164,13 @@ def prepare_enron_quality(
     max_memberships_total: int = DEFAULT_MAX_QUALITY_MEMBERSHIPS_TOTAL,
     max_spool_bytes: int = DEFAULT_MAX_QUALITY_SPOOL_BYTES,
     activity_callback: Callable[[], None] | None = None,
+    scan_threads: int = 1,
 ) -> EnronQualitySession:
-    """Prepare one streaming quality session and compile its bank exactly once."""
+    """Prepare one streaming quality session and compile its bank exactly once.
+
+    ``scan_threads`` only sets how many native workers ``consume_batch`` uses;
+    it is not part of the execution policy.
+    """
 
     _retry_pending_spool_cleanups()
     if activity_callback is not None and not callable(activity_callback):
@@ -1142,6 +1196,8 @@ def prepare_enron_quality(
         raise EnronQualityError("Quality metadata spool limit must be at least 64 KiB.")
     if type(max_diagnostics) is not int or not 0 <= max_diagnostics <= DEFAULT_MAX_QUALITY_DIAGNOSTICS:
         raise EnronQualityError("Quality diagnostic capacity must be between zero and 100.")
+    if type(scan_threads) is not int or not 1 <= scan_threads <= MAX_SCAN_THREADS:
+        raise EnronQualityError(f"Quality scan threads must be between 1 and {MAX_SCAN_THREADS}.")
     specs = _prepare_slices(slice_specs)
     declared_unsupported = _prepare_declared_unsupported(unsupported_slice_specs, specs)
     try:
@@ -1175,6 +1231,7 @@ def prepare_enron_quality(
             max_memberships_total=max_memberships_total,
             max_spool_bytes=max_spool_bytes,
             activity_callback=activity_callback,
+            scan_threads=scan_threads,
         )
     except BaseException as exc:
         initial_control = exc if isinstance(exc, (KeyboardInterrupt, SystemExit)) else None
@@ -1214,8 +1271,12 @@ def evaluate_enron_quality(
     max_memberships_total: int = DEFAULT_MAX_QUALITY_MEMBERSHIPS_TOTAL,
     max_spool_bytes: int = DEFAULT_MAX_QUALITY_SPOOL_BYTES,
     activity_callback: Callable[[], None] | None = None,
+    scan_threads: int = 1,
 ) -> dict[str, Any]:
-    """Stream closed per-document envelopes through the sole session path."""
+    """Stream closed per-document envelopes through the sole session path.
+
+    Documents are scanned in bounded batches with ``consume_batch``.
+    """
 
     if activity_callback is not None and not callable(activity_callback):
         raise EnronQualityError("Quality activity callback must be callable when provided.")
@@ -1232,14 +1293,11 @@ def evaluate_enron_quality(
         max_memberships_total=max_memberships_total,
         max_spool_bytes=max_spool_bytes,
         activity_callback=activity_callback,
+        scan_threads=scan_threads,
     )
     with session:
         try:
-            for index, record in enumerate(records):
-                _require_closed_mapping(record, _STREAM_RECORD_FIELDS, "quality stream record", index)
-                session.consume(record["document"], record["gold_spans"], record["slice_ids"])
-                if (index + 1) % ACTIVITY_RECORD_INTERVAL == 0:
-                    _report_quality_activity(activity_callback)
+            _consume_record_stream(session, records, activity_callback)
             _report_quality_activity(activity_callback)
             result = session.finish()
             _report_quality_activity(activity_callback)
@@ -1250,6 +1308,35 @@ def evaluate_enron_quality(
             raise EnronQualityError("Quality input stream failed safely.") from None
 
 
+def _consume_record_stream(
+    session: EnronQualitySession,
+    records: Iterable[Mapping[str, Any]],
+    activity_callback: Callable[[], None] | None,
+) -> None:
+    batch: list[tuple[Mapping[str, Any], Iterable[Mapping[str, Any]], Sequence[str]]] = []
+    batch_chars = 0
+    try:
+        for index, record in enumerate(records):
+            _require_closed_mapping(record, _STREAM_RECORD_FIELDS, "quality stream record", index)
+            document = record["document"]
+            text = document.get("text") if isinstance(document, Mapping) else None
+            batch.append((document, record["gold_spans"], record["slice_ids"]))
+            batch_chars += len(text) if isinstance(text, str) else 0
+            if len(batch) >= DEFAULT_QUALITY_SCAN_BATCH_DOCUMENTS or batch_chars >= _SCAN_BATCH_TEXT_CHARS:
+                pending, batch, batch_chars = batch, [], 0
+                session.consume_batch(pending)
+            if (index + 1) % ACTIVITY_RECORD_INTERVAL == 0:
+                _report_quality_activity(activity_callback)
+    except Exception:
+        # Earlier documents are consumed first, so their errors keep
+        # precedence over a later malformed record or stream failure.
+        if batch:
+            session.consume_batch(batch)
+        raise
+    if batch:
+        session.consume_batch(batch)
+
+
 def evaluate_enron_quality_files(
     bank: Mapping[str, Any],
     *,
@@ -1261,6 +1348,7 @@ def evaluate_enron_quality_files(
     max_input_bytes: int = DEFAULT_MAX_QUALITY_INPUT_BYTES,
     max_records: int = DEFAULT_MAX_QUALITY_RECORDS,
     activity_callback: Callable[[], None] | None = None,
+    scan_threads: int = 1,
 ) -> dict[str, Any]:
     """Stream strict private JSONL envelopes through the same session path."""
 
@@ -1296,6 +1384,7 @@ def evaluate_enron_quality_files(
             unsupported_slice_specs=unsupported,
             spool_path=spool_path,
             activity_callback=activity_callback,
+            scan_threads=scan_threads,
         )
     except EnronPrivateIOError:
         raise EnronQualityError("Quality JSONL input could not be read safely.") from None
@@ -1851,7 +1940,6 @@ def _scan_document(
     *,
     max_predictions: int,
 ) -> tuple[_Prediction, ...]:
-    predictions: list[_Prediction] = []
     try:
         records = compiled.finditer(document.text, max_matches=max_predictions)
     except MemoryError:
@@ -1860,39 +1948,54 @@ def _scan_document(
         raise EnronQualityError("A private quality document could not be scanned safely.") from None
     if len(records) > max_predictions:
         raise EnronQualityError("Quality scan exceeded the per-document prediction limit.")
-    raw_offsets: set[int] = set()
+    spans: list[tuple[Any, Any, str, str, str]] = []
     for record in records:
         try:
             start = record["start"]
             end = record["end"]
         except KeyError as exc:
             raise EnronQualityError("A native prediction did not contain bounded offsets.") from exc
-        if (
-            record.get("offset_unit") != "byte"
-            or type(start) is not int
-            or type(end) is not int
-            or start < 0
-            or end <= start
-        ):
+        if record.get("offset_unit") != "byte":
+            raise EnronQualityError("A native prediction did not contain bounded offsets.")
+        spans.append((start, end, str(record["entity_id"]), str(record["name_id"]), str(record["pattern_id"])))
+    return _document_predictions(document, spans)
+
+
+def _span_predictions(
+    document: _Document,
+    spans: Sequence[Any],
+    *,
+    max_predictions: int,
+) -> tuple[_Prediction, ...]:
+    """Build predictions from ``CompiledBank.finditer_spans`` byte spans."""
+
+    if len(spans) > max_predictions:
+        raise EnronQualityError("Quality scan exceeded the per-document prediction limit.")
+    return _document_predictions(
+        document,
+        [(start, end, identity.entity_id, identity.name_id, identity.pattern_id) for start, end, identity in spans],
+    )
+
+
+def _document_predictions(
+    document: _Document,
+    spans: Sequence[tuple[Any, Any, str, str, str]],
+) -> tuple[_Prediction, ...]:
+    raw_offsets: set[int] = set()
+    for start, end, _entity_id, _name_id, _pattern_id in spans:
+        if type(start) is not int or type(end) is not int or start < 0 or end <= start:
             raise EnronQualityError("A native prediction did not contain bounded offsets.")
         raw_offsets.update((start, end))
     byte_to_scalar = _selected_byte_to_scalar_boundaries(document.text, raw_offsets)
-    for record in records:
+    predictions: list[_Prediction] = []
+    for start, end, entity_id, name_id, pattern_id in spans:
         try:
-            start = byte_to_scalar[record["start"]]
-            end = byte_to_scalar[record["end"]]
+            scalar_start = byte_to_scalar[start]
+            scalar_end = byte_to_scalar[end]
         except KeyError as exc:
             raise EnronQualityError("A native prediction did not align to Unicode scalar boundaries.") from exc
         predictions.append(
-            _Prediction(
-                document.document_id,
-                str(record["entity_id"]),
-                start,
-                end,
-                str(record["entity_id"]),
-                str(record["name_id"]),
-                str(record["pattern_id"]),
-            )
+            _Prediction(document.document_id, entity_id, scalar_start, scalar_end, entity_id, name_id, pattern_id)
         )
     return tuple(
         sorted(
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import hashlib
 import heapq
+import importlib
 import json
 import math
 import os
@@ -45,6 +46,11 @@ from .enron_private_io import (
     open_private_directory_input,
 )
 
+try:  # pragma: no cover - import availability depends on the optional NumPy install.
+    _numpy: Any = importlib.import_module("numpy")
+except ImportError:  # pragma: no cover - exercised when NumPy is not installed.
+    _numpy = None
+
 SPLIT_MANIFEST_SCHEMA_VERSION = "nerb.enron_split_manifest.v2"
 SPLIT_FREEZE_RECEIPT_SCHEMA_VERSION = "nerb.enron_split_freeze_receipt.v2"
 SPLIT_MEMBERSHIP_SCHEMA_VERSION = "nerb.enron_split_membership.v2"
@@ -65,6 +71,8 @@ PRODUCTION_MIN_REQUIRED_COHORT_RECORDS = 100
 PRODUCTION_MIN_ROLE_FRACTION = 0.05
 PRODUCTION_MAX_COMPONENT_FRACTION = 0.05
 IDENTITY_HEAD_MIN_TRAIN_GROUPS = 10
+DEFAULT_NEAR_INDEX_MEMORY_BYTES = 1024 * 1024 * 1024
+HARD_MAX_NEAR_INDEX_MEMORY_BYTES = 64 * 1024 * 1024 * 1024
 _COMMIT_MARKER = "COMMITTED"
 _COMMIT_PAYLOAD = b"nerb.enron.private-run.v2\n"
 _ROLE_NAMES = ("train", "validation", "test")
@@ -91,6 +99,10 @@ _FROZEN_TARGET_KEYS = frozenset(
 )
 _NEAR_BAND_BITS = (13, 13, 13, 13, 12)
 _NEAR_BAND_PAIRS = tuple((left, right) for left in range(5) for right in range(left + 1, 5))
+# Conservative peak-byte estimates for the in-memory band index: per-signature
+# band, key, and sort arrays, then candidate codes plus their merge copies.
+_NEAR_INDEX_BYTES_PER_SIGNATURE = 96
+_NEAR_INDEX_BYTES_PER_EMISSION = 32
 _GROUPING_TRUNCATION_COUNTERS = (
     "bcc_recipient_truncated",
     "cc_recipient_truncated",
@@ -161,6 +173,7 @@ class EnronSplitOptions:
     validation_fraction: float = 0.1
     near_hamming: int = 3
     max_near_candidate_pairs: int = 100_000_000
+    near_index_memory_bytes: int = DEFAULT_NEAR_INDEX_MEMORY_BYTES
     sample_per_role: int = 10_000
     fixture_mode: bool = False
     allow_unignored_output: bool = False
@@ -247,6 +260,7 @@ class _BuildState:
     edge_counts: Mapping[str, int]
     near_candidate_emissions: int
     near_candidate_pairs: int
+    near_index: Mapping[str, Any]
     grouping_truncated_records: int
     role_records: Mapping[str, int]
     role_groups: Mapping[str, int]
@@ -523,6 +537,12 @@ def _validate_options(options: EnronSplitOptions) -> None:
         or not 1 <= options.max_near_candidate_pairs <= 100_000_000
     ):
         raise EnronSplitError("max_near_candidate_pairs must be from 1 through 100000000.")
+    if (
+        isinstance(options.near_index_memory_bytes, bool)
+        or not isinstance(options.near_index_memory_bytes, int)
+        or not 0 <= options.near_index_memory_bytes <= HARD_MAX_NEAR_INDEX_MEMORY_BYTES
+    ):
+        raise EnronSplitError(f"near_index_memory_bytes must be from 0 through {HARD_MAX_NEAR_INDEX_MEMORY_BYTES}.")
     if (
         isinstance(options.sample_per_role, bool)
         or not isinstance(options.sample_per_role, int)
@@ -762,15 +782,6 @@ def _ingest_prepared(
         except BaseException:
             raise EnronSplitError("Split progress callback failed.") from None
     if finalize:
-        if activity_reporter is not None:
-            activity_reporter.boundary()
-        for node, signature in connection.execute(
-            "SELECT node, signature FROM near_signatures ORDER BY node, signature"
-        ):
-            if activity_reporter is not None:
-                activity_reporter.worked()
-            for pair_index, value in _near_pair_keys(str(signature)):
-                connection.execute("INSERT OR IGNORE INTO near_bands VALUES (?, ?, ?)", (pair_index, value, node))
         for table, columns in (
             ("exact_features", "feature, node"),
             ("own_message_ids", "feature, node"),
@@ -821,7 +832,7 @@ def _build_leakage_graph(
     options: EnronSplitOptions,
     *,
     activity_reporter: _ActivityReporter | None = None,
-) -> tuple[_UnionFind, Counter[str], int, int]:
+) -> tuple[_UnionFind, Counter[str], int, int, dict[str, Any]]:
     union_find = _UnionFind(records)
     edge_counts: Counter[str] = Counter()
     _union_runs(
@@ -867,9 +878,187 @@ def _build_leakage_graph(
 
     # Five disjoint 13/13/13/13/12-bit bands indexed by all ten band pairs
     # are complete for Hamming distance <= 3: at least two bands must remain
-    # unchanged. Materialize each pair-key index incrementally and enforce
-    # budgets against both raw join emissions and unique candidates. Per-node
-    # band keys are unique, so the bucket sum exactly bounds SQL join work.
+    # unchanged. Both index backends enforce budgets against raw pair-key
+    # bucket emissions and unique candidates, and yield candidates in
+    # (left, right) node order.
+    near_started = time.perf_counter()
+    signatures_by_node = _near_signatures_by_node(connection, records, activity_reporter=activity_reporter)
+    in_memory = _near_candidates_in_memory(signatures_by_node, options, activity_reporter=activity_reporter)
+    candidates: Iterator[tuple[int, int]]
+    if in_memory is None:
+        backend = "sqlite"
+        near_candidate_emissions, near_candidate_pairs = _spool_near_candidates(
+            connection,
+            records,
+            options,
+            activity_reporter=activity_reporter,
+        )
+        candidates = (
+            (int(left), int(right))
+            for left, right in connection.execute(
+                "SELECT left_node, right_node FROM near_candidates ORDER BY left_node, right_node"
+            )
+        )
+    else:
+        backend = "memory"
+        near_candidate_emissions, candidate_codes = in_memory
+        near_candidate_pairs = len(candidate_codes)
+        candidates = (
+            (code >> 32, code & 0xFFFFFFFF)
+            for first in range(0, near_candidate_pairs, ACTIVITY_RECORD_INTERVAL)
+            for code in candidate_codes[first : first + ACTIVITY_RECORD_INTERVAL].tolist()
+        )
+    for left, right in candidates:
+        if activity_reporter is not None:
+            activity_reporter.worked()
+        # SQLite builds do not consistently expose bit_count; compare the
+        # small signature inventories in Python for either candidate index.
+        left_signatures = signatures_by_node[left]
+        right_signatures = signatures_by_node[right]
+        if any((a ^ b).bit_count() <= options.near_hamming for a in left_signatures for b in right_signatures):
+            connection.execute("INSERT OR IGNORE INTO edge_provenance VALUES ('near_duplicate', ?)", (left,))
+            connection.execute("INSERT OR IGNORE INTO edge_provenance VALUES ('near_duplicate', ?)", (right,))
+            if union_find.union(left, right):
+                edge_counts["near_duplicate"] += 1
+    near_index = {
+        "backend": backend,
+        "raw_emissions": near_candidate_emissions,
+        "candidate_pairs": near_candidate_pairs,
+        "seconds": round(time.perf_counter() - near_started, 6),
+    }
+    return union_find, edge_counts, near_candidate_emissions, near_candidate_pairs, near_index
+
+
+def _near_signatures_by_node(
+    connection: sqlite3.Connection,
+    records: int,
+    *,
+    activity_reporter: _ActivityReporter | None = None,
+) -> list[tuple[int, ...]]:
+    signatures_by_node: list[tuple[int, ...]] = [()] * records
+    current_node: int | None = None
+    current_values: list[int] = []
+    for node, signature in connection.execute("SELECT node, signature FROM near_signatures ORDER BY node, signature"):
+        if activity_reporter is not None:
+            activity_reporter.worked()
+        node_int = int(node)
+        if current_node is not None and node_int != current_node:
+            signatures_by_node[current_node] = tuple(current_values)
+            current_values = []
+        current_node = node_int
+        current_values.append(int(str(signature), 16))
+    if current_node is not None:
+        signatures_by_node[current_node] = tuple(current_values)
+    return signatures_by_node
+
+
+def _near_candidates_in_memory(
+    signatures_by_node: Sequence[tuple[int, ...]],
+    options: EnronSplitOptions,
+    *,
+    activity_reporter: _ActivityReporter | None = None,
+) -> tuple[int, Any] | None:
+    """Return raw emissions and a sorted array of ``left << 32 | right`` candidate codes.
+
+    Each band pair is indexed as one sorted array of ``value << 32 | node``
+    keys, so equal values form contiguous buckets with ascending nodes. Returns
+    ``None`` when NumPy is unavailable or the estimated peak memory exceeds
+    ``options.near_index_memory_bytes``; callers then use the SQLite spool.
+    """
+
+    signature_count = sum(len(values) for values in signatures_by_node)
+    budget = options.near_index_memory_bytes
+    if _numpy is None or signature_count * _NEAR_INDEX_BYTES_PER_SIGNATURE > budget:
+        return None
+    np = _numpy
+    nodes = np.fromiter(
+        (node for node, values in enumerate(signatures_by_node) for _ in values),
+        dtype=np.uint64,
+        count=signature_count,
+    )
+    signatures = np.fromiter(
+        (value for values in signatures_by_node for value in values),
+        dtype=np.uint64,
+        count=signature_count,
+    )
+    bands = []
+    offset = 0
+    for bits in _NEAR_BAND_BITS:
+        bands.append((signatures >> np.uint64(offset)) & np.uint64((1 << bits) - 1))
+        offset += bits
+    del signatures
+
+    def pair_keys(pair_index: int) -> Any:
+        left, right = _NEAR_BAND_PAIRS[pair_index]
+        values = (bands[left] << np.uint64(_NEAR_BAND_BITS[right])) | bands[right]
+        # Unique keys drop a node's repeated value, like the spool's primary key.
+        return np.unique((values << np.uint64(32)) | nodes)
+
+    def bucket_bounds(keys: Any) -> tuple[Any, Any]:
+        values = keys >> np.uint64(32)
+        starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+        return starts, np.diff(np.append(starts, len(keys)))
+
+    near_candidate_emissions = 0
+    for pair_index in range(len(_NEAR_BAND_PAIRS)):
+        _, sizes = bucket_bounds(pair_keys(pair_index))
+        sizes = sizes[sizes > 1].astype(np.int64)
+        near_candidate_emissions += int((sizes * (sizes - 1) // 2).sum())
+        if near_candidate_emissions > options.max_near_candidate_pairs:
+            raise EnronSplitError("Near-duplicate raw-emission budget exceeded; split aborted fail-closed.")
+        if activity_reporter is not None:
+            activity_reporter.boundary()
+    estimated_bytes = (
+        signature_count * _NEAR_INDEX_BYTES_PER_SIGNATURE + near_candidate_emissions * _NEAR_INDEX_BYTES_PER_EMISSION
+    )
+    if estimated_bytes > budget:
+        return None
+
+    candidates = np.empty(0, dtype=np.uint64)
+    for pair_index in range(len(_NEAR_BAND_PAIRS)):
+        keys = pair_keys(pair_index)
+        starts, sizes = bucket_bounds(keys)
+        shared = sizes > 1
+        # Walk each shared bucket by node distance; positions leave the active
+        # set once their bucket has no node that far ahead.
+        in_shared = np.repeat(shared, sizes)
+        positions = np.flatnonzero(in_shared)
+        ends = np.repeat(starts + sizes, sizes)[in_shared]
+        bucket_nodes = keys & np.uint64(0xFFFFFFFF)
+        codes = []
+        distance = 1
+        while len(positions):
+            active = positions + distance < ends
+            positions = positions[active]
+            ends = ends[active]
+            codes.append((bucket_nodes[positions] << np.uint64(32)) | bucket_nodes[positions + distance])
+            distance += 1
+        if codes:
+            candidates = np.union1d(candidates, np.concatenate(codes))
+        if len(candidates) > options.max_near_candidate_pairs:
+            raise EnronSplitError("Near-duplicate candidate budget exceeded; split aborted fail-closed.")
+        if activity_reporter is not None:
+            activity_reporter.boundary()
+    return near_candidate_emissions, candidates
+
+
+def _spool_near_candidates(
+    connection: sqlite3.Connection,
+    records: int,
+    options: EnronSplitOptions,
+    *,
+    activity_reporter: _ActivityReporter | None = None,
+) -> tuple[int, int]:
+    """Materialize the band index and unique candidates in the disk-bounded spool."""
+
+    for node, signature in connection.execute("SELECT node, signature FROM near_signatures ORDER BY node, signature"):
+        if activity_reporter is not None:
+            activity_reporter.worked()
+        connection.executemany(
+            "INSERT OR IGNORE INTO near_bands VALUES (?, ?, ?)",
+            ((pair_index, value, node) for pair_index, value in _near_pair_keys(str(signature))),
+        )
+    # Per-node band keys are unique, so the bucket sum exactly bounds SQL join work.
     near_candidate_emissions = 0
     for (bucket_size,) in connection.execute("SELECT COUNT(*) FROM near_bands GROUP BY band, value"):
         if activity_reporter is not None:
@@ -919,36 +1108,7 @@ def _build_leakage_graph(
                 raise EnronSplitError("Near-duplicate candidate budget exceeded; split aborted fail-closed.")
             if activity_reporter is not None:
                 activity_reporter.boundary()
-    signatures_by_node: list[tuple[int, ...]] = [()] * records
-    current_node: int | None = None
-    current_values: list[int] = []
-    for node, signature in connection.execute("SELECT node, signature FROM near_signatures ORDER BY node, signature"):
-        if activity_reporter is not None:
-            activity_reporter.worked()
-        node_int = int(node)
-        if current_node is not None and node_int != current_node:
-            signatures_by_node[current_node] = tuple(current_values)
-            current_values = []
-        current_node = node_int
-        current_values.append(int(str(signature), 16))
-    if current_node is not None:
-        signatures_by_node[current_node] = tuple(current_values)
-    for left, right in connection.execute(
-        "SELECT left_node, right_node FROM near_candidates ORDER BY left_node, right_node"
-    ):
-        if activity_reporter is not None:
-            activity_reporter.worked()
-        # SQLite builds do not consistently expose bit_count; compare the
-        # small signature inventories in Python while preserving disk-bounded
-        # candidate enumeration.
-        left_signatures = signatures_by_node[int(left)]
-        right_signatures = signatures_by_node[int(right)]
-        if any((a ^ b).bit_count() <= options.near_hamming for a in left_signatures for b in right_signatures):
-            connection.execute("INSERT OR IGNORE INTO edge_provenance VALUES ('near_duplicate', ?)", (left,))
-            connection.execute("INSERT OR IGNORE INTO edge_provenance VALUES ('near_duplicate', ?)", (right,))
-            if union_find.union(int(left), int(right)):
-                edge_counts["near_duplicate"] += 1
-    return union_find, edge_counts, near_candidate_emissions, near_candidate_pairs
+    return near_candidate_emissions, near_candidate_pairs
 
 
 def _component_id(document_ids: Sequence[str]) -> str:
@@ -1492,7 +1652,7 @@ def _build_state(
     *,
     activity_reporter: _ActivityReporter | None = None,
 ) -> _BuildState:
-    union_find, edge_counts, near_candidate_emissions, near_candidate_pairs = _build_leakage_graph(
+    union_find, edge_counts, near_candidate_emissions, near_candidate_pairs, near_index = _build_leakage_graph(
         connection,
         records,
         options,
@@ -1549,6 +1709,7 @@ def _build_state(
         edge_counts=dict(sorted(edge_counts.items())),
         near_candidate_emissions=near_candidate_emissions,
         near_candidate_pairs=near_candidate_pairs,
+        near_index=near_index,
         grouping_truncated_records=grouping_truncated_records,
         role_records=dict(role_records),
         role_groups=dict(role_groups),
@@ -2199,7 +2360,7 @@ def _rebuild_preseal_state(
                 role_counts[role] = count
                 start_node += count
             observed_roles = tuple(role for role in _ROLE_NAMES for _ in range(role_counts[role]))
-            union_find, edge_counts, near_candidate_emissions, near_candidate_pairs = _build_leakage_graph(
+            union_find, edge_counts, near_candidate_emissions, near_candidate_pairs, near_index = _build_leakage_graph(
                 connection,
                 start_node,
                 options,
@@ -2251,6 +2412,7 @@ def _rebuild_preseal_state(
                 edge_counts=dict(sorted(edge_counts.items())),
                 near_candidate_emissions=near_candidate_emissions,
                 near_candidate_pairs=near_candidate_pairs,
+                near_index=near_index,
                 grouping_truncated_records=grouping_truncated_records,
                 role_records=dict(role_records),
                 role_groups=dict(role_groups),
@@ -2526,6 +2688,7 @@ def split_enron_preparation(options: EnronSplitOptions) -> dict[str, Any]:
                     activity_reporter=activity,
                 )
                 summary_groups = len(state.components)
+                summary_near_index = dict(state.near_index)
                 summary_roles = {
                     role: {"records": state.role_records[role], "groups": state.role_groups[role]}
                     for role in _ROLE_NAMES
@@ -2584,6 +2747,7 @@ def split_enron_preparation(options: EnronSplitOptions) -> dict[str, Any]:
         "records": records,
         "groups": summary_groups,
         "roles": summary_roles,
+        "near_duplicate_index": summary_near_index,
         "manifest_sha256": full_manifest_sha256,
         "policy_sha256": policy["sha256"],
     }
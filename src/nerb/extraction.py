@@ -7,8 +7,8 @@ from stat import S_ISREG
 from typing import Any
 
 # Project
-from .engines import CompiledBank, ExtractionError, compile_bank, resolve_extraction_options
-from .records import MatchRecord, record_sort_key
+from .engines import CompiledBank, ExtractionError, _OverlapGroup, compile_bank, resolve_extraction_options
+from .records import MatchRecord
 from .schema import ID_RE
 
 __all__ = [
@@ -41,17 +41,7 @@ def extract_text(
     if not isinstance(text, str):
         raise TypeError("extract_text text must be a string.")
 
-    resolved = resolve_extraction_options(options)
-    _ensure_text_limit(text, resolved.max_text_bytes)
-    compiled, cache_hit = compile_bank(bank, options=options)
-    _ensure_bank_status_extractable(compiled.bank, resolved.include_statuses)
-    records = _extract_records(compiled, text)
-    return {
-        "bank": _bank_metadata(compiled),
-        "engine": _engine_metadata(compiled, cache_hit),
-        "source": _text_source_metadata(text),
-        "records": records,
-    }
+    return _extract_checked_text(bank, text, options=options)
 
 
 def extract_file(
@@ -66,7 +56,8 @@ def extract_file(
     text, byte_count = _read_utf8_file(path, max_bytes=resolved.max_text_bytes)
     compiled, cache_hit = compile_bank(bank, options=options)
     _ensure_bank_status_extractable(compiled.bank, resolved.include_statuses)
-    records = _extract_records(compiled, text)
+    _ensure_entity_ids_known(compiled.bank, resolved.entity_ids)
+    records = _extract_records(compiled, text, resolved.entity_ids, resolved.deadline_ms)
     return {
         "bank": _bank_metadata(compiled),
         "engine": _engine_metadata(compiled, cache_hit),
@@ -122,16 +113,31 @@ def _extract_prepared_batch(
     *,
     combined_bytes: int,
     options: Mapping[str, Any] | None = None,
+    overlaps: bool = False,
 ) -> dict[str, Any]:
     resolved = resolve_extraction_options(options)
     compiled, cache_hit = compile_bank(bank, options=options)
     _ensure_bank_status_extractable(compiled.bank, resolved.include_statuses)
+    _ensure_entity_ids_known(compiled.bank, resolved.entity_ids)
 
     document_results: list[dict[str, Any]] = []
     flat_records: list[MatchRecord] = []
+    # Byte-identical documents in one batch are scanned once.
+    scanned: dict[str, tuple[list[MatchRecord], list[_OverlapGroup]]] = {}
     for document_id, source, text in prepared_documents:
-        records = _extract_records(compiled, text)
-        document_results.append({"document_id": document_id, "source": source, "records": records})
+        scanned_result = scanned.get(text)
+        if scanned_result is None:
+            if overlaps:
+                records, groups = _extract_resolved_records(compiled, text, resolved.entity_ids, resolved.deadline_ms)
+            else:
+                records, groups = _extract_records(compiled, text, resolved.entity_ids, resolved.deadline_ms), []
+            scanned[text] = (records, groups)
+        else:
+            records, groups = _copy_records(scanned_result[0]), scanned_result[1]
+        document_result: dict[str, Any] = {"document_id": document_id, "source": source, "records": records}
+        if overlaps:
+            document_result["overlap_groups"] = groups
+        document_results.append(document_result)
         for record in records:
             flat_record = {"document_id": document_id, **record}
             flat_records.append(flat_record)
@@ -218,10 +224,52 @@ def explain_match(
     return _explain_match(bank, entity_id, name_id, pattern_id, options=options)
 
 
-def _extract_records(compiled: CompiledBank, text: str) -> list[MatchRecord]:
-    records = compiled.finditer(text)
-    records.sort(key=record_sort_key)
-    return records
+def _extract_checked_text(
+    bank: Mapping[str, Any],
+    text: str,
+    *,
+    options: Mapping[str, Any] | None = None,
+    overlaps: bool = False,
+) -> dict[str, Any]:
+    resolved = resolve_extraction_options(options)
+    _ensure_text_limit(text, resolved.max_text_bytes)
+    compiled, cache_hit = compile_bank(bank, options=options)
+    _ensure_bank_status_extractable(compiled.bank, resolved.include_statuses)
+    _ensure_entity_ids_known(compiled.bank, resolved.entity_ids)
+    result: dict[str, Any] = {
+        "bank": _bank_metadata(compiled),
+        "engine": _engine_metadata(compiled, cache_hit),
+        "source": _text_source_metadata(text),
+    }
+    if overlaps:
+        result["records"], result["overlap_groups"] = _extract_resolved_records(
+            compiled, text, resolved.entity_ids, resolved.deadline_ms
+        )
+    else:
+        result["records"] = _extract_records(compiled, text, resolved.entity_ids, resolved.deadline_ms)
+    return result
+
+
+def _extract_records(
+    compiled: CompiledBank,
+    text: str,
+    entity_ids: tuple[str, ...] | None = None,
+    deadline_ms: int | None = None,
+) -> list[MatchRecord]:
+    return compiled.finditer(text, entity_ids=entity_ids, deadline_ms=deadline_ms)
+
+
+def _extract_resolved_records(
+    compiled: CompiledBank,
+    text: str,
+    entity_ids: tuple[str, ...] | None = None,
+    deadline_ms: int | None = None,
+) -> tuple[list[MatchRecord], list[_OverlapGroup]]:
+    return compiled.finditer_resolved(text, entity_ids=entity_ids, deadline_ms=deadline_ms)
+
+
+def _copy_records(records: Sequence[MatchRecord]) -> list[MatchRecord]:
+    return [{**record, "captures": dict(record["captures"])} for record in records]
 
 
 def _ensure_text_limit(text: str, max_text_bytes: int) -> None:
@@ -238,6 +286,15 @@ def _ensure_bank_status_extractable(bank: Mapping[str, Any], include_statuses: t
         )
 
 
+def _ensure_entity_ids_known(bank: Mapping[str, Any], entity_ids: tuple[str, ...] | None) -> None:
+    if entity_ids is None:
+        return
+    entities = bank.get("entities", {})
+    unknown = [entity_id for entity_id in entity_ids if entity_id not in entities]
+    if unknown:
+        raise ExtractionError(f"Extraction option entity_ids names unknown entities: {', '.join(unknown)}.")
+
+
 def _text_size_bytes(text: str) -> int:
     return len(text.encode("utf-8"))
 
@@ -59,7 +59,7 @@ from .deanonymization import (
 )
 from .diagnostics import DIAGNOSTIC_ERROR, JSON_PARSE
 from .diff import diff_banks as _diff_banks
-from .engine import Bank
+from .engine import Bank, ScanTimeoutError, _compile_config_entity_bank
 from .engine import bank_cache_info as _bank_cache_info
 from .engine import clear_bank_cache as _clear_bank_cache
 from .engines import DEFAULT_MAX_TEXT_BYTES
@@ -387,6 +387,8 @@ def _run_json_tool(action: Any) -> dict[str, Any]:
         if diagnostics:
             return _diagnostic_payload(str(exc), diagnostics)
         _raise_tool_error(str(exc))
+    except ScanTimeoutError as exc:
+        _raise_tool_error(f"Extraction stopped early: {exc}")
     except (TypeError, ValueError) as exc:
         diagnostics = getattr(exc, "diagnostics", [])
         if diagnostics:
@@ -828,11 +830,7 @@ def _compile_config_bank(
     word_boundaries: bool,
 ) -> Bank:
     try:
-        bank = Bank.from_config(
-            pattern_config,
-            selected_entity=selected_entity,
-            word_boundaries=word_boundaries,
-        )
+        bank = _compile_config_entity_bank(pattern_config, selected_entity, word_boundaries=word_boundaries)
     except ValueError as exc:
         _raise_tool_error(f"Could not compile detectors with the Rust engine: {exc}")
     diagnostics = rust_empty_match_diagnostics(bank)
@@ -841,12 +839,12 @@ def _compile_config_bank(
     return bank
 
 
-def _scan_records(bank: Bank, source: str | bytes) -> list[dict[str, Any]]:
+def _scan_records(bank: Bank, source: str | bytes, *, deadline_ms: int | None = None) -> list[dict[str, Any]]:
     try:
         if isinstance(source, bytes):
-            return bank.scan_bytes(source)
-        return bank.scan_text(source)
-    except ValueError as exc:
+            return bank.scan_bytes(source, deadline_ms=deadline_ms)
+        return bank.scan_text(source, deadline_ms=deadline_ms)
+    except (ValueError, ScanTimeoutError) as exc:
         _raise_tool_error(f"Could not scan document with the Rust engine: {exc}")
 
 
@@ -856,9 +854,10 @@ def _extract_records_with_cache(
     source: str | bytes,
     *,
     word_boundaries: bool,
+    deadline_ms: int | None = None,
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     bank = _compile_config_bank(pattern_config, selected_entity, word_boundaries=word_boundaries)
-    return _scan_records(bank, source), bank.cache_metadata()
+    return _scan_records(bank, source, deadline_ms=deadline_ms), bank.cache_metadata()
 
 
 def _detector_records(pattern_config: PatternConfig, selected_entity: str | None = None) -> list[dict[str, str]]:
@@ -1307,6 +1306,7 @@ def extract_entity(
     text: str | None = None,
     file_path: str | None = None,
     word_boundaries: bool = False,
+    deadline_ms: int | None = None,
 ) -> dict[str, Any]:
     """Extract one configured entity from provided text or an explicit document file path."""
     path, pattern_config = _load_tool_config(config_path)
@@ -1317,6 +1317,7 @@ def extract_entity(
         entity,
         document_source,
         word_boundaries=word_boundaries,
+        deadline_ms=deadline_ms,
     )
     return {
         "config_path": str(path),
@@ -1334,6 +1335,7 @@ def extract_all_entities(
     text: str | None = None,
     file_path: str | None = None,
     word_boundaries: bool = False,
+    deadline_ms: int | None = None,
 ) -> dict[str, Any]:
     """Extract all configured entities from provided text or an explicit document file path."""
     path, pattern_config = _load_tool_config(config_path)
@@ -1344,6 +1346,7 @@ def extract_all_entities(
         None,
         document_source,
         word_boundaries=word_boundaries,
+        deadline_ms=deadline_ms,
     )
     return {
         "config_path": str(path),
@@ -1361,6 +1364,7 @@ def extract_inline(
     file_path: str | None = None,
     entity: str | None = None,
     word_boundaries: bool = False,
+    deadline_ms: int | None = None,
 ) -> dict[str, Any]:
     """
     Extract from one-shot detector definitions without reading or writing a config file.
@@ -1382,6 +1386,7 @@ def extract_inline(
         entity,
         document_source,
         word_boundaries=word_boundaries,
+        deadline_ms=deadline_ms,
     )
     return {
         "entity": entity,
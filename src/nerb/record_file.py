@@ -0,0 +1,331 @@
+"""Compact columnar binary files of extraction records.
+
+A record file stores each document's matches as integer columns that refer to a
+file-wide detector dictionary, instead of repeating every detector string per
+record. All integers are little-endian unsigned 32-bit values::
+
+    file      := MAGIC VERSION block*
+    block     := kind:u8 length:u32 payload[length]
+    detectors := count:u32 (size:u32 json[size])*          # kind 1
+    document  := id_size:u32 id[id_size]                   # kind 2
+                 metadata_size:u32 metadata_json[metadata_size]
+                 count:u32 detector:u32[count] start:u32[count] end:u32[count]
+                 string_size:u32[count] strings
+
+A detectors block appends entries to the dictionary before the first document
+that uses them. Each entry is a JSON record template whose ``string``,
+``start``, and ``end`` values are ``null``; the reader fills them from the
+document columns, so materialized records equal the dicts that were written,
+including key order.
+"""
+
+from __future__ import annotations
+
+# Standard library
+import copy
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any, BinaryIO
+
+# Project
+from .records import MatchRecord
+
+__all__ = [
+    "RECORD_FILE_MAGIC",
+    "RECORD_FILE_VERSION",
+    "RecordFileDocument",
+    "RecordFileError",
+    "RecordFileWriter",
+    "iter_record_file",
+    "read_record_file",
+    "write_record_file",
+]
+
+RECORD_FILE_MAGIC = b"NERBREC\x00"
+RECORD_FILE_VERSION = 1
+
+_DETECTORS_BLOCK = 1
+_DOCUMENT_BLOCK = 2
+_MATCH_FIELDS = ("string", "start", "end")
+_U32 = struct.Struct("<I")
+_BLOCK_HEADER = struct.Struct("<BI")
+_U32_MAX = 0xFFFFFFFF
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+class RecordFileError(ValueError):
+    """Raised when a record file cannot be written or decoded."""
+
+
+class RecordFileWriter:
+    """Append documents of match records to a binary record stream.
+
+    Records must carry ``string``, ``start``, and ``end``; every other field is
+    treated as detector identity and stored once in the dictionary.
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        self._detector_refs: dict[tuple[Any, ...], int] = {}
+        stream.write(RECORD_FILE_MAGIC + _U32.pack(RECORD_FILE_VERSION))
+
+    def write_document(
+        self,
+        document_id: str,
+        records: Sequence[Mapping[str, Any]],
+        *,
+        metadata: Mapping[str, Any] | None = None,
+    ) -> None:
+        count = len(records)
+        detectors = array("I", bytes(4 * count))
+        starts = array("I", bytes(4 * count))
+        ends = array("I", bytes(4 * count))
+        string_sizes = array("I", bytes(4 * count))
+        strings: list[bytes] = []
+        new_templates: list[bytes] = []
+        for index, record in enumerate(records):
+            try:
+                string, start, end = record["string"], record["start"], record["end"]
+            except KeyError as exc:
+                raise RecordFileError(
+                    f"Record {index} of document {document_id!r} is missing {exc.args[0]!r}."
+                ) from None
+            key = _detector_key(record)
+            detector = self._detector_refs.get(key)
+            if detector is None:
+                detector = len(self._detector_refs)
+                self._detector_refs[key] = detector
+                new_templates.append(_encode_json(_record_template(record)))
+            encoded = string.encode("utf-8")
+            detectors[index] = detector
+            starts[index] = _u32(start, "start")
+            ends[index] = _u32(end, "end")
+            string_sizes[index] = _u32(len(encoded), "string size")
+            strings.append(encoded)
+
+        if new_templates:
+            self._write_block(
+                _DETECTORS_BLOCK,
+                [_U32.pack(len(new_templates)), *(_sized(template) for template in new_templates)],
+            )
+        self._write_block(
+            _DOCUMENT_BLOCK,
+            [
+                _sized(document_id.encode("utf-8")),
+                _sized(b"" if metadata is None else _encode_json(metadata)),
+                _U32.pack(count),
+                _little_endian(detectors),
+                _little_endian(starts),
+                _little_endian(ends),
+                _little_endian(string_sizes),
+                *strings,
+            ],
+        )
+
+    def _write_block(self, kind: int, parts: list[bytes]) -> None:
+        length = sum(len(part) for part in parts)
+        self._stream.write(_BLOCK_HEADER.pack(kind, _u32(length, "block size")))
+        self._stream.writelines(parts)
+
+
+class RecordFileDocument:
+    """One decoded document whose records are materialized on demand.
+
+    ``detectors``, ``starts``, and ``ends`` expose the integer columns directly
+    for consumers that do not need record dicts.
+    """
+
+    __slots__ = ("document_id", "metadata", "detectors", "starts", "ends", "_string_offsets", "_strings", "_templates")
+
+    def __init__(
+        self,
+        document_id: str,
+        metadata: dict[str, Any] | None,
+        detectors: array[int],
+        starts: array[int],
+        ends: array[int],
+        string_offsets: list[int],
+        strings: bytes,
+        templates: list[tuple[dict[str, Any], bool]],
+    ) -> None:
+        self.document_id = document_id
+        self.metadata = metadata
+        self.detectors = detectors
+        self.starts = starts
+        self.ends = ends
+        self._string_offsets = string_offsets
+        self._strings = strings
+        self._templates = templates
+
+    def __len__(self) -> int:
+        return len(self.detectors)
+
+    def __getitem__(self, index: int) -> MatchRecord:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+        template, nested = self._templates[self.detectors[index]]
+        record = copy.deepcopy(template) if nested else template.copy()
+        record["string"] = self._strings[self._string_offsets[index] : self._string_offsets[index + 1]].decode("utf-8")
+        record["start"] = self.starts[index]
+        record["end"] = self.ends[index]
+        return record
+
+    def __iter__(self) -> Iterator[MatchRecord]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def records(self) -> list[MatchRecord]:
+        return list(self)
+
+
+def write_record_file(
+    path: str | Path,
+    documents: Iterable[tuple[str, Sequence[Mapping[str, Any]]]],
+) -> None:
+    """Write ``(document_id, records)`` pairs to a new record file."""
+    with Path(path).expanduser().open("wb") as stream:
+        writer = RecordFileWriter(stream)
+        for document_id, records in documents:
+            writer.write_document(document_id, records)
+
+
+def read_record_file(path: str | Path) -> list[RecordFileDocument]:
+    """Decode every document in a record file."""
+    with Path(path).expanduser().open("rb") as stream:
+        return list(iter_record_file(stream))
+
+
+def iter_record_file(stream: BinaryIO) -> Iterator[RecordFileDocument]:
+    """Yield documents from a record stream one block at a time."""
+    header = stream.read(len(RECORD_FILE_MAGIC) + _U32.size)
+    if header[: len(RECORD_FILE_MAGIC)] != RECORD_FILE_MAGIC or len(header) != len(RECORD_FILE_MAGIC) + _U32.size:
+        raise RecordFileError("Input is not a NERB record file.")
+    (version,) = _U32.unpack_from(header, len(RECORD_FILE_MAGIC))
+    if version != RECORD_FILE_VERSION:
+        raise RecordFileError(f"Unsupported record file version {version}; expected {RECORD_FILE_VERSION}.")
+
+    templates: list[tuple[dict[str, Any], bool]] = []
+    while block_header := stream.read(_BLOCK_HEADER.size):
+        if len(block_header) != _BLOCK_HEADER.size:
+            raise RecordFileError("Record file ends inside a block header.")
+        kind, length = _BLOCK_HEADER.unpack(block_header)
+        payload = memoryview(stream.read(length))
+        if len(payload) != length:
+            raise RecordFileError("Record file ends inside a block.")
+        reader = _PayloadReader(payload)
+        if kind == _DETECTORS_BLOCK:
+            for _index in range(reader.u32()):
+                template = _decode_json(reader.sized())
+                if not isinstance(template, dict):
+                    raise RecordFileError("Record file detector entries must be JSON objects.")
+                nested = any(not isinstance(value, _SCALAR_TYPES) for value in template.values())
+                templates.append((template, nested))
+        elif kind == _DOCUMENT_BLOCK:
+            yield _read_document(reader, templates)
+        else:
+            raise RecordFileError(f"Record file block kind {kind} is not recognized.")
+        reader.finish()
+
+
+def _read_document(reader: _PayloadReader, templates: list[tuple[dict[str, Any], bool]]) -> RecordFileDocument:
+    document_id = _decode_utf8(reader.sized())
+    raw_metadata = reader.sized()
+    metadata = _decode_json(raw_metadata) if raw_metadata else None
+    if metadata is not None and not isinstance(metadata, dict):
+        raise RecordFileError("Record file document metadata must be a JSON object.")
+    count = reader.u32()
+    detectors = reader.u32_array(count)
+    starts = reader.u32_array(count)
+    ends = reader.u32_array(count)
+    string_sizes = reader.u32_array(count)
+    if count and max(detectors) >= len(templates):
+        raise RecordFileError(f"Document {document_id!r} refers to an undefined detector.")
+    string_offsets = [0]
+    for size in string_sizes:
+        string_offsets.append(string_offsets[-1] + size)
+    strings = reader.take(string_offsets[-1])
+    return RecordFileDocument(document_id, metadata, detectors, starts, ends, string_offsets, strings, templates)
+
+
+class _PayloadReader:
+    def __init__(self, payload: memoryview) -> None:
+        self._payload = payload
+        self._offset = 0
+
+    def take(self, size: int) -> bytes:
+        end = self._offset + size
+        if end > len(self._payload):
+            raise RecordFileError("Record file block is truncated.")
+        data = self._payload[self._offset : end].tobytes()
+        self._offset = end
+        return data
+
+    def u32(self) -> int:
+        (value,) = _U32.unpack(self.take(_U32.size))
+        return int(value)
+
+    def sized(self) -> bytes:
+        return self.take(self.u32())
+
+    def u32_array(self, count: int) -> array[int]:
+        values = array("I", self.take(4 * count))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def finish(self) -> None:
+        if self._offset != len(self._payload):
+            raise RecordFileError("Record file block has trailing bytes.")
+
+
+def _detector_key(record: Mapping[str, Any]) -> tuple[Any, ...]:
+    return tuple(
+        key
+        if key in _MATCH_FIELDS
+        else (key, value if isinstance(value, _SCALAR_TYPES) else json.dumps(value, sort_keys=True))
+        for key, value in record.items()
+    )
+
+
+def _record_template(record: Mapping[str, Any]) -> dict[str, Any]:
+    return {key: None if key in _MATCH_FIELDS else value for key, value in record.items()}
+
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _decode_json(data: bytes) -> Any:
+    try:
+        return json.loads(_decode_utf8(data))
+    except json.JSONDecodeError as exc:
+        raise RecordFileError(f"Record file contains invalid JSON: {exc.msg}.") from None
+
+
+def _decode_utf8(data: bytes) -> str:
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise RecordFileError(f"Record file contains invalid UTF-8: {exc}.") from None
+
+
+def _sized(data: bytes) -> bytes:
+    return _U32.pack(_u32(len(data), "field size")) + data
+
+
+def _u32(value: Any, label: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value <= _U32_MAX:
+        raise RecordFileError(f"Record file {label} must be an unsigned 32-bit integer; got {value!r}.")
+    return value
+
+
+def _little_endian(values: array[int]) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
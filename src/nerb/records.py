@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-__all__ = ["MatchRecord", "record_sort_key"]
+__all__ = ["MatchRecord", "record_sort_key", "sort_span_ordered_records"]
 
 MatchRecord = dict[str, Any]
 
@@ -16,3 +16,22 @@ def record_sort_key(record: MatchRecord) -> tuple[int, int, str, str, str, str]:
         str(record["pattern_id"]),
         str(record["string"]),
     )
+
+
+def sort_span_ordered_records(records: list[MatchRecord]) -> None:
+    """Sort records already ordered by span into ``record_sort_key`` order in place.
+
+    Only runs of records sharing one ``(start, end)`` span are re-sorted, so
+    native scan output costs one linear pass instead of a full sort.
+    """
+    run_start = 0
+    previous_span: tuple[Any, Any] | None = None
+    for index, record in enumerate(records):
+        span = (record["start"], record["end"])
+        if span != previous_span:
+            if index - run_start > 1:
+                records[run_start:index] = sorted(records[run_start:index], key=record_sort_key)
+            run_start = index
+            previous_span = span
+    if len(records) - run_start > 1:
+        records[run_start:] = sorted(records[run_start:], key=record_sort_key)
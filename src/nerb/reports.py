@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import Counter
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
+from itertools import accumulate
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, BinaryIO, cast
 
 from .bank import canonicalize_bank
 from .diagnostics import DIAGNOSTIC_WARNING, REPORT_EXPECTED_MISSING, diagnostic, has_errors
-from .engines import ExtractionError
-from .extraction import _extract_prepared_batch, _prepare_batch_documents, extract_text
-from .records import MatchRecord, record_sort_key
+from .engines import CompiledBank, ExtractionError, compile_bank, resolve_extraction_options
+from .extraction import (
+    _bank_metadata,
+    _ensure_bank_status_extractable,
+    _ensure_entity_ids_known,
+    _extract_checked_text,
+    _extract_prepared_batch,
+    _extract_resolved_records,
+    _prepare_batch_documents,
+)
+from .records import MatchRecord
 from .schema import REGEX_FLAG_ORDER, validate_bank_schema
 
 __all__ = ["extract_report", "extract_report_batch", "extract_report_file", "explain_match"]
@@ -20,6 +30,7 @@ DEFAULT_CONTEXT_CHARS = 80
 DEFAULT_INCLUDE_METADATA = False
 DEFAULT_INCLUDE_PATTERN_VALUES = True
 DEFAULT_EXPECTED_MATCH_SCOPE = "resolved"
+STREAM_CUT_WHITESPACE = b" \t\n\x0c\r"
 
 
 @dataclass(frozen=True)
@@ -47,7 +58,7 @@ def extract_report(
 ) -> dict[str, Any]:
     """Return a report with raw records, report-level resolved records, summaries, and diagnostics."""
     report_options = _resolve_report_options(options)
-    extraction = extract_text(bank, text, options=options)
+    extraction = _extract_checked_text(bank, text, options=options, overlaps=True)
     canonical_bank = canonicalize_bank(bank)
     return _build_report(canonical_bank, text, extraction, report_options)
 
@@ -64,7 +75,9 @@ def extract_report_file(
         [{"document_id": "document_0", "file_path": str(file_path)}],
         options=options,
     )
-    batch = _extract_prepared_batch(bank, prepared_documents, combined_bytes=combined_bytes, options=options)
+    batch = _extract_prepared_batch(
+        bank, prepared_documents, combined_bytes=combined_bytes, options=options, overlaps=True
+    )
     _document_id, _source, text = prepared_documents[0]
     document_result = batch["documents"][0]
     canonical_bank = canonicalize_bank(bank)
@@ -76,6 +89,7 @@ def extract_report_file(
             "engine": batch["engine"],
             "source": document_result["source"],
             "records": document_result["records"],
+            "overlap_groups": document_result["overlap_groups"],
         },
         report_options,
     )
@@ -90,7 +104,9 @@ def extract_report_batch(
     """Return reports for a bounded batch of text or file documents."""
     report_options = _resolve_report_options(options)
     prepared_documents, combined_bytes = _prepare_batch_documents(documents, options=options)
-    batch = _extract_prepared_batch(bank, prepared_documents, combined_bytes=combined_bytes, options=options)
+    batch = _extract_prepared_batch(
+        bank, prepared_documents, combined_bytes=combined_bytes, options=options, overlaps=True
+    )
     canonical_bank = canonicalize_bank(bank)
 
     document_reports: list[dict[str, Any]] = []
@@ -108,6 +124,7 @@ def extract_report_batch(
                 "engine": batch["engine"],
                 "source": document_result["source"],
                 "records": document_result["records"],
+                "overlap_groups": document_result["overlap_groups"],
             },
             report_options,
         )
@@ -186,8 +203,8 @@ def _build_report(
     options: ReportOptions,
 ) -> dict[str, Any]:
     records = list(extraction["records"])
-    overlap_groups = _overlap_groups(bank, records, options)
-    resolved_records = _resolve_records(records, overlap_groups)
+    overlap_groups = _overlap_groups(records, extraction["overlap_groups"])
+    resolved_records = _resolve_records(records, extraction["overlap_groups"])
     decorated_resolved_records = [
         {
             "record": record,
@@ -214,6 +231,158 @@ def _build_report(
     }
 
 
+@dataclass(frozen=True)
+class _ReportWindow:
+    """One committed stretch of a streamed document with its resolved records.
+
+    ``start`` is the stretch's byte offset in the stream, and record offsets are
+    stream offsets as well.
+    """
+
+    start: int
+    text: str
+    resolved_records: list[MatchRecord]
+
+
+class _ReportStream:
+    """Resolve report records over a UTF-8 byte stream, one bounded window at a time.
+
+    A window holds at most ``max_text_bytes``. Unless it reaches the end of the
+    stream, it commits only the records before a cut that follows ASCII
+    whitespace, ends no record, and lies at least the bank's chunk overlap before
+    the window's end. The next window scans from that cut, so the committed
+    records and overlap winners are those of one whole-document report.
+    """
+
+    def __init__(self, bank: Mapping[str, Any], source: BinaryIO, *, options: Mapping[str, Any] | None = None):
+        self._report_options = _resolve_report_options(options)
+        resolved = resolve_extraction_options(options)
+        compiled, _cache_hit = compile_bank(bank, options=options)
+        _ensure_bank_status_extractable(compiled.bank, resolved.include_statuses)
+        _ensure_entity_ids_known(compiled.bank, resolved.entity_ids)
+        self.bank = _bank_metadata(compiled)
+        self.byte_count = 0
+        self.length = 0
+        self.window_count = 0
+        self._compiled = compiled
+        self._source = source
+        self._window_bytes = resolved.max_text_bytes
+        self._entity_ids = resolved.entity_ids
+        self._deadline_ms = resolved.deadline_ms
+        self._raw_pairs: set[tuple[str, str]] = set()
+        self._resolved_pairs: set[tuple[str, str]] = set()
+
+    def __iter__(self) -> Iterator[_ReportWindow]:
+        pending = b""
+        start = 0
+        while True:
+            data = pending + _read_stream(self._source, self._window_bytes + 1 - len(pending))
+            at_end = len(data) <= self._window_bytes
+            window = data if at_end else _complete_utf8_prefix(data[: self._window_bytes])
+            text = _decode_stream_window(window, start)
+            records, groups = _extract_resolved_records(self._compiled, text, self._entity_ids, self._deadline_ms)
+            cut = len(window) if at_end else self._window_cut(window, records, start)
+            resolved_records = [record for record in _resolve_records(records, groups) if record["start"] < cut]
+            self._raw_pairs.update(_record_pairs(record for record in records if record["start"] < cut))
+            self._resolved_pairs.update(_record_pairs(resolved_records))
+            segment = text if cut == len(window) else str(window[:cut], "utf-8")
+            self.byte_count += cut
+            self.length += len(segment)
+            self.window_count += 1
+            yield _ReportWindow(start, segment, [_shift_record(record, start) for record in resolved_records])
+            if at_end:
+                return
+            pending = data[cut:]
+            start += cut
+
+    def diagnostics(self) -> list[dict[str, Any]]:
+        """Return the report diagnostics for the records committed so far."""
+        return _expected_diagnostics(
+            self._report_options,
+            [{"entity_id": entity_id, "name_id": name_id} for entity_id, name_id in sorted(self._raw_pairs)],
+            [{"entity_id": entity_id, "name_id": name_id} for entity_id, name_id in sorted(self._resolved_pairs)],
+        )
+
+    def _window_cut(self, window: bytes, records: Sequence[MatchRecord], start: int) -> int:
+        overlap = _chunk_overlap_bytes(self._compiled)
+        if overlap is None:
+            raise ExtractionError(
+                f"Bank cannot stream text longer than max_text_bytes ({self._window_bytes}): a pattern has no longest "
+                "match, can match the empty string, or anchors to the start of the text or a line."
+            )
+        starts = [int(record["start"]) for record in records]
+        reach = list(accumulate((int(record["end"]) for record in records), max))
+        candidate = len(window) - overlap
+        while candidate > 0:
+            cut = max(window.rfind(byte, 0, candidate) for byte in STREAM_CUT_WHITESPACE) + 1
+            if cut == 0:
+                break
+            covered = bisect_left(starts, cut)
+            # A bank without patterns has no overlap, so the cut can reach the window's end; the byte
+            # after a cut must lie in this window to show that the cut ends a whitespace run.
+            if (
+                cut < len(window)
+                and window[cut] not in STREAM_CUT_WHITESPACE
+                and (covered == 0 or reach[covered - 1] <= cut)
+            ):
+                return cut
+            candidate = cut - 1
+        raise ExtractionError(
+            f"Stream window at byte {start} has no cut after ASCII whitespace outside a match in its first "
+            f"{max(len(window) - overlap, 0)} bytes; raise max_text_bytes."
+        )
+
+
+def _chunk_overlap_bytes(compiled: CompiledBank) -> int | None:
+    if compiled.native_bank is None:
+        return 0
+    overlap = compiled.native_bank.metadata()["scan_limits"]["chunk_overlap_bytes"]
+    return None if overlap is None else int(overlap)
+
+
+def _read_stream(source: BinaryIO, size: int) -> bytes:
+    chunks: list[bytes] = []
+    try:
+        while size > 0:
+            chunk = source.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+    except OSError as exc:
+        raise ExtractionError(f"Could not read extraction source stream: {exc}.") from exc
+    return b"".join(chunks)
+
+
+def _complete_utf8_prefix(data: bytes) -> bytes:
+    # Hold back a character the window boundary split; the next window reads it whole.
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte & 0xC0 != 0x80:
+            width = 1 if byte < 0x80 else 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return data[:-back] if width > back else data
+    return data
+
+
+def _decode_stream_window(window: bytes, start: int) -> str:
+    try:
+        return str(window, "utf-8")
+    except UnicodeDecodeError as exc:
+        raise ExtractionError(
+            f"Extraction source stream is not valid UTF-8 at byte {start + exc.start}: {exc.reason}."
+        ) from exc
+
+
+def _record_pairs(records: Iterable[MatchRecord]) -> set[tuple[str, str]]:
+    return {(str(record["entity_id"]), str(record["name_id"])) for record in records}
+
+
+def _shift_record(record: MatchRecord, offset: int) -> MatchRecord:
+    if offset == 0:
+        return record
+    return {**record, "start": int(record["start"]) + offset, "end": int(record["end"]) + offset}
+
+
 def _resolve_report_options(options: Mapping[str, Any] | None) -> ReportOptions:
     raw_options = options or {}
     overlap_policy = raw_options.get("overlap_policy", DEFAULT_OVERLAP_POLICY)
@@ -268,90 +437,32 @@ def _expected_matches(value: Any) -> tuple[ExpectedMatch, ...]:
 
 
 def _overlap_groups(
-    bank: Mapping[str, Any],
     records: list[MatchRecord],
-    options: ReportOptions,
+    groups: Sequence[tuple[int, int, int]],
 ) -> list[dict[str, Any]]:
-    del options
-    groups: list[list[tuple[int, MatchRecord]]] = []
-    current_group: list[tuple[int, MatchRecord]] = []
-    current_end = -1
-
-    for index, record in enumerate(records):
-        start = int(record["start"])
-        end = int(record["end"])
-        if not current_group or start >= current_end:
-            if len(current_group) > 1:
-                groups.append(current_group)
-            current_group = [(index, record)]
-            current_end = end
-            continue
-        current_group.append((index, record))
-        current_end = max(current_end, end)
-
-    if len(current_group) > 1:
-        groups.append(current_group)
-
+    # The native bank resolved each (first, end, winner) group from the match buffer.
     overlap_items: list[dict[str, Any]] = []
-    for group_index, group in enumerate(groups):
-        winner_index, winner = _select_priority_winner(bank, group)
-        losers = [record for index, record in group if index != winner_index]
+    for group_index, (first, end, winner) in enumerate(groups):
+        group = records[first:end]
         overlap_items.append(
             {
                 "id": f"overlap_{group_index}",
                 "policy": DEFAULT_OVERLAP_POLICY,
                 "span": {
-                    "start": min(int(record["start"]) for _, record in group),
-                    "end": max(int(record["end"]) for _, record in group),
+                    "start": int(group[0]["start"]),
+                    "end": max(int(record["end"]) for record in group),
                 },
-                "records": [record for _, record in group],
-                "resolved_record": winner,
-                "dropped_records": losers,
+                "records": group,
+                "resolved_record": records[winner],
+                "dropped_records": [records[index] for index in range(first, end) if index != winner],
             }
         )
     return overlap_items
 
 
-def _resolve_records(records: list[MatchRecord], overlap_groups: list[dict[str, Any]]) -> list[MatchRecord]:
-    dropped_keys = {_record_identity_key(record) for group in overlap_groups for record in group["dropped_records"]}
-    resolved = [record for record in records if _record_identity_key(record) not in dropped_keys]
-    resolved.sort(key=record_sort_key)
-    return resolved
-
-
-def _select_priority_winner(
-    bank: Mapping[str, Any],
-    group: list[tuple[int, MatchRecord]],
-) -> tuple[int, MatchRecord]:
-    return min(group, key=lambda item: (_priority_resolution_key(bank, item[1]), item[0]))
-
-
-def _priority_resolution_key(bank: Mapping[str, Any], record: MatchRecord) -> tuple[int, int, int, str, str, str, str]:
-    pattern = _pattern_for_record(bank, record)
-    priority = pattern.get("priority", 0)
-    if not isinstance(priority, int) or isinstance(priority, bool):
-        priority = 0
-    length = int(record["end"]) - int(record["start"])
-    return (
-        priority,
-        -length,
-        int(record["start"]),
-        str(record["entity_id"]),
-        str(record["name_id"]),
-        str(record["pattern_id"]),
-        str(record["string"]),
-    )
-
-
-def _record_identity_key(record: MatchRecord) -> tuple[str, str, str, int, int, str]:
-    return (
-        str(record["entity_id"]),
-        str(record["name_id"]),
-        str(record["pattern_id"]),
-        int(record["start"]),
-        int(record["end"]),
-        str(record["string"]),
-    )
+def _resolve_records(records: list[MatchRecord], groups: Sequence[tuple[int, int, int]]) -> list[MatchRecord]:
+    dropped = {index for first, end, winner in groups for index in range(first, end) if index != winner}
+    return [record for index, record in enumerate(records) if index not in dropped]
 
 
 def _grouped_counts(records: Sequence[Mapping[str, Any]]) -> dict[str, dict[str, int]]:
@@ -470,16 +581,6 @@ def _expected_diagnostics(
     return diagnostics
 
 
-def _pattern_for_record(bank: Mapping[str, Any], record: Mapping[str, Any]) -> Mapping[str, Any]:
-    _, _, pattern = _pattern_context(
-        bank,
-        str(record["entity_id"]),
-        str(record["name_id"]),
-        str(record["pattern_id"]),
-    )
-    return pattern
-
-
 def _pattern_context(
     bank: Mapping[str, Any],
     entity_id: str,
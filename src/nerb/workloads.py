@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import re
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from .benchmarks import SYNTHETIC_BANK_TIMESTAMP, _synthetic_literal_slot
+from .engines import ExtractionError
+from .schema import ID_PATTERN
+
+__all__ = [
+    "WORKLOAD_DOCUMENT_FORMATS",
+    "generate_workload",
+]
+
+WORKLOAD_SCHEMA_VERSION = "nerb.synthetic_workload.v1"
+WORKLOAD_GENERATOR = "nerb.workloads.generate_workload"
+WORKLOAD_DOCUMENT_FORMATS = ("jsonl", "files")
+WORKLOAD_BANK_FILENAME = "bank.json"
+WORKLOAD_DOCUMENTS_FILENAME = "documents.jsonl"
+WORKLOAD_DOCUMENTS_DIRNAME = "documents"
+WORKLOAD_DOCUMENT_MANIFEST_FILENAME = "documents.manifest"
+WORKLOAD_MANIFEST_FILENAME = "workload.json"
+MAX_WORKLOAD_PATTERNS = 10_000_000
+_UINT64_MASK = (1 << 64) - 1
+_TRAIT_SALTS = {"case_insensitive": 1, "word_boundary": 2, "normalize_whitespace": 3}
+_REGEX_SUFFIX_RE = r"-\d{2,4}"
+_WHITESPACE_VARIANTS = ("  ", "\t", "\n", " \n ", "   ")
+# Lowercase filler words share no token with generated pattern values, so planted hits are the only matches.
+_FILLER_WORDS = (
+    "account",
+    "agenda",
+    "approve",
+    "budget",
+    "call",
+    "contract",
+    "deadline",
+    "draft",
+    "email",
+    "forecast",
+    "forward",
+    "invoice",
+    "meeting",
+    "memo",
+    "notes",
+    "office",
+    "pipeline",
+    "plan",
+    "please",
+    "project",
+    "quarter",
+    "report",
+    "review",
+    "schedule",
+    "signed",
+    "status",
+    "summary",
+    "team",
+    "thanks",
+    "today",
+    "update",
+    "week",
+)
+
+
+@dataclass(frozen=True)
+class _WorkloadSpec:
+    entity_count: int
+    names_per_entity: int
+    patterns_per_name: int
+    literal_ratio: float
+    case_insensitive_ratio: float
+    word_boundary_ratio: float
+    normalize_whitespace_ratio: float
+    document_count: int
+    document_bytes: int
+    match_density: float
+    seed: int
+    document_format: str
+    bank_id: str
+
+    @property
+    def name_count(self) -> int:
+        return self.entity_count * self.names_per_entity
+
+    @property
+    def pattern_count(self) -> int:
+        return self.name_count * self.patterns_per_name
+
+
+@dataclass(frozen=True)
+class _PlannedPattern:
+    entity_index: int
+    name_ordinal: int
+    pattern_index: int
+    kind: str
+    case_insensitive: bool
+    word_boundary: bool
+    normalize_whitespace: bool
+
+    @property
+    def tokens(self) -> tuple[str, str]:
+        # The trailing letters terminate each token, so no generated value is a prefix of another.
+        return f"Wkld{self.name_ordinal}q", f"Alias{self.pattern_index}z"
+
+
+def generate_workload(
+    output_dir: str | Path,
+    *,
+    entity_count: int,
+    names_per_entity: int,
+    patterns_per_name: int,
+    literal_ratio: float = 1.0,
+    case_insensitive_ratio: float = 0.0,
+    word_boundary_ratio: float = 0.0,
+    normalize_whitespace_ratio: float = 0.0,
+    document_count: int = 100,
+    document_bytes: int = 4096,
+    match_density: float = 1.0,
+    seed: int = 0,
+    document_format: str = "jsonl",
+    bank_id: str = "synthetic_workload_bank",
+    overwrite: bool = False,
+) -> dict[str, Any]:
+    """Stream a seeded synthetic bank and matching document corpus to disk and return the workload manifest.
+
+    Patterns are derived from their ordinal, so neither the bank nor the corpus is held in memory. ``match_density``
+    is the number of planted pattern hits per KiB of document text; every planted hit is a distinct extraction.
+    """
+    spec = _resolve_workload_spec(
+        entity_count=entity_count,
+        names_per_entity=names_per_entity,
+        patterns_per_name=patterns_per_name,
+        literal_ratio=literal_ratio,
+        case_insensitive_ratio=case_insensitive_ratio,
+        word_boundary_ratio=word_boundary_ratio,
+        normalize_whitespace_ratio=normalize_whitespace_ratio,
+        document_count=document_count,
+        document_bytes=document_bytes,
+        match_density=match_density,
+        seed=seed,
+        document_format=document_format,
+        bank_id=bank_id,
+    )
+    root = Path(output_dir).expanduser()
+    targets = [root / WORKLOAD_BANK_FILENAME, root / WORKLOAD_MANIFEST_FILENAME]
+    if spec.document_format == "jsonl":
+        targets.append(root / WORKLOAD_DOCUMENTS_FILENAME)
+    else:
+        targets.extend([root / WORKLOAD_DOCUMENTS_DIRNAME, root / WORKLOAD_DOCUMENT_MANIFEST_FILENAME])
+    existing = [path.name for path in targets if path.exists()]
+    if existing and not overwrite:
+        raise ExtractionError(f"Workload output already exists in {root}: {', '.join(existing)}.")
+
+    try:
+        root.mkdir(parents=True, exist_ok=True)
+        bank_file, pattern_counts = _write_workload_bank(root / WORKLOAD_BANK_FILENAME, spec)
+        documents, document_files = _write_workload_documents(root, spec)
+        manifest = {
+            "schema_version": WORKLOAD_SCHEMA_VERSION,
+            "generator": WORKLOAD_GENERATOR,
+            "spec": asdict(spec),
+            "counts": {
+                "entities": spec.entity_count,
+                "names": spec.name_count,
+                "patterns": spec.pattern_count,
+                **pattern_counts,
+                **documents,
+            },
+            "files": {"bank": bank_file, **document_files},
+        }
+        _write_bytes(root / WORKLOAD_MANIFEST_FILENAME, _json_bytes(manifest, indent=2) + b"\n")
+    except OSError as exc:
+        raise ExtractionError(f"Could not write workload to {root}: {exc.strerror or exc}.") from exc
+    return manifest
+
+
+def _resolve_workload_spec(**values: Any) -> _WorkloadSpec:
+    for name in ("entity_count", "names_per_entity", "patterns_per_name", "document_bytes"):
+        _ensure_positive_workload_int(values[name], name)
+    document_count = values["document_count"]
+    if not isinstance(document_count, int) or isinstance(document_count, bool) or document_count < 0:
+        raise ExtractionError("Workload document_count must be a non-negative integer.")
+    seed = values["seed"]
+    if not isinstance(seed, int) or isinstance(seed, bool):
+        raise ExtractionError("Workload seed must be an integer.")
+    for name in ("literal_ratio", "case_insensitive_ratio", "word_boundary_ratio", "normalize_whitespace_ratio"):
+        ratio = values[name]
+        if not isinstance(ratio, (int, float)) or isinstance(ratio, bool) or not 0 <= ratio <= 1:
+            raise ExtractionError(f"Workload {name} must be a number between 0 and 1.")
+        values[name] = float(ratio)
+    density = values["match_density"]
+    if not isinstance(density, (int, float)) or isinstance(density, bool) or not 0 <= density < float("inf"):
+        raise ExtractionError("Workload match_density must be a non-negative number.")
+    values["match_density"] = float(density)
+    if values["document_format"] not in WORKLOAD_DOCUMENT_FORMATS:
+        raise ExtractionError(f"Workload document_format must be one of {', '.join(WORKLOAD_DOCUMENT_FORMATS)}.")
+    if not isinstance(values["bank_id"], str) or re.match(ID_PATTERN, values["bank_id"]) is None:
+        raise ExtractionError("Workload bank_id must be a lowercase bank identifier.")
+
+    spec = _WorkloadSpec(**values)
+    if spec.pattern_count > MAX_WORKLOAD_PATTERNS:
+        raise ExtractionError(f"Workload pattern count must not exceed {MAX_WORKLOAD_PATTERNS:,}.")
+    return spec
+
+
+def _ensure_positive_workload_int(value: Any, name: str) -> None:
+    if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+        raise ExtractionError(f"Workload {name} must be a positive integer.")
+
+
+def _seed_key(seed: int) -> int:
+    digest = hashlib.sha256(f"nerb-workload:{seed}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def _mix64(value: int) -> int:
+    value = (value + 0x9E3779B97F4A7C15) & _UINT64_MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _UINT64_MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _UINT64_MASK
+    return value ^ (value >> 31)
+
+
+def _trait(seed_key: int, ordinal: int, salt: int, ratio: float) -> bool:
+    if ratio <= 0:
+        return False
+    if ratio >= 1:
+        return True
+    return (_mix64(seed_key ^ _mix64(ordinal * 4 + salt)) >> 11) / float(1 << 53) < ratio
+
+
+def _planned_pattern(spec: _WorkloadSpec, seed_key: int, ordinal: int) -> _PlannedPattern:
+    name_ordinal, pattern_index = divmod(ordinal, spec.patterns_per_name)
+    literal_count = round(spec.pattern_count * spec.literal_ratio)
+    return _PlannedPattern(
+        entity_index=name_ordinal // spec.names_per_entity,
+        name_ordinal=name_ordinal,
+        pattern_index=pattern_index,
+        kind="literal" if _synthetic_literal_slot(ordinal, spec.pattern_count, literal_count) else "regex",
+        case_insensitive=_trait(seed_key, ordinal, _TRAIT_SALTS["case_insensitive"], spec.case_insensitive_ratio),
+        word_boundary=_trait(seed_key, ordinal, _TRAIT_SALTS["word_boundary"], spec.word_boundary_ratio),
+        normalize_whitespace=_trait(
+            seed_key,
+            ordinal,
+            _TRAIT_SALTS["normalize_whitespace"],
+            spec.normalize_whitespace_ratio,
+        ),
+    )
+
+
+def _pattern_definition(planned: _PlannedPattern) -> dict[str, Any]:
+    first, second = planned.tokens
+    if planned.kind == "literal":
+        return {
+            "kind": "literal",
+            "value": f"{first} {second}",
+            "description": "Synthetic workload literal pattern.",
+            "status": "active",
+            "priority": 100,
+            "case_sensitive": not planned.case_insensitive,
+            "normalize_whitespace": planned.normalize_whitespace,
+            "left_boundary": "word" if planned.word_boundary else "none",
+            "right_boundary": "word" if planned.word_boundary else "none",
+            "metadata": {},
+        }
+
+    separator = r"\s+" if planned.normalize_whitespace else " "
+    value = f"{re.escape(first)}{separator}{re.escape(second)}{_REGEX_SUFFIX_RE}"
+    if planned.word_boundary:
+        value = rf"\b{value}\b"
+    return {
+        "kind": "regex",
+        "value": value,
+        "description": "Synthetic workload regex pattern.",
+        "status": "active",
+        "priority": 50,
+        "regex_flags": ["IGNORECASE"] if planned.case_insensitive else [],
+        "metadata": {},
+    }
+
+
+def _planted_text(planned: _PlannedPattern, rng: random.Random) -> str:
+    first, second = planned.tokens
+    separator = rng.choice(_WHITESPACE_VARIANTS) if planned.normalize_whitespace else " "
+    text = f"{first}{separator}{second}"
+    if planned.kind == "regex":
+        text += "-" + str(rng.randrange(10, 10_000))
+    if planned.case_insensitive:
+        text = text.upper() if rng.random() < 0.5 else text.lower()
+    return text
+
+
+def _iter_entity_names(
+    spec: _WorkloadSpec,
+    seed_key: int,
+    entity_index: int,
+    counts: dict[str, int],
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    for name_offset in range(spec.names_per_entity):
+        name_ordinal = entity_index * spec.names_per_entity + name_offset
+        patterns: dict[str, Any] = {}
+        for pattern_index in range(spec.patterns_per_name):
+            planned = _planned_pattern(spec, seed_key, name_ordinal * spec.patterns_per_name + pattern_index)
+            counts[planned.kind] += 1
+            counts["case_insensitive"] += planned.case_insensitive
+            counts["word_boundary"] += planned.word_boundary
+            counts["normalize_whitespace"] += planned.normalize_whitespace
+            prefix = "lit" if planned.kind == "literal" else "rx"
+            patterns[f"{prefix}_{pattern_index:04d}"] = _pattern_definition(planned)
+        yield (
+            f"name_{name_ordinal:08d}",
+            {
+                "canonical": f"Synthetic Workload Name {name_ordinal}",
+                "description": "Synthetic workload name.",
+                "status": "active",
+                "patterns": patterns,
+                "metadata": {},
+            },
+        )
+
+
+def _write_workload_bank(path: Path, spec: _WorkloadSpec) -> tuple[dict[str, Any], dict[str, int]]:
+    seed_key = _seed_key(spec.seed)
+    counts = {"literal": 0, "regex": 0, "case_insensitive": 0, "word_boundary": 0, "normalize_whitespace": 0}
+    header = {
+        "schema_version": "nerb.bank.v1",
+        "id": spec.bank_id,
+        "name": "Synthetic Workload Bank",
+        "description": f"Deterministic bank generated by {WORKLOAD_GENERATOR}.",
+        "version": "2026.06.03",
+        "status": "active",
+        "created_at": SYNTHETIC_BANK_TIMESTAMP,
+        "updated_at": SYNTHETIC_BANK_TIMESTAMP,
+        "unicode_normalization": "none",
+        "default_regex_flags": [],
+        "metadata": {"generator": WORKLOAD_GENERATOR, "seed": spec.seed},
+    }
+    entity_prefix = _json_bytes(
+        {"description": "Synthetic workload entity.", "status": "active", "regex_flags": [], "metadata": {}}
+    )[:-1]
+    with _HashingWriter(path) as writer:
+        writer.write(_json_bytes(header)[:-1] + b',"entities":{')
+        for entity_index in range(spec.entity_count):
+            separator = b"," if entity_index else b""
+            writer.write(separator + b"\n" + _json_bytes(f"entity_{entity_index:06d}") + b":")
+            writer.write(entity_prefix + b',"names":{')
+            names = _iter_entity_names(spec, seed_key, entity_index, counts)
+            for name_offset, (name_id, name) in enumerate(names):
+                writer.write((b"," if name_offset else b"") + b"\n" + _json_bytes(name_id) + b":" + _json_bytes(name))
+            writer.write(b"}}")
+        writer.write(b"\n}}\n")
+    return writer.file_record(path.name), counts
+
+
+def _write_workload_documents(root: Path, spec: _WorkloadSpec) -> tuple[dict[str, int], dict[str, Any]]:
+    seed_key = _seed_key(spec.seed)
+    rng = random.Random(f"nerb-workload-documents:{spec.seed}")
+    total_hits = round(spec.document_count * spec.document_bytes * spec.match_density / 1024)
+    text_bytes = 0
+    planted = 0
+
+    if spec.document_format == "jsonl":
+        with _HashingWriter(root / WORKLOAD_DOCUMENTS_FILENAME) as writer:
+            for document_index in range(spec.document_count):
+                hit_count = _document_hit_count(document_index, spec.document_count, total_hits)
+                text = _document_text(spec, seed_key, rng, hit_count)
+                line = {"id": f"doc_{document_index:08d}", "text": text, "planted_matches": hit_count}
+                writer.write(_json_bytes(line) + b"\n")
+                text_bytes += len(text.encode("utf-8"))
+                planted += hit_count
+        files = {"documents": writer.file_record(WORKLOAD_DOCUMENTS_FILENAME)}
+    else:
+        documents_dir = root / WORKLOAD_DOCUMENTS_DIRNAME
+        documents_dir.mkdir(exist_ok=True)
+        with _HashingWriter(root / WORKLOAD_DOCUMENT_MANIFEST_FILENAME) as writer:
+            for document_index in range(spec.document_count):
+                hit_count = _document_hit_count(document_index, spec.document_count, total_hits)
+                payload = _document_text(spec, seed_key, rng, hit_count).encode("utf-8")
+                document_path = documents_dir / f"doc_{document_index:08d}.txt"
+                _write_bytes(document_path, payload)
+                writer.write(f"{WORKLOAD_DOCUMENTS_DIRNAME}/{document_path.name}\n".encode())
+                text_bytes += len(payload)
+                planted += hit_count
+        files = {"document_manifest": writer.file_record(WORKLOAD_DOCUMENT_MANIFEST_FILENAME)}
+
+    return {"documents": spec.document_count, "document_text_bytes": text_bytes, "planted_matches": planted}, files
+
+
+def _document_hit_count(document_index: int, document_count: int, total_hits: int) -> int:
+    return ((document_index + 1) * total_hits) // document_count - (document_index * total_hits) // document_count
+
+
+def _document_text(spec: _WorkloadSpec, seed_key: int, rng: random.Random, hit_count: int) -> str:
+    hits = [
+        _planted_text(_planned_pattern(spec, seed_key, rng.randrange(spec.pattern_count)), rng)
+        for _ in range(hit_count)
+    ]
+    filler_budget = spec.document_bytes - sum(len(hit) + 1 for hit in hits)
+    average_word_bytes = sum(len(word) + 1 for word in _FILLER_WORDS) / len(_FILLER_WORDS)
+    words = rng.choices(_FILLER_WORDS, k=max(0, round(filler_budget / average_word_bytes)))
+    for hit in hits:
+        words.insert(rng.randrange(len(words) + 1), hit)
+    return " ".join(words)
+
+
+def _json_bytes(value: Any, *, indent: int | None = None) -> bytes:
+    separators = None if indent is not None else (",", ":")
+    return json.dumps(value, ensure_ascii=False, indent=indent, separators=separators, allow_nan=False).encode("utf-8")
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    temporary = path.with_name(f".{path.name}.tmp")
+    with temporary.open("wb") as file:
+        file.write(payload)
+    os.replace(temporary, path)
+
+
+class _HashingWriter:
+    """Write a file through a temporary sibling while tracking its size and SHA-256."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._temporary = path.with_name(f".{path.name}.tmp")
+        self._file: BinaryIO | None = None
+        self._digest = hashlib.sha256()
+        self._bytes = 0
+
+    def __enter__(self) -> _HashingWriter:
+        self._file = self._temporary.open("wb")
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        if self._file is not None:
+            self._file.close()
+        if exc_type is None:
+            os.replace(self._temporary, self._path)
+        else:
+            self._temporary.unlink(missing_ok=True)
+
+    def write(self, payload: bytes) -> None:
+        if self._file is None:
+            raise RuntimeError("Workload writer is not open.")
+        self._file.write(payload)
+        self._digest.update(payload)
+        self._bytes += len(payload)
+
+    def file_record(self, relative_path: str) -> dict[str, Any]:
+        return {"path": relative_path, "bytes": self._bytes, "sha256": self._digest.hexdigest()}
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nerb import (
+    ExtractionError,
+    benchmark_bank,
+    benchmark_history_report,
+    load_benchmark_history,
+    record_benchmark_history,
+    regress_bank,
+)
+from nerb.benchmark_history import BENCHMARK_HISTORY_FILENAME, benchmark_environment_fingerprint
+
+
+@pytest.fixture
+def benchmark_result(test_data_path) -> dict[str, Any]:
+    with open(test_data_path / "minimal_bank.json", encoding="utf-8") as file:
+        bank = json.load(file)
+    return benchmark_bank(
+        bank,
+        options={"benchmark_iterations": 1, "stress_multiplier": 2, "benchmark_max_threads": 1},
+    )
+
+
+@pytest.fixture
+def minimal_bank_pair(test_data_path) -> tuple[dict[str, Any], dict[str, Any]]:
+    with open(test_data_path / "minimal_bank.json", encoding="utf-8") as file:
+        old_bank = json.load(file)
+    new_bank = copy.deepcopy(old_bank)
+    new_bank["version"] = "2026.06.04"
+    return old_bank, new_bank
+
+
+def _with_target_metrics(result: dict[str, Any], *, p95_seconds: float, bytes_per_second: float) -> dict[str, Any]:
+    adjusted = copy.deepcopy(result)
+    adjusted["tiers"]["target"]["latency"]["p95_seconds"] = p95_seconds
+    adjusted["tiers"]["target"]["throughput"]["bytes_per_second"] = bytes_per_second
+    return adjusted
+
+
+def _record_series(
+    result: dict[str, Any],
+    history_dir: Path,
+    values: list[tuple[float, float]],
+    *,
+    engine_versions: list[str] | None = None,
+) -> None:
+    for index, (p95_seconds, bytes_per_second) in enumerate(values):
+        sample = _with_target_metrics(result, p95_seconds=p95_seconds, bytes_per_second=bytes_per_second)
+        if engine_versions is not None:
+            sample["engine"]["version"] = engine_versions[index]
+        record_benchmark_history(sample, history_dir=history_dir, recorded_at=f"2026-10-{index + 1:02d}T00:00:00Z")
+
+
+def test_record_benchmark_history_appends_keyed_samples(benchmark_result, tmp_path):
+    samples = record_benchmark_history(benchmark_result, history_dir=tmp_path / "history", label="nightly")
+    record_benchmark_history(benchmark_result, history_dir=tmp_path / "history")
+
+    stored = load_benchmark_history(tmp_path / "history")
+    lines = (tmp_path / "history" / BENCHMARK_HISTORY_FILENAME).read_text(encoding="utf-8").splitlines()
+
+    assert len(samples) == 1
+    assert len(lines) == 2
+    assert stored[0] == samples[0]
+    assert stored[0]["label"] == "nightly"
+    assert stored[0]["key"] == {
+        "bank_hash": benchmark_result["bank"]["hash"],
+        "engine_version": benchmark_result["engine"]["version"],
+        "environment_fingerprint": benchmark_environment_fingerprint(benchmark_result["environment"]),
+        "profile_id": None,
+    }
+    target = stored[0]["metrics"]["tiers"]["target"]
+    assert target["p99_seconds"] == benchmark_result["tiers"]["target"]["latency"]["p99_seconds"]
+    assert target["bytes_per_second"] == benchmark_result["tiers"]["target"]["throughput"]["bytes_per_second"]
+    assert load_benchmark_history(tmp_path / "history", bank_hash="sha256:missing") == []
+
+
+def test_record_benchmark_history_splits_regression_results(minimal_bank_pair, tmp_path):
+    old_bank, new_bank = minimal_bank_pair
+    result = regress_bank(old_bank, new_bank, options={"benchmark_iterations": 1, "stress_multiplier": 2})
+
+    samples = record_benchmark_history(result, history_dir=tmp_path)
+
+    assert [sample["role"] for sample in samples] == ["old", "new"]
+    assert [sample["bank_version"] for sample in samples] == [old_bank["version"], new_bank["version"]]
+
+
+def test_benchmark_history_report_flags_regressions_beyond_noise(benchmark_result, tmp_path):
+    _record_series(
+        benchmark_result,
+        tmp_path,
+        [(0.010, 1000.0), (0.011, 1010.0), (0.009, 990.0), (0.010, 1005.0), (0.020, 600.0)],
+        engine_versions=["0.1.0", "0.1.0", "0.1.0", "0.1.0", "0.2.0"],
+    )
+
+    report = benchmark_history_report(tmp_path)
+
+    assert report["sample_count"] == 5
+    assert report["regressed"] is True
+    [series] = report["series"]
+    assert series["engine_versions"] == ["0.1.0", "0.2.0"]
+    assert series["latest_engine_version"] == "0.2.0"
+    p95 = series["metrics"]["target.p95_seconds"]
+    assert p95["status"] == "regressed"
+    assert p95["baseline_median"] == pytest.approx(0.0100)
+    assert p95["noise_band"][0] < 0.010 < p95["noise_band"][1] < 0.020
+    assert series["metrics"]["target.bytes_per_second"]["status"] == "regressed"
+    assert {item["metric"] for item in report["regressions"]} >= {"target.p95_seconds", "target.bytes_per_second"}
+    assert all(item["engine_version"] == "0.2.0" for item in report["regressions"])
+
+
+def test_benchmark_history_report_treats_noise_and_improvements_as_passing(benchmark_result, tmp_path):
+    _record_series(
+        benchmark_result,
+        tmp_path,
+        [(0.010, 1000.0), (0.011, 1010.0), (0.009, 990.0), (0.0102, 1002.0)],
+    )
+    noisy = benchmark_history_report(tmp_path)
+    _record_series(benchmark_result, tmp_path / "improved", [(0.010, 1000.0)] * 3 + [(0.004, 2500.0)])
+    improved = benchmark_history_report(tmp_path / "improved")
+
+    noisy_metrics = noisy["series"][0]["metrics"]
+    improved_metrics = improved["series"][0]["metrics"]
+    assert noisy_metrics["target.p95_seconds"]["status"] == "stable"
+    assert noisy_metrics["target.bytes_per_second"]["status"] == "stable"
+    assert improved_metrics["target.p95_seconds"]["status"] == "improved"
+    assert improved_metrics["target.bytes_per_second"]["status"] == "improved"
+    assert improved_metrics["target.p95_seconds"]["noise_band"] == [0.0095, 0.0105]
+
+
+def test_benchmark_history_report_requires_baseline_samples(benchmark_result, tmp_path):
+    _record_series(benchmark_result, tmp_path, [(0.010, 1000.0), (0.030, 300.0)])
+
+    report = benchmark_history_report(tmp_path)
+
+    assert report["regressed"] is False
+    assert report["series"][0]["metrics"]["target.p95_seconds"]["status"] == "insufficient_samples"
+    assert benchmark_history_report(tmp_path / "empty")["series"] == []
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"noise_multiplier": 0}, "noise_multiplier"),
+        ({"window": 0}, "window"),
+        ({"min_baseline_samples": True}, "min_baseline_samples"),
+        ({"min_relative_band": -0.1}, "min_relative_band"),
+    ],
+)
+def test_benchmark_history_report_rejects_invalid_options(tmp_path, kwargs, message):
+    with pytest.raises(ExtractionError, match=message):
+        benchmark_history_report(tmp_path, **kwargs)
+
+
+def test_load_benchmark_history_rejects_malformed_lines(tmp_path):
+    (tmp_path / BENCHMARK_HISTORY_FILENAME).write_text('{"schema_version": "other"}\n', encoding="utf-8")
+
+    with pytest.raises(ExtractionError, match="line 1"):
+        load_benchmark_history(tmp_path)
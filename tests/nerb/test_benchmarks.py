@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import copy
+import importlib
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +13,7 @@ from nerb import (
     ExtractionError,
     benchmark_bank,
     benchmark_fixture_profiles,
+    benchmark_literal_scale,
     make_benchmark_fixture_profile,
     regress_bank,
 )
@@ -58,6 +61,22 @@ EXPECTED_BENCHMARK_PROFILES = {
         "target_documents": ["adversarial_dense_hits", "adversarial_near_miss", "adversarial_mixed"],
         "record_counts": {"baseline": 4, "target": 52, "stress": 52},
     },
+    "non_ascii_dense": {
+        "workload": "non_ascii_dense",
+        "active_totals": {"entities": 24, "names": 48, "patterns": 96},
+        "by_kind": {"literal": 96, "regex": 0},
+        "bank_profile": "mostly_literal",
+        "target_documents": ["non_ascii_casefold", "non_ascii_whitespace", "non_ascii_mixed"],
+        "record_counts": {"baseline": 1, "target": 192, "stress": 192},
+    },
+    "dense_matches": {
+        "workload": "dense_matches",
+        "active_totals": {"entities": 16, "names": 32, "patterns": 32},
+        "by_kind": {"literal": 16, "regex": 16},
+        "bank_profile": "mixed",
+        "target_documents": ["dense_match_tokens", "dense_match_sparse"],
+        "record_counts": {"baseline": 32, "target": 6144, "stress": 8192},
+    },
 }
 
 
@@ -147,6 +166,79 @@ def test_benchmark_bank_reports_cache_compile_and_deterministic_tier_counts(mini
     assert _benchmark_projection(first) == _benchmark_projection(second)
 
 
+def test_benchmark_bank_reports_latency_memory_and_thread_scaling(minimal_bank):
+    result = benchmark_bank(
+        minimal_bank,
+        options={"benchmark_iterations": 2, "stress_multiplier": 2, "benchmark_max_threads": 3},
+    )
+
+    assert json.loads(json.dumps(result, allow_nan=False)) == result
+    for tier in result["tiers"].values():
+        latency = tier["latency"]
+        assert latency["sample_count"] == tier["document_count"] * tier["iterations"]
+        assert latency["percentile_method"] == "nearest_rank"
+        assert 0 <= latency["min_seconds"] <= latency["p50_seconds"] <= latency["p95_seconds"]
+        assert latency["p95_seconds"] <= latency["p99_seconds"] <= latency["max_seconds"]
+        assert sum(bucket["count"] for bucket in latency["histogram"]) == latency["sample_count"]
+        assert latency["histogram"][-1]["le_seconds"] is None
+        memory = tier["memory"]
+        native_buffer = memory["native_match_buffer"]
+        assert native_buffer["status"] == "supported"
+        assert native_buffer["capacity_matches"] >= native_buffer["peak_document_records"]
+        assert (
+            native_buffer["capacity_bytes"]
+            == native_buffer["capacity_matches"] * importlib.import_module("nerb._engine").RAW_MATCH_BYTES
+        )
+        assert memory["python_allocations"]["status"] == "supported"
+        assert memory["python_allocations"]["peak_bytes"] > 0
+        if memory["peak_rss_status"] == "supported":
+            assert memory["peak_rss_bytes"] > 0
+        if sys.platform == "linux":
+            assert memory["peak_rss_scope"] == "tier"
+            assert memory["peak_rss_growth_bytes"] >= 0
+
+    scaling = result["thread_scaling"]
+    assert result["options"]["max_threads"] == 3
+    assert scaling["tier"] == "target"
+    assert scaling["shared_bank"] is True
+    assert scaling["native_scan_slots"] == 8
+    assert [cell["threads"] for cell in scaling["cells"]] == [1, 2, 3]
+    assert scaling["record_count_stable"] is True
+    assert scaling["cells"][0]["speedup"] == 1.0
+    assert all(
+        cell["record_count"] == result["tiers"]["target"]["record_count"] * 2
+        and cell["latency"]["sample_count"] == result["tiers"]["target"]["document_count"] * 2
+        for cell in scaling["cells"]
+    )
+    assert result["summary"]["thread_scaling_max_threads"] == 3
+    assert result["summary"]["target_p99_seconds"] == result["tiers"]["target"]["latency"]["p99_seconds"]
+
+
+def test_benchmark_bank_reports_early_exit_scan_modes(minimal_bank):
+    result = benchmark_bank(minimal_bank, options={"benchmark_iterations": 2, "stress_multiplier": 2})
+
+    scan_modes = result["scan_modes"]
+    stress = result["tiers"]["stress"]
+    cells = {cell["mode"]: cell for cell in scan_modes["cells"]}
+    assert scan_modes["tier"] == "stress"
+    assert scan_modes["document_count"] == stress["document_count"]
+    assert list(cells) == ["scan", "scanner", "stop_after", "contains_any", "count"]
+    assert cells["scan"]["matches"] == cells["scanner"]["matches"] == cells["count"]["matches"]
+    assert cells["scan"]["matches"] == stress["record_count"]
+    assert cells["stop_after"]["matches"] == sum(
+        min(document["record_count"], scan_modes["stop_after"]) for document in stress["documents"]
+    )
+    assert cells["contains_any"]["matches"] == stress["documents_with_records"]
+    assert cells["scan"]["speedup_vs_scan"] == 1.0
+    assert all(cell["latency"]["sample_count"] == stress["document_count"] * 2 for cell in cells.values())
+
+
+@pytest.mark.parametrize("value", [0, -1, True, "2"])
+def test_benchmark_bank_rejects_invalid_max_threads(minimal_bank, value):
+    with pytest.raises(ExtractionError, match="benchmark_max_threads must be a positive integer"):
+        benchmark_bank(minimal_bank, options={"benchmark_max_threads": value})
+
+
 def test_benchmark_fixture_profiles_manifest_is_json_compatible_and_explicit():
     manifest = benchmark_fixture_profiles()
 
@@ -245,6 +337,35 @@ def test_synthetic_scale_bank_helper_is_deterministic_and_reports_rust_engine_pr
     assert make_synthetic_bank(name_count=6, patterns_per_name=4, entity_count=3, literal_ratio=0.75) == bank
 
 
+@pytest.mark.parametrize("literal_matcher", ["standard", "compact"])
+def test_literal_scale_benchmark_reports_native_literal_memory(literal_matcher):
+    result = benchmark_literal_scale(3_000, entity_count=2, literal_matcher=literal_matcher, scan_hits=50)
+    resources = result["literal_resources"]
+
+    assert result["schema_version"] == "nerb.literal_scale_benchmark.v1"
+    assert result["scan"]["records"] == result["scan"]["expected_records"] == 50
+    assert resources["literal_matcher"] == literal_matcher
+    assert resources["literal_patterns"] == 3_000
+    assert resources["accounted_bytes"] == resources["automaton_bytes"] + resources["literal_table_bytes"]
+    assert resources["accounted_bytes_per_pattern"] == resources["accounted_bytes"] // 3_000
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"pattern_count": 0}, "pattern_count"),
+        ({"entity_count": 4}, "entity_count"),
+        ({"literal_matcher": "dense"}, "literal_matcher"),
+        ({"word_boundaries": "yes"}, "word_boundaries"),
+    ],
+)
+def test_literal_scale_benchmark_rejects_invalid_shapes(overrides, message):
+    options = {"pattern_count": 3, "entity_count": 1, **overrides}
+
+    with pytest.raises(ExtractionError, match=message):
+        benchmark_literal_scale(**options)
+
+
 def test_regress_bank_reports_diff_eval_benchmark_deltas_and_quality_gate(tmp_path, minimal_bank):
     old_bank = copy.deepcopy(minimal_bank)
     eval_ref = _write_jsonl(
@@ -39,6 +39,7 @@ from nerb import (
 )
 from nerb.cli import _extract_records, _read_extraction_source, app
 from nerb.config import DEFAULT_CONFIG_ENV_VAR
+from nerb.enron_conformance import EnronConformanceOptions
 from nerb.replacements import create_replacement_db, load_replacement_db
 
 runner = CliRunner()
@@ -188,6 +189,8 @@ def test_help_shows_command_structure():
         "diff-banks",
         "extract-text",
         "extract-file",
+        "extract-corpus",
+        "read-records",
         "extract-report",
         "anonymize-text",
         "anonymize-file",
@@ -213,6 +216,8 @@ def test_help_shows_command_structure():
         "eval-enron-cmu-train",
         "eval-enron-conformance",
         "benchmark-bank",
+        "benchmark-history",
+        "generate-workload",
         "regress-bank",
         "extract",
         "extract-batch",
@@ -431,6 +436,28 @@ def test_json_bank_extraction_commands_match_helpers(tmp_path, test_data_path):
     assert json.loads(file_result.output)["source"]["bytes"] == 23
 
 
+def test_extract_corpus_command_writes_shards_and_resumes(tmp_path, test_data_path):
+    bank_path = test_data_path / "minimal_bank.json"
+    root = tmp_path / "corpus"
+    root.mkdir()
+    (root / "a.eml").write_text("Acme Corp", encoding="utf-8")
+    (root / "b.txt").write_text("Acme Corp", encoding="utf-8")
+    output_dir = tmp_path / "out"
+    args = ["extract-corpus", "--bank", str(bank_path), "--root", str(root), "--glob", "*.eml"]
+
+    first = runner.invoke(app, [*args, "--output-dir", str(output_dir), "--jobs", "2"])
+    resumed = runner.invoke(app, [*args, "--output-dir", str(output_dir)])
+    refused = runner.invoke(app, [*args, "--output-dir", str(output_dir), "--no-resume"])
+
+    assert first.exit_code == 0
+    assert json.loads(first.output)["summary"]["record_count"] == 1
+    assert json.loads((output_dir / "records-00000.jsonl").read_text(encoding="utf-8"))["path"] == "a.eml"
+    assert resumed.exit_code == 0
+    assert json.loads(resumed.output)["summary"]["skipped_count"] == 1
+    assert refused.exit_code == 1
+    assert "already has a checkpoint" in refused.output
+
+
 def test_json_bank_cli_enforces_text_source_rules(tmp_path, test_data_path):
     bank_path = test_data_path / "minimal_bank.json"
     document_path = tmp_path / "email.txt"
@@ -533,6 +560,8 @@ def test_json_bank_benchmark_and_regress_commands_return_json(tmp_path, test_dat
             "1",
             "--stress-multiplier",
             "2",
+            "--max-threads",
+            "2",
         ],
     )
     regress_result = runner.invoke(
@@ -552,10 +581,14 @@ def test_json_bank_benchmark_and_regress_commands_return_json(tmp_path, test_dat
 
     assert benchmark_result.exit_code == 0
     benchmark_payload = json.loads(benchmark_result.output)
-    expected_projection = benchmark_bank(bank, options={"benchmark_iterations": 1, "stress_multiplier": 2})
+    expected_projection = benchmark_bank(
+        bank,
+        options={"benchmark_iterations": 1, "stress_multiplier": 2, "benchmark_max_threads": 2},
+    )
     assert benchmark_payload["bank"]["id"] == expected_projection["bank"]["id"]
     assert benchmark_payload["options"] == expected_projection["options"]
     assert benchmark_payload["summary"]["cache_hit_verified"] is True
+    assert [cell["threads"] for cell in benchmark_payload["thread_scaling"]["cells"]] == [1, 2]
 
     assert regress_result.exit_code == 1
     regress_payload = json.loads(regress_result.output)
@@ -573,6 +606,79 @@ def test_json_bank_benchmark_and_regress_commands_return_json(tmp_path, test_dat
     assert regress_payload["gates"]["passed"] == expected_regression["gates"]["passed"]
 
 
+def test_benchmark_history_command_records_runs_and_reports_trends(tmp_path, test_data_path):
+    bank_path = test_data_path / "minimal_bank.json"
+    history_dir = tmp_path / "history"
+    for _ in range(2):
+        benchmark_result = runner.invoke(
+            app,
+            [
+                "benchmark-bank",
+                "--bank",
+                str(bank_path),
+                "--benchmark-iterations",
+                "1",
+                "--stress-multiplier",
+                "2",
+                "--max-threads",
+                "1",
+                "--history-dir",
+                str(history_dir),
+                "--history-label",
+                "ci",
+            ],
+        )
+        assert benchmark_result.exit_code == 0
+        assert json.loads(benchmark_result.output)["history"]["recorded_samples"] == 1
+
+    history_result = runner.invoke(app, ["benchmark-history", "--history-dir", str(history_dir)])
+    missing_dir_result = runner.invoke(app, ["benchmark-history"], env={"NERB_BENCHMARK_HISTORY_DIR": ""})
+
+    assert history_result.exit_code == 0
+    payload = json.loads(history_result.output)
+    assert payload["sample_count"] == 2
+    assert payload["regressed"] is False
+    assert payload["series"][0]["metrics"]["target.p95_seconds"]["status"] == "insufficient_samples"
+    assert missing_dir_result.exit_code != 0
+    assert "--history-dir" in missing_dir_result.output
+
+
+def test_generate_workload_command_writes_seeded_bank_and_corpus(tmp_path):
+    arguments = [
+        "generate-workload",
+        "--output-dir",
+        str(tmp_path),
+        "--entities",
+        "2",
+        "--names-per-entity",
+        "2",
+        "--patterns-per-name",
+        "3",
+        "--literal-ratio",
+        "0.5",
+        "--documents",
+        "4",
+        "--document-bytes",
+        "512",
+        "--match-density",
+        "4",
+        "--seed",
+        "3",
+    ]
+
+    result = runner.invoke(app, arguments)
+    repeat = runner.invoke(app, arguments)
+
+    assert result.exit_code == 0
+    payload = json.loads(result.output)
+    assert payload["counts"]["patterns"] == 12
+    assert payload["counts"]["planted_matches"] == 8
+    assert (tmp_path / "bank.json").is_file()
+    assert (tmp_path / "documents.jsonl").is_file()
+    assert repeat.exit_code != 0
+    assert "already exists" in repeat.output
+
+
 def test_prepare_enron_command_writes_private_run_and_returns_aggregate_json(tmp_path, test_data_path):
     output_dir = tmp_path / "prepared-run"
     scratch_dir = tmp_path / "verification-scratch"
@@ -601,12 +707,15 @@ def test_prepare_enron_command_writes_private_run_and_returns_aggregate_json(tmp
             str(2 * 1024),
             "--max-recipients-per-field",
             "2",
+            "--workers",
+            "2",
         ],
     )
 
     assert result.exit_code == 0, result.output
     payload = json.loads(result.output)
     assert payload["committed"] is True
+    assert payload["workers"] == 2
     assert payload["source_records"] == 8
     assert payload["prepared_records"] == 7
     assert payload["prepared_occurrences"] == 8
@@ -1482,6 +1591,7 @@ def test_enron_quality_commands_route_private_inputs_and_fail_closed(monkeypatch
         "records_path": records_path,
         "slice_specs_path": plan_path,
         "unsupported_slice_specs_path": unsupported_path,
+        "scan_threads": 1,
     }
 
     annotation_dir = tmp_path / "annotation-run"
@@ -1570,7 +1680,7 @@ def test_enron_conformance_command_commits_audit_and_exits_nonzero_on_gate_failu
         positive_path,
         negative_path,
         output_dir,
-        {"allow_unignored_output": True},
+        {"options": EnronConformanceOptions(), "allow_unignored_output": True},
     )
 
 
@@ -1733,6 +1843,77 @@ def test_extract_batch_json_compiles_once_and_preserves_document_order(monkeypat
     assert bank_cache_info()["hits"] == 1
 
 
+def test_extract_batch_jsonl_streams_documents_with_jobs_and_summary(monkeypatch, tmp_path):
+    monkeypatch.setenv(DEFAULT_CONFIG_ENV_VAR, str(tmp_path / "missing-default.yaml"))
+    manifest = tmp_path / "manifest.txt"
+    names = [f"doc-{index}.txt" for index in range(9)]
+    for index, name in enumerate(names):
+        (tmp_path / name).write_text("Rush " * index, encoding="utf-8")
+    manifest.write_text("\n".join(names) + "\n", encoding="utf-8")
+    command = ["extract-batch", "--manifest", str(manifest), "--all", "--detector", "ARTIST:Rush=Rush"]
+
+    ordered = runner.invoke(app, [*command, "--format", "jsonl", "--jobs", "3"])
+    unordered = runner.invoke(app, [*command, "--format", "jsonl", "--jobs", "3", "--unordered"])
+    serial_json = runner.invoke(app, [*command, "--format", "json"])
+
+    assert ordered.exit_code == 0
+    lines = _jsonl_records(ordered.output)
+    assert [line["document_id"] for line in lines[:-1]] == [str(tmp_path / name) for name in names]
+    assert [line["record_count"] for line in lines[:-1]] == list(range(9))
+    assert lines[-1]["summary"]["document_count"] == 9
+    assert lines[-1]["summary"]["record_count"] == 36
+    assert lines[-1]["summary"]["cache"]["key"]["compile_options"] == {"match_mode": "entity_independent"}
+    assert unordered.exit_code == 0
+    unordered_lines = _jsonl_records(unordered.output)
+    assert sorted(unordered_lines[:-1], key=lambda line: line["document_id"]) == sorted(
+        lines[:-1], key=lambda line: line["document_id"]
+    )
+    assert unordered_lines[-1]["summary"]["record_count"] == 36
+    assert serial_json.exit_code == 0
+    assert json.loads(serial_json.output)["documents"] == lines[:-1]
+
+
+def test_extract_batch_records_format_round_trips_through_read_records(monkeypatch, tmp_path):
+    monkeypatch.setenv(DEFAULT_CONFIG_ENV_VAR, str(tmp_path / "missing-default.yaml"))
+    documents = []
+    for index in range(3):
+        document = tmp_path / f"doc-{index}.txt"
+        document.write_text("Rush and Yes " * index, encoding="utf-8")
+        documents.append(str(document))
+    command = ["extract-batch", *documents, "--all", "--detector", "ARTIST:Rush=Rush", "--detector", "ARTIST:Yes=Yes"]
+    record_path = tmp_path / "batch.nerbrec"
+
+    written = runner.invoke(app, [*command, "--format", "records", "--output", str(record_path), "--jobs", "2"])
+    expected = runner.invoke(app, [*command, "--format", "json"])
+    read_json = runner.invoke(app, ["read-records", str(record_path)])
+    read_jsonl = runner.invoke(app, ["read-records", str(record_path), "--format", "jsonl"])
+    missing_output = runner.invoke(app, [*command, "--format", "records"])
+
+    assert written.exit_code == 0
+    assert json.loads(written.output)["record_count"] == 6
+    assert read_json.exit_code == 0
+    assert json.loads(read_json.output)["documents"] == json.loads(expected.output)["documents"]
+    assert _jsonl_records(read_jsonl.output) == json.loads(expected.output)["documents"]
+    assert missing_output.exit_code == 1
+    assert "--output exactly when --format is records" in missing_output.output
+
+
+def test_extract_batch_jsonl_emits_documents_before_a_later_manifest_error(monkeypatch, tmp_path):
+    monkeypatch.setenv(DEFAULT_CONFIG_ENV_VAR, str(tmp_path / "missing-default.yaml"))
+    (tmp_path / "first.txt").write_text("Rush", encoding="utf-8")
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("first.txt\nmissing.txt\n", encoding="utf-8")
+
+    result = runner.invoke(
+        app,
+        ["extract-batch", "--manifest", str(manifest), "--all", "--detector", "ARTIST:Rush=Rush", "--format", "jsonl"],
+    )
+
+    assert result.exit_code == 1
+    assert json.loads(result.stdout.splitlines()[0])["document_id"] == str(tmp_path / "first.txt")
+    assert "line 2 does not exist" in result.stderr
+
+
 def test_extract_uses_default_config_path_from_env(monkeypatch, tmp_path):
     config_path = save_config({"ARTIST": {"Rush": "Rush"}}, tmp_path / "default-detectors.yaml")
     monkeypatch.setenv(DEFAULT_CONFIG_ENV_VAR, str(config_path))
@@ -3009,6 +3190,41 @@ def test_cli_anonymize_file_refuses_unsaved_assignment_output(tmp_path):
     assert load_replacement_db(db_path)["assignments"] == {}
 
 
+def test_cli_anonymize_file_streams_output_identical_to_the_in_memory_path(tmp_path):
+    bank_path = _write_json(tmp_path / "people.json", _person_json_bank())
+    db_path = tmp_path / "replacements.json"
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.txt"
+    streamed_path = tmp_path / "streamed.txt"
+    input_path.write_text("John Smith joined.\r\nJohn  Smith left.\n" * 3, encoding="utf-8")
+
+    assert runner.invoke(app, ["replacement-db", "init", "--db", str(db_path), "--reversible"]).exit_code == 0
+    command = ["anonymize-file", "--bank", str(bank_path), "--db", str(db_path), "--file", str(input_path)]
+    missing_output = runner.invoke(app, [*command, "--stream", "--mode", "redact"])
+    unsaved_result = runner.invoke(app, [*command, "--output", str(streamed_path), "--stream", "--mode", "redact"])
+    in_memory_result = runner.invoke(app, [*command, "--output", str(output_path), "--mode", "redact", "--save-db"])
+    streamed_result = runner.invoke(app, [*command, "--output", str(streamed_path), "--stream", "--mode", "redact"])
+
+    assert missing_output.exit_code == 1
+    assert "--stream writes the transformed text only to --output" in missing_output.output
+    assert unsaved_result.exit_code == 1
+    assert "Refusing to write output that depends on new unsaved assignments" in unsaved_result.output
+    assert in_memory_result.exit_code == 0
+    assert streamed_result.exit_code == 0
+    assert streamed_path.read_bytes() == output_path.read_bytes()
+    assert output_path.read_bytes().startswith(b"[PERSON_0001] joined.\r\n[PERSON_0001] left.")
+    payload = json.loads(streamed_result.output)
+    assert "text" not in payload
+    assert payload["output"] == {
+        "bytes": len(output_path.read_bytes()),
+        "windows": 1,
+        "path": str(streamed_path),
+        "written": True,
+    }
+    assert payload["replacement_db"]["modified"] is False
+    assert not [path.name for path in tmp_path.iterdir() if path.name.endswith(".tmp")]
+
+
 def test_cli_file_outputs_refuse_overwrite_without_force(tmp_path):
     bank_path = _write_json(tmp_path / "people.json", _person_json_bank())
     db_path = tmp_path / "replacements.json"
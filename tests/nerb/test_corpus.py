@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from nerb import ExtractionError, extract_corpus
+
+
+@pytest.fixture
+def minimal_bank(test_data_path) -> dict[str, Any]:
+    with open(test_data_path / "minimal_bank.json", encoding="utf-8") as file:
+        return json.load(file)
+
+
+@pytest.fixture
+def corpus_root(tmp_path) -> Path:
+    root = tmp_path / "corpus"
+    (root / "inbox" / "nested").mkdir(parents=True)
+    (root / "inbox" / "a.eml").write_text("Acme Corp wrote back.", encoding="utf-8")
+    (root / "inbox" / "b.eml").write_text("Nothing to see.", encoding="utf-8")
+    (root / "inbox" / "nested" / "c.eml").write_text("acme corp and Acme Corp", encoding="utf-8")
+    (root / "inbox" / "notes.txt").write_text("Acme Corp", encoding="utf-8")
+    (root / "bad.eml").write_bytes(b"\xff\xfe")
+    return root
+
+
+def _shard_lines(output_dir: Path) -> list[dict[str, Any]]:
+    lines = []
+    for shard in sorted(output_dir.glob("records-*.jsonl")):
+        lines.extend(json.loads(line) for line in shard.read_text(encoding="utf-8").splitlines())
+    return lines
+
+
+def test_extract_corpus_writes_sorted_shards_and_checkpoint(tmp_path, corpus_root, minimal_bank):
+    output_dir = tmp_path / "out"
+
+    result = extract_corpus(minimal_bank, corpus_root, output_dir=output_dir, glob="*.eml", jobs=3, shard_documents=2)
+
+    assert result["output"]["shards"] == ["records-00000.jsonl", "records-00001.jsonl"]
+    assert result["summary"] == {"document_count": 4, "record_count": 3, "error_count": 1, "skipped_count": 0}
+    lines = _shard_lines(output_dir)
+    assert [line["path"] for line in lines] == ["bad.eml", "inbox/a.eml", "inbox/b.eml", "inbox/nested/c.eml"]
+    assert "not valid UTF-8" in lines[0]["error"]
+    assert [record["string"] for record in lines[3]["records"]] == ["acme corp", "Acme Corp"]
+    checkpoint = (output_dir / "checkpoint.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(checkpoint[0])["checkpoint"]["bank_hash"] == result["bank"]["hash"]
+    assert [json.loads(line)["path"] for line in checkpoint[1:]] == [line["path"] for line in lines]
+
+
+def test_extract_corpus_resume_trims_uncheckpointed_lines_and_skips_completed_files(
+    tmp_path, corpus_root, minimal_bank
+):
+    output_dir = tmp_path / "out"
+    extract_corpus(minimal_bank, corpus_root, output_dir=output_dir, glob="*.eml", shard_documents=2)
+    expected = _shard_lines(output_dir)
+
+    # Simulate a run interrupted after the shard line but before its checkpoint entry.
+    checkpoint_path = output_dir / "checkpoint.jsonl"
+    checkpoint = checkpoint_path.read_bytes().splitlines(keepends=True)
+    checkpoint_path.write_bytes(b"".join(checkpoint[:-1]) + checkpoint[-1][:10])
+
+    result = extract_corpus(minimal_bank, corpus_root, output_dir=output_dir, glob="*.eml", shard_documents=2)
+
+    assert result["summary"]["skipped_count"] == 3
+    assert result["summary"]["document_count"] == 1
+    assert result["output"]["shards"] == ["records-00002.jsonl"]
+    assert _shard_lines(output_dir) == expected
+
+    rerun = extract_corpus(minimal_bank, corpus_root, output_dir=output_dir, glob="*.eml")
+    assert rerun["summary"]["document_count"] == 0
+    assert rerun["output"]["shards"] == []
+
+
+def test_extract_corpus_rejects_mismatched_or_unresumable_checkpoints(tmp_path, corpus_root, minimal_bank):
+    output_dir = tmp_path / "out"
+    extract_corpus(minimal_bank, corpus_root, output_dir=output_dir, glob="*.eml")
+
+    with pytest.raises(ExtractionError, match="already has a checkpoint"):
+        extract_corpus(minimal_bank, corpus_root, output_dir=output_dir, glob="*.eml", resume=False)
+    with pytest.raises(ExtractionError, match="different bank or glob"):
+        extract_corpus(minimal_bank, corpus_root, output_dir=output_dir, glob="*.txt")
+    with pytest.raises(ExtractionError, match="jobs must be a positive integer"):
+        extract_corpus(minimal_bank, corpus_root, output_dir=tmp_path / "other", jobs=0)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import io
 
 import pytest
 
@@ -10,9 +11,12 @@ from nerb.deanonymization import (
     ByteEdit,
     DeanonymizationError,
     _anonymize_config_text_with_db_update,
+    _anonymize_stream_with_db_update,
+    _anonymize_text_with_db_update,
     allocate_assignment,
     anonymize_config_text,
     anonymize_file,
+    anonymize_stream,
     anonymize_text,
     apply_byte_replacements,
     assignment_key,
@@ -719,6 +723,61 @@ def test_anonymize_file_preserves_crlf_bytes_and_enforces_extraction_file_limit(
     assert limit_info.value.diagnostics[0]["code"] == "anonymize.extraction_error"
 
 
+def test_anonymize_stream_writes_the_in_memory_text_across_windows():
+    bank = _person_bank(extra_people=True)
+    for name in bank["entities"]["person"]["names"].values():
+        for pattern in name["patterns"].values():
+            pattern["normalize_whitespace"] = False
+    people = ["John Smith", "Johnny", "Jane Smith", "Alex Smith"] * 40
+    source = "".join(f"{person} joined 東京 on day {day}.\r\n" for day, person in enumerate(people))
+    db = create_replacement_db(reversible=True, now="2026-06-13T00:00:00Z")
+    whole, whole_db = _anonymize_text_with_db_update(bank, source, db, options={"mode": "redact"})
+
+    output = io.BytesIO()
+    streamed, streamed_db = _anonymize_stream_with_db_update(
+        bank,
+        io.BytesIO(source.encode("utf-8")),
+        output,
+        db,
+        options={"mode": "redact", "max_text_bytes": 256},
+    )
+
+    assert output.getvalue().decode("utf-8") == whole["text"]
+    assert streamed["output"]["bytes"] == len(whole["text"].encode("utf-8"))
+    assert streamed["output"]["windows"] > 20
+    assert streamed["summary"] == whole["summary"] == {"record_count": 160, "applied_count": 160, "diagnostic_count": 0}
+    assert streamed["source"] == {"type": "stream", "length": len(source), "bytes": len(source.encode("utf-8"))}
+    assert "text" not in streamed
+    assert "applied_replacements" not in streamed
+    assert streamed_db["assignments"].keys() == whole_db["assignments"].keys()
+
+    with pytest.raises(DeanonymizationError) as unbounded_info:
+        anonymize_stream(
+            _person_bank(),
+            io.BytesIO(source.encode("utf-8")),
+            io.BytesIO(),
+            db,
+            options={"mode": "redact", "max_text_bytes": 256, "include_sensitive_metadata": True},
+        )
+    assert "has no longest match" in unbounded_info.value.diagnostics[0]["message"]
+
+
+def test_anonymize_stream_cuts_inside_windows_that_end_in_whitespace_for_a_bank_without_patterns():
+    bank = _person_bank()
+    bank["entities"]["person"]["status"] = "draft"
+    source = ("John Smith joined.".ljust(31) + "\n") * 20
+    db = create_replacement_db(reversible=True, now="2026-06-13T00:00:00Z")
+
+    output = io.BytesIO()
+    streamed, _ = _anonymize_stream_with_db_update(
+        bank, io.BytesIO(source.encode("utf-8")), output, db, options={"mode": "redact", "max_text_bytes": 32}
+    )
+
+    assert output.getvalue() == source.encode("utf-8")
+    assert streamed["output"] == {"bytes": len(source), "windows": 30}
+    assert streamed["summary"] == {"record_count": 0, "applied_count": 0, "diagnostic_count": 0}
+
+
 def test_anonymize_text_name_scope_aliases_share_replacement_and_surface_scope_splits_surfaces():
     bank = _person_bank(include_alias=True)
     source = "John Smith and Johnny"
@@ -3,6 +3,8 @@ from __future__ import annotations
 import importlib
 import importlib.metadata
 import json
+import mmap
+import threading
 from pathlib import Path
 
 import pytest
@@ -16,6 +18,7 @@ class _FakeNativeBank:
         self.metadata_calls = 0
         self.detector_metadata_calls: list[int] = []
         self.path: str | None = None
+        self.scanned: object = None
         self._detectors = (
             ("NAME", "Alpha", "Alpha"),
             ("NAME", "Beta", "Beta"),
@@ -46,9 +49,10 @@ class _FakeNativeBank:
         return self._detectors[detector_index]
 
     def scan_bytes(self, source):
-        return self._matches(source)
+        self.scanned = source
+        return self._matches(source.encode() if isinstance(source, str) else bytes(source))
 
-    def scan_path_with_bytes(self, path):
+    def scan_path_with_bytes(self, path, threads=1, entities=None):
         self.path = path
         source = b"Beta Alpha"
         return self._matches(source), source
@@ -61,7 +65,8 @@ class _FakeNativeBank:
             while start >= 0:
                 matches.append((detector_index, start, start + len(token)))
                 start = source.find(token, start + len(token))
-        return matches
+        # The native engine returns raw matches in span order.
+        return sorted(matches, key=lambda match: (match[1], match[2], match[0]))
 
 
 def _fake_scan_records():
@@ -130,6 +135,98 @@ def test_public_bank_projects_byte_and_char_records_and_scans_paths(tmp_path):
     assert bank.scan_path(document_path) == bank.scan_text("Café Rush")
 
 
+def test_public_bank_scans_long_documents_in_chunks(tmp_path):
+    bank = nerb.Bank.from_source_bytes(b'{"ARTIST":{"Rush":"Rush"}}', format_hint="json")
+    document = "Café Rush played.\n".encode() * 40_000
+    document_path = tmp_path / "document.txt"
+    document_path.write_bytes(document)
+
+    serial = bank.scan_bytes(document)
+    assert len(serial) == 40_000
+    assert bank.scan_bytes(document, threads=4) == serial
+    assert bank.scan_path(document_path, threads=4) == bank.scan_path(document_path) == serial
+    for threads in (0, 9, True, "2"):
+        with pytest.raises(ValueError, match="threads must be an integer between 1 and 8"):
+            bank.scan_bytes(document, threads=threads)
+    with pytest.raises(ValueError, match="stop_after or threads, not both"):
+        bank.scan_bytes(document, stop_after=1, threads=2)
+
+
+def _chunk_cuts(document: bytes, chunk_bytes: int) -> list[int]:
+    # The native chunk cuts: each follows ASCII whitespace at or after the previous cut plus chunk_bytes.
+    cuts = [0]
+    target = chunk_bytes
+    while target < len(document):
+        offset = next(
+            (
+                index
+                for index in range(target, len(document))
+                if document[index - 1] in b" \t\n\x0c\r" and document[index] not in b" \t\n\x0c\r"
+            ),
+            None,
+        )
+        if offset is None:
+            break
+        cuts.append(offset)
+        target = offset + chunk_bytes
+    return cuts
+
+
+def test_chunked_scans_equal_serial_scans_when_matches_straddle_cuts():
+    bank = nerb.Bank.from_source_bytes(
+        json.dumps(
+            {
+                "CITY": {"New York City": "New York City"},
+                "STATE": {"New York": "New York"},
+                "PAIR": {"Rush Rush": "Rush Rush"},
+            }
+        ).encode(),
+        format_hint="json",
+    )
+    unit = "Rush " * 7 + "New York City. "
+    body = (unit * (700 * 1024 // len(unit))).encode()
+
+    for threads in (2, 3, 4, 8):
+        # Leading words shift the cuts until one of them falls inside a serial match.
+        for padding in range(len(unit.split())):
+            document = b"Rush " * padding + body
+            serial = bank.scan_bytes(document)
+            cuts = _chunk_cuts(document, max(-(-len(document) // threads), 256 * 1024))
+            if any(record["start"] < cut < record["end"] for cut in cuts[1:] for record in serial):
+                break
+        else:
+            pytest.fail(f"no chunk cut falls inside a match with {threads} threads")
+        assert len(cuts) > 1
+        assert bank.scan_bytes(document, threads=threads) == serial
+
+
+def test_public_bank_resolves_overlaps_from_a_match_buffer():
+    bank = nerb.Bank.from_source_bytes(
+        json.dumps(
+            {
+                "CITY": {"New York City": "New York City"},
+                "STATE": {"New York": "New York"},
+                "TEAM": {"York City": "York City"},
+                "A": {"Boston": "Boston"},
+                "B": {"Boston": "Boston"},
+            }
+        ).encode(),
+        format_hint="json",
+    )
+    raw = bank.scan_text_raw("New York City, Boston. Chicago")
+    matches = [(bank.detector(raw[index][0])[0], *raw[index][1:]) for index in range(len(raw))]
+    assert matches == [("STATE", 0, 8), ("CITY", 0, 13), ("TEAM", 4, 13), ("A", 15, 21), ("B", 15, 21)]
+
+    # Equal priorities keep the longest match, then the first detector in span order.
+    assert bank.resolve_overlaps(raw) == [(0, 3, 1), (3, 5, 3)]
+    tie_ranks = list(range(len(bank.metadata()["detectors"])))
+    a_detector, b_detector = raw[3][0], raw[4][0]
+    tie_ranks[a_detector], tie_ranks[b_detector] = tie_ranks[b_detector], tie_ranks[a_detector]
+    assert bank.resolve_overlaps(raw, tie_ranks=tie_ranks) == [(0, 3, 1), (3, 5, 4)]
+    with pytest.raises(ValueError, match="one rank per detector"):
+        bank.resolve_overlaps(raw, tie_ranks=[0])
+
+
 def test_public_bank_lazily_caches_detector_projection_for_repeated_scans():
     native = _FakeNativeBank()
     bank = nerb.Bank(native)
@@ -146,6 +243,49 @@ def test_public_bank_lazily_caches_detector_projection_for_repeated_scans():
     assert native.metadata_calls == 0
 
 
+def test_public_bank_borrows_read_only_buffers_and_ascii_text(tmp_path):
+    native = _FakeNativeBank()
+    bank = nerb.Bank(native)
+    text = "Beta Alpha"
+
+    assert bank.scan_text(text) == _fake_scan_records()
+    assert native.scanned is text
+    assert [record["offset_unit"] for record in bank.scan_text(text, offsets="char")] == ["char", "char"]
+    assert bank.scan_text("Café Alpha", offsets="char")[0]["start"] == 5
+    assert native.scanned == "Café Alpha".encode()
+
+    document_path = tmp_path / "document.txt"
+    document_path.write_bytes(b"header\nBeta Alpha")
+    with document_path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert bank.scan_bytes(memoryview(mapped)[7:]) == _fake_scan_records()
+        assert isinstance(native.scanned, memoryview)
+        assert native.scanned.obj is mapped
+        native.scanned = None
+
+    writable = bytearray(b"Beta Alpha")
+    assert bank.scan_bytes(memoryview(writable)) == _fake_scan_records()
+    assert type(native.scanned) is bytes
+
+
+def test_public_bank_copies_read_only_views_of_mutable_buffers(tmp_path):
+    native = _FakeNativeBank()
+    bank = nerb.Bank(native)
+    writable = bytearray(b"Beta Alpha")
+
+    read_only = memoryview(writable).toreadonly()
+    assert read_only.readonly
+    assert bank.scan_bytes(read_only) == _fake_scan_records()
+    assert type(native.scanned) is bytes
+    writable[:4] = b"Zeta"
+    assert native.scanned == b"Beta Alpha"
+
+    document_path = tmp_path / "document.txt"
+    document_path.write_bytes(b"Beta Alpha")
+    with document_path.open("r+b") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_WRITE) as mapped:
+        assert bank.scan_bytes(memoryview(mapped).toreadonly()) == _fake_scan_records()
+        assert type(native.scanned) is bytes
+
+
 def test_public_bank_metadata_mutation_cannot_change_cached_scan_projection():
     native = _FakeNativeBank()
     bank = nerb.Bank(native)
@@ -173,6 +313,302 @@ def test_public_bank_bounded_scan_stops_native_match_collection() -> None:
         bank.scan_text("AAA", max_matches=0)
 
 
+def test_public_bank_raw_batch_scan_matches_single_raw_scans():
+    bank = nerb.Bank.from_source_bytes(b'{"CODE":{"A":"A"},"WORD":{"Zoe":"Zo\\u00eb"}}', format_hint="json")
+    texts = ["A Zoë A", "", "Zoë", "nothing here"] * 5
+
+    def rows(raw):
+        return [raw[index] for index in range(len(raw))]
+
+    expected = [rows(bank.scan_text_raw(text)) for text in texts]
+    for threads in (1, 3):
+        assert [rows(raw) for raw in bank.scan_text_raw_batch(texts, threads=threads)] == expected
+    detector, start, end = expected[0][1]
+    assert bank.detector(detector) == ("WORD", "Zoe", "Zoe")
+    assert "A Zoë A".encode()[start:end] == "Zoë".encode()
+
+    with pytest.raises(MemoryError, match="configured match limit 1"):
+        bank.scan_text_raw_batch(texts, max_matches=1, threads=2)
+    with pytest.raises(ValueError, match="threads"):
+        bank.scan_text_raw_batch(texts, threads=0)
+
+
+def test_public_bank_scan_result_cache_is_opt_in_lru_within_byte_budget(monkeypatch):
+    class _CountingNativeBank(_FakeNativeBank):
+        def __init__(self) -> None:
+            super().__init__()
+            self.scans: list[object] = []
+
+        def scan_bytes(self, source):
+            self.scans.append(source)
+            return super().scan_bytes(source)
+
+        def scan_bytes_batch(self, haystacks, max_matches, threads, entities=None):
+            self.scans.extend(haystacks)
+            return [self._matches(haystack.encode()) for haystack in haystacks]
+
+    monkeypatch.setattr(engine_module, "_SCAN_RESULT_CACHE_MAX_BYTES", 0)
+    nerb.clear_scan_result_cache()
+    native = _CountingNativeBank()
+    bank = nerb.Bank(native, cache_key=nerb.Bank.from_config({"NAME": {"Alpha": "Alpha"}})._cache_key)
+    uncached_native = _CountingNativeBank()
+    uncached = nerb.Bank(uncached_native)
+
+    assert bank.scan_text("Beta Alpha") == bank.scan_text("Beta Alpha") == _fake_scan_records()
+    assert native.scans == ["Beta Alpha"] * 2
+    assert nerb.scan_result_cache_info()["enabled"] is False
+
+    native.scans.clear()
+    nerb.configure_scan_result_cache(1024)
+    assert bank.scan_text("Beta Alpha") == _fake_scan_records()
+    assert bank.scan_bytes(b"Beta Alpha") == _fake_scan_records()
+    assert [record["start"] for record in bank.scan_text("Beta Alpha", offsets="char")] == [0, 5]
+    uncached.scan_text("Beta Alpha")
+    uncached.scan_text("Beta Alpha")
+    assert native.scans == ["Beta Alpha"]
+    assert len(uncached_native.scans) == 2
+    entry_bytes = engine_module._SCAN_RESULT_ENTRY_BYTES + 2 * engine_module._SCAN_RESULT_MATCH_BYTES
+    assert nerb.scan_result_cache_info() == {
+        "enabled": True,
+        "size": 1,
+        "bytes": entry_bytes,
+        "max_bytes": 1024,
+        "hits": 2,
+        "misses": 1,
+        "evictions": 0,
+    }
+
+    native.scans.clear()
+    nerb.configure_scan_result_cache(entry_bytes + engine_module._SCAN_RESULT_MATCH_BYTES)
+    raw = bank.scan_text_raw_batch(["Beta Alpha", "Alpha", "Beta Alpha"])
+    assert [list(buffer) for buffer in raw] == [[(1, 0, 4), (0, 5, 10)], [(0, 0, 5)], [(1, 0, 4), (0, 5, 10)]]
+    assert native.scans == ["Alpha"]
+    bank.scan_text("Alpha")
+    bank.scan_text("Beta Alpha")
+    assert native.scans == ["Alpha", "Beta Alpha"]
+    assert nerb.scan_result_cache_info()["evictions"] == 2
+
+    nerb.configure_scan_result_cache(0)
+    assert nerb.scan_result_cache_info()["size"] == 0
+    with pytest.raises(ValueError, match="non-negative integer"):
+        nerb.configure_scan_result_cache(-1)
+    nerb.clear_scan_result_cache()
+
+
+def test_public_bank_entity_selection_matches_subset_compiled_bank(tmp_path):
+    config = {"NAME": {"Alpha": "Alpha"}, "CODE": {"Beta": "Beta"}, "CITY": {"Gamma": "Gamma"}}
+    text = "Alpha Beta Gamma Alpha"
+    bank = nerb.Bank.from_config(config)
+    subset = nerb.Bank.from_config({"NAME": config["NAME"], "CITY": config["CITY"]})
+
+    assert bank.entity_names() == ("CITY", "CODE", "NAME")
+    assert bank.scan_text(text, entities=["CITY", "NAME"]) == subset.scan_text(text)
+    assert bank.scan_text(text, entities=[]) == []
+
+    view = bank.select_entities(["NAME", "CITY"])
+    assert view.scan_text(text) == subset.scan_text(text)
+    assert view.scan_bytes(text.encode()) == subset.scan_bytes(text.encode())
+    assert [record["entity"] for record in view.scan_text(text, entities=["CITY", "CODE"])] == ["CITY"]
+    assert [list(raw) for raw in view.scan_text_raw_batch([text, "Beta"])] == [
+        list(view.scan_text_raw(text)),
+        [],
+    ]
+    texts = [text, "Beta", "Gamma Beta Alpha", ""] * 3
+    assert [list(raw) for raw in view.scan_text_raw_batch(texts, threads=3)] == [
+        list(view.scan_text_raw(batch_text)) for batch_text in texts
+    ]
+    document_path = tmp_path / "document.txt"
+    document_path.write_text(f"{text}\n" * 20_000, encoding="utf-8")
+    assert view.scan_path(document_path) == view.scan_path(document_path, threads=4) == subset.scan_path(document_path)
+    raw, _source = bank._native.scan_path_with_bytes(str(document_path), 1, [bank.entity_names().index("CODE")])
+    assert {bank.detector(raw[index][0])[0] for index in range(len(raw))} == {"CODE"}
+    assert bank.scan_text(text) == nerb.Bank.from_config(config).scan_text(text)
+
+    with pytest.raises(ValueError, match="Bank has no entity 'MISSING'"):
+        bank.select_entities(["MISSING"])
+    with pytest.raises(TypeError, match="iterable of entity names"):
+        bank.scan_text(text, entities="NAME")
+    overlapping = nerb.Bank.from_source_bytes(
+        b'{"NAME":{"Alpha":"Alpha"},"CODE":{"Beta":"Beta"}}',
+        format_hint="json",
+        compile_options_json='{"match_mode":"all_overlaps"}',
+    )
+    with pytest.raises(ValueError, match="requires match_mode entity_independent"):
+        overlapping.select_entities(["NAME"])
+
+    acquisitions = bank.scan_stats()["acquisitions"]
+    bank.select_entities(["CODE"])
+    assert bank.scan_stats()["acquisitions"] == acquisitions
+
+
+def test_public_bank_early_exit_modes_agree_with_full_scans():
+    bank = nerb.Bank.from_config({"NAME": {"Alpha": "Alpha", "Al": "Al"}, "CODE": {"Beta": "Beta"}})
+    text = "Alpha Beta Al Alpha"
+    full = bank.scan_text(text)
+
+    assert bank.scan_text(text, stop_after=2) == full[:2]
+    assert bank.scan_bytes(text.encode(), stop_after=10) == full
+    assert list(bank.scan_text_raw(text, stop_after=1)) == list(bank.scan_text_raw(text))[:1]
+    assert bank.contains_any(text) is True
+    assert bank.contains_any(b"nothing") is False
+    assert bank.contains_any("Beta", entities=["NAME"]) is False
+    assert bank.select_entities(["CODE"]).contains_any("Beta") is True
+    assert bank.count(text) == {
+        "total": 4,
+        "entities": {"CODE": 1, "NAME": 3},
+        "detectors": [
+            {"entity": "CODE", "canonical_name": "Beta", "surface_name": "Beta", "count": 1},
+            {"entity": "NAME", "canonical_name": "Alpha", "surface_name": "Alpha", "count": 2},
+            {"entity": "NAME", "canonical_name": "Al", "surface_name": "Al", "count": 1},
+        ],
+    }
+    assert bank.count(text, entities=["CODE"])["entities"] == {"CODE": 1}
+    assert bank.count("nothing") == {"total": 0, "entities": {}, "detectors": []}
+
+    with pytest.raises(ValueError, match="stop_after must be a positive integer"):
+        bank.scan_text(text, stop_after=0)
+    with pytest.raises(ValueError, match="max_matches or stop_after, not both"):
+        bank.scan_text(text, stop_after=1, max_matches=5)
+    with pytest.raises(TypeError, match="Bank.count haystack must be bytes-like"):
+        bank.count(42)
+
+
+def test_public_bank_scans_honor_deadlines_and_cancellation():
+    bank = nerb.Bank.from_config({"NAME": {"Alpha": "Alpha"}, "CODE": {"Beta": "Beta"}})
+    text = "Alpha Beta Alpha"
+    token = nerb.CancellationToken()
+
+    assert bank.scan_text(text, deadline_ms=60_000, cancel=token) == bank.scan_text(text)
+    assert bank.count(text, deadline_ms=60_000)["total"] == 3
+    assert token.cancelled is False
+
+    token.cancel()
+    assert token.cancelled is True
+    scans = [
+        lambda: bank.scan_text(text, cancel=token),
+        lambda: bank.scan_bytes(text.encode(), entities=["CODE"], cancel=token),
+        lambda: bank.scan_text_raw(text, stop_after=1, cancel=token),
+        lambda: bank.contains_any(text, cancel=token),
+        lambda: bank.count(text, cancel=token),
+    ]
+    for scan in scans:
+        with pytest.raises(nerb.ScanTimeoutError, match="scan was cancelled") as exc_info:
+            scan()
+        assert exc_info.value.reason == "cancelled"
+        assert set(exc_info.value.progress) == {"elapsed_ms", "shards_completed", "shards_total", "matches"}
+        assert isinstance(exc_info.value, TimeoutError)
+
+    with pytest.raises(ValueError, match="deadline_ms must be a positive integer"):
+        bank.scan_text(text, deadline_ms=0)
+    with pytest.raises(TypeError, match="cancel must be a CancellationToken"):
+        bank.scan_text(text, cancel=True)
+
+
+def test_public_bank_scan_stats_count_slot_acquisitions():
+    bank = nerb.Bank.from_config({"NAME": {"Alpha": "Alpha"}, "CODE": {"Beta": "Beta"}})
+    before = bank.scan_stats()
+
+    assert bank.try_scan("Alpha Beta") == bank.scan_text("Alpha Beta")
+    assert bank.try_scan(b"Beta", entities=["CODE"])[0]["entity"] == "CODE"
+    assert bank.contains_any("Alpha", max_wait_ms=1_000) is True
+
+    stats = bank.scan_stats()
+    assert stats["max_concurrent_scans"] == 8
+    assert stats["active"] == 0
+    assert stats["acquisitions"] >= before["acquisitions"] + 3
+    assert stats["rejected"] == 0
+    assert sum(bucket["count"] for bucket in stats["wait_histogram"]) == stats["acquisitions"]
+    assert stats["wait_histogram"][-1]["le_us"] is None
+    assert set(bank.metadata()["scan_stats"]) == set(stats)
+    with pytest.raises(ValueError, match="max_wait_ms must be a non-negative integer"):
+        bank.scan_text("Alpha", max_wait_ms=-1)
+
+
+def test_scanner_reuses_one_match_buffer_and_matches_bank_scans():
+    bank = nerb.Bank.from_config({"NAME": {"Alpha": "Alpha"}, "CODE": {"Beta": "Beta"}})
+    scanner = bank.scanner()
+    texts = ["Alpha Beta", "Café Alpha", "", "Beta Beta Beta"]
+
+    for text in texts:
+        assert scanner.scan_text(text) == bank.scan_text(text)
+        assert scanner.scan_text(text, offsets="char") == bank.scan_text(text, offsets="char")
+        assert scanner.scan_bytes(text.encode()) == bank.scan_bytes(text.encode())
+    assert scanner.scan_text("Alpha Beta", entities=["CODE"]) == bank.scan_text("Alpha Beta", entities=["CODE"])
+    view_scanner = nerb.Scanner(bank.select_entities(["NAME"]))
+    assert view_scanner.scan_text("Alpha Beta") == bank.scan_text("Alpha Beta", entities=["NAME"])
+
+    first = scanner.scan_text_raw("Alpha Beta")
+    assert list(first) == [(1, 0, 5), (0, 6, 10)]
+    assert scanner.scan_text_raw("Beta") is first
+    assert list(first) == [(0, 0, 4)]
+    with pytest.raises(MemoryError, match="match limit"):
+        scanner.scan_text("Beta Beta Beta", max_matches=2)
+    assert scanner.scan_text("Beta Beta Beta") == bank.scan_text("Beta Beta Beta")
+
+    with pytest.raises(TypeError, match="Scanner.scan_text text must be a string"):
+        scanner.scan_text(b"Alpha")
+    errors: list[BaseException] = []
+    worker = threading.Thread(target=lambda: _capture_error(errors, lambda: scanner.scan_text("Alpha")))
+    worker.start()
+    worker.join()
+    assert [type(error) for error in errors] == [RuntimeError]
+
+
+def test_scanner_unbounded_scan_after_bounded_scan_drops_the_match_limit(monkeypatch):
+    # Without the result cache every scan reaches the scanner's native buffer.
+    monkeypatch.setattr(engine_module, "_SCAN_RESULT_CACHE_MAX_BYTES", 0)
+    bank = nerb.Bank.from_config({"CODE": {"Beta": "Beta"}})
+    scanner = bank.scanner()
+
+    bounded = scanner.scan_text_raw("Beta Beta", max_matches=2)
+    assert len(bounded) == 2
+    unbounded = scanner.scan_text_raw("Beta Beta Beta Beta")
+    assert unbounded is bounded
+    assert len(unbounded) == 4
+    with pytest.raises(MemoryError, match="match limit"):
+        scanner.scan_text("Beta Beta Beta", max_matches=2)
+    assert scanner.scan_text("Beta Beta Beta") == bank.scan_text("Beta Beta Beta")
+    assert len(scanner.scan_bytes(b"Beta " * 5)) == 5
+
+
+def _capture_error(errors: list[BaseException], call) -> None:
+    try:
+        call()
+    except BaseException as exc:
+        errors.append(exc)
+
+
+def test_public_bank_try_scan_returns_none_when_every_slot_is_busy():
+    class BusyNativeBank:
+        def scan_bytes_with(self, *args, **kwargs):
+            assert kwargs["max_wait_ms"] == 0
+            raise TimeoutError(
+                "scan rejected after waiting 0 ms because all 8 scan slots were busy", "busy", 0, 0, 0, 0
+            )
+
+    bank = nerb.Bank(BusyNativeBank())
+
+    assert bank.try_scan("Alpha") is None
+    with pytest.raises(nerb.ScanBusyError, match="scan slots were busy") as exc_info:
+        bank.scan_text("Alpha", max_wait_ms=0)
+    assert exc_info.value.reason == "busy"
+    assert isinstance(exc_info.value, nerb.ScanTimeoutError)
+
+
+def test_public_bank_entity_selection_keys_scan_result_cache(monkeypatch):
+    monkeypatch.setattr(engine_module, "_SCAN_RESULT_CACHE_MAX_BYTES", 0)
+    nerb.clear_scan_result_cache()
+    nerb.configure_scan_result_cache(1024 * 1024)
+    bank = nerb.Bank.from_config({"NAME": {"Alpha": "Alpha"}, "CODE": {"Beta": "Beta"}})
+
+    assert [record["entity"] for record in bank.scan_text("Alpha Beta")] == ["NAME", "CODE"]
+    assert [record["entity"] for record in bank.scan_text("Alpha Beta", entities=["CODE"])] == ["CODE"]
+    assert [record["entity"] for record in bank.select_entities(["NAME"]).scan_text("Alpha Beta")] == ["NAME"]
+    assert nerb.scan_result_cache_info()["size"] == 3
+
+    nerb.configure_scan_result_cache(0)
+
+
 def test_public_bank_scan_path_projects_native_scanned_bytes(tmp_path):
     native = _FakeNativeBank()
     bank = nerb.Bank(native)
@@ -180,7 +616,7 @@ def test_public_bank_scan_path_projects_native_scanned_bytes(tmp_path):
 
     assert bank.scan_path(missing_path) == _fake_scan_records()
     assert native.path == str(missing_path)
-    assert native.detector_metadata_calls == [0, 1]
+    assert native.detector_metadata_calls == [1, 0]
     assert native.metadata_calls == 0
 
 
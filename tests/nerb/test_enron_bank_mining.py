@@ -168,6 +168,67 @@ def test_candidate_mining_is_row_order_independent(tmp_path: Path) -> None:
     assert first == second
 
 
+def test_candidate_mining_batches_and_workers_preserve_the_serial_pool(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rows = [
+        _sender_record(
+            index,
+            address=f"person.{index % 7}@example.invalid",
+            current_body=f"Synthetic source record {index}.\nPerson {index % 7}",
+        )
+        for index in range(1, 29)
+    ] + [_display_name_record(index, name="Zoë O'Brien", address="zoe.obrien@example.invalid") for index in (40, 41)]
+    policy = EnronBankPolicy()
+    source_sha256 = "sha256:" + "f" * 64
+    serial_spool = tmp_path / "serial.sqlite3"
+    serial_spool.touch()
+    serial = mine_enron_candidates(rows, sqlite_path=serial_spool, train_artifact_sha256=source_sha256, policy=policy)
+
+    monkeypatch.setattr(bank_builder_module, "_MINING_FLUSH_RECORDS", 4)
+    monkeypatch.setattr(bank_builder_module, "_MINING_PROJECTION_BATCH_RECORDS", 3)
+    parallel_spool = tmp_path / "parallel.sqlite3"
+    parallel_spool.touch()
+    parallel = mine_enron_candidates(
+        rows,
+        sqlite_path=parallel_spool,
+        train_artifact_sha256=source_sha256,
+        policy=policy,
+        workers=2,
+    )
+
+    assert parallel == serial
+    duplicate_spool = tmp_path / "duplicate.sqlite3"
+    duplicate_spool.touch()
+    with pytest.raises(EnronBankBuildError, match="duplicate document identifier"):
+        mine_enron_candidates(
+            [*rows[:5], rows[0]],
+            sqlite_path=duplicate_spool,
+            train_artifact_sha256=source_sha256,
+            policy=policy,
+        )
+
+
+def test_observation_digest_bytes_match_canonical_json() -> None:
+    observation = {
+        "document_id": "doc_\u2028",
+        "group_id": 'sha256:"quoted"\\',
+        "observed_at": None,
+        "occurrences": 3,
+        "related": "zoë@example.invalid",
+        "surface": "Zoë\tO'Brien\x00",
+        "source_type": "structured_display_name",
+    }
+
+    assert bank_builder_module._observation_digest_bytes(**observation) == (
+        bank_builder_module._canonical_json_bytes(observation)
+    )
+    assert bank_builder_module._observation_digest_bytes(**{**observation, "observed_at": "2001-01-01T00:00:00Z"}) == (
+        bank_builder_module._canonical_json_bytes({**observation, "observed_at": "2001-01-01T00:00:00Z"})
+    )
+
+
 def test_candidate_mining_uses_only_the_bounded_main_spool_file(tmp_path: Path) -> None:
     rows = [
         _sender_record(
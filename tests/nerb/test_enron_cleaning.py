@@ -5,6 +5,7 @@ from typing import Any, cast
 
 import pytest
 
+import nerb.enron_cleaning as enron_cleaning
 from nerb.enron_cleaning import (
     CLEANING_POLICY_SHA256,
     CLEANING_POLICY_VERSION,
@@ -646,3 +647,19 @@ def test_multipart_part_budget_has_a_stable_reason() -> None:
     with pytest.raises(EnronCleaningError, match="^invalid or unsafe Enron text$") as caught:
         clean_email_body(body, len(body) + 1, len(body.encode()) + 1)
     assert caught.value.reason is EnronCleaningReason.MIME_STRUCTURE_LIMIT
+
+
+def test_grouping_filter_candidates_cover_every_character_the_filter_changes() -> None:
+    unchanged = [
+        character
+        for codepoint in range(0x110000)
+        if not 0xD800 <= codepoint <= 0xDFFF
+        and enron_cleaning._GROUPING_FILTER_CANDIDATE_RE.match(character := chr(codepoint)) is None
+    ]
+    text = "".join(unchanged)
+
+    assert enron_cleaning._filter_grouping_characters(text) == text
+    assert enron_cleaning._filter_grouping_characters_scalar(text) == text
+    mixed = "a\u200db \u0915\u200d\u0937 \x07\u202eStra\u00dfe\ufeff\u0085\n\u180e\U000e0001end"
+    assert enron_cleaning._filter_grouping_characters(mixed) == "ab \u0915\u200d\u0937  Stra\u00dfe \nend"
+    assert enron_cleaning._filter_grouping_characters_scalar(mixed) == enron_cleaning._filter_grouping_characters(mixed)
@@ -618,6 +618,46 @@ def test_expected_span_must_align_to_utf8_scalar_boundaries() -> None:
         evaluate_enron_conformance(bank, positive, negative)
 
 
+def test_expected_string_must_equal_its_span_before_span_only_classification(monkeypatch) -> None:
+    bank = _bank()
+    positive, negative = _adversarial_cases(bank)
+    expected = positive[0]["expected"][0]
+    text_bytes = positive[0]["text"].encode("utf-8")
+    assert text_bytes[expected["start"] : expected["end"]].decode("utf-8") == expected["string"]
+    expected["string"] = "private wrong string"
+
+    def classify(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("a mismatched string must be rejected before exact-span classification")
+
+    monkeypatch.setattr(conformance_module, "_classify_expected", classify)
+    with pytest.raises(EnronConformanceError, match="string disagrees with its span") as exc_info:
+        evaluate_enron_conformance(bank, positive, negative)
+
+    assert "private wrong string" not in str(exc_info.value)
+
+
+def test_threaded_span_batches_equal_per_case_finditer() -> None:
+    bank = _bank()
+    positive, negative = _adversarial_cases(bank)
+    texts = [str(case["text"]) for case in [*positive, *negative]] * 4
+    compiled, _cache_hit = conformance_module.compile_bank(bank, options={"include_statuses": ["active"]})
+    per_case = [
+        [
+            (record["start"], record["end"], record["entity_id"], record["name_id"], record["pattern_id"])
+            for record in compiled.finditer(text)
+        ]
+        for text in texts
+    ]
+    assert any(per_case)
+
+    for threads in (1, 2, 8):
+        batch = compiled.finditer_spans_batch(texts, max_matches=1_000, threads=threads)
+        assert [
+            [(start, end, identity.entity_id, identity.name_id, identity.pattern_id) for start, end, identity in spans]
+            for spans in batch
+        ] == per_case
+
+
 def test_unknown_or_inactive_expected_pattern_is_rejected() -> None:
     bank = _bank()
     positive, negative = _adversarial_cases(bank)
@@ -657,7 +697,9 @@ def test_same_identity_wrong_pattern_classification_scales_linearly() -> None:
         }
         for index in range(5_000)
     ]
-    actual = [{**item, "pattern_id": f"actual_{index}"} for index, item in enumerate(expected)]
+    actual = [
+        ("person", "same_name", f"actual_{index}", "literal", "Same Name", 0, 9) for index in range(len(expected))
+    ]
 
     statuses = conformance_module._classify_expected(expected, actual)
 
@@ -691,10 +733,11 @@ def test_compile_failures_do_not_echo_private_bank_values(monkeypatch) -> None:
     assert "private canonical value" not in str(caught.value)
 
 
-def test_scan_requires_native_byte_offset_records(monkeypatch) -> None:
+def test_batched_native_scans_match_across_batch_sizes_without_record_dicts(monkeypatch) -> None:
     bank = _bank()
     positive, negative = _adversarial_cases(bank)
     original_compile = conformance_module.compile_bank
+    batch_sizes: list[int] = []
 
     class Proxy:
         def __init__(self, compiled: Any) -> None:
@@ -704,16 +747,31 @@ def test_scan_requires_native_byte_offset_records(monkeypatch) -> None:
             return getattr(self._compiled, name)
 
         def finditer(self, text: str, *, max_matches: int | None = None) -> list[dict[str, Any]]:
+            raise AssertionError("conformance scans must not materialize record dicts")
+
+        def finditer_spans_batch(self, texts: Any, *, max_matches: int | None = None, threads: int = 1) -> Any:
             assert max_matches is not None
-            return [{**record, "offset_unit": "char"} for record in self._compiled.finditer(text)]
+            batch_sizes.append(len(texts))
+            return self._compiled.finditer_spans_batch(texts, max_matches=max_matches, threads=threads)
 
     def proxy_compile(*args: Any, **kwargs: Any) -> Any:
         compiled, cache_hit = original_compile(*args, **kwargs)
         return Proxy(compiled), cache_hit
 
+    expected = evaluate_enron_conformance(bank, positive, negative)
     monkeypatch.setattr(conformance_module, "compile_bank", proxy_compile)
-    with pytest.raises(EnronConformanceError, match="UTF-8 byte offsets"):
-        evaluate_enron_conformance(bank, positive, negative)
+    batched = evaluate_enron_conformance(
+        bank,
+        positive,
+        negative,
+        options=EnronConformanceOptions(scan_batch_cases=2, scan_threads=3),
+    )
+
+    assert batched == expected
+    assert max(batch_sizes) == 2
+    assert sum(batch_sizes) == len(positive) + len(negative)
+    with pytest.raises(EnronConformanceError, match="scan threads"):
+        evaluate_enron_conformance(bank, positive, negative, options=EnronConformanceOptions(scan_threads=9))
 
 
 def test_file_evaluator_commits_canonical_private_audit_and_returns_only_safe_aggregate(tmp_path: Path) -> None:
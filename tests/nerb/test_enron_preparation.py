@@ -20,6 +20,7 @@ import pytest
 
 import nerb.enron_activity as enron_activity_module
 import nerb.enron_preparation as enron_preparation
+from nerb.enron_cleaning import EnronCleaningError, clean_email_body
 from nerb.enron_preparation import (
     PREPARED_RECORD_SCHEMA_VERSION,
     PROFILE_SCHEMA_VERSION,
@@ -880,6 +881,46 @@ def test_reordered_source_produces_identical_prepared_profile_and_manifest(
     assert first_receipt["transport_prefix_sha256"] is None
 
 
+def test_worker_pool_preparation_is_byte_identical_to_serial_preparation(tmp_path: Path, test_data_path: Path) -> None:
+    lines = (test_data_path / "enron_preparation.jsonl").read_text(encoding="utf-8").splitlines()
+    generated = [
+        json.dumps(
+            {
+                "message_id": f"<worker-{index:03d}@fixture.invalid>",
+                "subject": f"Worker batch {index % 7}",
+                "from": f"worker{index % 5}@fixture.invalid",
+                "to": [f"peer{index % 3}@fixture.invalid"],
+                "date": "2001-03-04T05:06:07Z",
+                "body": f"<p>Row {index} body</p>\n\n> quoted {index % 4}\n" + "filler words " * (index % 9),
+                "file_name": f"worker{index % 5}/inbox/{index}.",
+            },
+            separators=(",", ":"),
+        )
+        for index in range(150)
+    ]
+    # Duplicates land both inside a pending batch and after their first copy has been spooled.
+    rows = [*lines, *generated, generated[3], '{"message_id":', *generated[:40], *reversed(generated[140:])]
+    source = tmp_path / "workers.jsonl"
+    source.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    serial_summary, serial = _prepare(source, tmp_path / "serial")
+    parallel_summary, parallel = _prepare(source, tmp_path / "parallel", workers=2)
+
+    assert parallel_summary["workers"] == 2
+    for name in ("prepared.jsonl", "rejections.jsonl", "profile.json", "manifest.json"):
+        assert (serial.root / name).read_bytes() == (parallel.root / name).read_bytes()
+    assert parallel_summary["manifest_sha256"] == serial_summary["manifest_sha256"]
+    assert parallel_summary["near_duplicate_features"]["views"] == serial_summary["near_duplicate_features"]["views"]
+    load_enron_preparation_run(parallel.root, scratch_dir=_verification_scratch(tmp_path))
+
+
+@pytest.mark.parametrize("workers", [0, True, 65])
+def test_preparation_rejects_invalid_worker_counts(tmp_path: Path, test_data_path: Path, workers: Any) -> None:
+    with pytest.raises(ValueError, match="workers"):
+        prepare_enron_source(_options(test_data_path / "enron_preparation.jsonl", tmp_path / "run", workers=workers))
+    assert not (tmp_path / "run").exists()
+
+
 def test_row_limited_local_receipt_labels_prefix_hash_as_incomplete(tmp_path: Path, test_data_path: Path) -> None:
     source = test_data_path / "enron_preparation.jsonl"
     _, run = _prepare(source, tmp_path / "limited", max_rows=1)
@@ -1775,3 +1816,41 @@ def test_bit_sliced_simhash_majority_matches_naive_tie_semantics() -> None:
             expected |= 1 << bit
 
     assert enron_preparation._simhash64_majority(values) == expected
+    assert enron_preparation._simhash64_majority_scalar(values) == expected
+
+
+@pytest.mark.parametrize("numpy_backend", [True, False])
+def test_batched_near_duplicate_features_match_reference_over_fixture_corpus(
+    test_data_path: Path, monkeypatch: pytest.MonkeyPatch, numpy_backend: bool
+) -> None:
+    if numpy_backend and enron_preparation._numpy is None:
+        pytest.skip("NumPy is not installed.")
+    if not numpy_backend:
+        monkeypatch.setattr(enron_preparation, "_numpy", None)
+    texts: list[str] = ["", "one", "one two", "Zero\u200bwidth a\u200db \x07 bell \u202e rtl"]
+    for line in (test_data_path / "enron_preparation.jsonl").read_text(encoding="utf-8").splitlines():
+        row = json.loads(line)
+        body = row["body"] if isinstance(row.get("body"), str) else ""
+        try:
+            cleaned = clean_email_body(body, 1_000_000, 4_000_000)
+        except EnronCleaningError:
+            continue
+        texts.extend([body, cleaned.full_visible_body, cleaned.current_body, cleaned.current_body_core])
+    texts.append(" ".join(f"token{index % 5_003} word{index % 7}" for index in range(12_000)))
+
+    for text in texts:
+        assert enron_preparation._near_duplicate_features(text) == (
+            enron_preparation._near_duplicate_features_reference(text)
+        )
+    assert enron_preparation._near_duplicate_features(texts[-1])["shingle_count"] == 4096
+
+
+def test_preparation_summary_reports_calibrated_near_duplicate_speedup(test_data_path: Path, tmp_path: Path) -> None:
+    summary, run = _prepare(test_data_path / "enron_preparation.jsonl", tmp_path / "run")
+
+    profile = summary["near_duplicate_features"]
+    assert profile["backend"] == ("python" if enron_preparation._numpy is None else "numpy")
+    assert profile["views"] >= len(run.records)
+    assert profile["calibration"]["views"] == min(profile["views"], 64)
+    assert profile["calibration"]["speedup"] is None or profile["calibration"]["speedup"] > 0
+    assert "near_duplicate_features" not in json.dumps(run.profile)
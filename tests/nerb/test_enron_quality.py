@@ -826,6 +826,37 @@ def test_prepare_compiles_once_and_consume_never_recompiles(monkeypatch: pytest.
     assert calls == 1
 
 
+def test_batched_stream_scans_match_per_document_consume(monkeypatch: pytest.MonkeyPatch) -> None:
+    records = [
+        _record("doc_1", "Alice met Alicia", [_gold("doc_1", 0, 5, catalog_name_id="alice")]),
+        _record("doc_2", "Zoë wrote to Alicia", [_gold("doc_2", 13, 19, catalog_name_id="alicia")]),
+        _record("doc_3", "No sensitive value"),
+        _record("doc_4", "Alice Alice", [_gold("doc_4", 6, 11, catalog_name_id="alice")]),
+        _record("doc_5", "Alicia"),
+    ]
+    session = prepare_enron_quality(_bank(), slice_specs=[_slice()])
+    for record in records:
+        session.consume(record["document"], record["gold_spans"], record["slice_ids"])
+    expected = session.finish()
+
+    batch_sizes: list[int] = []
+    consume_batch = quality_module.EnronQualitySession.consume_batch
+
+    def counted(self: Any, items: Any) -> None:
+        batch_sizes.append(len(items))
+        consume_batch(self, items)
+
+    monkeypatch.setattr(quality_module, "DEFAULT_QUALITY_SCAN_BATCH_DOCUMENTS", 2)
+    monkeypatch.setattr(quality_module.EnronQualitySession, "consume_batch", counted)
+
+    assert _run(records, scan_threads=3) == expected
+    assert batch_sizes == [2, 2, 1]
+    with pytest.raises(EnronQualityError, match="per-document prediction"):
+        _run(records, max_predictions_per_document=1)
+    with pytest.raises(EnronQualityError, match="scan threads"):
+        _run(records, scan_threads=0)
+
+
 def test_person_contact_panel_reuses_one_scan_and_accumulates_cross_class_unions(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
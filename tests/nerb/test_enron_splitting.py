@@ -3,6 +3,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import random
 import re
 import shutil
 import sqlite3
@@ -887,6 +888,8 @@ def test_split_artifacts_are_byte_deterministic_and_row_order_invariant(tmp_path
 
     assert _tree_bytes(run_a.development) == _tree_bytes(run_b.development)
     assert _tree_bytes(run_a.sealed) == _tree_bytes(run_b.sealed)
+    for run in (run_a, run_b):
+        assert isinstance(run.summary["near_duplicate_index"].pop("seconds"), float)
     assert run_a.summary == run_b.summary
     assert verify_enron_splits(run_a.development, run_a.sealed, seed=run_a.seed) == verify_enron_splits(
         run_b.development, run_b.sealed, seed=run_b.seed
@@ -972,7 +975,11 @@ def test_paired_band_index_is_complete_at_radius_three_and_excludes_four_changed
     assert not base_keys & set(enron_splitting._near_pair_keys(four_changed_bands))  # noqa: SLF001
 
 
-def test_near_candidate_budget_aborts_before_materializing_an_oversized_bucket(tmp_path: Path) -> None:
+@pytest.mark.parametrize("near_index_memory_bytes", [enron_splitting.DEFAULT_NEAR_INDEX_MEMORY_BYTES, 0])
+def test_near_candidate_budget_aborts_before_materializing_an_oversized_bucket(
+    tmp_path: Path,
+    near_index_memory_bytes: int,
+) -> None:
     connection = enron_splitting._open_spool(tmp_path / "split.sqlite3")  # noqa: SLF001
     try:
         for node in range(3):
@@ -985,6 +992,7 @@ def test_near_candidate_budget_aborts_before_materializing_an_oversized_bucket(t
             sealed_output_dir=tmp_path / "unused-sealed",
             scratch_dir=tmp_path / "unused-scratch",
             max_near_candidate_pairs=1,
+            near_index_memory_bytes=near_index_memory_bytes,
             fixture_mode=True,
         )
 
@@ -994,6 +1002,49 @@ def test_near_candidate_budget_aborts_before_materializing_an_oversized_bucket(t
         connection.close()
 
 
+def test_in_memory_near_index_matches_the_sqlite_spool(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(7)
+    bases = [rng.getrandbits(64) for _ in range(40)]
+    signatures = []
+    for node in range(400):
+        for _ in range(rng.choice((0, 1, 2))):
+            signature = rng.choice(bases)
+            for _ in range(rng.randrange(6)):
+                signature ^= 1 << rng.randrange(64)
+            signatures.append((node, f"{signature:016x}"))
+
+    def build(name: str, near_index_memory_bytes: int) -> tuple[Any, ...]:
+        connection = enron_splitting._open_spool(tmp_path / f"{name}.sqlite3")  # noqa: SLF001
+        try:
+            connection.executemany("INSERT OR IGNORE INTO near_signatures VALUES (?, ?)", signatures)
+            options = EnronSplitOptions(
+                preparation_run=tmp_path / "unused-preparation",
+                development_output_dir=tmp_path / "unused-development",
+                sealed_output_dir=tmp_path / "unused-sealed",
+                scratch_dir=tmp_path / "unused-scratch",
+                near_index_memory_bytes=near_index_memory_bytes,
+                fixture_mode=True,
+            )
+            union_find, edge_counts, emissions, pairs, index = enron_splitting._build_leakage_graph(  # noqa: SLF001
+                connection, 400, options
+            )
+            provenance = connection.execute("SELECT edge, node FROM edge_provenance ORDER BY edge, node").fetchall()
+        finally:
+            connection.close()
+        assert index["raw_emissions"] == emissions
+        assert index["candidate_pairs"] == pairs
+        return index["backend"], (list(union_find.parent), dict(edge_counts), emissions, pairs, provenance)
+
+    memory_backend, in_memory = build("memory", enron_splitting.DEFAULT_NEAR_INDEX_MEMORY_BYTES)
+    spool_backend, spooled = build("spool", 0)
+    monkeypatch.setattr(enron_splitting, "_numpy", None)
+    fallback_backend, fallback = build("fallback", enron_splitting.DEFAULT_NEAR_INDEX_MEMORY_BYTES)
+
+    assert (memory_backend, spool_backend, fallback_backend) == ("memory", "sqlite", "sqlite")
+    assert in_memory == spooled == fallback
+    assert in_memory[1]["near_duplicate"] > 0
+
+
 def test_latest_group_member_controls_temporal_role_and_invalid_dates_are_auditable(tmp_path: Path) -> None:
     shared_subject = "Late member controls this exact group"
     shared_body = "The same bounded content occurs in both an early and a future mailbox copy."
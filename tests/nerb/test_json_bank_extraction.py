@@ -7,6 +7,7 @@ from typing import Any
 
 import pytest
 
+import nerb.extraction as extraction_module
 from nerb import (
     ExtractionError,
     bank_cache_info,
@@ -22,7 +23,9 @@ from nerb.engines import (
     compile_bank_with_report,
     extraction_execution_sha256,
     extraction_semantics_sha256,
+    resolve_extraction_options,
 )
+from nerb.records import record_sort_key, sort_span_ordered_records
 
 
 @pytest.fixture
@@ -149,13 +152,28 @@ def test_json_bank_extraction_accepts_rust_regex_syntax_that_python_re_cannot_pa
     assert [(record["pattern_id"], record["string"]) for record in result["records"]] == [("named_capture", "ACME")]
 
 
-def test_unicode_normalization_modes_are_rejected_until_supported_by_rust_engine(minimal_bank):
+def test_unicode_normalization_scans_normalized_text_with_original_spans(minimal_bank):
     minimal_bank["unicode_normalization"] = "NFC"
-    _set_customer_patterns(minimal_bank, {"accented": _regex_pattern("Café")})
+    _set_customer_patterns(minimal_bank, {"accented": _regex_pattern("Cafe\u0301")})
+    text = "Cafe\u0301 and Caf\u00e9 signed."
 
-    with pytest.raises(ExtractionError, match="Rust engine validation") as exc_info:
-        extract_text(minimal_bank, "Cafe\u0301 signed.")
-    assert any("unicode_normalization" in diagnostic["message"] for diagnostic in exc_info.value.diagnostics)
+    result = extract_text(minimal_bank, text)
+
+    assert [(record["start"], record["end"], record["string"]) for record in result["records"]] == [
+        (0, 5, "Cafe\u0301"),
+        (10, 14, "Caf\u00e9"),
+    ]
+
+    minimal_bank["unicode_normalization"] = "NFKC"
+    _set_customer_patterns(minimal_bank, {"acme": _literal_pattern("Acme Corp")})
+    text = "\uff21\uff43\uff4d\uff45 Corp and ACME CORP replied."
+
+    result = extract_text(minimal_bank, text)
+
+    assert [record["string"] for record in result["records"]] == ["\uff21\uff43\uff4d\uff45 Corp", "ACME CORP"]
+    assert [text[record["start"] : record["end"]] for record in result["records"]] == [
+        record["string"] for record in result["records"]
+    ]
 
 
 def test_case_insensitive_literal_uses_original_spans(minimal_bank):
@@ -209,6 +227,70 @@ def test_regex_entity_shards_use_deterministic_leftmost_first_for_same_start_mat
     assert [(record["pattern_id"], record["string"]) for record in result["records"]] == [("first_regex", "Acme")]
 
 
+def test_cross_entity_records_sharing_a_span_follow_record_sort_key(minimal_bank):
+    _set_customer_patterns(minimal_bank, {"name": _literal_pattern("Acme"), "digits": _regex_pattern(r"\d+")})
+    for entity_id in ("zeta", "alpha"):
+        minimal_bank["entities"][entity_id] = copy.deepcopy(minimal_bank["entities"]["customer"])
+
+    records = extract_text(minimal_bank, "Acme 42 Acme")["records"]
+
+    assert [(record["start"], record["entity_id"]) for record in records] == [
+        (0, "alpha"),
+        (0, "customer"),
+        (0, "zeta"),
+        (5, "alpha"),
+        (5, "customer"),
+        (5, "zeta"),
+        (8, "alpha"),
+        (8, "customer"),
+        (8, "zeta"),
+    ]
+    assert records == sorted(records, key=record_sort_key)
+
+
+def test_entity_ids_option_scans_only_selected_entities(minimal_bank):
+    for entity_id in ("zeta", "alpha"):
+        minimal_bank["entities"][entity_id] = copy.deepcopy(minimal_bank["entities"]["customer"])
+
+    result = extract_text(minimal_bank, "Acme Corp", options={"entity_ids": ["zeta", "alpha"]})
+    batch = extract_batch(minimal_bank, [{"document_id": "one", "text": "Acme Corp"}], options={"entity_ids": ["zeta"]})
+
+    assert [record["entity_id"] for record in result["records"]] == ["alpha", "zeta"]
+    assert [record["entity_id"] for record in batch["documents"][0]["records"]] == ["zeta"]
+    with pytest.raises(ExtractionError, match="names unknown entities: missing"):
+        extract_text(minimal_bank, "Acme Corp", options={"entity_ids": ["missing"]})
+    with pytest.raises(ExtractionError, match="sequence of entity ID strings"):
+        extract_text(minimal_bank, "Acme Corp", options={"entity_ids": "customer"})
+
+
+def test_deadline_ms_option_bounds_each_document_scan(minimal_bank):
+    result = extract_text(minimal_bank, "Acme Corp", options={"deadline_ms": 60_000})
+
+    assert [record["string"] for record in result["records"]] == ["Acme Corp"]
+    assert resolve_extraction_options({"deadline_ms": 250}).deadline_ms == 250
+    assert resolve_extraction_options(None).deadline_ms is None
+    for invalid in (0, -1, True, "250"):
+        with pytest.raises(ExtractionError, match="deadline_ms must be a positive integer"):
+            extract_text(minimal_bank, "Acme Corp", options={"deadline_ms": invalid})
+
+
+def test_sort_span_ordered_records_only_reorders_shared_spans():
+    def record(start: int, end: int, entity_id: str) -> dict[str, Any]:
+        return {"start": start, "end": end, "entity_id": entity_id, "name_id": "n", "pattern_id": "p", "string": "s"}
+
+    records = [record(0, 3, "b"), record(0, 3, "a"), record(0, 4, "a"), record(5, 6, "c"), record(5, 6, "a")]
+
+    sort_span_ordered_records(records)
+
+    assert [(item["start"], item["end"], item["entity_id"]) for item in records] == [
+        (0, 3, "a"),
+        (0, 3, "b"),
+        (0, 4, "a"),
+        (5, 6, "a"),
+        (5, 6, "c"),
+    ]
+
+
 def test_regex_numeric_backreferences_are_rejected_by_rust_regex_profile(minimal_bank):
     _set_customer_patterns(minimal_bank, {"code": _regex_pattern(r"\b([A-Z]+)-\1\b")})
 
@@ -313,6 +395,33 @@ def test_extract_batch_groups_documents_and_sorts_flat_records(minimal_bank):
     assert result["summary"] == {"document_count": 2, "record_count": 2, "documents_with_records": 2}
 
 
+def test_extract_batch_scans_identical_documents_once(monkeypatch, minimal_bank):
+    scanned: list[str] = []
+    extract_records = extraction_module._extract_records
+
+    def counting_extract_records(compiled, text, entity_ids=None, deadline_ms=None):
+        scanned.append(text)
+        return extract_records(compiled, text, entity_ids, deadline_ms)
+
+    monkeypatch.setattr(extraction_module, "_extract_records", counting_extract_records)
+    result = extract_batch(
+        minimal_bank,
+        [
+            {"document_id": "first", "text": "Acme Corp"},
+            {"document_id": "second", "text": "Acme Corp"},
+            {"document_id": "third", "text": "nothing"},
+        ],
+    )
+
+    first, second, third = (document["records"] for document in result["documents"])
+    assert scanned == ["Acme Corp", "nothing"]
+    assert first == second
+    assert first[0] is not second[0]
+    assert first[0]["captures"] is not second[0]["captures"]
+    assert third == []
+    assert result["summary"] == {"document_count": 3, "record_count": 2, "documents_with_records": 2}
+
+
 def test_extract_batch_file_documents_preserve_original_file_bytes(tmp_path, minimal_bank):
     source_path = tmp_path / "source.txt"
     source_path.write_bytes("Café\r\nAcme Corp".encode())
@@ -12,6 +12,7 @@ from typer.testing import CliRunner
 import nerb.mcp_server as mcp_server_module
 from nerb import (
     Bank,
+    ScanTimeoutError,
     clear_bank_cache,
     load_config,
     save_config,
@@ -1110,6 +1111,33 @@ def test_mcp_config_extraction_rejects_zero_width_regex(tmp_path):
     assert "zero-length match" in str(error.value)
 
 
+def test_mcp_extraction_tools_bound_scans_with_deadline_ms(monkeypatch, test_data_path):
+    detectors = {"ARTIST": {"Rush": "Rush"}}
+    bank = _load_json(test_data_path / "minimal_bank.json")
+
+    assert extract_inline(detectors, text="Rush", deadline_ms=60_000)["record_count"] == 1
+    assert extract_text("Acme Corp", bank=bank, options={"deadline_ms": 60_000})["records"][0]["string"] == "Acme Corp"
+    with pytest.raises(ToolError, match="deadline_ms must be a positive integer"):
+        extract_inline(detectors, text="Rush", deadline_ms=0)
+
+    scan_text = Bank.scan_text
+
+    def expired_scan(self, text, **kwargs):
+        if kwargs.get("deadline_ms") is None:
+            return scan_text(self, text, **kwargs)
+        raise ScanTimeoutError(
+            "scan deadline exceeded after 5 ms with 0 of 1 shards scanned and 0 matches found",
+            reason="deadline_exceeded",
+            progress={"elapsed_ms": 5, "shards_completed": 0, "shards_total": 1, "matches": 0},
+        )
+
+    monkeypatch.setattr(Bank, "scan_text", expired_scan)
+    with pytest.raises(ToolError, match="Could not scan document with the Rust engine: scan deadline exceeded"):
+        extract_inline(detectors, text="Rush", deadline_ms=5)
+    with pytest.raises(ToolError, match="Extraction stopped early: scan deadline exceeded"):
+        extract_text("Acme Corp", bank=bank, options={"deadline_ms": 5})
+
+
 def test_mcp_tools_report_invalid_inline_detector_definitions():
     with pytest.raises(ToolError) as invalid_inline_error:
         extract_inline({"ARTIST": {"_flags": "IGNORECASE"}}, text="Rush")
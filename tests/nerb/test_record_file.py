@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from nerb import (
+    Bank,
+    RecordFileError,
+    RecordFileWriter,
+    extract_text,
+    iter_record_file,
+    read_record_file,
+    write_record_file,
+)
+from nerb.record_file import RECORD_FILE_MAGIC
+
+
+def test_record_file_round_trips_bank_scan_records(tmp_path):
+    bank = Bank.from_source_bytes(b'{"ARTIST":{"Pink Floyd":"Pink\\\\s+Floyd"},"GENRE":{"Rock":"rock"}}')
+    first = bank.scan_text("Pink Floyd played rock; Pink  Floyd again. " * 20)
+    second = bank.scan_text("Café rock", offsets="char")
+    path = tmp_path / "records.nerbrec"
+
+    write_record_file(path, [("first", first), ("second", second), ("empty", [])])
+    documents = read_record_file(path)
+
+    assert [document.document_id for document in documents] == ["first", "second", "empty"]
+    assert documents[0].records() == first
+    assert list(documents[0][0]) == list(first[0])
+    assert documents[1][-1] == second[-1]
+    assert len(documents[2]) == 0
+    assert list(documents[0].starts) == [record["start"] for record in first]
+    # Three detectors across both documents are each stored once.
+    assert len(set(documents[0].detectors) | set(documents[1].detectors)) == 3
+    assert path.stat().st_size * 3 < len(json.dumps([first, second]).encode("utf-8"))
+
+
+def test_record_file_materializes_independent_nested_fields(test_data_path):
+    bank = json.loads((test_data_path / "minimal_bank.json").read_text(encoding="utf-8"))
+    records = extract_text(bank, "Acme Corp and acme corp")["records"]
+    stream = io.BytesIO()
+
+    RecordFileWriter(stream).write_document("email", records, metadata={"source": {"type": "text"}})
+    stream.seek(0)
+    (document,) = iter_record_file(stream)
+
+    assert document.metadata == {"source": {"type": "text"}}
+    assert document.records() == records
+    document[0]["captures"]["group"] = "changed"
+    assert document[1]["captures"] == {}
+
+
+def test_record_file_rejects_invalid_input():
+    with pytest.raises(RecordFileError, match="missing 'end'"):
+        RecordFileWriter(io.BytesIO()).write_document("doc", [{"string": "a", "start": 0}])
+    with pytest.raises(RecordFileError, match="not a NERB record file"):
+        list(iter_record_file(io.BytesIO(b"{}")))
+
+    stream = io.BytesIO()
+    RecordFileWriter(stream).write_document("doc", [{"entity": "A", "string": "a", "start": 0, "end": 1}])
+    with pytest.raises(RecordFileError, match="ends inside a block"):
+        list(iter_record_file(io.BytesIO(stream.getvalue()[:-1])))
+    assert stream.getvalue().startswith(RECORD_FILE_MAGIC)
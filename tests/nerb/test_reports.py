@@ -180,6 +180,105 @@ def test_priority_overlap_tie_breakers_use_longest_then_pattern_identity(minimal
     assert report["overlaps"] == []
 
 
+def _python_overlap_resolution(bank: dict[str, Any], records: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Resolve overlaps per record in Python, as reports did before native overlap groups."""
+    priorities = {
+        (entity_id, name_id, pattern_id): pattern["priority"]
+        for entity_id, entity in bank["entities"].items()
+        for name_id, name in entity["names"].items()
+        for pattern_id, pattern in name["patterns"].items()
+    }
+    groups: list[list[int]] = []
+    current: list[int] = []
+    current_end = -1
+    for index, record in enumerate(records):
+        if current and record["start"] < current_end:
+            current.append(index)
+            current_end = max(current_end, record["end"])
+            continue
+        if len(current) > 1:
+            groups.append(current)
+        current = [index]
+        current_end = record["end"]
+    if len(current) > 1:
+        groups.append(current)
+
+    def winner_key(index: int) -> tuple[Any, ...]:
+        record = records[index]
+        return (
+            priorities[(record["entity_id"], record["name_id"], record["pattern_id"])],
+            record["start"] - record["end"],
+            record["start"],
+            record["entity_id"],
+            record["name_id"],
+            record["pattern_id"],
+            record["string"],
+            index,
+        )
+
+    overlaps = []
+    for group in groups:
+        winner = min(group, key=winner_key)
+        overlaps.append(
+            {
+                "span": {"start": records[group[0]]["start"], "end": max(records[index]["end"] for index in group)},
+                "records": [records[index] for index in group],
+                "resolved_record": records[winner],
+                "dropped_records": [records[index] for index in group if index != winner],
+            }
+        )
+    return overlaps
+
+
+@pytest.mark.parametrize(
+    ("fixture", "tie_winner"),
+    [
+        ("chained", None),
+        ("entity_ties", ("aardvark", "primary", "primary")),
+    ],
+)
+def test_native_overlap_groups_equal_the_python_resolution(minimal_bank, fixture, tie_winner):
+    if fixture == "chained":
+        _set_customer_patterns(minimal_bank, {"long": _literal_pattern("Acme Corp", priority=200)})
+        _add_entity(minimal_bank, "vendor", "Acme Vendor", {"short": _literal_pattern("Acme", priority=20)})
+        _add_entity(
+            minimal_bank, "holding", "Corp Holdings", {"holding": _literal_pattern("Corp Holdings", priority=10)}
+        )
+        text = "Acme Corp Holdings and Acme Corp. " * 20
+    else:
+        # Entity ids sort opposite to their canonical names, so only the JSON-order tie ranks
+        # reproduce the Python winners of equal-priority, equal-span matches. Each entity's
+        # shard already keeps one match per span, so ties between entities are the ones
+        # overlap resolution sees.
+        _set_customer_patterns(
+            minimal_bank,
+            {
+                "z_regex": _regex_pattern(r"\bAcme\b"),
+                "a_literal": _literal_pattern("Acme"),
+                "long": _literal_pattern("Acme Corp", priority=200),
+            },
+        )
+        _add_customer_name(minimal_bank, "aa_acme", "Zed Acme", {"primary": _literal_pattern("Acme")})
+        _add_entity(minimal_bank, "aardvark", "Zulu Acme", {"primary": _literal_pattern("Acme")})
+        _add_entity(minimal_bank, "zebra", "Alpha Acme", {"primary": _literal_pattern("Acme")})
+        text = "Acme met Acme Corp; ACME and acme. " * 5
+
+    report = extract_report(minimal_bank, text)
+
+    expected = _python_overlap_resolution(minimal_bank, report["records"])
+    assert expected
+    assert [{key: overlap[key] for key in expected[0]} for overlap in report["overlaps"]] == expected
+    dropped = [record for overlap in expected for record in overlap["dropped_records"]]
+    assert [item["record"] for item in report["resolved_records"]] == [
+        record for record in report["records"] if not any(record is other for other in dropped)
+    ]
+    if tie_winner is not None:
+        assert {
+            (record["entity_id"], record["name_id"], record["pattern_id"])
+            for record in (overlap["resolved_record"] for overlap in report["overlaps"])
+        } == {tie_winner}
+
+
 def test_report_cross_entity_overlap_uses_ascending_rust_priority(minimal_bank):
     _set_customer_patterns(minimal_bank, {"long": _literal_pattern("Acme Corp", priority=200)})
     _add_entity(minimal_bank, "vendor", "Acme Vendor", {"short": _literal_pattern("Acme", priority=20)})
@@ -196,6 +295,36 @@ def test_report_cross_entity_overlap_uses_ascending_rust_priority(minimal_bank):
     assert report["overlaps"][0]["resolved_record"]["entity_id"] == "vendor"
 
 
+def test_report_overlap_groups_chain_and_repeat_across_dense_batches(minimal_bank):
+    _set_customer_patterns(minimal_bank, {"long": _literal_pattern("Acme Corp", priority=200)})
+    _add_entity(minimal_bank, "vendor", "Acme Vendor", {"short": _literal_pattern("Acme", priority=20)})
+    _add_entity(minimal_bank, "holding", "Corp Holdings", {"holding": _literal_pattern("Corp Holdings", priority=10)})
+    text = "Acme Corp Holdings and Acme Corp. " * 200
+
+    report = extract_report(minimal_bank, text)
+
+    assert len(report["records"]) == 1000
+    assert len(report["overlaps"]) == 400
+    chained, pair = report["overlaps"][:2]
+    assert chained["span"] == {"start": 0, "end": 18}
+    assert [record["entity_id"] for record in chained["records"]] == ["vendor", "customer", "holding"]
+    assert chained["resolved_record"]["entity_id"] == "holding"
+    assert [record["entity_id"] for record in chained["dropped_records"]] == ["vendor", "customer"]
+    assert pair["span"] == {"start": 23, "end": 32}
+    assert pair["resolved_record"]["entity_id"] == "vendor"
+    assert [item["record"]["entity_id"] for item in report["resolved_records"][:2]] == ["holding", "vendor"]
+    assert report["summary"]["resolved_record_count"] == 400
+
+    batch = extract_report_batch(
+        minimal_bank,
+        [{"document_id": "first", "text": text}, {"document_id": "second", "text": text}],
+    )
+
+    for document in batch["documents"]:
+        assert document["overlaps"] == report["overlaps"]
+        assert document["resolved_records"] == report["resolved_records"]
+
+
 def test_grouped_summary_counts_use_resolved_records(minimal_bank):
     report = extract_report(minimal_bank, "Acme Corp and Acme Corp")
 
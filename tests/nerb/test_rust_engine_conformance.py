@@ -11,6 +11,8 @@ from conformance_helpers import (
     utf8_byte_span,
 )
 
+import nerb
+
 
 @pytest.fixture
 def engine():
@@ -70,6 +72,26 @@ def test_native_entity_independent_scan_matches_supported_planned_conformance_ca
     assert_planned_records_equal(_project_native_scan_records(bank, case.text), case.expected_records)
 
 
+@pytest.mark.parametrize(
+    "case",
+    RUST_CONFORMANCE_CASES,
+    ids=[case.case_id for case in RUST_CONFORMANCE_CASES],
+)
+def test_chunked_scan_matches_serial_scan_on_planned_conformance_cases(case):
+    bank = nerb.Bank.from_source_bytes(_native_source_for_case(case), format_hint="jsonl")
+    # Several 256 KiB chunks, cut after spaces both inside and between the case texts.
+    repeats = 800_000 // (len(case.text.encode("utf-8")) + 1) + 1
+    document = " ".join([case.text] * repeats).encode("utf-8")
+
+    serial = bank.scan_bytes(document)
+
+    assert serial
+    assert bank.scan_bytes(document, threads=4) == serial
+    assert bank.scan_bytes(document, threads=8, entities=bank.entity_names()[:1]) == bank.scan_bytes(
+        document, entities=bank.entity_names()[:1]
+    )
+
+
 def test_compact_json_source_order_sets_within_entity_priority(engine):
     short_first = engine.Bank.from_source_bytes(b'{"PERSON":{"Sam":"Sam","Samba":"Samba"}}', format_hint="json")
     long_first = engine.Bank.from_source_bytes(b'{"PERSON":{"Samba":"Samba","Sam":"Sam"}}', format_hint="json")
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from nerb import ExtractionError, extract_text, generate_workload, load_bank, validate_bank
+
+WORKLOAD_SHAPE = {
+    "entity_count": 3,
+    "names_per_entity": 4,
+    "patterns_per_name": 5,
+    "literal_ratio": 0.5,
+    "case_insensitive_ratio": 0.5,
+    "word_boundary_ratio": 0.5,
+    "normalize_whitespace_ratio": 0.5,
+    "document_count": 12,
+    "document_bytes": 1024,
+    "match_density": 3.0,
+}
+
+
+def test_generate_workload_streams_valid_bank_and_matching_corpus(tmp_path):
+    manifest = generate_workload(tmp_path, seed=7, **WORKLOAD_SHAPE)
+
+    bank = load_bank(tmp_path / "bank.json")
+    documents = [json.loads(line) for line in (tmp_path / "documents.jsonl").read_text(encoding="utf-8").splitlines()]
+
+    assert validate_bank(bank)["valid"] is True
+    assert json.loads((tmp_path / "workload.json").read_text(encoding="utf-8")) == manifest
+    counts = manifest["counts"]
+    assert (counts["entities"], counts["names"], counts["patterns"]) == (3, 12, 60)
+    assert counts["literal"] == counts["regex"] == 30
+    assert 0 < counts["case_insensitive"] < 60
+    assert 0 < counts["word_boundary"] < 60
+    assert 0 < counts["normalize_whitespace"] < 60
+    assert counts["planted_matches"] == round(12 * 1024 * 3.0 / 1024) == 36
+    assert manifest["files"]["bank"]["bytes"] == (tmp_path / "bank.json").stat().st_size
+    assert len(documents) == 12
+    for document in documents:
+        assert len(document["text"].encode("utf-8")) == pytest.approx(1024, rel=0.1)
+        assert len(extract_text(bank, document["text"])["records"]) == document["planted_matches"]
+
+
+def test_generate_workload_is_deterministic_per_seed(tmp_path):
+    first = generate_workload(tmp_path / "first", seed=11, **WORKLOAD_SHAPE)
+    second = generate_workload(tmp_path / "second", seed=11, **WORKLOAD_SHAPE)
+    other = generate_workload(tmp_path / "other", seed=12, **WORKLOAD_SHAPE)
+
+    assert first["files"] == second["files"]
+    assert first["files"]["bank"]["sha256"] != other["files"]["bank"]["sha256"]
+    assert first["files"]["documents"]["sha256"] != other["files"]["documents"]["sha256"]
+
+
+def test_generate_workload_writes_document_files_with_manifest(tmp_path):
+    manifest = generate_workload(
+        tmp_path,
+        entity_count=1,
+        names_per_entity=2,
+        patterns_per_name=2,
+        document_count=3,
+        document_bytes=256,
+        document_format="files",
+    )
+
+    listed = (tmp_path / "documents.manifest").read_text(encoding="utf-8").splitlines()
+
+    assert listed == ["documents/doc_00000000.txt", "documents/doc_00000001.txt", "documents/doc_00000002.txt"]
+    assert all((tmp_path / path).is_file() for path in listed)
+    assert manifest["counts"]["document_text_bytes"] == sum((tmp_path / path).stat().st_size for path in listed)
+    with pytest.raises(ExtractionError, match="already exists"):
+        generate_workload(tmp_path, entity_count=1, names_per_entity=1, patterns_per_name=1, document_format="files")
+    generate_workload(
+        tmp_path,
+        entity_count=1,
+        names_per_entity=1,
+        patterns_per_name=1,
+        document_format="files",
+        overwrite=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("overrides", "message"),
+    [
+        ({"entity_count": 0}, "entity_count"),
+        ({"patterns_per_name": True}, "patterns_per_name"),
+        ({"literal_ratio": 1.5}, "literal_ratio"),
+        ({"match_density": -1}, "match_density"),
+        ({"document_count": -1}, "document_count"),
+        ({"document_format": "csv"}, "document_format"),
+        ({"bank_id": "Bad-Id"}, "bank_id"),
+    ],
+)
+def test_generate_workload_rejects_invalid_shapes(tmp_path, overrides, message):
+    options = {**WORKLOAD_SHAPE, **overrides}
+
+    with pytest.raises(ExtractionError, match=message):
+        generate_workload(tmp_path, **options)
+    assert not (tmp_path / "bank.json").exists()